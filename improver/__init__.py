@@ -33,6 +33,8 @@ from abc import ABC, abstractmethod
 
 from pkg_resources import DistributionNotFound, get_distribution
 
+from improver.plugin_trace import trace_call
+
 try:
     __version__ = get_distribution("improver").version
 except DistributionNotFound:
@@ -44,6 +46,7 @@ class BasePlugin(ABC):
     """An abstract class for IMPROVER plugins.
     Subclasses must be callable. We preserve the process
     method by redirecting to __call__.
+    Calls are recorded if tracing is enabled in improver.plugin_trace.
     """
 
     def __call__(self, *args, **kwargs):
@@ -56,7 +59,7 @@ class BasePlugin(ABC):
         Returns:
             Output of self.process()
         """
-        return self.process(*args, **kwargs)
+        return trace_call(self, self.process, args, kwargs)
 
     @abstractmethod
     def process(self, *args, **kwargs):
@@ -57,6 +57,7 @@ from improver.utilities.cube_manipulation import (
     get_dim_coord_names,
     sort_coord_in_cube,
 )
+from improver.utilities.interpolation import interpolate_rows
 
 
 class MergeCubesForWeightedBlending(BasePlugin):
@@ -252,6 +253,9 @@ class PercentileBlendingAggregator:
             Combining_Probabilities.pdf
     """
 
+    # Number of grid points to blend together, limiting memory use
+    CHUNK_SIZE = 1024
+
     @staticmethod
     def aggregate(data, axis, percentiles, arr_weights):
         """
@@ -301,17 +305,76 @@ class PercentileBlendingAggregator:
         weights_shape = [data.shape[0], grid_points]
         arr_weights = arr_weights.reshape(weights_shape)
 
-        # Find the blended percentile values at each point in the flattened data
+        # Find the blended percentile values for chunks of points in the
+        # flattened data
         result = np.zeros(flattened_shape[1:], dtype=FLOAT_DTYPE)
-        for i in range(data.shape[-1]):
-            result[:, i] = PercentileBlendingAggregator.blend_percentiles(
-                data[:, :, i], percentiles, arr_weights[:, i]
-            )
+        chunk_size = PercentileBlendingAggregator.CHUNK_SIZE
+        for start in range(0, grid_points, chunk_size):
+            chunk = slice(start, start + chunk_size)
+            result[:, chunk] = PercentileBlendingAggregator.blend_percentiles_batched(
+                np.moveaxis(data[:, :, chunk], -1, 0),
+                percentiles,
+                arr_weights[:, chunk].T,
+            ).T
         # Reshape the data with a leading percentile dimension
         shape = percentiles.shape + grid_shape
         result = result.reshape(shape)
         return result
 
+    @staticmethod
+    def blend_percentiles_batched(perc_values, percentiles, weights):
+        """ Blend percentiles function, to calculate the weighted blend across
+            a given axis of percentile data for many grid points at once.
+            This gives the same result as applying blend_percentiles to each
+            point in turn.
+
+        Args:
+            perc_values (numpy.ndarray):
+                Array containing the percentile values to blend, with
+                shape: (num of points, length of coord to blend,
+                num of percentiles)
+            percentiles (numpy.ndarray):
+                Array of percentile values e.g [0, 20.0, 50.0, 70.0, 100.0],
+                same size as the percentile dimension of data.
+            weights (numpy.ndarray):
+                Array of weights, with shape: (num of points, length of coord
+                to blend).
+
+        Returns:
+            numpy.ndarray:
+                Array containing the weighted percentile blend data
+                across the chosen coord, with shape: (num of points,
+                num of percentiles)
+        """
+        npoints, inputs_to_blend, _ = perc_values.shape
+        combined_cdf = np.zeros(
+            (npoints, inputs_to_blend, len(percentiles)), dtype=FLOAT_DTYPE
+        )
+        # Find the values for the probability at each threshold in the cdf,
+        # for each of the other inputs we are blending over, as for
+        # blend_percentiles, and add them to the running totals.
+        for i in range(0, inputs_to_blend):
+            for j in range(0, inputs_to_blend):
+                if i == j:
+                    values_in_cdf = percentiles
+                else:
+                    values_in_cdf = interpolate_rows(
+                        perc_values[:, i], perc_values[:, j], percentiles
+                    )
+                combined_cdf[:, i] += values_in_cdf * weights[:, j, np.newaxis]
+
+        # Combine and sort the threshold values and blended probability
+        # values at each point.
+        combined_perc_thres_data = np.sort(perc_values.reshape(npoints, -1), axis=-1)
+        combined_perc_values = np.sort(combined_cdf.reshape(npoints, -1), axis=-1)
+
+        # Find the percentile values from this combined data by interpolating
+        # back from probability values to the original percentiles.
+        new_combined_perc = interpolate_rows(
+            percentiles, combined_perc_values, combined_perc_thres_data
+        ).astype(FLOAT_DTYPE)
+        return new_combined_perc
+
     @staticmethod
     def blend_percentiles(perc_values, percentiles, weights):
         """ Blend percentiles function, to calculate the weighted blend across
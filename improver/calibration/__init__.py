@@ -38,26 +38,23 @@ from improver.metadata.probabilistic import (
 from improver.utilities.cube_manipulation import MergeCubes
 
 
-def split_forecasts_and_truth(cubes, truth_attribute):
+def _group_forecasts_and_truth(cubes, truth_attribute):
     """
-    A common utility for splitting the various inputs cubes required for
-    calibration CLIs. These are generally the forecast cubes, historic truths,
-    and in some instances a land-sea mask is also required.
+    Group the input cubes required for calibration CLIs into historic
+    forecasts, truths and, if present, a land-sea mask, without merging them.
 
     Args:
         cubes (list):
             A list of input cubes which will be split into relevant groups.
-            These include the historical forecasts, in the format supported by
-            the calibration CLIs, and the truth cubes.
         truth_attribute (str):
             An attribute and its value in the format of "attribute=value",
             which must be present on truth cubes.
     Returns:
         (tuple): tuple containing:
-            **forecast** (iris.cube.Cube):
-                A cube containing all the historic forecasts.
-            **truth** (iris.cube.Cube):
-                A cube containing all the truth data.
+            **forecasts** (list of iris.cube.Cube):
+                The historic forecast cubes.
+            **truths** (list of iris.cube.Cube):
+                The truth cubes.
             **land_sea_mask** (iris.cube.Cube or None):
                 If found within the input cubes list a land-sea mask will be
                 returned, else None is returned.
@@ -109,7 +106,92 @@ def split_forecasts_and_truth(cubes, truth_attribute):
     if missing_inputs:
         raise IOError(f"Missing {missing_inputs} input.")
 
-    truth = MergeCubes()(grouped_cubes["truth"])
-    forecast = MergeCubes()(grouped_cubes["historical forecast"])
+    return grouped_cubes["historical forecast"], grouped_cubes["truth"], land_sea_mask
+
+
+def split_forecasts_and_truth(cubes, truth_attribute):
+    """
+    A common utility for splitting the various inputs cubes required for
+    calibration CLIs. These are generally the forecast cubes, historic truths,
+    and in some instances a land-sea mask is also required.
+
+    Args:
+        cubes (list):
+            A list of input cubes which will be split into relevant groups.
+            These include the historical forecasts, in the format supported by
+            the calibration CLIs, and the truth cubes.
+        truth_attribute (str):
+            An attribute and its value in the format of "attribute=value",
+            which must be present on truth cubes.
+    Returns:
+        (tuple): tuple containing:
+            **forecast** (iris.cube.Cube):
+                A cube containing all the historic forecasts.
+            **truth** (iris.cube.Cube):
+                A cube containing all the truth data.
+            **land_sea_mask** (iris.cube.Cube or None):
+                If found within the input cubes list a land-sea mask will be
+                returned, else None is returned.
+    Raises:
+        ValueError:
+            An unexpected number of distinct cube names were passed in.
+        IOError:
+            More than one cube was identified as a land-sea mask.
+        IOError:
+            Missing truth or historical forecast in input cubes.
+    """
+    forecasts, truths, land_sea_mask = _group_forecasts_and_truth(
+        cubes, truth_attribute
+    )
+    truth = MergeCubes()(truths)
+    forecast = MergeCubes()(forecasts)
 
     return forecast, truth, land_sea_mask
+
+
+def pair_forecasts_and_truth(cubes, truth_attribute):
+    """
+    Split the input cubes into historic forecasts and truths, as
+    split_forecasts_and_truth does, but pair each historic forecast cube
+    with the truths at its validity times instead of merging all of them.
+    The pairs are generated one at a time, so that the data of the cubes in
+    a pair need not be loaded until the pair is used.
+
+    Args:
+        cubes (list):
+            A list of input cubes, containing the historical forecasts and
+            the truth cubes.
+        truth_attribute (str):
+            An attribute and its value in the format of "attribute=value",
+            which must be present on truth cubes.
+    Yields:
+        (tuple): tuple containing:
+            **forecast** (iris.cube.Cube):
+                One of the historic forecast cubes.
+            **truth** (iris.cube.Cube):
+                A cube containing the truths with validity times matching
+                those of the forecast.
+    Raises:
+        ValueError:
+            None of the historic forecasts match the validity time of a
+            truth.
+    """
+    forecasts, truths, _ = _group_forecasts_and_truth(cubes, truth_attribute)
+    truth_times = [
+        {cell.point for cell in truth.coord("time").cells()} for truth in truths
+    ]
+    matched = False
+    for forecast in forecasts:
+        times = {cell.point for cell in forecast.coord("time").cells()}
+        matching = [
+            truth for truth, points in zip(truths, truth_times) if times & points
+        ]
+        if matching:
+            matched = True
+            yield forecast, MergeCubes()(matching)
+    if not matched:
+        msg = (
+            "The filtering has found no matches in validity time "
+            "between the historic forecasts and the truths."
+        )
+        raise ValueError(msg)
@@ -38,6 +38,8 @@ Statistics (EMOS).
 
 """
 import warnings
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 import iris
 import numpy as np
@@ -84,13 +86,23 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
     The number of coefficients that will be optimised depend upon the initial
     guess.
 
-    Minimisation is performed using the Nelder-Mead algorithm for 200
-    iterations to limit the computational expense.
-    Note that the BFGS algorithm was initially trialled but had a bug
-    in comparison to comparative results generated in R.
+    Minimisation is performed using the Nelder-Mead algorithm by default.
+    The gradient-based BFGS and L-BFGS-B algorithms may be selected instead,
+    in which case the analytic gradient of the CRPS with respect to the
+    coefficients is provided to the minimiser. These typically require
+    far fewer evaluations of the CRPS than Nelder-Mead.
+
+    Coefficients may instead be estimated independently at each point.
+    As this requires a separate minimisation at every point, the points are
+    minimised together by a BFGS algorithm that evaluates the CRPS and its
+    gradient for all points at once. Groups of points may also be
+    minimised in parallel by a pool of processes.
 
     """
 
+    # The minimisation methods supported, named as in scipy.optimize.minimize.
+    MINIMISATION_METHODS = ("Nelder-Mead", "BFGS", "L-BFGS-B")
+
     # The tolerated percentage change for the final iteration when
     # performing the minimisation.
     TOLERATED_PERCENTAGE_CHANGE = 5
@@ -99,7 +111,25 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
     # as part of the minimisation.
     BAD_VALUE = np.float64(999999)
 
-    def __init__(self, tolerance=0.02, max_iterations=1000):
+    # The sufficient decrease condition for each step of the minimisation
+    # at each point, and the maximum number of times that the step may be
+    # halved to satisfy this condition.
+    SUFFICIENT_DECREASE = 1e-4
+    MAX_STEP_HALVINGS = 30
+
+    # The number of groups of points for each process when minimising
+    # point by point in parallel, so that the work is evenly shared even if
+    # some groups converge more slowly.
+    GROUPS_PER_WORKER = 4
+
+    def __init__(
+        self,
+        tolerance=0.02,
+        max_iterations=1000,
+        minimisation_method="Nelder-Mead",
+        point_by_point=False,
+        max_workers=1,
+    ):
         """
         Initialise class for performing minimisation of the Continuous
         Ranked Probability Score (CRPS).
@@ -122,6 +152,22 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
                 predictor_of_mean is "realizations", then the number of
                 iterations may require increasing, as there will be
                 more coefficients to solve for.
+            minimisation_method (str):
+                The method used by scipy.optimize.minimize, one of
+                "Nelder-Mead", "BFGS" or "L-BFGS-B" (case insensitive). The
+                gradient-based methods use the analytic gradient of the CRPS.
+            point_by_point (bool):
+                If True, coefficients are estimated independently at each
+                point, rather than for the whole domain. All points are
+                minimised together using the BFGS algorithm with the analytic
+                gradient of the CRPS, whatever the minimisation_method.
+            max_workers (int):
+                The number of processes used to minimise groups of points in
+                parallel when point_by_point is True. If 1, all points are
+                minimised within the current process.
+
+        Raises:
+            ValueError: If the minimisation method is not supported.
 
         """
         # Dictionary containing the functions that will be minimised,
@@ -131,20 +177,53 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
             "norm": self.calculate_normal_crps,
             "truncnorm": self.calculate_truncated_normal_crps,
         }
+        # Dictionary containing the gradients of the functions above, for
+        # use by the gradient-based minimisation methods.
+        self.gradient_dict = {
+            "norm": self.calculate_normal_crps_gradient,
+            "truncnorm": self.calculate_truncated_normal_crps_gradient,
+        }
+        # Dictionary containing the functions that calculate the CRPS and its
+        # gradient with respect to the location and scale parameters at each
+        # point, for use when minimising point by point.
+        self.crps_terms_dict = {
+            "norm": self._calculate_normal_crps_terms,
+            "truncnorm": self._calculate_truncated_normal_crps_terms,
+        }
         self.tolerance = tolerance
-        # Maximum iterations for minimisation using Nelder-Mead.
+        # Maximum iterations for minimisation.
         self.max_iterations = max_iterations
 
+        methods = {method.lower(): method for method in self.MINIMISATION_METHODS}
+        try:
+            self.minimisation_method = methods[minimisation_method.lower()]
+        except KeyError:
+            msg = (
+                "Minimisation method {} is not supported. Supported methods "
+                "are {}".format(minimisation_method, self.MINIMISATION_METHODS)
+            )
+            raise ValueError(msg)
+        self.point_by_point = point_by_point
+        self.max_workers = max_workers
+
     def __repr__(self):
         """Represent the configured plugin instance as a string."""
         result = (
             "<ContinuousRankedProbabilityScoreMinimisers: "
-            "minimisation_dict: {}; tolerance: {}; max_iterations: {}>"
+            "minimisation_dict: {}; tolerance: {}; max_iterations: {}; "
+            "minimisation_method: {}; point_by_point: {}; max_workers: {}>"
         )
         print_dict = {}
         for key in self.minimisation_dict:
             print_dict.update({key: self.minimisation_dict[key].__name__})
-        return result.format(print_dict, self.tolerance, self.max_iterations)
+        return result.format(
+            print_dict,
+            self.tolerance,
+            self.max_iterations,
+            self.minimisation_method,
+            self.point_by_point,
+            self.max_workers,
+        )
 
     def process(
         self,
@@ -183,9 +262,12 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
                 minimisation within self.minimisation_dict.
 
         Returns:
-            list of float:
-                List of optimised coefficients.
+            numpy.ndarray:
+                Array of optimised coefficients.
                 Order of coefficients is [alpha, beta, gamma, delta].
+                If point_by_point is True, the coefficients are followed
+                by the spatial dimensions of the truth, with a set of
+                coefficients at each point.
 
         Raises:
             KeyError: If the distribution is not supported.
@@ -203,9 +285,9 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
             the threshold, a warning message is printed.
 
             Args:
-                allvecs (list):
-                    List of numpy arrays containing the optimised coefficients,
-                    after each iteration.
+                allvecs (collections.deque):
+                    The numpy arrays containing the optimised coefficients
+                    after the last two iterations.
 
             Warns:
                 Warning: If a satisfactory minimisation has not been achieved.
@@ -245,6 +327,16 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
         # Ensure predictor is valid.
         check_predictor(predictor)
 
+        if self.point_by_point:
+            return self._process_point_by_point(
+                initial_guess,
+                forecast_predictor,
+                truth,
+                forecast_var,
+                predictor,
+                distribution,
+            )
+
         # Flatten the data arrays and remove any missing data.
         truth_data = flatten_ignoring_masked_data(truth.data)
         forecast_var_data = flatten_ignoring_masked_data(forecast_var.data)
@@ -267,20 +359,68 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
         forecast_var_data = forecast_var_data.astype(np.float64)
         truth_data = truth_data.astype(np.float64)
         sqrt_pi = np.sqrt(np.pi).astype(np.float64)
-        optimised_coeffs = minimize(
-            minimisation_function,
-            initial_guess,
-            args=(
-                forecast_predictor_data,
-                truth_data,
-                forecast_var_data,
-                sqrt_pi,
-                predictor,
-            ),
-            method="Nelder-Mead",
-            tol=self.tolerance,
-            options={"maxiter": self.max_iterations, "return_all": True},
-        )
+
+        # The gradient-based methods are considered converged once the
+        # gradient of the CRPS is within the tolerance, as the CRPS itself
+        # can change by less than the tolerance long before convergence.
+        tolerance = self.tolerance
+        gradient_function = None
+        options = {"maxiter": self.max_iterations}
+        predictor_offset = None
+        if self.minimisation_method != "Nelder-Mead":
+            tolerance = None
+            gradient_function = self.gradient_dict[distribution]
+            options["gtol"] = self.tolerance
+
+            # Minimise with the predictor centred on zero and alpha adjusted
+            # to match, which leaves the CRPS unchanged. Otherwise alpha and
+            # beta are strongly dependent for predictors far from zero, which
+            # greatly slows the convergence of gradient-based methods.
+            predictor_offset = np.nanmean(forecast_predictor_data, axis=0)
+            forecast_predictor_data = forecast_predictor_data - predictor_offset
+            initial_guess = initial_guess.copy()
+            initial_guess[0] += self._calculate_location_offset(
+                initial_guess, predictor_offset, predictor
+            )
+
+        starting_guesses = [initial_guess]
+        if gradient_function and initial_guess[-2] == 0:
+            # The CRPS depends upon gamma only through its square, so the
+            # gradient with respect to gamma is zero whilst gamma is zero and
+            # a gradient-based minimisation would never move it. A second
+            # minimisation is started with gamma set to the spread of the
+            # errors of the initial guess, and the better result is kept.
+            mu, _ = self._calculate_location_and_scale(
+                initial_guess, forecast_predictor_data, forecast_var_data, predictor
+            )
+            spread_guess = initial_guess.copy()
+            spread_guess[-2] = np.nanstd(truth_data - mu)
+            if np.isfinite(spread_guess[-2]) and spread_guess[-2] > 0:
+                starting_guesses.append(spread_guess)
+
+        optimised_coeffs = None
+        for starting_guess in starting_guesses:
+            # Only the last two iterations are needed to check the final
+            # percentage change, so avoid keeping every iteration.
+            iterations = deque([starting_guess], maxlen=2)
+            result = minimize(
+                minimisation_function,
+                starting_guess,
+                args=(
+                    forecast_predictor_data,
+                    truth_data,
+                    forecast_var_data,
+                    sqrt_pi,
+                    predictor,
+                ),
+                method=self.minimisation_method,
+                jac=gradient_function,
+                tol=tolerance,
+                options=options,
+                callback=lambda coeffs: iterations.append(np.copy(coeffs)),
+            )
+            if optimised_coeffs is None or result.fun < optimised_coeffs.fun:
+                optimised_coeffs, allvecs = result, iterations
 
         if not optimised_coeffs.success:
             msg = (
@@ -290,8 +430,17 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
                 )
             )
             warnings.warn(msg)
-        calculate_percentage_change_in_last_iteration(optimised_coeffs.allvecs)
-        return optimised_coeffs.x.astype(np.float32)
+        # The gradient-based methods instead report convergence through the
+        # gradient, so this check is only needed for Nelder-Mead.
+        if self.minimisation_method == "Nelder-Mead":
+            calculate_percentage_change_in_last_iteration(allvecs)
+
+        coefficients = optimised_coeffs.x
+        if predictor_offset is not None:
+            coefficients[0] -= self._calculate_location_offset(
+                coefficients, predictor_offset, predictor
+            )
+        return coefficients.astype(np.float32)
 
     def calculate_normal_crps(
         self, initial_guess, forecast_predictor, truth, forecast_var, sqrt_pi, predictor
@@ -434,6 +583,753 @@ class ContinuousRankedProbabilityScoreMinimisers(BasePlugin):
             result = self.BAD_VALUE
         return result
 
+    @staticmethod
+    def _calculate_location_and_scale(
+        initial_guess, forecast_predictor, forecast_var, predictor
+    ):
+        """
+        Calculate the location and scale parameters of the distribution
+        given the coefficients.
+
+        Args:
+            initial_guess (numpy.ndarray):
+                Coefficients in the order [alpha, beta, gamma, delta].
+                If the predictor is "realizations", beta is the square root
+                of the weight given to each realization.
+            forecast_predictor (numpy.ndarray):
+                Data to be used as the predictor,
+                either the ensemble mean or the ensemble realizations.
+            forecast_var (numpy.ndarray):
+                Ensemble variance data.
+            predictor (str):
+                String to specify the form of the predictor used to calculate
+                the location parameter when estimating the EMOS coefficients.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]:
+                The location and scale parameters at each point.
+        """
+        if predictor.lower() == "mean":
+            mu = initial_guess[0] + initial_guess[1] * forecast_predictor
+        elif predictor.lower() == "realizations":
+            mu = initial_guess[0] + np.dot(forecast_predictor, initial_guess[1:-2] ** 2)
+        gamma, delta = initial_guess[-2:]
+        sigma = np.sqrt(gamma ** 2 + delta ** 2 * forecast_var)
+        return mu, sigma
+
+    @staticmethod
+    def _calculate_location_offset(initial_guess, predictor_offset, predictor):
+        """
+        Calculate the change in the location parameter given by the
+        coefficients when the predictor is offset.
+
+        Args:
+            initial_guess (numpy.ndarray):
+                Coefficients in the order [alpha, beta, gamma, delta]. The
+                coefficients are along the last axis, so that there may be
+                leading dimensions for a set of coefficients at each point.
+            predictor_offset (numpy.ndarray):
+                The offset of the predictor, with a value for each
+                realization if the predictor is "realizations", along the
+                last axis.
+            predictor (str):
+                String to specify the form of the predictor used to calculate
+                the location parameter when estimating the EMOS coefficients.
+
+        Returns:
+            float or numpy.ndarray:
+                The change in the location parameter.
+        """
+        if predictor.lower() == "mean":
+            return initial_guess[..., 1] * predictor_offset
+        return np.sum(initial_guess[..., 1:-2] ** 2 * predictor_offset, axis=-1)
+
+    @staticmethod
+    def _apply_chain_rule(
+        initial_guess,
+        forecast_predictor,
+        forecast_var,
+        sigma,
+        crps_mu_gradient,
+        crps_sigma_gradient,
+        predictor,
+    ):
+        """
+        Calculate the gradient of the mean CRPS with respect to each of the
+        coefficients, given the gradient of the CRPS at each point with
+        respect to the location and scale parameters.
+
+        Args:
+            initial_guess (numpy.ndarray):
+                Coefficients in the order [alpha, beta, gamma, delta].
+            forecast_predictor (numpy.ndarray):
+                Data to be used as the predictor,
+                either the ensemble mean or the ensemble realizations.
+            forecast_var (numpy.ndarray):
+                Ensemble variance data.
+            sigma (numpy.ndarray):
+                Scale parameter at each point.
+            crps_mu_gradient (numpy.ndarray):
+                Gradient of the CRPS with respect to the location parameter
+                at each point.
+            crps_sigma_gradient (numpy.ndarray):
+                Gradient of the CRPS with respect to the scale parameter
+                at each point.
+            predictor (str):
+                String to specify the form of the predictor used to calculate
+                the location parameter when estimating the EMOS coefficients.
+
+        Returns:
+            numpy.ndarray:
+                Gradient of the mean CRPS with respect to each coefficient.
+        """
+        gamma, delta = initial_guess[-2:]
+        if predictor.lower() == "mean":
+            beta_gradient = [np.nanmean(crps_mu_gradient * forecast_predictor)]
+        elif predictor.lower() == "realizations":
+            # The weight of each realization is the square of its coefficient.
+            beta_gradient = (
+                np.nanmean(crps_mu_gradient[:, np.newaxis] * forecast_predictor, axis=0)
+                * 2
+                * initial_guess[1:-2]
+            )
+        return np.array(
+            [
+                np.nanmean(crps_mu_gradient),
+                *beta_gradient,
+                np.nanmean(crps_sigma_gradient * gamma / sigma),
+                np.nanmean(crps_sigma_gradient * delta * forecast_var / sigma),
+            ],
+            dtype=np.float64,
+        )
+
+    def calculate_normal_crps_gradient(
+        self, initial_guess, forecast_predictor, truth, forecast_var, sqrt_pi, predictor
+    ):
+        """
+        Calculate the gradient of the CRPS for a normal distribution with
+        respect to each of the coefficients, as minimised by
+        :meth:`calculate_normal_crps`.
+
+        Args:
+            initial_guess (list):
+                List of optimised coefficients.
+                Order of coefficients is [alpha, beta, gamma, delta].
+            forecast_predictor (numpy.ndarray):
+                Data to be used as the predictor,
+                either the ensemble mean or the ensemble realizations.
+            truth (numpy.ndarray):
+                Data to be used as truth.
+            forecast_var (numpy.ndarray):
+                Ensemble variance data.
+            sqrt_pi (numpy.ndarray):
+                Square root of Pi
+            predictor (str):
+                String to specify the form of the predictor used to calculate
+                the location parameter when estimating the EMOS coefficients.
+                Currently the ensemble mean ("mean") and the ensemble
+                realizations ("realizations") are supported as the predictors.
+
+        Returns:
+            numpy.ndarray:
+                Gradient of the mean CRPS with respect to each coefficient.
+                Zeros are returned where the CRPS is set to BAD_VALUE.
+        """
+        initial_guess = np.asarray(initial_guess, dtype=np.float64)
+        mu, sigma = self._calculate_location_and_scale(
+            initial_guess, forecast_predictor, forecast_var, predictor
+        )
+        if not np.isfinite(np.min(mu / sigma)):
+            return np.zeros(initial_guess.shape, dtype=np.float64)
+
+        _, crps_mu_gradient, crps_sigma_gradient = self._calculate_normal_crps_terms(
+            truth, mu, sigma, sqrt_pi
+        )
+        return self._apply_chain_rule(
+            initial_guess,
+            forecast_predictor,
+            forecast_var,
+            sigma,
+            crps_mu_gradient,
+            crps_sigma_gradient,
+            predictor,
+        )
+
+    def calculate_truncated_normal_crps_gradient(
+        self, initial_guess, forecast_predictor, truth, forecast_var, sqrt_pi, predictor
+    ):
+        """
+        Calculate the gradient of the CRPS for a truncated normal distribution
+        with zero as the lower bound with respect to each of the coefficients,
+        as minimised by :meth:`calculate_truncated_normal_crps`.
+
+        Args:
+            initial_guess (list):
+                List of optimised coefficients.
+                Order of coefficients is [alpha, beta, gamma, delta].
+            forecast_predictor (numpy.ndarray):
+                Data to be used as the predictor,
+                either the ensemble mean or the ensemble realizations.
+            truth (numpy.ndarray):
+                Data to be used as truth.
+            forecast_var (numpy.ndarray):
+                Ensemble variance data.
+            sqrt_pi (numpy.ndarray):
+                Square root of Pi
+            predictor (str):
+                String to specify the form of the predictor used to calculate
+                the location parameter when estimating the EMOS coefficients.
+                Currently the ensemble mean ("mean") and the ensemble
+                realizations ("realizations") are supported as the predictors.
+
+        Returns:
+            numpy.ndarray:
+                Gradient of the mean CRPS with respect to each coefficient.
+                Zeros are returned where the CRPS is set to BAD_VALUE.
+        """
+        initial_guess = np.asarray(initial_guess, dtype=np.float64)
+        mu, sigma = self._calculate_location_and_scale(
+            initial_guess, forecast_predictor, forecast_var, predictor
+        )
+        if not (np.isfinite(np.min(mu / sigma)) or (np.min(mu / sigma) >= -3)):
+            return np.zeros(initial_guess.shape, dtype=np.float64)
+
+        (
+            _,
+            crps_mu_gradient,
+            crps_sigma_gradient,
+        ) = self._calculate_truncated_normal_crps_terms(truth, mu, sigma, sqrt_pi)
+        return self._apply_chain_rule(
+            initial_guess,
+            forecast_predictor,
+            forecast_var,
+            sigma,
+            crps_mu_gradient,
+            crps_sigma_gradient,
+            predictor,
+        )
+
+    @staticmethod
+    def _calculate_normal_crps_terms(truth, mu, sigma, sqrt_pi):
+        """
+        Calculate the CRPS for a normal distribution at each point, and the
+        gradient of the CRPS with respect to the location and scale
+        parameters.
+
+        Args:
+            truth (numpy.ndarray):
+                Data to be used as truth.
+            mu (numpy.ndarray):
+                Location parameter at each point.
+            sigma (numpy.ndarray):
+                Scale parameter at each point.
+            sqrt_pi (numpy.ndarray):
+                Square root of Pi
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+                The CRPS at each point, and its gradient with respect to the
+                location and scale parameters.
+        """
+        xz = (truth - mu) / sigma
+        normal_cdf = norm.cdf(xz)
+        normal_pdf = norm.pdf(xz)
+        crps = sigma * (xz * (2 * normal_cdf - 1) + 2 * normal_pdf - 1 / sqrt_pi)
+        return crps, 1 - 2 * normal_cdf, 2 * normal_pdf - 1 / sqrt_pi
+
+    @staticmethod
+    def _calculate_truncated_normal_crps_terms(truth, mu, sigma, sqrt_pi):
+        """
+        Calculate the CRPS for a truncated normal distribution with zero as
+        the lower bound at each point, and the gradient of the CRPS with
+        respect to the location and scale parameters.
+
+        Args:
+            truth (numpy.ndarray):
+                Data to be used as truth.
+            mu (numpy.ndarray):
+                Location parameter at each point.
+            sigma (numpy.ndarray):
+                Scale parameter at each point.
+            sqrt_pi (numpy.ndarray):
+                Square root of Pi
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+                The CRPS at each point, and its gradient with respect to the
+                location and scale parameters.
+        """
+        xz = (truth - mu) / sigma
+        x0 = mu / sigma
+        normal_cdf = norm.cdf(xz)
+        normal_pdf = norm.pdf(xz)
+        normal_cdf_0 = norm.cdf(x0)
+        normal_pdf_0 = norm.pdf(x0)
+
+        # The CRPS is sigma * numerator / normal_cdf_0 ** 2, a function of
+        # xz = (truth - mu) / sigma and x0 = mu / sigma.
+        numerator = (
+            xz * normal_cdf_0 * (2 * normal_cdf + normal_cdf_0 - 2)
+            + 2 * normal_pdf * normal_cdf_0
+            - norm.cdf(np.sqrt(2) * x0) / sqrt_pi
+        )
+        xz_gradient = (2 * normal_cdf + normal_cdf_0 - 2) / normal_cdf_0
+        numerator_x0_gradient = (
+            normal_pdf_0
+            * (xz * (2 * normal_cdf + 2 * normal_cdf_0 - 2) + 2 * normal_pdf)
+            - np.sqrt(2) * norm.pdf(np.sqrt(2) * x0) / sqrt_pi
+        )
+        x0_gradient = (
+            numerator_x0_gradient / normal_cdf_0 ** 2
+            - 2 * numerator * normal_pdf_0 / normal_cdf_0 ** 3
+        )
+        crps = sigma * numerator / normal_cdf_0 ** 2
+        crps_mu_gradient = x0_gradient - xz_gradient
+        crps_sigma_gradient = (
+            numerator / normal_cdf_0 ** 2 - xz * xz_gradient - x0 * x0_gradient
+        )
+        return crps, crps_mu_gradient, crps_sigma_gradient
+
+    @staticmethod
+    def _get_point_data(cube, trailing_coords):
+        """
+        Get the data from a cube with a leading dimension over all spatial
+        points, followed by the dimensions of the trailing coordinates.
+        Masked data is replaced by NaN.
+
+        Args:
+            cube (iris.cube.Cube):
+                Cube containing the data.
+            trailing_coords (list of str):
+                Names of the coordinates that do not vary spatially, such
+                as time. Their dimensions are moved to the end, in order.
+
+        Returns:
+            numpy.ndarray:
+                The data with a leading dimension over all spatial points.
+        """
+        for coord in trailing_coords:
+            if not cube.coord_dims(coord):
+                cube = iris.util.new_axis(cube, coord)
+        dims = [cube.coord_dims(coord)[0] for coord in trailing_coords]
+        data = np.ma.filled(cube.data.astype(np.float64), np.nan)
+        data = np.moveaxis(data, dims, range(-len(dims), 0))
+        return data.reshape((-1,) + data.shape[-len(dims) :])
+
+    @staticmethod
+    def _calculate_point_location_and_scale(
+        coefficients, forecast_predictor, forecast_var, predictor
+    ):
+        """
+        Calculate the location and scale parameters of the distribution
+        given the coefficients at each of a group of points.
+
+        Args:
+            coefficients (numpy.ndarray):
+                Coefficients at each point, with the coefficients in the
+                order [alpha, beta, gamma, delta] along the last axis.
+            forecast_predictor (numpy.ndarray):
+                Predictor with dimensions of point and time, followed by
+                realization if the predictor is "realizations".
+            forecast_var (numpy.ndarray):
+                Ensemble variance with dimensions of point and time.
+            predictor (str):
+                String to specify the form of the predictor used to calculate
+                the location parameter when estimating the EMOS coefficients.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]:
+                The location and scale parameters with dimensions of point
+                and time.
+        """
+        if predictor.lower() == "mean":
+            mu = coefficients[:, 0:1] + coefficients[:, 1:2] * forecast_predictor
+        elif predictor.lower() == "realizations":
+            mu = coefficients[:, 0:1] + np.einsum(
+                "ntr,nr->nt", forecast_predictor, coefficients[:, 1:-2] ** 2
+            )
+        sigma = np.sqrt(
+            coefficients[:, -2:-1] ** 2 + coefficients[:, -1:] ** 2 * forecast_var
+        )
+        return mu, sigma
+
+    def _calculate_point_crps_and_gradient(
+        self,
+        coefficients,
+        forecast_predictor,
+        truth,
+        forecast_var,
+        sqrt_pi,
+        predictor,
+        distribution,
+    ):
+        """
+        Calculate the mean CRPS and its gradient with respect to each of the
+        coefficients independently at each of a group of points.
+
+        Args:
+            coefficients (numpy.ndarray):
+                Coefficients at each point, with the coefficients in the
+                order [alpha, beta, gamma, delta] along the last axis.
+            forecast_predictor (numpy.ndarray):
+                Predictor with dimensions of point and time, followed by
+                realization if the predictor is "realizations".
+            truth (numpy.ndarray):
+                Truth with dimensions of point and time. Times at which the
+                truth is NaN do not contribute to the CRPS.
+            forecast_var (numpy.ndarray):
+                Ensemble variance with dimensions of point and time.
+            sqrt_pi (numpy.ndarray):
+                Square root of Pi
+            predictor (str):
+                String to specify the form of the predictor used to calculate
+                the location parameter when estimating the EMOS coefficients.
+            distribution (str):
+                String used to access the appropriate function within
+                self.crps_terms_dict.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]:
+                The mean CRPS at each point, and its gradient with respect to
+                each coefficient at each point. As for the whole domain, the
+                CRPS is set to BAD_VALUE, with a zero gradient, at points
+                where the location and scale parameters are not usable.
+        """
+        mu, sigma = self._calculate_point_location_and_scale(
+            coefficients, forecast_predictor, forecast_var, predictor
+        )
+        gamma, delta = coefficients[:, -2:-1], coefficients[:, -1:]
+        n_times = np.count_nonzero(np.isfinite(truth), axis=1)
+        # Invalid values only arise at points where the CRPS is then set to
+        # the BAD_VALUE.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crps, crps_mu_gradient, crps_sigma_gradient = self.crps_terms_dict[
+                distribution
+            ](truth, mu, sigma, sqrt_pi)
+            min_x0 = np.min(mu / sigma, axis=1)
+
+            if predictor.lower() == "mean":
+                beta_gradient = np.nansum(crps_mu_gradient * forecast_predictor, axis=1)
+                beta_gradient = (beta_gradient / n_times)[:, np.newaxis]
+            elif predictor.lower() == "realizations":
+                # The weight of each realization is the square of its coefficient.
+                beta_gradient = np.nansum(
+                    crps_mu_gradient[..., np.newaxis] * forecast_predictor, axis=1
+                )
+                beta_gradient *= 2 * coefficients[:, 1:-2] / n_times[:, np.newaxis]
+            gradient = np.column_stack(
+                (
+                    np.nansum(crps_mu_gradient, axis=1) / n_times,
+                    beta_gradient,
+                    np.nansum(crps_sigma_gradient * gamma / sigma, axis=1) / n_times,
+                    np.nansum(
+                        crps_sigma_gradient * delta * forecast_var / sigma, axis=1
+                    )
+                    / n_times,
+                )
+            )
+            crps = np.nansum(crps, axis=1) / n_times
+
+        if distribution == "truncnorm":
+            bad_value = ~(np.isfinite(min_x0) | (min_x0 >= -3))
+        else:
+            bad_value = ~np.isfinite(min_x0)
+        crps[bad_value] = self.BAD_VALUE
+        gradient[bad_value] = 0
+        return crps, gradient
+
+    def _minimise_points(
+        self,
+        initial_guess,
+        forecast_predictor,
+        truth,
+        forecast_var,
+        predictor,
+        distribution,
+    ):
+        """
+        Minimise the CRPS independently at each of a group of points. The
+        BFGS algorithm is applied to all points at once, so that the CRPS and
+        its gradient are calculated for every point together. At each
+        iteration, the step at each point is halved until the CRPS at that
+        point is sufficiently reduced.
+
+        Args:
+            initial_guess (numpy.ndarray):
+                Coefficients used as the initial guess at every point.
+                Order of coefficients is [alpha, beta, gamma, delta].
+            forecast_predictor (numpy.ndarray):
+                Predictor with dimensions of point and time, followed by
+                realization if the predictor is "realizations".
+            truth (numpy.ndarray):
+                Truth with dimensions of point and time. Times at which the
+                truth is NaN are not used at that point.
+            forecast_var (numpy.ndarray):
+                Ensemble variance with dimensions of point and time.
+            predictor (str):
+                String to specify the form of the predictor used to calculate
+                the location parameter when estimating the EMOS coefficients.
+            distribution (str):
+                String used to access the appropriate function within
+                self.crps_terms_dict.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]:
+                The optimised coefficients at each point, and whether the
+                minimisation converged at each point.
+        """
+        sqrt_pi = np.sqrt(np.pi).astype(np.float64)
+        valid = np.isfinite(truth)
+        predictor_valid = valid
+        if predictor.lower() == "realizations":
+            predictor_valid = valid[..., np.newaxis]
+
+        # As when minimising the whole domain using the gradient, the
+        # predictor at each point is centred on zero, with alpha adjusted to
+        # match. Data at invalid times is replaced by values which keep the
+        # location and scale parameters finite.
+        forecast_predictor = np.where(predictor_valid, forecast_predictor, np.nan)
+        predictor_offset = np.nanmean(forecast_predictor, axis=1)
+        forecast_predictor = np.where(
+            predictor_valid,
+            forecast_predictor - np.expand_dims(predictor_offset, 1),
+            0,
+        )
+        forecast_var = np.where(valid, forecast_var, 1)
+        coefficients = np.tile(initial_guess, (truth.shape[0], 1))
+        coefficients[:, 0] += self._calculate_location_offset(
+            coefficients, predictor_offset, predictor
+        )
+
+        # As when minimising the whole domain using the gradient, a second
+        # minimisation is started with gamma set to the spread of the errors
+        # of the initial guess wherever gamma is zero, and the better result
+        # at each point is kept. Both are minimised together, by appending
+        # the second starting guesses as further points.
+        n_points = truth.shape[0]
+        mu, _ = self._calculate_point_location_and_scale(
+            coefficients, forecast_predictor, forecast_var, predictor
+        )
+        spread = np.nanstd(truth - mu, axis=1)
+        spread_points = np.flatnonzero(
+            (coefficients[:, -2] == 0) & np.isfinite(spread) & (spread > 0)
+        )
+        spread_guess = coefficients[spread_points]
+        spread_guess[:, -2] = spread[spread_points]
+        coefficients = np.concatenate((coefficients, spread_guess))
+        rows = np.concatenate((np.arange(n_points), spread_points))
+        forecast_predictor = forecast_predictor[rows]
+        truth = truth[rows]
+        forecast_var = forecast_var[rows]
+
+        args = (sqrt_pi, predictor, distribution)
+        crps, gradient = self._calculate_point_crps_and_gradient(
+            coefficients, forecast_predictor, truth, forecast_var, *args
+        )
+        n_coeffs = coefficients.shape[1]
+        inverse_hessian = np.tile(np.eye(n_coeffs), (rows.size, 1, 1))
+        converged = np.max(np.abs(gradient), axis=1) <= self.tolerance
+        active = ~converged
+
+        for _ in range(self.max_iterations):
+            points = np.flatnonzero(active)
+            if not points.size:
+                break
+            direction = -np.einsum(
+                "nij,nj->ni", inverse_hessian[points], gradient[points]
+            )
+            slope = np.einsum("ni,ni->n", direction, gradient[points])
+            # Restart from the direction of steepest descent wherever the
+            # approximate inverse Hessian does not give a descent direction.
+            restart = ~(slope < 0)
+            inverse_hessian[points[restart]] = np.eye(n_coeffs)
+            direction[restart] = -gradient[points[restart]]
+            slope[restart] = -np.sum(gradient[points[restart]] ** 2, axis=1)
+
+            step = np.ones(points.size)
+            new_coefficients = coefficients[points]
+            new_crps = crps[points]
+            new_gradient = gradient[points]
+            searching = np.arange(points.size)
+            for _ in range(self.MAX_STEP_HALVINGS):
+                indices = points[searching]
+                trial = (
+                    coefficients[indices]
+                    + step[searching, np.newaxis] * direction[searching]
+                )
+                trial_crps, trial_gradient = self._calculate_point_crps_and_gradient(
+                    trial,
+                    forecast_predictor[indices],
+                    truth[indices],
+                    forecast_var[indices],
+                    *args,
+                )
+                accepted = (
+                    trial_crps
+                    <= crps[indices]
+                    + self.SUFFICIENT_DECREASE * step[searching] * slope[searching]
+                )
+                new_coefficients[searching[accepted]] = trial[accepted]
+                new_crps[searching[accepted]] = trial_crps[accepted]
+                new_gradient[searching[accepted]] = trial_gradient[accepted]
+                searching = searching[~accepted]
+                if not searching.size:
+                    break
+                step[searching] *= 0.5
+
+            # The CRPS can not be reduced any further at points where no step
+            # was accepted, so the minimisation stops without converging.
+            active[points[searching]] = False
+            updated = np.ones(points.size, dtype=bool)
+            updated[searching] = False
+
+            # Update the approximate inverse Hessian wherever the curvature
+            # condition is satisfied.
+            s = new_coefficients[updated] - coefficients[points[updated]]
+            y = new_gradient[updated] - gradient[points[updated]]
+            sy = np.einsum("ni,ni->n", s, y)
+            curved = sy > 0
+            s, y, sy = s[curved], y[curved], sy[curved, np.newaxis, np.newaxis]
+            curved_points = points[updated][curved]
+            hy = np.einsum("nij,nj->ni", inverse_hessian[curved_points], y)
+            yhy = np.einsum("ni,ni->n", y, hy)[:, np.newaxis, np.newaxis]
+            inverse_hessian[curved_points] += (
+                (sy + yhy) * np.einsum("ni,nj->nij", s, s) / sy ** 2
+                - (np.einsum("ni,nj->nij", hy, s) + np.einsum("ni,nj->nij", s, hy)) / sy
+            )
+
+            coefficients[points[updated]] = new_coefficients[updated]
+            crps[points[updated]] = new_crps[updated]
+            gradient[points[updated]] = new_gradient[updated]
+            converged[points[updated]] = (
+                np.max(np.abs(new_gradient[updated]), axis=1) <= self.tolerance
+            )
+            active &= ~converged
+
+        better = crps[n_points:] < crps[spread_points]
+        coefficients[spread_points[better]] = coefficients[n_points:][better]
+        converged[spread_points[better]] = converged[n_points:][better]
+        coefficients = coefficients[:n_points]
+        coefficients[:, 0] -= self._calculate_location_offset(
+            coefficients, predictor_offset, predictor
+        )
+        return coefficients, converged[:n_points]
+
+    def _process_point_by_point(
+        self,
+        initial_guess,
+        forecast_predictor,
+        truth,
+        forecast_var,
+        predictor,
+        distribution,
+    ):
+        """
+        Estimate optimised values for the coefficients independently at
+        each point. If more than one worker is requested, groups of points
+        are minimised in parallel by a pool of processes.
+
+        Args:
+            initial_guess (list):
+                List of coefficients used as the initial guess at every
+                point. Order of coefficients is [alpha, beta, gamma, delta].
+            forecast_predictor (iris.cube.Cube):
+                Cube containing the fields to be used as the predictor,
+                either the ensemble mean or the ensemble realizations.
+            truth (iris.cube.Cube):
+                Cube containing the field, which will be used as truth.
+            forecast_var (iris.cube.Cube):
+                Cube containing the field containing the ensemble variance.
+            predictor (str):
+                String to specify the form of the predictor used to calculate
+                the location parameter when estimating the EMOS coefficients.
+                Currently the ensemble mean ("mean") and the ensemble
+                realizations ("realizations") are supported as the predictors.
+            distribution (str):
+                String used to access the appropriate function within
+                self.crps_terms_dict.
+
+        Returns:
+            numpy.ndarray:
+                Array of optimised coefficients, followed by the spatial
+                dimensions of the truth. Order of coefficients is
+                [alpha, beta, gamma, delta]. The coefficients are NaN at
+                points without any valid training data.
+
+        Warns:
+            Warning: If the minimisation did not converge at every point.
+        """
+        time_dims = truth.coord_dims("time")
+        spatial_shape = tuple(
+            size for dim, size in enumerate(truth.shape) if dim not in time_dims
+        )
+        truth_data = self._get_point_data(truth, ["time"])
+        forecast_var_data = self._get_point_data(forecast_var, ["time"])
+        if predictor.lower() == "mean":
+            forecast_predictor_data = self._get_point_data(forecast_predictor, ["time"])
+            predictor_valid = np.isfinite(forecast_predictor_data)
+        elif predictor.lower() == "realizations":
+            forecast_predictor_data = self._get_point_data(
+                forecast_predictor, ["time", "realization"]
+            )
+            predictor_valid = np.isfinite(forecast_predictor_data).all(axis=-1)
+
+        # Only use the times at which both the truth and forecast are valid.
+        valid = np.isfinite(truth_data) & np.isfinite(forecast_var_data)
+        valid &= predictor_valid
+        truth_data[~valid] = np.nan
+
+        initial_guess = np.array(initial_guess, dtype=np.float64)
+        coefficients = np.full((truth_data.shape[0], initial_guess.size), np.nan)
+        points = np.flatnonzero(valid.any(axis=1))
+        if np.any(np.isnan(initial_guess)):
+            points = points[:0]
+
+        groups = [points] if points.size else []
+        if self.max_workers > 1 and points.size > 1:
+            groups = np.array_split(
+                points, min(points.size, self.max_workers * self.GROUPS_PER_WORKER)
+            )
+        groups_args = [
+            (
+                initial_guess,
+                forecast_predictor_data[group],
+                truth_data[group],
+                forecast_var_data[group],
+                predictor,
+                distribution,
+            )
+            for group in groups
+        ]
+        if len(groups_args) > 1:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(self._minimise_points, *group_args)
+                    for group_args in groups_args
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [self._minimise_points(*group_args) for group_args in groups_args]
+
+        not_converged = 0
+        for group, (group_coefficients, group_converged) in zip(groups, results):
+            coefficients[group] = group_coefficients
+            not_converged += np.count_nonzero(~group_converged)
+        if not_converged:
+            msg = (
+                "Minimisation did not result in convergence at {} of {} points "
+                "after {} iterations.".format(
+                    not_converged, points.size, self.max_iterations
+                )
+            )
+            warnings.warn(msg)
+
+        return (
+            np.moveaxis(coefficients, -1, 0)
+            .reshape((-1,) + spatial_shape)
+            .astype(np.float32)
+        )
+
 
 class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
     """
@@ -455,6 +1351,9 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
         predictor="mean",
         tolerance=0.01,
         max_iterations=1000,
+        minimisation_method="Nelder-Mead",
+        point_by_point=False,
+        max_workers=1,
     ):
         """
         Create an ensemble calibration plugin that, for Nonhomogeneous Gaussian
@@ -494,6 +1393,19 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
                 predictor_of_mean is "realizations", then the number of
                 iterations may require increasing, as there will be
                 more coefficients to solve for.
+            minimisation_method (str):
+                The method used to minimise the CRPS, one of "Nelder-Mead",
+                "BFGS" or "L-BFGS-B". The gradient-based BFGS and L-BFGS-B
+                methods usually converge in far fewer iterations.
+            point_by_point (bool):
+                If True, coefficients are estimated independently at each
+                grid point or site, rather than for the whole domain. The
+                coefficients cubes then have the spatial dimensions of the
+                historic forecasts. All points are minimised together using
+                the BFGS algorithm, whatever the minimisation_method.
+            max_workers (int):
+                The number of processes used to minimise groups of points in
+                parallel when point_by_point is True.
 
         """
         self.distribution = distribution
@@ -505,8 +1417,15 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
         self.tolerance = tolerance
         self.max_iterations = max_iterations
         self.minimiser = ContinuousRankedProbabilityScoreMinimisers(
-            tolerance=self.tolerance, max_iterations=self.max_iterations
+            tolerance=self.tolerance,
+            max_iterations=self.max_iterations,
+            minimisation_method=minimisation_method,
+            point_by_point=point_by_point,
+            max_workers=max_workers,
         )
+        self.minimisation_method = self.minimiser.minimisation_method
+        self.point_by_point = point_by_point
+        self.max_workers = max_workers
 
         # Setting default values for coeff_names.
         self.coeff_names = ["alpha", "beta", "gamma", "delta"]
@@ -523,7 +1442,10 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
             "minimiser: {}; "
             "coeff_names: {}; "
             "tolerance: {}; "
-            "max_iterations: {}>"
+            "max_iterations: {}; "
+            "minimisation_method: {}; "
+            "point_by_point: {}; "
+            "max_workers: {}>"
         )
         return result.format(
             self.distribution,
@@ -533,6 +1455,9 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
             self.coeff_names,
             self.tolerance,
             self.max_iterations,
+            self.minimisation_method,
+            self.point_by_point,
+            self.max_workers,
         )
 
     def _validate_distribution(self):
@@ -638,9 +1563,12 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
 
         return [(frt_coord, None), (fp_coord, None)]
 
-    @staticmethod
-    def _create_spatial_coordinates(historic_forecasts):
+    def _create_spatial_coordinates(self, historic_forecasts):
         """Create spatial coordinates for the EMOS coefficients cube.
+        If the coefficients are estimated point by point, these are all the
+        coordinates that vary spatially, with their dimensions numbered
+        within the spatial dimensions of the historic forecasts. Otherwise,
+        these are the collapsed x and y coordinates.
 
         Args:
             historic_forecasts (iris.cube.Cube):
@@ -652,6 +1580,22 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
                 dimension. This format is suitable for use by iris.cube.Cube.
         """
         spatial_coords_and_dims = []
+        if self.point_by_point:
+            non_spatial_dims = set(historic_forecasts.coord_dims("time"))
+            non_spatial_dims.update(historic_forecasts.coord_dims("realization"))
+            spatial_dims = [
+                dim
+                for dim in range(historic_forecasts.ndim)
+                if dim not in non_spatial_dims
+            ]
+            for coord in historic_forecasts.coords():
+                dims = historic_forecasts.coord_dims(coord)
+                if dims and not non_spatial_dims.intersection(dims):
+                    spatial_coords_and_dims.append(
+                        (coord, tuple(spatial_dims.index(dim) for dim in dims))
+                    )
+            return spatial_coords_and_dims
+
         for axis in ["x", "y"]:
             spatial_coords_and_dims.append(
                 (historic_forecasts.coord(axis=axis).collapsed(), None)
@@ -665,7 +1609,9 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
         appropriate metadata. The units of the alpha and gamma coefficients
         match the units of the historic forecast. If the predictor is the
         realizations, then the beta coefficient cube contains a realization
-        coordinate.
+        coordinate. If the coefficients are estimated point by point,
+        dimension coordinates within the aux_coords_and_dims are used as the
+        dimension coordinates of each cube.
 
         Args:
             optimised_coeffs (numpy.ndarray)
@@ -690,16 +1636,26 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
             if coeff_name in ["alpha", "gamma"]:
                 coeff_units = historic_forecasts.units
             dim_coords_and_dims = []
+            leading_dims = 0
             if self.predictor.lower() == "realizations" and coeff_name == "beta":
                 dim_coords_and_dims = [
                     (historic_forecasts.coord("realization").copy(), 0)
                 ]
+                leading_dims = 1
+            cube_aux_coords_and_dims = []
+            for coord, dims in aux_coords_and_dims:
+                if dims is not None:
+                    dims = tuple(dim + leading_dims for dim in dims)
+                    if isinstance(coord, iris.coords.DimCoord):
+                        dim_coords_and_dims.append((coord.copy(), dims[0]))
+                        continue
+                cube_aux_coords_and_dims.append((coord.copy(), dims))
             cube = iris.cube.Cube(
                 optimised_coeff,
                 long_name=f"emos_coefficient_{coeff_name}",
                 units=coeff_units,
                 dim_coords_and_dims=dim_coords_and_dims,
-                aux_coords_and_dims=aux_coords_and_dims,
+                aux_coords_and_dims=cube_aux_coords_and_dims,
                 attributes=attributes,
             )
             cubelist.append(cube)
@@ -716,6 +1672,9 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
             optimised_coeffs (list or numpy.ndarray):
                 Array or list of optimised coefficients.
                 Order of coefficients is [alpha, beta, gamma, delta].
+                If the coefficients are estimated point by point, the
+                coefficients are followed by the spatial dimensions of the
+                historic forecasts.
             historic_forecasts (iris.cube.Cube):
                 Historic forecasts from the training dataset.
 
@@ -905,7 +1864,9 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
         6. Calculate initial guess at coefficient values by performing a
            linear regression, if requested, otherwise default values are
            used.
-        7. Perform minimisation.
+        7. Perform minimisation, either for the whole domain or
+           independently at each point. The initial guess for the whole
+           domain is used at each point.
 
         Args:
             historic_forecasts (iris.cube.Cube):
@@ -984,7 +1945,9 @@ class EstimateCoefficientsForEnsembleCalibration(BasePlugin):
         )
 
         # Calculate coefficients if there are no nans in the initial guess.
-        if np.any(np.isnan(initial_guess)):
+        # When minimising point by point, the minimiser returns coefficients
+        # of NaN at each point instead.
+        if np.any(np.isnan(initial_guess)) and not self.point_by_point:
             optimised_coeffs = initial_guess
         else:
             optimised_coeffs = self.minimiser(
@@ -1054,7 +2017,8 @@ class CalibratedForecastDistributionParameters(BasePlugin):
     def _spatial_domain_match(self):
         """
         Check that the domain of the current forecast and coefficients cube
-        match.
+        match. If the coefficients were estimated point by point, the
+        spatial coordinates must match at every point.
 
         Raises:
             ValueError: If the points or bounds of the specified axis of the
@@ -1067,7 +2031,15 @@ class CalibratedForecastDistributionParameters(BasePlugin):
 
         for axis in ["x", "y"]:
             for coeff_cube in self.coefficients_cubelist:
-                if (
+                coeff_coord = coeff_cube.coord(axis=axis)
+                if coeff_cube.coord_dims(coeff_coord):
+                    forecast_coord = self.current_forecast.coord(axis=axis)
+                    if not (
+                        np.array_equal(forecast_coord.points, coeff_coord.points)
+                        and np.array_equal(forecast_coord.bounds, coeff_coord.bounds)
+                    ):
+                        raise ValueError(msg.format(axis, forecast_coord, coeff_coord))
+                elif (
                     (
                         self.current_forecast.coord(axis=axis).collapsed().points
                         != coeff_cube.coord(axis=axis).collapsed().points
@@ -1131,6 +2103,21 @@ class CalibratedForecastDistributionParameters(BasePlugin):
         # Calculate location parameter = a + b1*X1 .... + bn*Xn, where X is the
         # ensemble realizations. The number of b and X terms depends upon the
         # number of ensemble realizations. In this case, b = beta^2.
+        alpha = self.coefficients_cubelist.extract_strict("emos_coefficient_alpha")
+        if alpha.ndim:
+            # Coefficients estimated point by point have a value at each
+            # point, with beta also varying along a leading realization
+            # dimension.
+            beta_values = self.coefficients_cubelist.extract_strict(
+                "emos_coefficient_beta"
+            ).data
+            realization_dim = forecast_predictor.coord_dims("realization")[0]
+            forecast_data = np.moveaxis(forecast_predictor.data, realization_dim, 0)
+            location_parameter = alpha.data + np.sum(
+                beta_values ** 2 * forecast_data, axis=0
+            )
+            return location_parameter.astype(np.float32)
+
         beta_values = np.array([], dtype=np.float32)
         beta_values = self.coefficients_cubelist.extract_strict(
             "emos_coefficient_beta"
@@ -35,19 +35,20 @@ import warnings
 
 import iris
 import numpy as np
-import scipy
 
 from improver import BasePlugin, PostProcessingPlugin
 from improver.calibration.utilities import (
     check_forecast_consistency,
     create_unified_frt_coord,
     filter_non_matching_cubes,
+    forecast_coords_match,
 )
 from improver.metadata.probabilistic import (
     find_threshold_coordinate,
     probability_is_above_or_below,
 )
 from improver.metadata.utilities import generate_mandatory_attributes
+from improver.utilities.cube_checker import spatial_coords_match
 from improver.utilities.cube_manipulation import MergeCubes, collapsed
 
 
@@ -184,7 +185,7 @@ class ConstructReliabilityCalibrationTables(BasePlugin):
         are observation_count, sum_of_forecast_probabilities, and
         forecast_count. The order used here is the order in which the table
         data is populated, so these must remain consistent with the
-        _populate_reliability_bins function.
+        _accumulate_reliability_bins function.
 
         Returns:
             (tuple): tuple containing:
@@ -293,119 +294,52 @@ class ConstructReliabilityCalibrationTables(BasePlugin):
 
         return reliability_cube
 
-    def _populate_reliability_bins(self, forecast, truth):
+    def _accumulate_reliability_bins(self, table, forecast, truth):
         """
-        For an x-y slice at a single validity time and threshold, populate
-        a reliability table using the provided truth.
+        For an x-y slice at a single validity time and threshold, add the
+        contributions of the forecast and truth to a reliability table. Each
+        forecast value is assigned to a probability bin once, and is then
+        added into that bin of the table at its grid point. Forecast values
+        that fall outside all of the probability bins are not counted.
 
         Args:
-            forecast (numpy.ndarray or numpy.ma.MaskedArray):
-                An array containing data over an xy slice for a single validity
-                time and threshold.
-            truth (numpy.ndarray or numpy.ma.MaskedArray):
-                An array containing a thresholded gridded truth at an
-                equivalent validity time to the forecast array.
-        Returns:
-            numpy.ma.MaskedArray:
-                An array containing reliability table data for a single time
-                and threshold. The leading dimension corresponds to the rows
-                of a calibration table, the second dimension to the number of
+            table (numpy.ndarray):
+                The contiguous reliability table array, which is modified in
+                place. The leading dimension corresponds to the rows of a
+                calibration table, the second dimension to the number of
                 probability bins, and the trailing dimensions are the spatial
-                dimensions of the forecast and truth cubes (which are
-                equivalent).
-        """
-        observation_counts = []
-        forecast_probabilities = []
-        forecast_counts = []
-
-        for bin_min, bin_max in self.probability_bins:
-            observation_mask = (
-                ((forecast >= bin_min) & (forecast <= bin_max)) & (np.isclose(truth, 1))
-            ).astype(int)
-            forecast_mask = ((forecast >= bin_min) & (forecast <= bin_max)).astype(int)
-            forecasts_probability_values = forecast * forecast_mask
-
-            observation_counts.append(observation_mask)
-            forecast_probabilities.append(forecasts_probability_values)
-            forecast_counts.append(forecast_mask)
-
-        reliability_table = np.ma.stack(
-            [
-                np.ma.stack(observation_counts),
-                np.ma.stack(forecast_probabilities),
-                np.ma.stack(forecast_counts),
-            ]
-        )
-
-        return reliability_table.astype(np.float32)
-
-    def _populate_masked_reliability_bins(self, forecast, truth):
-        """
-        Support populating the reliability table bins with a masked truth. If a
-        masked truth is provided, a masked reliability table is returned.
-
-        Args:
-            forecast (numpy.ndarray):
-                An array containing data over an xy slice for a single validity
-                time and threshold.
-            truth (numpy.ma.MaskedArray):
-                An array containing a thresholded gridded truth at an
-                equivalent validity time to the forecast array.
-        Returns:
-            numpy.ma.MaskedArray:
-                An array containing reliability table data for a single time
-                and threshold. The leading dimension corresponds to the rows
-                of a calibration table, the second dimension to the number of
-                probability bins, and the trailing dimensions are the spatial
-                dimensions of the forecast and truth cubes (which are
-                equivalent).
-        """
-        forecast = np.ma.masked_where(np.ma.getmask(truth), forecast)
-        table = self._populate_reliability_bins(forecast, truth)
-        # Zero data underneath mask to support bitwise addition of masks.
-        table.data[table.mask] = 0
-        return table
-
-    def _add_reliability_tables(self, forecast, truth, threshold_reliability):
-        """
-        Add reliability tables. The presence of a masked truth is handled
-        separately to ensure support for a mask that changes with validity time.
-
-        Args:
-            forecast (numpy.ndarray):
+                dimensions of the forecast and truth.
+            forecast (numpy.ndarray or numpy.ma.MaskedArray):
                 An array containing data over an xy slice for a single validity
                 time and threshold.
             truth (numpy.ndarray or numpy.ma.MaskedArray):
                 An array containing a thresholded gridded truth at an
                 equivalent validity time to the forecast array.
-            threshold_reliability (numpy.ndarray or numpy.ma.MaskedArray):
-                The current reliability table that will be added to.
         Returns:
-            numpy.ndarray or numpy.ma.MaskedArray:
-                An array containing reliability table data for a single time
-                and threshold. The leading dimension corresponds to the rows
-                of a calibration table, the second dimension to the number of
-                probability bins, and the trailing dimensions are the spatial
-                dimensions of the forecast and truth cubes (which are
-                equivalent).
+            numpy.ndarray:
+                Boolean array over the xy slice that is True where neither the
+                forecast nor the truth is masked, and so the point has
+                contributed to the table.
         """
-        if np.ma.is_masked(truth.data):
-            table = self._populate_masked_reliability_bins(forecast.data, truth.data)
-            # Bitwise addition of masks. This ensures that only points that are
-            # masked in both the existing and new reliability tables are kept
-            # as being masked within the resulting reliability table.
-            mask = threshold_reliability.mask & table.mask
-            threshold_reliability = np.ma.array(
-                threshold_reliability.data + table.data, mask=mask, dtype=np.float32,
-            )
-        else:
-            np.add(
-                threshold_reliability,
-                self._populate_reliability_bins(forecast.data, truth.data),
-                out=threshold_reliability,
-                dtype=np.float32,
-            )
-        return threshold_reliability
+        unmasked = ~(np.ma.getmaskarray(forecast) | np.ma.getmaskarray(truth))
+        forecast = np.ma.getdata(forecast)
+        truth = np.ma.getdata(truth)
+
+        # The bins are sorted and do not overlap, so each forecast value is
+        # in at most one bin, the last with a lower bound below the value.
+        bin_lower, bin_upper = self.probability_bins.T
+        bin_index = np.searchsorted(bin_lower, forecast, side="right") - 1
+        counted = unmasked & (bin_index >= 0) & (forecast <= bin_upper[bin_index])
+
+        # Each point is counted in a single bin, so the indices into the
+        # flattened bins and points of each table row are unique.
+        points = np.arange(forecast.size).reshape(forecast.shape)
+        indices = (bin_index * forecast.size + points)[counted]
+        rows = table.reshape(len(table), -1)
+        rows[0, indices] += np.isclose(truth[counted], 1)
+        rows[1, indices] += forecast[counted].astype(np.float32)
+        rows[2, indices] += 1
+        return unmasked
 
     def process(self, historic_forecasts, truths):
         """
@@ -430,6 +364,9 @@ class ConstructReliabilityCalibrationTables(BasePlugin):
         whether the data is thresholded below or above a given diagnostic
         threshold.
 
+        The data of each time and threshold is realised separately, so lazily
+        loaded historic forecasts and truths are never held in memory at once.
+
         Args:
             historic_forecasts (iris.cube.Cube):
                 A cube containing the historical forecasts used in calibration.
@@ -446,48 +383,125 @@ class ConstructReliabilityCalibrationTables(BasePlugin):
             ValueError: If the forecast and truth cubes have differing
                         threshold coordinates.
         """
-        historic_forecasts, truths = filter_non_matching_cubes(
-            historic_forecasts, truths
-        )
+        return self.process_iterable([(historic_forecasts, truths)])
 
-        threshold_coord = find_threshold_coordinate(historic_forecasts)
-        truth_threshold_coord = find_threshold_coordinate(truths)
-        if not threshold_coord == truth_threshold_coord:
-            msg = "Threshold coordinates differ between forecasts and truths."
-            raise ValueError(msg)
+    def process_iterable(self, forecasts_and_truths):
+        """
+        Construct reliability tables, as process does, from historic forecasts
+        and truths that are provided in parts, e.g. one pair of cubes for each
+        day of the training period. The parts are consumed one at a time and
+        their contributions added into the tables, so an iterator that loads
+        each part from file as it is required means that the whole training
+        period never has to be loaded at once.
+
+        Args:
+            forecasts_and_truths (iterable of tuple):
+                Pairs of cubes, each containing historic forecasts and the
+                corresponding thresholded gridded truths, as used by process.
+                All the parts must have the same threshold coordinate, grid,
+                forecast period and cycle hour.
+        Returns:
+            iris.cube.CubeList:
+                A cubelist of reliability table cubes, one for each threshold
+                in the historic forecast cubes.
+        Raises:
+            ValueError: If the forecast and truth cubes have differing
+                        threshold coordinates.
+            ValueError: If parts of the historic forecasts have differing
+                        threshold coordinates.
+            ValueError: If parts of the historic forecasts are on differing
+                        grids.
+            ValueError: If no historic forecasts and truths are provided.
+        """
+        reference = None
+        frt_coords = []
+        for historic_forecasts, truths in forecasts_and_truths:
+            historic_forecasts, truths = filter_non_matching_cubes(
+                historic_forecasts, truths
+            )
+
+            threshold_coord = find_threshold_coordinate(historic_forecasts)
+            truth_threshold_coord = find_threshold_coordinate(truths)
+            if not threshold_coord == truth_threshold_coord:
+                msg = "Threshold coordinates differ between forecasts and truths."
+                raise ValueError(msg)
 
-        time_coord = historic_forecasts.coord("time")
+            check_forecast_consistency(historic_forecasts)
+            if reference is None:
+                reference = historic_forecasts
+                reference_threshold_coord = threshold_coord
+                forecast_slice = next(
+                    historic_forecasts.slices_over(["time", threshold_coord])
+                )
+                tables = np.zeros(
+                    (len(threshold_coord.points),)
+                    + self.expected_table_shape
+                    + forecast_slice.shape,
+                    dtype=np.float32,
+                )
+                unmasked = np.zeros(
+                    (len(threshold_coord.points),) + forecast_slice.shape, dtype=bool
+                )
+                is_masked = False
+            else:
+                if not threshold_coord == reference_threshold_coord:
+                    msg = "Threshold coordinates differ between historic forecasts."
+                    raise ValueError(msg)
+                if not spatial_coords_match(reference, historic_forecasts):
+                    msg = "Spatial coordinates differ between historic forecasts."
+                    raise ValueError(msg)
+                forecast_coords_match(reference, historic_forecasts)
+            frt_coords.append(
+                create_unified_frt_coord(
+                    historic_forecasts.coord("forecast_reference_time")
+                )
+            )
+
+            threshold_slices = zip(
+                historic_forecasts.slices_over(threshold_coord),
+                truths.slices_over(threshold_coord),
+            )
+            for index, (forecast_slice, truth_slice) in enumerate(threshold_slices):
+                time_slices = zip(
+                    forecast_slice.slices_over("time"), truth_slice.slices_over("time"),
+                )
+                for forecast, truth in time_slices:
+                    forecast, truth = forecast.data, truth.data
+                    is_masked |= np.ma.is_masked(forecast) or np.ma.is_masked(truth)
+                    unmasked[index] |= self._accumulate_reliability_bins(
+                        tables[index], forecast, truth
+                    )
+
+        if reference is None:
+            raise ValueError("No historic forecasts and truths were provided.")
 
-        check_forecast_consistency(historic_forecasts)
         reliability_cube = self._create_reliability_table_cube(
-            historic_forecasts, threshold_coord
+            reference, reference_threshold_coord
         )
+        frt_coord = frt_coords[0].copy(
+            points=max(coord.points[0] for coord in frt_coords),
+            bounds=(
+                min(coord.bounds[0, 0] for coord in frt_coords),
+                max(coord.bounds[0, 1] for coord in frt_coords),
+            ),
+        )
+        reliability_cube.replace_coord(frt_coord)
 
-        populate_bins_func = self._populate_reliability_bins
-        if np.ma.is_masked(truths.data):
-            populate_bins_func = self._populate_masked_reliability_bins
+        if is_masked:
+            # Points that have not contributed to a table at any time are
+            # masked. Their table values are zero.
+            mask = np.empty(tables.shape, dtype=bool)
+            mask[...] = ~unmasked[:, np.newaxis, np.newaxis]
+            tables = np.ma.array(tables, mask=mask)
 
         reliability_tables = iris.cube.CubeList()
-        threshold_slices = zip(
-            historic_forecasts.slices_over(threshold_coord),
-            truths.slices_over(threshold_coord),
-        )
-        for forecast_slice, truth_slice in threshold_slices:
-
-            time_slices = zip(
-                forecast_slice.slices_over(time_coord),
-                truth_slice.slices_over(time_coord),
+        for index, threshold_slice in enumerate(
+            reference.slices_over(reference_threshold_coord)
+        ):
+            reliability_entry = reliability_cube.copy(data=tables[index])
+            reliability_entry.replace_coord(
+                threshold_slice.coord(reference_threshold_coord)
             )
-            forecast, truth = next(time_slices)
-            threshold_reliability = populate_bins_func(forecast.data, truth.data)
-
-            for forecast, truth in time_slices:
-                threshold_reliability = self._add_reliability_tables(
-                    forecast, truth, threshold_reliability
-                )
-
-            reliability_entry = reliability_cube.copy(data=threshold_reliability)
-            reliability_entry.replace_coord(forecast_slice.coord(threshold_coord))
             reliability_tables.append(reliability_entry)
 
         return MergeCubes()(reliability_tables, copy=False)
@@ -1013,26 +1027,26 @@ class ApplyReliabilityCalibration(PostProcessingPlugin):
         self.threshold_coord = None
 
     @staticmethod
-    def _extract_matching_reliability_table(forecast, reliability_table):
+    def _extract_matching_reliability_table(threshold, reliability_table):
         """
         Extract the reliability table with a threshold coordinate
-        matching the forecast cube.
+        matching a single forecast threshold.
         If no matching reliability table is found raise an exception.
 
         Args:
-            forecast (iris.cube.Cube):
-                The forecast to be calibrated.
+            threshold (iris.coords.Coord):
+                The threshold coordinate of the forecast to be calibrated,
+                containing a single threshold value.
             reliability_table (iris.cube.CubeList):
                 The reliability table to use for applying calibration.
         Returns:
             iris.cube.Cube:
                 A reliability table who's threshold coordinate matches
-                the forecast cube.
+                the forecast threshold.
         Raises:
             ValueError: If no matching reliability table is found.
         """
-        threshold_coord = find_threshold_coordinate(forecast)
-        coord_values = {threshold_coord.name(): threshold_coord.points}
+        coord_values = {threshold.name(): threshold.points}
         constr = iris.Constraint(coord_values=coord_values)
         if isinstance(reliability_table, iris.cube.Cube):
             extracted = reliability_table.extract(constr)
@@ -1041,7 +1055,7 @@ class ApplyReliabilityCalibration(PostProcessingPlugin):
         if not extracted:
             raise ValueError(
                 "No reliability table found to match threshold "
-                f"{find_threshold_coordinate(forecast).points[0]}."
+                f"{threshold.points[0]}."
             )
         return extracted
 
@@ -1135,21 +1149,75 @@ class ApplyReliabilityCalibration(PostProcessingPlugin):
 
         return forecast_probability, observation_frequency
 
+    def _calculate_reliability_curves(self, reliability_table):
+        """
+        Calculates the calibration curve for every forecast threshold from
+        the matching reliability table, and stacks the curves so that they
+        can be applied to all thresholds at once. Each curve is sorted by
+        reliability probability. Curves with fewer points than the longest
+        are padded at the end with infinite reliability probabilities and
+        missing observation frequencies, which are never used by
+        :meth:`_interpolate`.
+
+        Args:
+            reliability_table (iris.cube.Cube or iris.cube.CubeList):
+                The reliability table to use for applying calibration.
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+                Tuple containing the stacked reliability probabilities and
+                observation frequencies, each of shape (thresholds, points),
+                and a boolean array that is False for any threshold that
+                cannot be calibrated.
+        """
+        n_thresholds = len(self.threshold_coord.points)
+        curves = []
+        for index in range(n_thresholds):
+            reliability_threshold = self._extract_matching_reliability_table(
+                self.threshold_coord[index], reliability_table
+            )
+            (
+                reliability_probabilities,
+                observation_frequencies,
+            ) = self._calculate_reliability_probabilities(reliability_threshold)
+            if reliability_probabilities is None:
+                curves.append(None)
+                continue
+            order = np.argsort(reliability_probabilities, kind="mergesort")
+            curves.append(
+                (reliability_probabilities[order], observation_frequencies[order])
+            )
+
+        calibrated = np.array([curve is not None for curve in curves])
+        n_points = max([len(curve[0]) for curve in curves if curve] + [0])
+        probabilities = np.full((n_thresholds, n_points), np.inf, dtype=np.float32)
+        frequencies = np.full((n_thresholds, n_points), np.nan, dtype=np.float32)
+        for index, curve in enumerate(curves):
+            if curve:
+                probabilities[index, : len(curve[0])] = curve[0]
+                frequencies[index, : len(curve[1])] = curve[1]
+        return probabilities, frequencies, calibrated
+
     @staticmethod
-    def _interpolate(
-        forecast_threshold, reliability_probabilities, observation_frequencies
-    ):
+    def _interpolate(forecast, reliability_probabilities, observation_frequencies):
         """
         Perform interpolation of the forecast probabilities using the
         reliability table data to produce the calibrated forecast. Where
         necessary linear extrapolation will be applied. Any mask in place on
-        the forecast_threshold data is removed and reapplied after calibration.
+        the forecast data is removed and reapplied after calibration.
+
+        Calibration curves for several thresholds may be provided stacked
+        along the leading dimension, in which case each curve is applied to
+        the matching leading slice of the forecast. Every curve must be
+        sorted by reliability probability and may be padded at the end with
+        infinite reliability probabilities, as returned by
+        :meth:`_calculate_reliability_curves`.
 
         Args:
-            forecast_threshold (numpy.ndarray):
+            forecast (numpy.ndarray):
                 The forecast probabilities to be calibrated.
             reliability_probabilities (numpy.ndarray):
-                Probabilities taken from the reliability tables.
+                Probabilities taken from the reliability tables, either a
+                single curve or curves of shape (thresholds, points).
             observation_frequencies (numpy.ndarray):
                 Observation frequencies that relate to the reliability
                 probabilities, taken from the reliability tables.
@@ -1160,15 +1228,51 @@ class ApplyReliabilityCalibration(PostProcessingPlugin):
                 clipped to ensure any extrapolation has not yielded
                 probabilities outside the range 0 to 1.
         """
-        shape = forecast_threshold.shape
-        mask = forecast_threshold.mask if np.ma.is_masked(forecast_threshold) else None
-
-        forecast_probabilities = np.ma.getdata(forecast_threshold).flatten()
+        shape = forecast.shape
+        mask = forecast.mask if np.ma.is_masked(forecast) else None
+
+        reliability_probabilities = np.atleast_2d(reliability_probabilities)
+        observation_frequencies = np.atleast_2d(observation_frequencies)
+        n_curves, width = reliability_probabilities.shape
+        n_points = np.sum(reliability_probabilities != np.inf, axis=1, keepdims=True)
+        forecast_probabilities = np.ma.getdata(forecast).reshape(n_curves, -1)
+
+        # Each curve segment is described by its lower point and slope. The
+        # first and last segments are extended to extrapolate, so only the
+        # interior points of each curve separate segments.
+        valid_segments = np.arange(width - 1) < n_points - 1
+        with np.errstate(invalid="ignore"):
+            # Differences between padding points are never used.
+            probability_steps = np.diff(reliability_probabilities, axis=1)
+        slope = np.divide(
+            np.diff(observation_frequencies, axis=1),
+            probability_steps,
+            out=np.full(
+                probability_steps.shape,
+                np.nan,
+                dtype=np.result_type(observation_frequencies, probability_steps),
+            ),
+            where=valid_segments,
+        )
+        breakpoints = np.where(
+            valid_segments[:, 1:], reliability_probabilities[:, 1:-1], np.inf
+        )
 
-        interpolation_function = scipy.interpolate.interp1d(
-            reliability_probabilities, observation_frequencies, fill_value="extrapolate"
+        # Count the interior points below each value to find the segment it
+        # lies in, as numpy.searchsorted would, for all curves at once.
+        segment = np.zeros(
+            forecast_probabilities.shape, dtype=np.uint8 if width <= 256 else int
+        )
+        for breakpoint in breakpoints.T:
+            segment += breakpoint[:, np.newaxis] < forecast_probabilities
+        index = segment + np.arange(0, slope.size, width - 1)[:, np.newaxis]
+
+        lower_probabilities = reliability_probabilities[:, :-1].ravel().take(index)
+        lower_frequencies = observation_frequencies[:, :-1].ravel().take(index)
+        interpolated = (
+            slope.ravel().take(index) * (forecast_probabilities - lower_probabilities)
+            + lower_frequencies
         )
-        interpolated = interpolation_function(forecast_probabilities.data)
 
         interpolated = interpolated.reshape(shape).astype(np.float32)
 
@@ -1193,39 +1297,25 @@ class ApplyReliabilityCalibration(PostProcessingPlugin):
                 The forecast cube following calibration.
         """
         self.threshold_coord = find_threshold_coordinate(forecast)
-
-        forecast_thresholds = forecast.slices_over(self.threshold_coord)
-
-        uncalibrated_thresholds = []
-        calibrated_cubes = iris.cube.CubeList()
-        for forecast_threshold in forecast_thresholds:
-            reliability_threshold = self._extract_matching_reliability_table(
-                forecast_threshold, reliability_table
-            )
-            (
-                reliability_probabilities,
-                observation_frequencies,
-            ) = self._calculate_reliability_probabilities(reliability_threshold)
-
-            if reliability_probabilities is None:
-                calibrated_cubes.append(forecast_threshold)
-                uncalibrated_thresholds.append(
-                    forecast_threshold.coord(self.threshold_coord).points[0]
-                )
-                continue
-
-            interpolated = self._interpolate(
-                forecast_threshold.data,
-                reliability_probabilities,
-                observation_frequencies,
+        (
+            reliability_probabilities,
+            observation_frequencies,
+            calibrated,
+        ) = self._calculate_reliability_curves(reliability_table)
+
+        calibrated_forecast = forecast.copy()
+        if calibrated.any():
+            (threshold_dim,) = forecast.coord_dims(self.threshold_coord)
+            data = np.moveaxis(calibrated_forecast.data, threshold_dim, 0)
+            data[calibrated] = self._interpolate(
+                data[calibrated],
+                reliability_probabilities[calibrated],
+                observation_frequencies[calibrated],
             )
-
-            calibrated_cubes.append(forecast_threshold.copy(data=interpolated))
-
-        calibrated_forecast = calibrated_cubes.merge_cube()
         self._ensure_monotonicity_across_thresholds(calibrated_forecast)
 
-        if uncalibrated_thresholds:
+        if not calibrated.all():
+            uncalibrated_thresholds = self.threshold_coord.points[~calibrated].tolist()
             msg = (
                 "The following thresholds were not calibrated due to "
                 "insufficient forecast counts in reliability table bins: "
@@ -33,7 +33,7 @@
 import pathlib
 import shlex
 from collections import OrderedDict
-from functools import partial
+from functools import lru_cache, partial
 
 import clize
 from clize import parameters
@@ -354,7 +354,7 @@ def improver_help(prog_name: parameters.pass_name, command=None, *, usage=False)
     """Show command help."""
     prog_name = prog_name.split()[0]
     args = filter(None, [command, "--help", usage and "--usage"])
-    result = execute_command(SUBCOMMANDS_DISPATCHER, prog_name, *args)
+    result = execute_command(dispatch_subcommand, prog_name, *args)
     if not command and usage:
         result = "\n".join(
             line
@@ -364,31 +364,82 @@ def improver_help(prog_name: parameters.pass_name, command=None, *, usage=False)
     return result
 
 
-def _cli_items():
-    """Dynamically discover CLIs."""
-    import importlib
+@lru_cache()
+def _cli_names():
+    """Discover the names of the CLI modules, without importing them."""
     import pkgutil
     from improver.cli import __path__ as improver_cli_pkg_path
 
-    yield ("help", improver_help)
-    for minfo in pkgutil.iter_modules(improver_cli_pkg_path):
-        mod_name = minfo.name
-        if mod_name != "__main__":
-            mcli = importlib.import_module("improver.cli." + mod_name)
-            yield (mod_name, clizefy(mcli.process))
+    names = [
+        minfo.name
+        for minfo in pkgutil.iter_modules(improver_cli_pkg_path)
+        if minfo.name != "__main__"
+    ]
+    return sorted(names + ["help"])
+
+
+@lru_cache(maxsize=None)
+def _cli_item(mod_name):
+    """Import a CLI module and create its CLI object."""
+    import importlib
+
+    if mod_name == "help":
+        return improver_help
+    mcli = importlib.import_module("improver.cli." + mod_name)
+    return clizefy(mcli.process)
 
 
-SUBCOMMANDS_TABLE = OrderedDict(sorted(_cli_items()))
+def subcommands_table():
+    """Import all the CLI modules and create their CLI objects.
+
+    Returns:
+        collections.OrderedDict:
+            The CLI objects, keyed on module name.
+    """
+    return OrderedDict((mod_name, _cli_item(mod_name)) for mod_name in _cli_names())
+
+
+@lru_cache(maxsize=None)
+def _subcommands_dispatcher(mod_name=None):
+    """Create a dispatcher for a single subcommand, or for all of them if
+    mod_name is None."""
+    if mod_name is None:
+        table = subcommands_table()
+    else:
+        table = {mod_name: _cli_item(mod_name)}
+    return clizefy(
+        table,
+        description="""IMPROVER NWP post-processing toolbox""",
+        footnotes="""See also improver --help for more information.""",
+    )
 
 
 # main CLI object with subcommands
 
 
-SUBCOMMANDS_DISPATCHER = clizefy(
-    SUBCOMMANDS_TABLE,
-    description="""IMPROVER NWP post-processing toolbox""",
-    footnotes="""See also improver --help for more information.""",
-)
+def dispatch_subcommand(prog_name, *args):
+    """Dispatch to a subcommand, given as the first of args.
+
+    Only the module of the subcommand is imported, so that running a single
+    command is quick. All the CLI modules are imported if no known
+    subcommand is given, to list them in help or suggest the closest match
+    to an unknown command.
+
+    Args:
+        prog_name (str):
+            The program name.
+        args (str):
+            The subcommand and its arguments.
+
+    Returns:
+        Result of running the subcommand.
+    """
+    mod_name = None
+    if args and isinstance(args[0], str):
+        mod_name = args[0].lower().replace("-", "_")
+    if mod_name not in _cli_names():
+        mod_name = None
+    return _subcommands_dispatcher(mod_name)(prog_name, *args)
 
 
 # IMPROVER top level main
@@ -454,6 +505,8 @@ def main(
     *args,
     profile: value_converter(lambda _: _, name="FILENAME") = None,
     memprofile: value_converter(lambda _: _, name="FILENAME") = None,
+    trace: value_converter(lambda _: _, name="FILENAME") = None,
+    via_server: value_converter(lambda _: _, name="SOCKET") = None,
     verbose=False,
     dry_run=False,
 ):
@@ -482,6 +535,15 @@ def main(
             of your program (suffixed with _SNAPSHOT)
             and a track of the maximum memory used by your program
             over time (suffixed with _MAX_TRACKER).
+        trace (str):
+            If given, records the time and memory used by each plugin call
+            to the file given, as a Chrome trace if the file name ends with
+            .json, or as lines of JSON otherwise. Tracing can also be enabled
+            by setting the IMPROVER_PLUGIN_TRACE environment variable to a
+            file name.
+        via_server (str):
+            If given, send the command to be run by a server started with
+            improver serve, which listens on this Unix socket.
         verbose (bool):
             Print executed commands
         dry_run (bool):
@@ -490,6 +552,17 @@ def main(
     See improver help [--usage] [command] for more information
     on available command(s).
     """
+    if via_server is not None:
+        from improver.utilities.cli_server import run_via_server
+
+        if any(option is not None for option in (profile, memprofile, trace)):
+            raise ValueError("Profiling is not supported with --via-server")
+        options = [
+            option
+            for option, selected in (("--verbose", verbose), ("--dry-run", dry_run))
+            if selected
+        ]
+        return run_via_server(via_server, [*options, command, *args])
     args = unbracket(args)
     exec_cmd = execute_command
     if profile is not None:
@@ -500,8 +573,12 @@ def main(
         from improver.memprofile import memory_profile_decorator
 
         exec_cmd = memory_profile_decorator(exec_cmd, memprofile)
+    if trace is not None:
+        from improver.plugin_trace import trace_enable
+
+        trace_enable(trace)
     result = exec_cmd(
-        SUBCOMMANDS_DISPATCHER,
+        dispatch_subcommand,
         prog_name,
         command,
         *args,
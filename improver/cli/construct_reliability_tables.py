@@ -48,7 +48,9 @@ def process(
     Loads historical forecasts and gridded truths that are compared to build
     reliability tables. Reliability tables are returned as a cube with a
     leading threshold dimension that matches that of the forecast probability
-    cubes and the thresholded truth.
+    cubes and the thresholded truth. Each historic forecast is paired with the
+    truths at its validity time and added into the tables in turn, so the
+    data of the whole training period are not loaded at once.
 
     Args:
         cubes (list of iris.cube.Cube):
@@ -77,15 +79,15 @@ def process(
             Reliability tables for the forecast diagnostic with a leading
             threshold coordinate.
     """
-    from improver.calibration import split_forecasts_and_truth
+    from improver.calibration import pair_forecasts_and_truth
     from improver.calibration.reliability_calibration import (
         ConstructReliabilityCalibrationTables,
     )
 
-    forecast, truth, _ = split_forecasts_and_truth(cubes, truth_attribute)
+    forecasts_and_truths = pair_forecasts_and_truth(cubes, truth_attribute)
 
     return ConstructReliabilityCalibrationTables(
         n_probability_bins=n_probability_bins,
         single_value_lower_limit=single_value_lower_limit,
         single_value_upper_limit=single_value_upper_limit,
-    )(forecast, truth)
+    ).process_iterable(forecasts_and_truths)
@@ -46,6 +46,9 @@ def process(
     predictor="mean",
     tolerance: float = 0.01,
     max_iterations: int = 1000,
+    minimisation_method="Nelder-Mead",
+    point_by_point=False,
+    max_workers: int = 1,
 ):
     """Estimate coefficients for Ensemble Model Output Statistics.
 
@@ -91,6 +94,20 @@ def process(
             is raised. If the predictor is "realizations", then the number of
             iterations may require increasing, as there will be more
             coefficients to solve.
+        minimisation_method (str):
+            The method used to minimise the Continuous Ranked Probability
+            Score, one of "Nelder-Mead", "BFGS" or "L-BFGS-B". The
+            gradient-based BFGS and L-BFGS-B methods use the analytic gradient
+            of the CRPS and usually converge in far fewer iterations. For
+            these methods, the minimisation terminates once the gradient of
+            the CRPS is within the tolerance.
+        point_by_point (bool):
+            If True, coefficients are estimated independently at each grid
+            point or site, rather than for the whole domain. All points are
+            minimised together using the BFGS method.
+        max_workers (int):
+            The number of processes used to estimate the coefficients for
+            groups of points in parallel, if point_by_point is True.
 
     Returns:
         iris.cube.CubeList:
@@ -111,6 +128,9 @@ def process(
         predictor=predictor,
         tolerance=tolerance,
         max_iterations=max_iterations,
+        minimisation_method=minimisation_method,
+        point_by_point=point_by_point,
+        max_workers=max_workers,
     )
 
     return plugin(forecast, truth, landsea_mask=land_sea_mask)
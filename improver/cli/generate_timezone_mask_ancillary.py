@@ -42,6 +42,8 @@ def process(
     include_dst=False,
     time=None,
     groupings: cli.inputjson = None,
+    coarse_step: int = 1,
+    max_workers: int = 1,
 ):
     """Generate a timezone mask ancillary.
 
@@ -73,6 +75,16 @@ def process(
             group. The numbers in the lists denote the inclusive limits of the
             timezones for which that data should be used. This is of use if data
             is not available at hourly intervals.
+        coarse_step (int):
+            The spacing, in grid points, of a coarse grid on which the
+            timezones are found first. Timezones are then only found at the
+            grid points within coarse grid cells whose corners are not all at
+            the same UTC offset. This is much quicker for large grids, but
+            features smaller than a coarse grid cell may be missed. The default
+            of 1 finds the timezone of every grid point.
+        max_workers (int):
+            The maximum number of processes used to find the timezones of the
+            grid points in parallel.
 
     Returns:
         iris.cube.Cube:
@@ -86,5 +98,9 @@ def process(
     )
 
     return GenerateTimezoneMask(
-        include_dst=include_dst, time=time, groupings=groupings
+        include_dst=include_dst,
+        time=time,
+        groupings=groupings,
+        coarse_step=coarse_step,
+        max_workers=max_workers,
     )(cube)
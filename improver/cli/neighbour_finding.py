@@ -50,6 +50,7 @@ def process(
     site_coordinate_options=None,
     site_x_coordinate=None,
     site_y_coordinate=None,
+    cache_dir=None,
 ):
     """Create neighbour cubes for extracting spot data.
 
@@ -113,6 +114,12 @@ def process(
         site_y_coordinate (str):
             The key that identifies site y coordinates in the provided site
             dictionary. Defaults to latitude.
+        cache_dir (str):
+            Directory in which to cache the neighbours found for each site
+            and the KDTrees used to find them. Later runs for the same grid
+            reuse these, so that only the neighbours of sites that have been
+            added to the site list need to be found. The directory must only
+            be writable by trusted users.
 
     Returns:
         iris.cube.Cube:
@@ -182,6 +189,7 @@ def process(
         "site_x_coordinate": site_x_coordinate,
         "node_limit": node_limit,
         "site_y_coordinate": site_y_coordinate,
+        "cache_dir": cache_dir,
     }
     fargs = (site_list, orography, land_sea_mask)
     kwargs = {k: v for (k, v) in args.items() if v is not None}
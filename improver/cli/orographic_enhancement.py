@@ -80,6 +80,7 @@ def process(
     *,
     boundary_height: float = 1000.0,
     boundary_height_units="m",
+    stream_distances=False,
 ):
     """Calculate orographic enhancement
 
@@ -105,6 +106,10 @@ def process(
             enhancement, as proxy for the boundary layer.
         boundary_height_units (str):
             Units of the boundary height specified for extracting model levels.
+        stream_distances (bool):
+            If True, accumulate the upstream contributions one upstream
+            distance at a time, which reduces the memory required for large
+            grids.
 
     Returns:
         iris.cube.Cube:
@@ -125,6 +130,6 @@ def process(
     # resolve u and v wind components
     u_wind, v_wind = ResolveWindComponents()(wind_speed, wind_direction)
     # calculate orographic enhancement
-    return OrographicEnhancement()(
+    return OrographicEnhancement(stream_distances=stream_distances)(
         temperature, humidity, pressure, u_wind, v_wind, orography
     )
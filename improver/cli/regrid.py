@@ -45,6 +45,7 @@ def process(
     extrapolation_mode="nanmask",
     land_sea_mask_vicinity: float = 25000,
     regridded_title: str = None,
+    cache_dir: str = None,
 ):
     """Regrids source cube data onto a target grid. Optional land-sea awareness.
 
@@ -83,6 +84,11 @@ def process(
             New "title" attribute to be set if the field is being regridded
             (since "title" may contain grid information). If None, a default
             value is used.
+        cache_dir (str):
+            Directory in which to cache the regridding weights, including any
+            land-sea corrections, for each pair of source and target grids.
+            Later runs regridding between the same grids reuse these rather
+            than recalculating them.
 
     Returns:
         iris.cube.Cube:
@@ -110,4 +116,5 @@ def process(
         extrapolation_mode=extrapolation_mode,
         landmask=land_sea_mask,
         landmask_vicinity=land_sea_mask_vicinity,
+        cache_dir=cache_dir,
     )(cube, target_grid, regridded_title=regridded_title)
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Script to run a graph of improver commands in one process."""
+
+from improver import cli
+
+
+@cli.clizefy
+def process(graph_path, *, max_workers: int = 1, verbose=False):
+    """Run a graph of improver commands, passing results between them in memory.
+
+    Each node of the graph runs one improver command with the given
+    arguments. An argument "@name" is replaced by the result of the node of
+    that name without writing it to file, so only the outputs declared in
+    the graph are written. Nodes that do not depend on each other are run
+    concurrently, and the result of each node is released once the last
+    node using it has started. For example, in YAML::
+
+        wet_bulb:
+          command: wet-bulb-temperature
+          args: [temperature.nc, humidity.nc, pressure.nc]
+        wet_bulb_probability:
+          command: threshold
+          args: ["@wet_bulb", --threshold-values, "273.15"]
+          output: wet_bulb_probability.nc
+
+    Args:
+        graph_path (str):
+            Path of a JSON file describing the graph, or a YAML file if it
+            has a .yaml or .yml extension, which requires PyYAML. The file
+            contains a mapping of node names to nodes, each with a "command",
+            a list of "args" and an optional "output" path.
+        max_workers (int):
+            Maximum number of commands to run at the same time.
+        verbose (bool):
+            Print each command as it is run.
+    """
+    from improver.utilities.command_graph import load_graph, run_graph
+
+    run_graph(load_graph(graph_path), max_workers=max_workers, verbose=verbose)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Script to run a server that runs improver commands sent with
+`improver --via-server`"""
+
+from improver import cli
+
+
+@cli.clizefy
+def process(socket_path, *, max_tasks: int = 100, workers: int = 1):
+    """Run improver commands sent to a Unix socket, until terminated.
+
+    Running a command in a new process spends much of its time importing
+    modules, which can be longer than the command itself takes for small
+    inputs. The server imports commonly used modules once, then runs the
+    commands sent by `improver --via-server SOCKET_PATH command ...` in
+    long-lived worker processes, which also keep any in-memory caches
+    between commands. The output of each command is sent back to
+    `improver --via-server` as it is written, followed by its exit status.
+
+    Args:
+        socket_path (str):
+            Path of the Unix socket on which to listen for commands. This must
+            not already exist, and is removed when the server stops.
+        max_tasks (int):
+            Number of commands each worker runs before it is replaced by a new
+            worker, to limit memory growth.
+        workers (int):
+            Number of worker processes, and so the number of commands that can
+            run at the same time.
+    """
+    from improver.utilities.cli_server import serve
+
+    serve(socket_path, max_tasks=max_tasks, workers=workers)
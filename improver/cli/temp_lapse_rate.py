@@ -44,6 +44,7 @@ def process(
     land_sea_mask: cli.inputcube = None,
     *,
     max_height_diff: float = 35,
+    ignore_height_diff=False,
     nbhood_radius: int = 7,
     max_lapse_rate: float = -3 * DALR,
     min_lapse_rate: float = DALR,
@@ -64,6 +65,11 @@ def process(
             Maximum allowable height difference between the central point and
             points in the neighbourhood over which the lapse rate will be
             calculated.
+        ignore_height_diff (bool):
+            If True, all points in the neighbourhood are used regardless of
+            their height difference from the central point and
+            max_height_diff is ignored. This allows a faster calculation
+            whose cost does not depend on the neighbourhood size.
         nbhood_radius (int):
             Radius of neighbourhood in grid points around each point. The
             neighbourhood is a square array with side length
@@ -115,7 +121,9 @@ def process(
         msg = "Minimum lapse rate specified is greater than the maximum."
         raise ValueError(msg)
 
-    if max_height_diff < 0:
+    if ignore_height_diff:
+        max_height_diff = None
+    elif max_height_diff < 0:
         msg = "Maximum height difference specified is less than zero."
         raise ValueError(msg)
 
@@ -37,7 +37,12 @@ from improver import cli
 
 @cli.clizefy
 @cli.with_output
-def process(*cubes: cli.inputcube, convergence_condition=0.05):
+def process(
+    *cubes: cli.inputcube,
+    convergence_condition=0.05,
+    whole_cube=False,
+    lookup_table=False,
+):
     """Module to generate wet-bulb temperatures.
 
     Call the calculate_wet_bulb_temperature function to calculate wet-bulb
@@ -59,6 +64,14 @@ def process(*cubes: cli.inputcube, convergence_condition=0.05):
         convergence_condition (float):
             The precision in Kelvin to which the Newton iterator must converge
             before returning wet-bulb temperatures.
+        whole_cube (bool):
+            If True, calculate wet-bulb temperatures for the whole of the
+            input cubes in chunks of bounded size, rather than splitting them
+            over vertical levels. The input cubes must have matching
+            dimensions.
+        lookup_table (bool):
+            If True, use wet-bulb temperatures interpolated from a lookup
+            table as the first guess for the Newton iterator.
 
     Returns:
         iris.cube.Cube:
@@ -69,4 +82,8 @@ def process(*cubes: cli.inputcube, convergence_condition=0.05):
         WetBulbTemperature,
     )
 
-    return WetBulbTemperature(precision=convergence_condition)(cubes)
+    return WetBulbTemperature(
+        precision=convergence_condition,
+        whole_cube=whole_cube,
+        lookup_table=lookup_table,
+    )(cubes)
@@ -37,7 +37,7 @@ import warnings
 import iris
 import numpy as np
 from iris.exceptions import CoordinateNotFoundError, InvalidCubeError
-from scipy import stats
+from scipy import special, stats
 
 from improver import BasePlugin
 from improver.calibration.utilities import convert_cube_data_to_2d
@@ -67,6 +67,7 @@ from improver.utilities.cube_manipulation import (
     get_dim_coord_names,
 )
 from improver.utilities.indexing_operations import choose
+from improver.utilities.interpolation import interpolate_rows
 
 
 class RebadgePercentilesAsRealizations(BasePlugin):
@@ -270,16 +271,9 @@ class ResamplePercentiles(BasePlugin):
             original_percentiles, forecast_at_reshaped_percentiles, bounds_pairing
         )
 
-        forecast_at_interpolated_percentiles = np.empty(
-            (len(desired_percentiles), forecast_at_reshaped_percentiles.shape[0]),
-            dtype=np.float32,
-        )
-        for index in range(forecast_at_reshaped_percentiles.shape[0]):
-            forecast_at_interpolated_percentiles[:, index] = np.interp(
-                desired_percentiles,
-                original_percentiles,
-                forecast_at_reshaped_percentiles[index, :],
-            )
+        forecast_at_interpolated_percentiles = interpolate_rows(
+            desired_percentiles, original_percentiles, forecast_at_reshaped_percentiles
+        ).T.astype(np.float32)
 
         # Reshape forecast_at_percentiles, so the percentiles dimension is
         # first, and any other dimension coordinates follow.
@@ -539,19 +533,9 @@ class ConvertProbabilitiesToPercentiles(BasePlugin):
             [x / 100.0 for x in percentiles], dtype=np.float32
         )
 
-        forecast_at_percentiles = (
-            # pylint: disable=unsubscriptable-object
-            np.empty(
-                (len(percentiles), probabilities_for_cdf.shape[0]), dtype=np.float32
-            )
-        )
-        # pylint: disable=unsubscriptable-object
-        for index in range(probabilities_for_cdf.shape[0]):
-            forecast_at_percentiles[:, index] = np.interp(
-                percentiles_as_fractions,
-                probabilities_for_cdf[index, :],
-                threshold_points,
-            )
+        forecast_at_percentiles = interpolate_rows(
+            percentiles_as_fractions, probabilities_for_cdf, threshold_points
+        ).T.astype(np.float32)
 
         # Reshape forecast_at_percentiles, so the percentiles dimension is
         # first, and any other dimension coordinates follow.
@@ -678,6 +662,10 @@ class ConvertLocationAndScaleParameters:
     probabilities from the location and scale parameters.
     """
 
+    # Number of points for which to evaluate the distribution together,
+    # limiting memory use
+    CHUNK_SIZE = 65536
+
     def __init__(self, distribution="norm", shape_parameters=None):
         """
         Initialise the class.
@@ -769,6 +757,122 @@ calculate_truncated_normal_crps`,
                 rescaled_values.append((value - location_parameter) / scale_parameter)
             self.shape_parameters = rescaled_values
 
+    def _evaluate_distribution(self, method, values, location, scale):
+        """
+        Evaluate the percent point function ("ppf"), cumulative distribution
+        function ("cdf") or survival function ("sf") of the distribution at
+        each of the values for every point, given the location and scale
+        parameters at each point and the shape parameters, which should
+        already have been rescaled for these parameters. The normal and
+        truncated normal distributions are evaluated directly using
+        scipy.special, and other distributions using scipy.stats. The points
+        are evaluated in chunks to limit memory use.
+
+        Args:
+            method (str):
+                The name of the method to evaluate: "ppf", "cdf" or "sf".
+            values (numpy.ndarray):
+                One-dimensional array of the probabilities or thresholds at
+                which to evaluate the method.
+            location (numpy.ndarray):
+                One-dimensional array of the location parameter at each point.
+            scale (numpy.ndarray):
+                One-dimensional array of the scale parameter at each point.
+
+        Returns:
+            numpy.ndarray:
+                Array of shape (number of values, number of points). As for
+                scipy.stats, the result is NaN at points where the
+                distribution parameters are not valid.
+        """
+        values = np.asarray(values, dtype=np.float64)[:, np.newaxis]
+        location = np.asarray(location, dtype=np.float64)
+        scale = np.asarray(scale, dtype=np.float64)
+        shape_parameters = [
+            np.broadcast_to(np.asarray(value, dtype=np.float64), location.shape)
+            for value in self.shape_parameters
+        ]
+        result = np.empty((len(values), len(location)), dtype=np.float64)
+        for start in range(0, len(location), self.CHUNK_SIZE):
+            chunk = slice(start, start + self.CHUNK_SIZE)
+            result[:, chunk] = self._evaluate_distribution_chunk(
+                method,
+                values,
+                location[chunk],
+                scale[chunk],
+                [value[chunk] for value in shape_parameters],
+            )
+        return result
+
+    def _evaluate_distribution_chunk(
+        self, method, values, location, scale, shape_parameters
+    ):
+        """
+        Evaluate a method of the distribution for a chunk of points.  See
+        _evaluate_distribution.
+        """
+        name = self.distribution.name
+        if name == "norm":
+            lower = np.full(location.shape, -np.inf)
+            upper = np.full(location.shape, np.inf)
+        elif name == "truncnorm":
+            lower, upper = shape_parameters
+        else:
+            distribution = self.distribution(
+                *shape_parameters, loc=location, scale=scale
+            )
+            return getattr(distribution, method)(values)
+
+        # Where the lower bound is above the mean, evaluate the mirror image
+        # of the truncated normal distribution, which is more accurate.
+        mirror = lower > 0
+        lower, upper = np.where(mirror, -upper, lower), np.where(mirror, -lower, upper)
+        cdf_lower = special.ndtr(lower)
+        cdf_range = special.ndtr(upper) - cdf_lower
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if method == "ppf":
+                probability = np.where(mirror, 1 - values, values)
+                cdf = cdf_lower + probability * cdf_range
+                # Near a finite upper bound, invert the survival function
+                # instead, which is more accurate.
+                sf = special.ndtr(-upper) + (1 - probability) * cdf_range
+                standard = np.where(
+                    (cdf > 0.5) & np.isfinite(upper),
+                    -special.ndtri(sf),
+                    special.ndtri(cdf),
+                )
+                standard = np.clip(standard, lower, upper)
+                standard[(probability < 0) | (probability > 1)] = np.nan
+                result = location + scale * np.where(mirror, -standard, standard)
+            else:
+                standard = (values - location) / scale
+                standard = np.clip(np.where(mirror, -standard, standard), lower, upper)
+                cdf = (special.ndtr(standard) - cdf_lower) / cdf_range
+                sf = np.where(
+                    (standard > 0) | np.isinf(upper),
+                    special.ndtr(-standard) - special.ndtr(-upper),
+                    special.ndtr(upper) - special.ndtr(standard),
+                )
+                sf = sf / cdf_range
+                # The survival function is the cumulative distribution
+                # function of the mirror image, and vice versa
+                result = np.where(mirror != (method == "sf"), sf, cdf)
+
+        valid = (scale > 0) & (lower < upper)
+        result[:, ~valid] = np.nan
+        # Truncations so far into the tail that the probability within the
+        # bounds underflows are left to scipy.stats
+        underflow = valid & ~(cdf_range > np.finfo(np.float64).tiny)
+        if np.any(underflow):
+            distribution = self.distribution(
+                *[value[underflow] for value in shape_parameters],
+                loc=location[underflow],
+                scale=scale[underflow],
+            )
+            result[:, underflow] = getattr(distribution, method)(values)
+        return result
+
 
 class ConvertLocationAndScaleParametersToPercentiles(
     BasePlugin, ConvertLocationAndScaleParameters
@@ -826,34 +930,28 @@ class ConvertLocationAndScaleParametersToPercentiles(
         # Convert percentiles into fractions.
         percentiles = np.array([x / 100.0 for x in percentiles], dtype=np.float32)
 
-        result = np.zeros((len(percentiles), location_data.shape[0]), dtype=np.float32)
-
         self._rescale_shape_parameters(location_data, np.sqrt(scale_data))
 
-        percentile_method = self.distribution(
-            *self.shape_parameters, loc=location_data, scale=np.sqrt(scale_data)
-        )
-
-        # Loop over percentiles, and use the distribution as the
-        # "percentile_method" with the location and scale parameter to
-        # calculate the values at each percentile.
-        for index, percentile in enumerate(percentiles):
-            percentile_list = np.repeat(percentile, len(location_data))
-            result[index, :] = percentile_method.ppf(percentile_list)
-            # If percent point function (PPF) returns NaNs, fill in
-            # mean instead of NaN values. NaN will only be generated if the
-            # variance is zero. Therefore, if the variance is zero, the mean
-            # value is used for all gridpoints with a NaN.
-            if np.any(scale_data == 0):
-                nan_index = np.argwhere(np.isnan(result[index, :]))
-                result[index, nan_index] = location_data[nan_index]
-            if np.any(np.isnan(result)):
-                msg = (
-                    "NaNs are present within the result for the {} "
-                    "percentile. Unable to calculate the percent point "
-                    "function."
-                )
-                raise ValueError(msg)
+        # Use the distribution with the location and scale parameter to
+        # calculate the values at all the percentiles together.
+        result = self._evaluate_distribution(
+            "ppf", percentiles, location_data, np.sqrt(scale_data)
+        ).astype(np.float32)
+        # If percent point function (PPF) returns NaNs, fill in
+        # mean instead of NaN values. NaN will only be generated if the
+        # variance is zero. Therefore, if the variance is zero, the mean
+        # value is used for all gridpoints with a NaN.
+        zero_variance = scale_data == 0
+        if np.any(zero_variance):
+            result[:, zero_variance] = location_data[zero_variance]
+        nan_percentiles = np.isnan(result).any(axis=1)
+        if np.any(nan_percentiles):
+            msg = (
+                "NaNs are present within the result for the {} "
+                "percentile. Unable to calculate the percent point "
+                "function."
+            )
+            raise ValueError(msg.format(100.0 * percentiles[nan_percentiles][0]))
 
         # Convert percentiles back into percentages.
         percentiles = [x * 100.0 for x in percentiles]
@@ -1064,26 +1162,22 @@ class ConvertLocationAndScaleParametersToProbabilities(
             location_parameter.data.flatten(), np.sqrt(scale_parameter.data).flatten()
         )
 
-        # Loop over thresholds, and use the specified distribution with the
-        # location and scale parameter to calculate the probabilities relative
-        # to each threshold.
-        probabilities = np.empty_like(probability_cube_template.data)
-
-        distribution = self.distribution(
-            *self.shape_parameters,
-            loc=location_parameter.data.flatten(),
-            scale=np.sqrt(scale_parameter.data.flatten()),
-        )
-
-        probability_method = distribution.cdf
+        # Use the specified distribution with the location and scale
+        # parameter to calculate the probabilities relative to all the
+        # thresholds together.
+        probability_method = "cdf"
         if relative_to_threshold == "above":
-            probability_method = distribution.sf
+            probability_method = "sf"
 
-        for index, threshold in enumerate(thresholds):
-            # pylint: disable=unsubscriptable-object
-            probabilities[index, ...] = np.reshape(
-                probability_method(threshold), probabilities.shape[1:]
-            )
+        probabilities = self._evaluate_distribution(
+            probability_method,
+            thresholds,
+            location_parameter.data.flatten(),
+            np.sqrt(scale_parameter.data.flatten()),
+        )
+        probabilities = probabilities.reshape(probability_cube_template.shape).astype(
+            probability_cube_template.dtype
+        )
 
         probability_cube = probability_cube_template.copy(data=probabilities)
         # Make the mask defined above fit the data size and then apply to the
@@ -30,6 +30,7 @@
 # POSSIBILITY OF SUCH DAMAGE.
 """A module for creating a saturated vapour pressure table"""
 
+import os
 import warnings
 
 import iris
@@ -37,6 +38,7 @@ import numpy as np
 
 from improver import BasePlugin
 from improver.constants import TRIPLE_PT_WATER
+from improver.utilities.save import atomic_write
 
 
 class SaturatedVapourPressureTable(BasePlugin):
@@ -123,26 +125,28 @@ class SaturatedVapourPressureTable(BasePlugin):
             msg = "Temperatures out of SVP table range: min {}, max {}"
             warnings.warn(msg.format(temperature.min(), temperature.max()))
 
+        # Calculate the SVP over water above the triple point and over ice
+        # below it, evaluating both branches for all temperatures at once.
         svp = temperature.copy()
-        for cell in np.nditer(svp, op_flags=["readwrite"]):
-            if cell > triple_pt:
-                n0 = constants[1] * (1.0 - triple_pt / cell)
-                n1 = constants[2] * np.log10(cell / triple_pt)
-                n2 = constants[3] * (
-                    1.0 - np.power(10.0, (constants[4] * (cell / triple_pt - 1.0)))
-                )
-                n3 = constants[5] * (
-                    np.power(10.0, (constants[6] * (1.0 - triple_pt / cell))) - 1.0
-                )
-                log_es = n0 - n1 + n2 + n3 + constants[7]
-                cell[...] = np.power(10.0, log_es)
-            else:
-                n0 = constants[8] * ((triple_pt / cell) - 1.0)
-                n1 = constants[9] * np.log10(triple_pt / cell)
-                n2 = constants[10] * (1.0 - (cell / triple_pt))
-                log_es = n0 - n1 + n2 + constants[11]
-                cell[...] = np.power(10.0, log_es)
+        temperature = temperature.astype(np.float64)
+        n0 = constants[1] * (1.0 - triple_pt / temperature)
+        n1 = constants[2] * np.log10(temperature / triple_pt)
+        n2 = constants[3] * (
+            1.0 - np.power(10.0, (constants[4] * (temperature / triple_pt - 1.0)))
+        )
+        n3 = constants[5] * (
+            np.power(10.0, (constants[6] * (1.0 - triple_pt / temperature))) - 1.0
+        )
+        log_es_water = n0 - n1 + n2 + n3 + constants[7]
 
+        n0 = constants[8] * ((triple_pt / temperature) - 1.0)
+        n1 = constants[9] * np.log10(triple_pt / temperature)
+        n2 = constants[10] * (1.0 - (temperature / triple_pt))
+        log_es_ice = n0 - n1 + n2 + constants[11]
+
+        svp[...] = np.power(
+            10.0, np.where(temperature > triple_pt, log_es_water, log_es_ice)
+        )
         return svp
 
     def process(self):
@@ -177,3 +181,49 @@ class SaturatedVapourPressureTable(BasePlugin):
         svp.attributes["temperature_increment"] = self.t_increment
 
         return svp
+
+
+def svp_table(t_min, t_max, t_increment, cache_dir=None):
+    """
+    Get the data of a saturated vapour pressure table, optionally from a cache
+    of tables held as .npy files within a directory. Tables are found in the
+    cache by their temperature range and increment, and are memory-mapped
+    rather than read so that processes using the same cache share a single
+    copy. Tables that are not found are created and added to the cache.
+
+    Args:
+        t_min (float):
+            The minimum temperature for the range, in Kelvin.
+        t_max (float):
+            The maximum temperature for the range, in Kelvin.
+        t_increment (float):
+            The temperature increment at which to create values for the
+            saturated vapour pressure between t_min and t_max.
+        cache_dir (str or None):
+            The directory in which the cached tables are kept. This is created
+            if it does not exist. If None, the table is always created.
+
+    Returns:
+        numpy.ndarray:
+            Array of saturated vapour pressures (Pa).
+    """
+    if cache_dir is None:
+        svp = SaturatedVapourPressureTable(
+            t_min=t_min, t_max=t_max, t_increment=t_increment
+        ).process()
+        return svp.data
+
+    path = os.path.join(
+        cache_dir, "svp_table_{!r}_{!r}_{!r}.npy".format(t_min, t_max, t_increment)
+    )
+    try:
+        return np.asarray(np.load(path, mmap_mode="r", allow_pickle=False))
+    except (OSError, EOFError, ValueError):
+        pass
+
+    svp_data = svp_table(t_min, t_max, t_increment)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    with atomic_write(path) as cache_file:
+        np.save(cache_file, svp_data, allow_pickle=False)
+    return svp_data
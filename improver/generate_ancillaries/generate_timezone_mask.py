@@ -32,6 +32,7 @@
 
 import importlib
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 import iris
@@ -68,7 +69,18 @@ class GenerateTimezoneMask(BasePlugin):
     to generate the masks.
     """
 
-    def __init__(self, include_dst=False, time=None, groupings=None):
+    # Number of chunks of coordinates given to each worker process, so that
+    # workers finishing early can take on more of the work.
+    CHUNKS_PER_WORKER = 4
+
+    def __init__(
+        self,
+        include_dst=False,
+        time=None,
+        groupings=None,
+        coarse_step=1,
+        max_workers=1,
+    ):
         """
         Configure plugin options to generate the desired ancillary.
 
@@ -89,6 +101,17 @@ class GenerateTimezoneMask(BasePlugin):
                 The numbers in the lists denote the inclusive limits of the
                 groups. This is of use if data is not available at hourly
                 intervals.
+            coarse_step (Optional[int]):
+                The spacing, in grid points, of a coarse grid on which the
+                timezones are found first. Timezones are then only found at
+                the points of the full grid that lie within coarse grid cells
+                whose corners are not all at the same UTC offset. Features
+                smaller than a coarse grid cell, e.g. small islands, that do not
+                reach the corners of a cell may be missed. The default of 1
+                finds the timezone of every grid point.
+            max_workers (Optional[int]):
+                The maximum number of processes used to find the timezones of
+                the grid points in parallel.
         """
         try:
             importlib.util.find_spec("timezonefinder")
@@ -101,6 +124,26 @@ class GenerateTimezoneMask(BasePlugin):
         self.time = time
         self.include_dst = include_dst
         self.groupings = groupings
+        self.coarse_step = coarse_step
+        self.max_workers = max_workers
+        # UTC offsets in seconds, memoised by timezone name.
+        self._zone_offsets = {}
+
+    def __getstate__(self):
+        """
+        Exclude the TimezoneFinder, which holds open files, when the plugin is
+        pickled to be sent to a worker process.
+        """
+        state = self.__dict__.copy()
+        del state["tf"]
+        return state
+
+    def __setstate__(self, state):
+        """Restore the plugin with a new TimezoneFinder."""
+        from timezonefinder import TimezoneFinder
+
+        self.__dict__.update(state)
+        self.tf = TimezoneFinder()
 
     def _set_time(self, cube):
         """
@@ -112,6 +155,8 @@ class GenerateTimezoneMask(BasePlugin):
                 The cube from which the validity time should be taken if one
                 has not been explicitly provided by the user.
         """
+        # Offsets memoised for a previous time may not be valid at this time.
+        self._zone_offsets = {}
         if self.time:
             self.time = datetime.strptime(self.time, "%Y%m%dT%H%MZ")
             self.time = pytz.utc.localize(self.time)
@@ -200,10 +245,96 @@ class GenerateTimezoneMask(BasePlugin):
 
         return np.array(grid_offsets, dtype=np.int32)
 
+    def _query_tz_offsets(self, coordinate_pairs):
+        """
+        Calculate the offset from UTC in seconds for each of the coordinates
+        provided, splitting the coordinates between worker processes if more
+        than one worker is allowed.
+
+        Args:
+            coordinate_pairs (numpy.array):
+                A numpy array containing pairs of coordinates, with shape
+                (number of points, 2).
+        Returns:
+            numpy.array:
+                A 1-dimensional array of offsets for the coordinate pairs.
+        """
+        if self.max_workers > 1 and len(coordinate_pairs) > 1:
+            chunks = np.array_split(
+                coordinate_pairs,
+                min(len(coordinate_pairs), self.max_workers * self.CHUNKS_PER_WORKER),
+            )
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                return np.concatenate(
+                    list(executor.map(self._calculate_tz_offsets, chunks))
+                )
+        return self._calculate_tz_offsets(coordinate_pairs)
+
+    def _calculate_grid_offsets(self, coordinate_pairs):
+        """
+        Calculate the offset from UTC in seconds for each point of the grid,
+        working from a coarse grid to the full grid.
+
+        The offsets are first calculated on a coarse grid of points that are
+        self.coarse_step grid points apart, including the last row and column.
+        Wherever the four corners of a coarse grid cell have the same offset,
+        the points within the cell are given that offset. The spacing is then
+        halved and the offsets calculated at the points of the new coarse grid
+        that are still unknown, until the spacing is one grid point and all the
+        remaining points have been calculated.
+
+        Args:
+            coordinate_pairs (numpy.array):
+                A numpy array containing all the pairs of coordinates that describe
+                the y-x points in the grid. This array is 3-dimensional, with shape
+                (len(y-points), len(x-points), 2).
+        Returns:
+            numpy.array:
+                A 1-dimensional array of grid offsets with a length equal
+                to the product of the grid's y-x dimension lengths.
+        """
+        shape = coordinate_pairs.shape[:-1]
+        grid_offsets = np.zeros(shape, dtype=np.int32)
+        known = np.zeros(shape, dtype=bool)
+        step = self.coarse_step
+        while True:
+            rows, columns = [
+                np.unique(np.append(np.arange(0, length, step), length - 1))
+                for length in shape
+            ]
+            nodes = np.ix_(rows, columns)
+            node_offsets = grid_offsets[nodes]
+            unknown = ~known[nodes]
+            node_offsets[unknown] = self._query_tz_offsets(
+                coordinate_pairs[nodes][unknown]
+            )
+            grid_offsets[nodes] = node_offsets
+            known[nodes] = True
+            if step == 1:
+                return grid_offsets.flatten()
+
+            if len(rows) > 1 and len(columns) > 1:
+                corner = node_offsets[:-1, :-1]
+                uniform = (
+                    (corner == node_offsets[1:, :-1])
+                    & (corner == node_offsets[:-1, 1:])
+                    & (corner == node_offsets[1:, 1:])
+                )
+                # Index of the coarse grid cell that contains each point.
+                cells = np.ix_(
+                    np.searchsorted(rows[1:-1], np.arange(shape[0]), side="right"),
+                    np.searchsorted(columns[1:-1], np.arange(shape[1]), side="right"),
+                )
+                fill = ~known & uniform[cells]
+                grid_offsets[fill] = corner[cells][fill]
+                known |= fill
+            step //= 2
+
     def _calculate_offset(self, point_tz):
         """
         Calculates the offset in seconds from UTC for a given timezone, either
-        with or without consideration of daylight savings.
+        with or without consideration of daylight savings. The offset is
+        memoised, as there are far fewer timezones than grid points.
 
         Args:
             point_tz (str):
@@ -213,19 +344,23 @@ class GenerateTimezoneMask(BasePlugin):
             int:
                 Timezone offset from UTC in seconds.
         """
+        if point_tz in self._zone_offsets:
+            return self._zone_offsets[point_tz]
+
         # The timezone for Ireland does not capture DST:
         # https://github.com/regebro/tzlocal/issues/80
         if point_tz == "Europe/Dublin":
-            point_tz = "Europe/London"
-
-        target = timezone(point_tz)
+            target = timezone("Europe/London")
+        else:
+            target = timezone(point_tz)
         local = self.time.astimezone(target)
         offset = local.utcoffset()
 
         if not self.include_dst:
             offset -= local.dst()
 
-        return int(offset.total_seconds())
+        self._zone_offsets[point_tz] = int(offset.total_seconds())
+        return self._zone_offsets[point_tz]
 
     def _create_template_cube(self, cube):
         """
@@ -335,7 +470,9 @@ class GenerateTimezoneMask(BasePlugin):
         """
         self._set_time(cube)
         coordinate_pairs = self._get_coordinate_pairs(cube)
-        grid_offsets = self._calculate_tz_offsets(coordinate_pairs)
+        grid_offsets = self._calculate_grid_offsets(
+            coordinate_pairs.reshape(cube.shape + (2,))
+        )
 
         # Model data is hourly, so we need offsets at hourly fidelity. This
         # rounds non-integer hour timezone offsets to the nearest hour.
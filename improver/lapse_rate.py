@@ -33,6 +33,7 @@
 import iris
 import numpy as np
 from iris.exceptions import CoordinateNotFoundError
+from scipy.ndimage import maximum_filter, minimum_filter
 
 from improver import BasePlugin, PostProcessingPlugin
 from improver.constants import DALR
@@ -40,7 +41,7 @@ from improver.metadata.utilities import (
     create_new_diagnostic_cube,
     generate_mandatory_attributes,
 )
-from improver.utilities import mathematical_operations, neighbourhood_tools
+from improver.utilities import neighbourhood_tools
 from improver.utilities.cube_checker import spatial_coords_match
 from improver.utilities.cube_manipulation import (
     enforce_coordinate_ordering,
@@ -154,20 +155,28 @@ class LapseRate(BasePlugin):
     1) Apply land/sea mask to temperature and orography datasets. Mask sea
        points as NaN since image processing module does not recognise Numpy
        masks.
-    2) Creates "views" of both datasets, where each view represents a
-       neighbourhood of points. To do this, each array is padded with
-       NaN values to a width of half the neighbourhood size.
-    3) For all the stored orography neighbourhoods - take the neighbours around
-       the central point and create a mask where the height difference from
-       the central point is greater than 35m.
-    4) Loop through array of neighbourhoods and take the height and temperature
-       of all grid points and calculate the
-       temperature/height gradient = lapse rate
-    5) Constrain the returned lapse rates between min_lapse_rate and
+    2) Accumulate the sums of height, temperature and their squares and
+       products over the neighbourhood of every point. Points outside the
+       domain, sea points and neighbours whose height differs from that of the
+       central point by more than max_height_diff (35m by default) are
+       excluded from the sums.
+    3) Calculate the temperature/height gradient = lapse rate of every
+       neighbourhood from these sums, i.e. the gradient of a linear least
+       squares fit.
+    4) Constrain the returned lapse rates between min_lapse_rate and
        max_lapse_rate. These default to > DALR and < -3.0*DALR but are user
        configurable
+
+    The height difference screen depends upon the central point of each
+    neighbourhood, so the sums are accumulated one neighbourhood offset at a
+    time for the whole grid. If the screen is disabled, the sums are instead
+    calculated with box sums, at a cost independent of the neighbourhood size.
     """
 
+    # Number of grid points, across all realizations, for which the screened
+    # sums are accumulated together, keeping the working arrays small
+    CHUNK_SIZE = 32768
+
     def __init__(
         self,
         max_height_diff=35,
@@ -180,11 +189,14 @@ class LapseRate(BasePlugin):
         code.
 
         Args:
-            max_height_diff (float):
+            max_height_diff (float or None):
                 Maximum allowable height difference between the central point
                 and points in the neighbourhood over which the lapse rate will
                 be calculated (metres).
-                The default value of 35m is from the referenced paper.
+                The default value of 35m is from the referenced paper. If
+                None, all points in the neighbourhood are used, which allows
+                a faster calculation that is independent of the neighbourhood
+                size.
 
             nbhood_radius (int):
                 Radius of neighbourhood around each point. The neighbourhood
@@ -212,7 +224,7 @@ class LapseRate(BasePlugin):
             msg = "Neighbourhood radius is less than zero"
             raise ValueError(msg)
 
-        if self.max_height_diff < 0:
+        if self.max_height_diff is not None and self.max_height_diff < 0:
             msg = "Maximum height difference is less than zero"
             raise ValueError(msg)
 
@@ -220,10 +232,6 @@ class LapseRate(BasePlugin):
         # central point.
         self.nbhood_size = int((2 * nbhood_radius) + 1)
 
-        # Used in the neighbourhood checks, ensures that the center
-        # of the array is non NaN.
-        self.ind_central_point = self.nbhood_size // 2
-
     def __repr__(self):
         """Represent the configured plugin instance as a string."""
         desc = (
@@ -237,31 +245,151 @@ class LapseRate(BasePlugin):
         )
         return desc
 
-    def _create_windows(self, temp, orog):
-        """Uses neighbourhood tools to pad and generate rolling windows
-        of the temp and orog datasets.
+    @staticmethod
+    def _centred_moments(counts, sum_x, sum_y, sum_xx, sum_yy, sum_xy):
+        """Calculate the sums of squared and cross deviations from the mean
+        of each neighbourhood from the raw sums over the neighbourhood.
+
+        Args:
+            counts (numpy.ndarray):
+                Number of valid points in each neighbourhood.
+            sum_x, sum_y, sum_xx, sum_yy, sum_xy (numpy.ndarray):
+                Sums of height, temperature, height squared, temperature
+                squared and height multiplied by temperature over each
+                neighbourhood.
+
+        Returns:
+            (tuple): tuple containing:
+                **x_var** (numpy.ndarray):
+                    Sum of squared height deviations.
+                **y_var** (numpy.ndarray):
+                    Sum of squared temperature deviations.
+                **xy_cov** (numpy.ndarray):
+                    Sum of height deviations multiplied by temperature
+                    deviations.
+                These are NaN for neighbourhoods with no valid points.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_var = np.maximum(sum_xx - sum_x * sum_x / counts, 0)
+            y_var = np.maximum(sum_yy - sum_y * sum_y / counts, 0)
+            xy_cov = sum_xy - sum_x * sum_y / counts
+        return x_var, y_var, xy_cov
+
+    def _screened_moments(self, temperature_data, orography_data):
+        """Calculate the number of points and the centred moments needed for
+        the regression over the neighbourhood of every point, excluding
+        neighbours whose height differs from that of the central point by
+        more than max_height_diff.
+
+        The screen differs for every central point, so the sums are built up
+        one neighbourhood offset at a time for blocks of rows. Heights and
+        temperatures are taken relative to those of the central point, which
+        keeps the sums small and makes the moments exactly zero for flat
+        neighbourhoods.
 
         Args:
-            temp (numpy.ndarray):
-                2D array (single realization) of temperature data, in Kelvin
-            orog (numpy.ndarray):
+            temperature_data (numpy.ndarray):
+                Array of temperature data, in Kelvin, with sea points set to
+                NaN. The last two dimensions are y and x.
+            orography_data (numpy.ndarray):
                 2D array of orographies, in metres
 
         Returns:
-            (tuple): tuple_containing:
-                **views of temp** (numpy.ndarray):
-                    Rolling windows of the padded temperature dataset.
-                **views of orog** (numpy.ndarray):
-                    Rolling windows of the padded orography dataset.
+            (tuple): tuple containing:
+                **counts** (numpy.ndarray):
+                    Number of valid points in each neighbourhood.
+                **x_var**, **y_var**, **xy_cov** (numpy.ndarray):
+                    Centred moments of height and temperature, as returned by
+                    _centred_moments.
         """
-        window_shape = (self.nbhood_size, self.nbhood_size)
-        orog_windows = neighbourhood_tools.pad_and_roll(
-            orog, window_shape, mode="constant", constant_values=np.nan
-        )
-        temp_windows = neighbourhood_tools.pad_and_roll(
-            temp, window_shape, mode="constant", constant_values=np.nan
-        )
-        return temp_windows, orog_windows
+        radius = self.nbhood_radius
+        ny, nx = orography_data.shape
+        temperature_data = temperature_data.astype(np.float64)
+        orography_data = orography_data.astype(np.float64)
+        padding = [(0, 0)] * (temperature_data.ndim - 2) + [(radius, radius)] * 2
+        temp_padded = np.pad(temperature_data, padding, constant_values=np.nan)
+        orog_padded = np.pad(orography_data, radius, constant_values=np.nan)
+
+        sums = [np.zeros_like(temperature_data) for _ in range(6)]
+        rows = max(1, self.CHUNK_SIZE * ny // temperature_data.size)
+        for start in range(0, ny, rows):
+            block = slice(start, start + rows)
+            orog_centre = orography_data[block]
+            temp_centre = temperature_data[..., block, :]
+            counts, sum_x, sum_y, sum_xx, sum_yy, sum_xy = [
+                array[..., block, :] for array in sums
+            ]
+            for i, j in np.ndindex(self.nbhood_size, self.nbhood_size):
+                rows_ij = slice(start + i, start + i + len(orog_centre))
+                orog_diff = orog_padded[rows_ij, j : j + nx] - orog_centre
+                temp_diff = temp_padded[..., rows_ij, j : j + nx] - temp_centre
+                # Comparisons with NaN are False, so neighbours or central
+                # points without a valid height or temperature are excluded.
+                valid = np.isfinite(temp_diff) & (
+                    np.abs(orog_diff) <= self.max_height_diff
+                )
+                orog_diff = np.where(valid, orog_diff, 0)
+                temp_diff = np.where(valid, temp_diff, 0)
+                counts += valid
+                sum_x += orog_diff
+                sum_y += temp_diff
+                sum_xx += orog_diff * orog_diff
+                sum_yy += temp_diff * temp_diff
+                sum_xy += orog_diff * temp_diff
+        return (sums[0], *self._centred_moments(*sums))
+
+    def _box_moments(self, temperature_data, orography_data):
+        """Calculate the number of points and the centred moments needed for
+        the regression over the neighbourhood of every point using box sums,
+        so that the cost is independent of the neighbourhood size. All valid
+        points in each neighbourhood are used.
+
+        Heights and temperatures are taken relative to a single reference
+        value to limit the loss of precision in the cumulative sums. Rounding
+        means the moments of flat neighbourhoods may not be exactly zero, so
+        these neighbourhoods are found by comparing their maximum and minimum
+        values instead.
+
+        Args:
+            temperature_data (numpy.ndarray):
+                Array of temperature data, in Kelvin, with sea points set to
+                NaN. The last two dimensions are y and x.
+            orography_data (numpy.ndarray):
+                2D array of orographies, in metres
+
+        Returns:
+            (tuple): tuple containing:
+                **counts** (numpy.ndarray):
+                    Number of valid points in each neighbourhood.
+                **x_var**, **y_var**, **xy_cov** (numpy.ndarray):
+                    Centred moments of height and temperature, as returned by
+                    _centred_moments.
+        """
+        valid = np.isfinite(temperature_data) & np.isfinite(orography_data)
+        fields = []
+        for data in (orography_data, temperature_data):
+            data = np.where(valid, data, 0).astype(np.float64)
+            if valid.any():
+                data = np.where(valid, data - data[valid].mean(), 0)
+            fields.append(data)
+        orog, temp = fields
+
+        sums = [
+            neighbourhood_tools.boxsum(data, self.nbhood_size, mode="constant")
+            for data in (valid, orog, temp, orog * orog, temp * temp, orog * temp)
+        ]
+        x_var, y_var, xy_cov = self._centred_moments(*sums)
+
+        size = (1,) * (valid.ndim - 2) + (self.nbhood_size, self.nbhood_size)
+        for data, var in zip(fields, (x_var, y_var)):
+            data_max = maximum_filter(
+                np.where(valid, data, -np.inf), size, mode="constant", cval=-np.inf
+            )
+            data_min = minimum_filter(
+                np.where(valid, data, np.inf), size, mode="constant", cval=np.inf
+            )
+            var[data_max == data_min] = 0
+        return (sums[0], x_var, y_var, xy_cov)
 
     def _generate_lapse_rate_array(
         self, temperature_data, orography_data, land_sea_mask_data
@@ -271,7 +399,9 @@ class LapseRate(BasePlugin):
 
         Args:
             temperature_data (numpy.ndarray):
-                2D array (single realization) of temperature data, in Kelvin
+                Array of temperature data, in Kelvin. The last two dimensions
+                are y and x, any leading dimensions (e.g. realization) are
+                processed together.
             orography_data (numpy.ndarray):
                 2D array of orographies, in metres
             land_sea_mask_data (numpy.ndarray):
@@ -284,53 +414,31 @@ class LapseRate(BasePlugin):
         # Fill sea points with NaN values.
         temperature_data = np.where(land_sea_mask_data, temperature_data, np.nan)
 
-        # Preallocate output array
-        lapse_rate_array = np.empty_like(temperature_data, dtype=np.float32)
-
-        # Pads the data with nans and generates masked windows representing
-        # a neighbourhood for each point.
-        temp_nbhood_window, orog_nbhood_window = self._create_windows(
-            temperature_data, orography_data
-        )
-
-        # Zips together the windows for temperature and orography
-        # then finds the gradient of the surface temperature with
-        # orography height - i.e. lapse rate.
-        cnpt = self.ind_central_point
-        axis = (-2, -1)
-        for lapse, temp, orog in zip(
-            lapse_rate_array, temp_nbhood_window, orog_nbhood_window
-        ):
-            # height_diff_mask is True for points where the height
-            # difference between the central points and its
-            # neighbours is greater then max_height_diff.
-            orog_centre = orog[..., cnpt : cnpt + 1, cnpt : cnpt + 1]
-            height_diff_mask = np.abs(orog - orog_centre) > self.max_height_diff
-
-            temp = np.where(height_diff_mask, np.nan, temp)
+        # Find the gradient of the surface temperature with orography
+        # height - i.e. lapse rate - from the moments over each
+        # neighbourhood.
+        if self.max_height_diff is None:
+            moments = self._box_moments(temperature_data, orography_data)
+        else:
+            moments = self._screened_moments(temperature_data, orography_data)
+        counts, x_var, y_var, xy_cov = moments
 
-            # Places NaNs in orog to match temp
-            orog = np.where(np.isnan(temp), np.nan, orog)
-
-            grad = mathematical_operations.fast_linear_fit(
-                orog, temp, axis=axis, gradient_only=True, with_nan=True
-            )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            grad = xy_cov / x_var
 
             # Checks that the standard deviations are not 0
             # i.e. there is some variance to fit a gradient to.
-            tempcheck = np.isclose(np.nanstd(temp, axis=axis), 0)
-            orogcheck = np.isclose(np.nanstd(orog, axis=axis), 0)
-            # checks that our central point in the neighbourhood
-            # is not nan
-            temp_nan_check = np.isnan(temp[..., cnpt, cnpt])
-
-            dalr_mask = tempcheck | orogcheck | temp_nan_check | np.isnan(grad)
-            grad[dalr_mask] = DALR
+            tempcheck = np.isclose(np.sqrt(y_var / counts), 0)
+            orogcheck = np.isclose(np.sqrt(x_var / counts), 0)
+        # checks that our central point in the neighbourhood
+        # is not nan
+        temp_nan_check = np.isnan(temperature_data)
 
-            lapse[...] = grad
+        dalr_mask = tempcheck | orogcheck | temp_nan_check | np.isnan(grad)
+        grad[dalr_mask] = DALR
 
         # Enforce upper and lower limits on lapse rate values.
-        lapse_rate_array = lapse_rate_array.clip(
+        lapse_rate_array = grad.astype(np.float32).clip(
             self.min_lapse_rate, self.max_lapse_rate
         )
         return lapse_rate_array
@@ -387,27 +495,15 @@ class LapseRate(BasePlugin):
         # Fill sea points with NaN values.
         orography_data = np.where(land_sea_mask_data, orography_data, np.nan)
 
-        # Create list of arrays over "realization" coordinate
-        has_realization_dimension = False
+        # Calculate lapse rate for all realizations together, with the
+        # realization coordinate leading.
         original_dimension_order = None
         if temperature_cube.coords("realization", dim_coords=True):
             original_dimension_order = get_dim_coord_names(temperature_cube)
             enforce_coordinate_ordering(temperature_cube, "realization")
-            temp_data_slices = temperature_cube.data
-            has_realization_dimension = True
-        else:
-            temp_data_slices = [temperature_cube.data]
-
-        # Calculate lapse rate for each realization
-        lapse_rate_data = []
-        for temperature_data in temp_data_slices:
-            lapse_rate_array = self._generate_lapse_rate_array(
-                temperature_data, orography_data, land_sea_mask_data
-            )
-            lapse_rate_data.append(lapse_rate_array)
-        lapse_rate_data = np.array(lapse_rate_data)
-        if not has_realization_dimension:
-            lapse_rate_data = np.squeeze(lapse_rate_data)
+        lapse_rate_data = self._generate_lapse_rate_array(
+            temperature_cube.data, orography_data, land_sea_mask_data
+        )
 
         attributes = generate_mandatory_attributes(
             [temperature], model_id_attr=model_id_attr
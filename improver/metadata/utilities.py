@@ -167,6 +167,26 @@ def generate_hash(data_in):
     return hashlib.sha256(bytestring).hexdigest()
 
 
+def hash_array(data):
+    """
+    Generate a hash of the values, and any mask, of an array. Unlike
+    generate_hash this hashes every value, so it distinguishes arrays that
+    differ anywhere, however large they are.
+
+    Args:
+        data (numpy.ndarray or numpy.ma.MaskedArray):
+            The array to be hashed.
+    Returns:
+        str:
+            A hexadecimal string which is a hash hexdigest of the array.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(str((data.dtype, data.shape)).encode("utf-8"))
+    hasher.update(np.ascontiguousarray(np.ma.getdata(data)).tobytes())
+    hasher.update(np.ascontiguousarray(np.ma.getmaskarray(data)).tobytes())
+    return hasher.hexdigest()
+
+
 def create_coordinate_hash(cube):
     """
     Generate a hash based on the input cube's x and y coordinates. This
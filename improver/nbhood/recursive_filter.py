@@ -31,7 +31,6 @@
 """Module to apply a recursive filter to neighbourhooded data."""
 import warnings
 
-import iris
 import numpy as np
 
 from improver import PostProcessingPlugin
@@ -39,8 +38,7 @@ from improver.generate_ancillaries.generate_orographic_smoothing_coefficients im
     OrographicSmoothingCoefficients,
 )
 from improver.metadata.constants.time_types import TIME_COORDS
-from improver.utilities.cube_checker import check_cube_coordinates
-from improver.utilities.pad_spatial import pad_cube_with_halo, remove_halo_from_cube
+from improver.utilities.pad_spatial import pad_cube_with_halo
 
 
 class RecursiveFilter(PostProcessingPlugin):
@@ -85,6 +83,36 @@ class RecursiveFilter(PostProcessingPlugin):
         result = "<RecursiveFilter: iterations: {}, edge_width: {}"
         return result.format(self.iterations, self.edge_width)
 
+    @staticmethod
+    def _align_recursion_axis(grid, smoothing_coefficients, axis):
+        """
+        Move the axis over which to recurse to the front of the data and
+        smoothing coefficient arrays, so that each step of the recursion
+        updates a whole slab of the data in one operation.
+
+        Args:
+            grid (numpy.ndarray):
+                Array containing the input data.
+            smoothing_coefficients (numpy.ndarray):
+                Array of smoothing_coefficient values that is broadcastable
+                against the trailing dimensions of grid.
+            axis (int):
+                Index of the axis of grid over which to recurse.
+
+        Returns:
+            tuple of numpy.ndarray:
+                Views of the data and smoothing coefficients with the
+                recursion axis first, and an array of the complements
+                (1 - smoothing_coefficient) of the smoothing coefficients.
+        """
+        leading_dims = (1,) * (grid.ndim - smoothing_coefficients.ndim)
+        coefficients = smoothing_coefficients.reshape(
+            leading_dims + smoothing_coefficients.shape
+        )
+        grid = np.moveaxis(grid, axis, 0)
+        coefficients = np.moveaxis(coefficients, axis, 0)
+        return grid, coefficients, 1.0 - coefficients
+
     @staticmethod
     def _recurse_forward(grid, smoothing_coefficients, axis):
         """
@@ -106,32 +134,31 @@ class RecursiveFilter(PostProcessingPlugin):
 
         Args:
             grid (numpy.ndarray):
-                2D array containing the input data to which the recursive
-                filter will be applied.
+                Array containing the input data to which the recursive
+                filter will be applied. This is modified in place.
             smoothing_coefficients (numpy.ndarray):
-                Matching 2D array of smoothing_coefficient values that will be
-                used when applying the recursive filter along the specified
-                axis.
+                Array of smoothing_coefficient values that will be used when
+                applying the recursive filter along the specified axis. This
+                must be broadcastable against the trailing dimensions of grid,
+                and one element shorter than grid along the specified axis.
             axis (int):
-                Index of the spatial axis (0 or 1) over which to recurse.
+                Index of the axis of grid over which to recurse.
 
         Returns:
             numpy.ndarray:
-                2D array containing the smoothed field after the recursive
+                Array containing the smoothed field after the recursive
                 filter method has been applied to the input array in the
                 forward direction along the specified axis.
         """
-        lim = grid.shape[axis]
-        for i in range(1, lim):
-            if axis == 0:
-                grid[i, :] = (1.0 - smoothing_coefficients[i - 1, :]) * grid[
-                    i, :
-                ] + smoothing_coefficients[i - 1, :] * grid[i - 1, :]
-            if axis == 1:
-                grid[:, i] = (1.0 - smoothing_coefficients[:, i - 1]) * grid[
-                    :, i
-                ] + smoothing_coefficients[:, i - 1] * grid[:, i - 1]
-        return grid
+        grid, coefficients, complements = RecursiveFilter._align_recursion_axis(
+            grid, smoothing_coefficients, axis
+        )
+        increment = np.empty_like(grid[0])
+        for i in range(1, grid.shape[0]):
+            np.multiply(complements[i - 1], grid[i], out=grid[i])
+            np.multiply(coefficients[i - 1], grid[i - 1], out=increment)
+            grid[i] += increment
+        return np.moveaxis(grid, 0, axis)
 
     @staticmethod
     def _recurse_backward(grid, smoothing_coefficients, axis):
@@ -154,32 +181,79 @@ class RecursiveFilter(PostProcessingPlugin):
 
         Args:
             grid (numpy.ndarray):
-                2D array containing the input data to which the recursive
-                filter will be applied.
+                Array containing the input data to which the recursive
+                filter will be applied. This is modified in place.
             smoothing_coefficients (numpy.ndarray):
-                Matching 2D array of smoothing_coefficient values that will be
-                used when applying the recursive filter along the specified
-                axis.
+                Array of smoothing_coefficient values that will be used when
+                applying the recursive filter along the specified axis. This
+                must be broadcastable against the trailing dimensions of grid,
+                and one element shorter than grid along the specified axis.
             axis (int):
-                Index of the spatial axis (0 or 1) over which to recurse.
+                Index of the axis of grid over which to recurse.
 
         Returns:
             numpy.ndarray:
-                2D array containing the smoothed field after the recursive
+                Array containing the smoothed field after the recursive
                 filter method has been applied to the input array in the
                 backwards direction along the specified axis.
         """
-        lim = grid.shape[axis]
-        for i in range(lim - 2, -1, -1):
-            if axis == 0:
-                grid[i, :] = (1.0 - smoothing_coefficients[i, :]) * grid[
-                    i, :
-                ] + smoothing_coefficients[i, :] * grid[i + 1, :]
-            if axis == 1:
-                grid[:, i] = (1.0 - smoothing_coefficients[:, i]) * grid[
-                    :, i
-                ] + smoothing_coefficients[:, i] * grid[:, i + 1]
-        return grid
+        grid, coefficients, complements = RecursiveFilter._align_recursion_axis(
+            grid, smoothing_coefficients, axis
+        )
+        increment = np.empty_like(grid[0])
+        for i in range(grid.shape[0] - 2, -1, -1):
+            np.multiply(complements[i], grid[i], out=grid[i])
+            np.multiply(coefficients[i], grid[i + 1], out=increment)
+            grid[i] += increment
+        return np.moveaxis(grid, 0, axis)
+
+    @staticmethod
+    def _recurse_array(
+        data, smoothing_coefficients_x, smoothing_coefficients_y, iterations
+    ):
+        """
+        Method to run the recursive filter on an array whose final two
+        dimensions are y and x. All leading dimensions are filtered together.
+
+        Each pass of the filter is made over a copy of the data in which the
+        axis being recursed over is first and contiguous in memory, so that
+        every step of the recursion updates a contiguous slab covering all of
+        the x-y slices at once.
+
+        Args:
+            data (numpy.ndarray):
+                Array containing the input data to which the recursive filter
+                will be applied, with the y and x dimensions last.
+            smoothing_coefficients_x (numpy.ndarray):
+                2D array of smoothing_coefficient values that will be used
+                when applying the recursive filter along the x-axis.
+            smoothing_coefficients_y (numpy.ndarray):
+                2D array of smoothing_coefficient values that will be used
+                when applying the recursive filter along the y-axis.
+            iterations (int):
+                The number of iterations of the recursive filter
+
+        Returns:
+            numpy.ndarray:
+                Array containing the smoothed field, with the same dimensions
+                as the input data.
+        """
+        # Arrange the coefficients to broadcast against data ordered
+        # (x, ..., y) and (y, ..., x) respectively.
+        leading_dims = (None,) * (data.ndim - 2)
+        coefficients_x = smoothing_coefficients_x.T[(slice(None),) + leading_dims]
+        coefficients_y = smoothing_coefficients_y[(slice(None),) + leading_dims]
+
+        output = np.moveaxis(data, -1, 0)
+        for _ in range(iterations):
+            output = np.ascontiguousarray(output)
+            output = RecursiveFilter._recurse_forward(output, coefficients_x, 0)
+            output = RecursiveFilter._recurse_backward(output, coefficients_x, 0)
+            output = np.ascontiguousarray(np.swapaxes(output, 0, -1))
+            output = RecursiveFilter._recurse_forward(output, coefficients_y, 0)
+            output = RecursiveFilter._recurse_backward(output, coefficients_y, 0)
+            output = np.swapaxes(output, 0, -1)
+        return np.moveaxis(output, 0, -1)
 
     @staticmethod
     def _run_recursion(
@@ -210,22 +284,14 @@ class RecursiveFilter(PostProcessingPlugin):
         """
         (x_index,) = cube.coord_dims(cube.coord(axis="x").name())
         (y_index,) = cube.coord_dims(cube.coord(axis="y").name())
-        output = cube.data
-
-        for _ in range(iterations):
-            output = RecursiveFilter._recurse_forward(
-                output, smoothing_coefficients_x.data, x_index
-            )
-            output = RecursiveFilter._recurse_backward(
-                output, smoothing_coefficients_x.data, x_index
-            )
-            output = RecursiveFilter._recurse_forward(
-                output, smoothing_coefficients_y.data, y_index
-            )
-            output = RecursiveFilter._recurse_backward(
-                output, smoothing_coefficients_y.data, y_index
-            )
-            cube.data = output
+        data = np.moveaxis(cube.data, [y_index, x_index], [-2, -1])
+        output = RecursiveFilter._recurse_array(
+            data,
+            smoothing_coefficients_x.data,
+            smoothing_coefficients_y.data,
+            iterations,
+        )
+        cube.data = np.moveaxis(output, [-2, -1], [y_index, x_index])
         return cube
 
     def _validate_coefficients(self, cube, smoothing_coefficients):
@@ -346,20 +412,15 @@ class RecursiveFilter(PostProcessingPlugin):
         and :func:`~improver.cli.generate_orographic_smoothing_coefficients`.
         The steps undertaken are:
 
-        1. Split the input cube into slices determined by the co-ordinates in
-           the x and y directions.
-        2. Construct an array of filter parameters (smoothing_coefficients_x
-           and smoothing_coefficients_y) for each cube slice that are used to
-           weight the recursive filter in the x- and y-directions.
-        3. Pad each cube slice with a square-neighbourhood halo and apply
-           the recursive filter for the required number of iterations.
-        4. Remove the halo from the cube slice and append the recursed cube
-           slice to a 'recursed cube'.
-        5. Merge all the cube slices in the 'recursed cube' into a 'new cube'.
-        6. Modify the 'new cube' so that its scalar dimension co-ordinates are
-           consistent with those in the original input cube.
-        7. Return the 'new cube' which now contains the recursively filtered
-           values for the original input cube.
+        1. Construct an array of filter parameters (smoothing_coefficients_x
+           and smoothing_coefficients_y) that are used to weight the
+           recursive filter in the x- and y-directions.
+        2. Pad the x-y slices of the input data with a square-neighbourhood
+           halo.
+        3. Apply the recursive filter for the required number of iterations
+           to all of the x-y slices together.
+        4. Remove the halo and return a copy of the input cube containing
+           the recursively filtered values.
 
         The smoothing_coefficient determines how much "value" of a cell
         undergoing filtering is comprised of the current value at that cell and
@@ -411,29 +472,32 @@ class RecursiveFilter(PostProcessingPlugin):
             coeffs_x, coeffs_y
         )
 
-        recursed_cube = iris.cube.CubeList()
-        for output in cube.slices([cube.coord(axis="y"), cube.coord(axis="x")]):
+        # Filter all x-y slices together, with the spatial dimensions last.
+        (y_index,) = cube.coord_dims(cube.coord(axis="y"))
+        (x_index,) = cube.coord_dims(cube.coord(axis="x"))
+        data = np.moveaxis(np.ma.getdata(cube.data), [y_index, x_index], [-2, -1])
 
-            padded_cube = pad_cube_with_halo(
-                output, 2 * self.edge_width, 2 * self.edge_width, pad_method="symmetric"
-            )
+        width = 2 * self.edge_width
+        padding = [(0, 0)] * (data.ndim - 2) + [(width, width), (width, width)]
+        padded_data = np.pad(data, padding, mode="symmetric")
 
-            new_cube = self._run_recursion(
-                padded_cube,
-                padded_coefficients_x,
-                padded_coefficients_y,
-                self.iterations,
-            )
-            new_cube = remove_halo_from_cube(
-                new_cube, 2 * self.edge_width, 2 * self.edge_width
-            )
-
-            if mask_cube is not None:
-                new_cube.data = np.ma.MaskedArray(new_cube.data, mask=mask_cube.data)
+        output = self._recurse_array(
+            padded_data,
+            padded_coefficients_x.data,
+            padded_coefficients_y.data,
+            self.iterations,
+        )
+        output = output[
+            ..., width : output.shape[-2] - width, width : output.shape[-1] - width
+        ]
 
-            recursed_cube.append(new_cube)
+        if mask_cube is not None:
+            output = np.ma.MaskedArray(
+                output, mask=np.broadcast_to(mask_cube.data, output.shape).copy()
+            )
 
-        new_cube = recursed_cube.merge_cube()
-        new_cube = check_cube_coordinates(cube, new_cube)
+        new_cube = cube.copy(
+            data=np.moveaxis(output, [-2, -1], [y_index, x_index]).copy()
+        )
 
         return new_cube
@@ -109,59 +109,16 @@ class AdvectField(BasePlugin):
         )
         return result
 
-    @staticmethod
-    def _increment_output_array(
-        indata,
-        outdata,
-        cond,
-        xdest_grid,
-        ydest_grid,
-        xsrc_grid,
-        ysrc_grid,
-        x_weight,
-        y_weight,
-    ):
-        """
-        Calculate and add contribution to the advected array from one source
-        grid point, for all points where boolean condition "cond" is valid.
-
-        Args:
-            indata (numpy.ndarray):
-                2D numpy array of source data to be advected
-            outdata (numpy.ndarray):
-                2D numpy array for advected output, modified in place by
-                this method (is both input and output).
-            cond (numpy.ndarray):
-                2D boolean mask of points to be processed
-            xdest_grid (numpy.ndarray):
-                Integer x-coordinates of all points on destination grid
-            ydest_grid (numpy.ndarray):
-                Integer y-coordinates of all points on destination grid
-            xsrc_grid (numpy.ndarray):
-                Integer x-coordinates of all points on source grid
-            ysrc_grid (numpy.ndarray):
-                Integer y-coordinates of all points on source grid
-            x_weight (numpy.ndarray):
-                Fractional contribution to destination grid of source data
-                advected along the x-axis.  Positive definite.
-            y_weight (numpy.ndarray):
-                Fractional contribution to destination grid of source data
-                advected along the y-axis.  Positive definite.
-        """
-        xdest = xdest_grid[cond]
-        ydest = ydest_grid[cond]
-        xsrc = xsrc_grid[cond]
-        ysrc = ysrc_grid[cond]
-        outdata[ydest, xdest] += (
-            indata[ysrc, xsrc] * x_weight[ydest, xdest] * y_weight[ydest, xdest]
-        )
-
-    def _advect_field(self, data, grid_vel_x, grid_vel_y, timestep):
+    def _advect_fields(self, data, grid_vel_x, grid_vel_y, timesteps):
         """
         Performs a dimensionless grid-based extrapolation of spatial data
-        using advection velocities via a backwards method.  Points where data
-        cannot be extrapolated (ie the source is out of bounds) are given a
-        fill value of np.nan and masked.
+        using advection velocities via a backwards method, for several time
+        steps at once.  Points where data cannot be extrapolated (ie the
+        source is out of bounds) are given a fill value of np.nan and masked.
+
+        The source locations for all the time steps are calculated together
+        as stacked arrays, and the data values at the four grid points
+        surrounding each source location are gathered using flat indices.
 
         Args:
             data (numpy.ndarray or numpy.ma.MaskedArray):
@@ -170,72 +127,117 @@ class AdvectField(BasePlugin):
                 Velocity in the x direction (in grid points per second)
             grid_vel_y (numpy.ndarray):
                 Velocity in the y direction (in grid points per second)
-            timestep (int):
-                Advection time step in seconds
+            timesteps (list of int):
+                Advection time steps in seconds
 
         Returns:
-            numpy.ma.MaskedArray:
-                2D float array of advected data values with masked "no data"
-                regions
+            list of numpy.ma.MaskedArray:
+                2D float arrays of advected data values with masked "no data"
+                regions, one for each time step.  Where a time step is 0, the
+                input data are returned unchanged.
         """
-        # Cater for special case where timestep (int) is 0
-        if timestep == 0:
-            return data
-
-        # Initialise advected field with np.nan
-        adv_field = np.full(data.shape, np.nan, dtype=np.float32)
+        advect_timesteps = [timestep for timestep in timesteps if timestep != 0]
+        if not advect_timesteps:
+            return [data for _ in timesteps]
 
         # Set up grids of data coordinates (meshgrid inverts coordinate order)
         ydim, xdim = data.shape
         (xgrid, ygrid) = np.meshgrid(np.arange(xdim), np.arange(ydim))
+        steps = np.array(advect_timesteps)[:, np.newaxis, np.newaxis]
+
+        def source_coordinate(grid_vel, grid):
+            """Trace grid coordinates backwards along the advection velocity"""
+            step = steps.astype(np.result_type(grid_vel.dtype, np.float32))
+            return -grid_vel * step + grid.astype(np.float32)
 
         # For each grid point on the output field, trace its (x,y) "source"
         # location backwards using advection velocities.  The source location
         # is generally fractional: eg with advection velocities of 0.5 grid
         # squares per second, the value at [2, 2] is represented by the value
         # that was at [1.5, 1.5] 1 second ago.
-        xsrc_point_frac = -grid_vel_x * timestep + xgrid.astype(np.float32)
-        ysrc_point_frac = -grid_vel_y * timestep + ygrid.astype(np.float32)
+        xsrc_point_frac = source_coordinate(grid_vel_x, xgrid)
+        ysrc_point_frac = source_coordinate(grid_vel_y, ygrid)
 
-        # For all the points where fractional source coordinates are within
-        # the bounds of the field, set the output field to 0
         def point_in_bounds(x, y, nx, ny):
             """Check point (y, x) lies within defined bounds"""
             return (x >= 0.0) & (x < nx) & (y >= 0.0) & (y < ny)
 
+        # Find the points where fractional source coordinates are within the
+        # bounds of the field
         cond_pt = point_in_bounds(xsrc_point_frac, ysrc_point_frac, xdim, ydim)
-        adv_field[cond_pt] = 0
 
         # Find the integer points surrounding the fractional source coordinates
-        xsrc_point_lower = xsrc_point_frac.astype(int)
-        ysrc_point_lower = ysrc_point_frac.astype(int)
-        x_points = [xsrc_point_lower, xsrc_point_lower + 1]
-        y_points = [ysrc_point_lower, ysrc_point_lower + 1]
+        xsrc_point_lower = xsrc_point_frac.astype(np.intp)
+        ysrc_point_lower = ysrc_point_frac.astype(np.intp)
 
         # Calculate the distance-weighted fractional contribution of points
         # surrounding the source coordinates
-        x_weight_upper = xsrc_point_frac - xsrc_point_lower.astype(float)
-        y_weight_upper = ysrc_point_frac - ysrc_point_lower.astype(float)
-        x_weights = np.array([1.0 - x_weight_upper, x_weight_upper], dtype=np.float32)
-        y_weights = np.array([1.0 - y_weight_upper, y_weight_upper], dtype=np.float32)
+        x_weight_upper = xsrc_point_frac - xsrc_point_lower
+        y_weight_upper = ysrc_point_frac - ysrc_point_lower
+        x_weights = [
+            (1.0 - x_weight_upper).astype(np.float32),
+            x_weight_upper.astype(np.float32),
+        ]
+        y_weights = [
+            (1.0 - y_weight_upper).astype(np.float32),
+            y_weight_upper.astype(np.float32),
+        ]
 
         # Check whether the input data is masked - if so substitute NaNs for
         # the masked data.  Note there is an implicit type conversion here: if
         # data is of integer type this unmasking will convert it to float.
+        unmasked_data = data
         if isinstance(data, np.ma.MaskedArray):
-            data = np.where(data.mask, np.nan, data.data)
-
-        # Advect data from each of the four source points onto the output grid
-        for xpt, xwt in zip(x_points, x_weights):
-            for ypt, ywt in zip(y_points, y_weights):
-                cond = point_in_bounds(xpt, ypt, xdim, ydim) & cond_pt
-                self._increment_output_array(
-                    data, adv_field, cond, xgrid, ygrid, xpt, ypt, xwt, ywt
-                )
+            unmasked_data = np.where(data.mask, np.nan, data.data)
+
+        # Pad the source data with a row and column of zeros, so that upper
+        # source points beyond the edge of the field contribute nothing, and
+        # find the flattened index of the lower source point
+        source = np.zeros((ydim + 1, xdim + 1), dtype=unmasked_data.dtype)
+        source[:ydim, :xdim] = unmasked_data
+        source = source.ravel()
+        lower_index = ysrc_point_lower * (xdim + 1) + xsrc_point_lower
+        offsets = [[0, xdim + 1], [1, xdim + 2]]
+
+        # Advect data from each of the four source points onto the output
+        # grid, gathering source values by their flattened index
+        adv_field = np.zeros(cond_pt.shape, dtype=np.float32)
+        for x_offsets, xwt in zip(offsets, x_weights):
+            for offset, ywt in zip(x_offsets, y_weights):
+                adv_field += source.take(lower_index + offset, mode="clip") * xwt * ywt
+
+        # Set points whose source lies outside the field to np.nan
+        adv_field[~cond_pt] = np.nan
 
         # Replace NaNs with a mask
         adv_field = np.ma.masked_where(~np.isfinite(adv_field), adv_field)
 
+        advected = iter(adv_field)
+        return [next(advected) if timestep != 0 else data for timestep in timesteps]
+
+    def _advect_field(self, data, grid_vel_x, grid_vel_y, timestep):
+        """
+        Performs a dimensionless grid-based extrapolation of spatial data
+        using advection velocities via a backwards method.  Points where data
+        cannot be extrapolated (ie the source is out of bounds) are given a
+        fill value of np.nan and masked.
+
+        Args:
+            data (numpy.ndarray or numpy.ma.MaskedArray):
+                2D numpy data array to be advected
+            grid_vel_x (numpy.ndarray):
+                Velocity in the x direction (in grid points per second)
+            grid_vel_y (numpy.ndarray):
+                Velocity in the y direction (in grid points per second)
+            timestep (int):
+                Advection time step in seconds
+
+        Returns:
+            numpy.ma.MaskedArray:
+                2D float array of advected data values with masked "no data"
+                regions
+        """
+        (adv_field,) = self._advect_fields(data, grid_vel_x, grid_vel_y, [timestep])
         return adv_field
 
     @staticmethod
@@ -321,27 +323,25 @@ class AdvectField(BasePlugin):
 
         return advected_cube
 
-    def process(self, cube, timestep):
+    def _grid_velocities(self, cube):
         """
-        Extrapolates input cube data and updates validity time.  The input
-        cube should have precisely two non-scalar dimension coordinates
-        (spatial x/y), and is expected to be in a projection such that grid
-        spacing is the same (or very close) at all points within the spatial
-        domain.  The input cube should also have a "time" coordinate.
+        Check the input cube and derive the advection velocities in grid
+        squares per second.
 
         Args:
             cube (iris.cube.Cube):
                 The 2D cube containing data to be advected
-            timestep (datetime.timedelta):
-                Advection time step
 
         Returns:
-            iris.cube.Cube:
-                New cube with updated time and extrapolated data.  New data
-                are filled with np.nan and masked where source data were
-                out of bounds (ie where data could not be advected from outside
-                the cube domain).
+            (tuple): tuple containing:
+                **grid_vel_x** (numpy.ndarray):
+                    Velocity in the x direction (in grid points per second)
+                **grid_vel_y** (numpy.ndarray):
+                    Velocity in the y direction (in grid points per second)
 
+        Raises:
+            InvalidCubeError: If the input data grid does not match the
+                advection velocities.
         """
         # check that the input cube has precisely two non-scalar dimension
         # coordinates (spatial x/y) and a scalar time coordinate
@@ -368,11 +368,69 @@ class AdvectField(BasePlugin):
         if nan_count > 0:
             warnings.warn("input data contains unmasked NaNs")
 
-        # perform advection and create output cube
-        advected_data = self._advect_field(
-            cube.data, grid_vel_x, grid_vel_y, round(timestep.total_seconds())
-        )
-        advected_cube = self._create_output_cube(cube, advected_data, timestep)
+        return grid_vel_x, grid_vel_y
+
+    def process_lead_times(self, cube, timesteps, batch_size=4):
+        """
+        Extrapolates input cube data to several lead times.  The advection
+        velocities are converted to grid squares per second once, and the
+        advection is calculated for batches of lead times together.
+
+        Args:
+            cube (iris.cube.Cube):
+                The 2D cube containing data to be advected
+            timesteps (list of datetime.timedelta):
+                Advection time steps
+            batch_size (int):
+                Maximum number of time steps to advect together.  Larger
+                batches need proportionally more memory.
+
+        Returns:
+            iris.cube.CubeList:
+                New cubes with updated time and extrapolated data, one for
+                each time step.  New data are filled with np.nan and masked
+                where source data were out of bounds (ie where data could not
+                be advected from outside the cube domain).
+        """
+        grid_vel_x, grid_vel_y = self._grid_velocities(cube)
+        advected_cubes = iris.cube.CubeList()
+        for start in range(0, len(timesteps), batch_size):
+            batch = timesteps[start : start + batch_size]
+            advected_data = self._advect_fields(
+                cube.data,
+                grid_vel_x,
+                grid_vel_y,
+                [round(timestep.total_seconds()) for timestep in batch],
+            )
+            advected_cubes.extend(
+                self._create_output_cube(cube, data, timestep)
+                for data, timestep in zip(advected_data, batch)
+            )
+        return advected_cubes
+
+    def process(self, cube, timestep):
+        """
+        Extrapolates input cube data and updates validity time.  The input
+        cube should have precisely two non-scalar dimension coordinates
+        (spatial x/y), and is expected to be in a projection such that grid
+        spacing is the same (or very close) at all points within the spatial
+        domain.  The input cube should also have a "time" coordinate.
+
+        Args:
+            cube (iris.cube.Cube):
+                The 2D cube containing data to be advected
+            timestep (datetime.timedelta):
+                Advection time step
+
+        Returns:
+            iris.cube.Cube:
+                New cube with updated time and extrapolated data.  New data
+                are filled with np.nan and masked where source data were
+                out of bounds (ie where data could not be advected from outside
+                the cube domain).
+
+        """
+        (advected_cube,) = self.process_lead_times(cube, [timestep])
         return advected_cube
 
 
@@ -451,6 +509,14 @@ class CreateExtrapolationForecast(BasePlugin):
         )
         return result
 
+    def _add_orographic_enhancement(self, forecast_cube):
+        """Reapply the orographic enhancement to a forecast, if supplied."""
+        if self.orographic_enhancement_cube:
+            (forecast_cube,) = ApplyOrographicEnhancement("add")(
+                forecast_cube, self.orographic_enhancement_cube
+            )
+        return forecast_cube
+
     def extrapolate(self, leadtime_minutes):
         """
         Produce a new forecast cube for the supplied lead time. Creates a new
@@ -475,17 +541,12 @@ class CreateExtrapolationForecast(BasePlugin):
         # cast to float as datetime.timedelta cannot accept np.int
         timestep = datetime.timedelta(minutes=float(leadtime_minutes))
         forecast_cube = self.advection_plugin(self.input_cube, timestep)
-        if self.orographic_enhancement_cube:
-            # Add orographic enhancement.
-            (forecast_cube,) = ApplyOrographicEnhancement("add")(
-                forecast_cube, self.orographic_enhancement_cube
-            )
-
-        return forecast_cube
+        return self._add_orographic_enhancement(forecast_cube)
 
     def process(self, interval, max_lead_time):
         """
-        Generate nowcasts at required intervals up to the maximum lead time
+        Generate nowcasts at required intervals up to the maximum lead time.
+        The advection to the lead times is calculated in batches.
 
         Args:
             interval (int):
@@ -498,7 +559,14 @@ class CreateExtrapolationForecast(BasePlugin):
                 List of forecast cubes at the required lead times
         """
         lead_times = np.arange(0, max_lead_time + 1, interval)
-        forecast_cubes = iris.cube.CubeList()
-        for lead_time in lead_times:
-            forecast_cubes.append(self.extrapolate(lead_time))
-        return forecast_cubes
+        # cast to float as datetime.timedelta cannot accept np.int
+        timesteps = [
+            datetime.timedelta(minutes=float(lead_time)) for lead_time in lead_times
+        ]
+        forecast_cubes = self.advection_plugin.process_lead_times(
+            self.input_cube, timesteps
+        )
+        return iris.cube.CubeList(
+            self._add_orographic_enhancement(forecast_cube)
+            for forecast_cube in forecast_cubes
+        )
@@ -481,6 +481,51 @@ class OpticalFlow(BasePlugin):
         weights[weights < 0.01] = 0
         return boxes, weights
 
+    def _make_box_arrays(self, field):
+        """
+        Rearrange the input field into an array with one row per
+        non-overlapping "box" of size self.boxsize**2, ordered as the boxes
+        returned by :meth:`_make_subboxes`.  Where the size of the data field
+        is not an exact multiple of "boxsize", the final boxes are padded
+        with zeros, which do not contribute to the sums over each box.
+
+        Args:
+            field (numpy.ndarray):
+                Input field (partial derivative or data)
+
+        Returns:
+            numpy.ndarray:
+                2D array of shape (number of boxes, boxsize**2) containing
+                the values within each box.
+        """
+        nboxes_y = int((field.shape[0] - 1) / self.boxsize) + 1
+        nboxes_x = int((field.shape[1] - 1) / self.boxsize) + 1
+        padded = np.zeros(
+            (nboxes_y * self.boxsize, nboxes_x * self.boxsize), dtype=field.dtype
+        )
+        padded[: field.shape[0], : field.shape[1]] = field
+        boxes = padded.reshape(nboxes_y, self.boxsize, nboxes_x, self.boxsize)
+        return boxes.swapaxes(1, 2).reshape(nboxes_y * nboxes_x, self.boxsize ** 2)
+
+    def _make_box_weights(self):
+        """
+        Calculate the weights associated with each box from data values at
+        times 1 and 2, as in :meth:`_make_subboxes`, for all boxes at once.
+
+        Returns:
+            numpy.ndarray:
+                1D numpy array containing weights values associated with
+                each box.
+        """
+        weighting_factor = 0.5 / self.boxsize ** 2.0
+        weights = weighting_factor * (
+            self._make_box_arrays(self.data1).sum(axis=1)
+            + self._make_box_arrays(self.data2).sum(axis=1)
+        )
+        weights = (1.0 - np.exp(-1.0 * weights / 0.8)).astype(np.float32)
+        weights[weights < 0.01] = 0
+        return weights
+
     def _box_to_grid(self, box_data):
         """
         Regrids calculated displacements from "box grid" (on which OFC
@@ -692,6 +737,56 @@ class OpticalFlow(BasePlugin):
             velocity = -m_inverted.dot(scale)[:, 0]
         return velocity
 
+    @staticmethod
+    def solve_for_uv_batched(deriv_x, deriv_y, deriv_t):
+        """
+        Solve the systems of linear simultaneous equations for u and v for
+        many boxes at once.  This is equivalent to calling
+        :meth:`solve_for_uv` for each box, but accumulates the terms of the
+        2x2 normal equations for every box with array reductions and solves
+        them in closed form.
+
+        As in :meth:`solve_for_uv`, boxes for which the system is singular
+        (eg because the derivatives are all zero) are given displacements
+        of 0.
+
+        Args:
+            deriv_x (numpy.ndarray):
+                2D array of partial field derivatives d/dx, with one row per
+                box
+            deriv_y (numpy.ndarray):
+                2D array of partial field derivatives d/dy, with one row per
+                box
+            deriv_t (numpy.ndarray):
+                2D array of partial field derivatives d/dt, with one row per
+                box
+
+        Returns:
+            (tuple): tuple containing:
+                **u** (numpy.ndarray):
+                    1D array of displacements in the x-direction for each box
+                **v** (numpy.ndarray):
+                    1D array of displacements in the y-direction for each box
+        """
+        # deriv_x and deriv_y must be float64 in order to work OK.
+        deriv_x = deriv_x.astype(np.float64)
+        deriv_y = deriv_y.astype(np.float64)
+        sum_xx = np.einsum("ij,ij->i", deriv_x, deriv_x)
+        sum_xy = np.einsum("ij,ij->i", deriv_x, deriv_y)
+        sum_yy = np.einsum("ij,ij->i", deriv_y, deriv_y)
+        sum_xt = np.einsum("ij,ij->i", deriv_x, deriv_t)
+        sum_yt = np.einsum("ij,ij->i", deriv_y, deriv_t)
+
+        determinant = sum_xx * sum_yy - sum_xy * sum_xy
+        singular = determinant == 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            u = -(sum_yy * sum_xt - sum_xy * sum_yt) / determinant
+            v = -(sum_xx * sum_yt - sum_xy * sum_xt) / determinant
+
+        u[singular] = 0
+        v[singular] = 0
+        return u, v
+
     @staticmethod
     def extreme_value_check(umat, vmat, weights):
         """
@@ -733,35 +828,22 @@ class OpticalFlow(BasePlugin):
                     2D array of displacements in the y-direction
         """
 
-        # (a) Generate lists of subboxes over which velocity is constant
-        dx_boxed, box_weights = self._make_subboxes(partial_dx)
-        dy_boxed, _ = self._make_subboxes(partial_dy)
-        dt_boxed, _ = self._make_subboxes(partial_dt)
-
-        # (b) Solve optical flow displacement calculation on each subbox
-        velocity = ([], [])
-        for deriv_x, deriv_y, deriv_t in zip(dx_boxed, dy_boxed, dt_boxed):
-
-            # Flatten arrays to create the system of linear simultaneous
-            # equations to solve for this subbox
-            deriv_x = deriv_x.flatten()
-            deriv_y = deriv_y.flatten()
-            deriv_t = deriv_t.flatten()
-            # deriv_xy must be float64 in order to work OK.
-            deriv_xy = (np.array([deriv_x, deriv_y], dtype=np.float64)).transpose()
+        # (a) Generate arrays of subboxes over which velocity is constant
+        dx_boxed = self._make_box_arrays(partial_dx)
+        dy_boxed = self._make_box_arrays(partial_dy)
+        dt_boxed = self._make_box_arrays(partial_dt)
+        box_weights = self._make_box_weights()
 
-            # Solve equations for u and v through matrix inversion
-            u, v = self.solve_for_uv(deriv_xy, deriv_t)
-            velocity[0].append(u)
-            velocity[1].append(v)
+        # (b) Solve optical flow displacement calculation on all subboxes
+        u, v = self.solve_for_uv_batched(dx_boxed, dy_boxed, dt_boxed)
 
         # (c) Reshape displacement arrays to match array of subbox points
         newshape = [
             int((self.shape[0] - 1) / self.boxsize) + 1,
             int((self.shape[1] - 1) / self.boxsize) + 1,
         ]
-        umat = np.array(velocity[0], dtype=np.float32).reshape(newshape)
-        vmat = np.array(velocity[1], dtype=np.float32).reshape(newshape)
+        umat = u.astype(np.float32).reshape(newshape)
+        vmat = v.astype(np.float32).reshape(newshape)
         weights = box_weights.reshape(newshape)
 
         # (d) Check for extreme advection displacements (over a significant
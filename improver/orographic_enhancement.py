@@ -72,7 +72,7 @@ class OrographicEnhancement(BasePlugin):
             and Planetary Sciences, 33, 645-671.
     """
 
-    def __init__(self):
+    def __init__(self, stream_distances=False):
         """
         Initialise the plugin with thresholds from STEPS code.  Usage as
         follows:
@@ -97,6 +97,13 @@ class OrographicEnhancement(BasePlugin):
         Create placeholder class members for regridded variable cubes
         (orography, temperature, humidity, pressure and wind components),
         saturation vapour pressure, V.gradZ (uplift) array and grid spacing.
+
+        Args:
+            stream_distances (bool):
+                If True, the upstream contributions are accumulated one
+                upstream distance at a time, rather than from 3D arrays
+                covering all distances.  The result is the same, but the
+                memory required is much reduced for large grids.
         """
         self.orog_thresh_m = 20.0
         self.rh_thresh_ratio = 0.8
@@ -105,6 +112,7 @@ class OrographicEnhancement(BasePlugin):
         self.upstream_range_of_influence_km = 15.0
         self.cloud_lifetime_s = 102.0
         self.efficiency_factor = 0.23265
+        self.stream_distances = stream_distances
 
         # initialise class members to store regridded variables for
         # orographic enhancement calculation
@@ -304,38 +312,50 @@ class OrographicEnhancement(BasePlugin):
         )
         return np.where(point_orogenh > 0, point_orogenh, 0)
 
-    def _get_point_distances(self, wind_speed, max_sin_cos):
+    def _max_range_of_influence(self, max_sin_cos):
+        """
+        Calculate the maximum upstream range of influence at each grid cell
+
+        Args:
+            max_sin_cos (numpy.ndarray):
+                2D array containing the larger of sin(wind_direction) or
+                cos(wind_direction) with respect to grid north
+
+        Returns:
+            numpy.ndarray:
+                2D array of maximum ranges of influence in grid squares
+        """
+        upstream_roi = self.upstream_range_of_influence_km / self.grid_spacing_km
+        return (upstream_roi * max_sin_cos).astype(int)
+
+    def _get_point_distances(self, wind_speed, max_sin_cos, steps=None):
         """
         Generate 3d array of distances to upstream components
 
         Args:
             wind_speed (numpy.ndarray):
                 2D array of wind speeds
-            max_roi (numpy.ndarray):
-                2D array of maximum ranges of influence in grid squares
             max_sin_cos (numpy.ndarray):
                 2D array containing the larger of sin(wind_direction) or
                 cos(wind_direction) with respect to grid north
+            steps (range or None):
+                Upstream steps, in grid squares along the larger wind
+                component, for which to generate distances.  If None, all
+                steps up to the largest range of influence are included.
 
         Returns:
             numpy.ndarray:
                 3D array of source-to-destination distances in grid points,
                 with np.nan filled in for out of range values
         """
-        # calculate maximum upstream radius of influence at each grid cell
-        upstream_roi = self.upstream_range_of_influence_km / self.grid_spacing_km
-        max_roi = (upstream_roi * max_sin_cos).astype(int)
-
-        length = np.amax(max_roi)
-        shape = (length, wind_speed.shape[0], wind_speed.shape[1])
-        distance = np.full(shape, np.nan, dtype=np.float32)
-        for y in range(distance.shape[1]):
-            for x in range(distance.shape[2]):
-                distance[: max_roi[y, x], y, x] = (
-                    np.arange(max_roi[y, x]) / max_sin_cos[y, x]
-                )
+        max_roi = self._max_range_of_influence(max_sin_cos)
+        if steps is None:
+            steps = range(np.amax(max_roi))
 
-        return distance
+        step = np.array(steps).reshape(-1, 1, 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            distance = np.where(step < max_roi, step / max_sin_cos, np.nan)
+        return distance.astype(np.float32).reshape((-1,) + wind_speed.shape)
 
     @staticmethod
     def _locate_source_points(wind_speed, distance, sin_wind_dir, cos_wind_dir):
@@ -409,14 +429,8 @@ class OrographicEnhancement(BasePlugin):
                 **sum_of_weights** (numpy.ndarray):
                     2D array containing weights for normalisation
         """
-        source_values = np.fromiter(
-            (
-                point_orogenh[y, x]
-                for (x, y) in zip(x_source.flatten(), y_source.flatten())
-            ),
-            np.float32,
-            count=x_source.size,
-        ).reshape(x_source.shape)
+        flat_source = np.ravel_multi_index((y_source, x_source), point_orogenh.shape)
+        source_values = np.take(point_orogenh, flat_source).astype(np.float32)
 
         # set standard deviation for Gaussian weighting function in grid
         # squares
@@ -462,18 +476,30 @@ class OrographicEnhancement(BasePlugin):
             abs(sin_wind_dir) > abs(cos_wind_dir), abs(sin_wind_dir), abs(cos_wind_dir)
         )
 
-        # generate 3D array of distances to source points
-        distance = self._get_point_distances(wind_speed, max_sin_cos)
-
-        # calculate positions of source points
-        x_source, y_source = self._locate_source_points(
-            wind_speed, distance, sin_wind_dir, cos_wind_dir
-        )
-
-        # compute weighted enhancements summed over all source points
-        orogenh, sum_of_weights = self._compute_weighted_values(
-            point_orogenh, x_source, y_source, distance, wind_speed
-        )
+        # compute weighted enhancements summed over all source points, either
+        # for all upstream distances together or one distance at a time
+        if self.stream_distances:
+            max_roi = self._max_range_of_influence(max_sin_cos)
+            steps = [range(step, step + 1) for step in range(np.amax(max_roi))]
+        else:
+            steps = [None]
+
+        orogenh = np.zeros(wind_speed.shape, dtype=np.float32)
+        sum_of_weights = np.zeros(wind_speed.shape, dtype=np.float32)
+        for step in steps:
+            # generate 3D array of distances to source points
+            distance = self._get_point_distances(wind_speed, max_sin_cos, steps=step)
+
+            # calculate positions of source points
+            x_source, y_source = self._locate_source_points(
+                wind_speed, distance, sin_wind_dir, cos_wind_dir
+            )
+
+            weighted_values, weights = self._compute_weighted_values(
+                point_orogenh, x_source, y_source, distance, wind_speed
+            )
+            orogenh = orogenh + weighted_values
+            sum_of_weights = sum_of_weights + weights
 
         # normalise by weights and scale by efficiency factor
         orogenh[mask] = self.efficiency_factor * np.divide(
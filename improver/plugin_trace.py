@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Module containing utilities to record the time and memory used by each
+plugin call."""
+
+import atexit
+import json
+import numbers
+import os
+import sys
+import threading
+import time
+
+# Environment variable naming a file to which plugin calls are recorded, so
+# that they are traced without changing how improver is run.
+TRACE_FILE_VARIABLE = "IMPROVER_PLUGIN_TRACE"
+
+# linux reports max_rss in KiB, other platforms in bytes
+_RSS_BYTES = 1024 if sys.platform == "linux" else 1
+
+_tracer = None
+
+
+def _max_rss():
+    """Return the maximum resident set size of the process so far, in bytes."""
+    # resource is only available on POSIX, so is imported only when tracing
+    from resource import RUSAGE_SELF, getrusage
+
+    return getrusage(RUSAGE_SELF).ru_maxrss * _RSS_BYTES
+
+
+def _array_bytes(obj, depth=0):
+    """Return the total size in bytes of the arrays in an object.
+
+    Cubes (or other objects with a core_data method) are sized without
+    realising lazy data, and lists, tuples and dictionary values are
+    searched for arrays to a limited depth.
+
+    Args:
+        obj:
+            Argument or result of a plugin.
+        depth (int):
+            Depth of the object within containers.
+
+    Returns:
+        int:
+            Number of bytes.
+    """
+    if hasattr(obj, "core_data"):
+        obj = obj.core_data()
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, numbers.Integral):
+        return int(nbytes)
+    if depth < 2:
+        if isinstance(obj, dict):
+            obj = list(obj.values())
+        if isinstance(obj, (list, tuple)):
+            return sum(_array_bytes(item, depth + 1) for item in obj)
+    return 0
+
+
+class PluginTracer:
+    """Record of plugin calls, written as JSON lines or a Chrome trace.
+
+    Each plugin call is recorded with the wall and CPU time it took, the
+    number of bytes in its input and output arrays, and how much it raised
+    the maximum resident set size of the process. Calls made by other
+    plugins are recorded with their depth in the stack of plugin calls.
+    """
+
+    def __init__(self, filename):
+        """Create a tracer writing to a file.
+
+        Args:
+            filename (str):
+                File to write the trace to. Files ending with .json are
+                written at exit in the Chrome trace event format, which can
+                be opened with chrome://tracing or Perfetto. Otherwise, each
+                call is written as a line of JSON when it ends.
+        """
+        self.filename = filename
+        self.chrome_trace = filename.endswith(".json")
+        self.events = []
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.start = time.perf_counter()
+        self.output = None if self.chrome_trace else open(filename, "w")
+
+    def call(self, plugin, method, args, kwargs):
+        """Call a plugin method and record the call.
+
+        Args:
+            plugin (improver.BasePlugin):
+                Plugin being called.
+            method (callable):
+                Method to call.
+            args (tuple):
+                Positional arguments of the method.
+            kwargs (dict):
+                Keyword arguments of the method.
+
+        Returns:
+            Result of the method.
+        """
+        depth = getattr(self.local, "depth", 0)
+        input_bytes = _array_bytes(args) + _array_bytes(kwargs)
+        max_rss = _max_rss()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        self.local.depth = depth + 1
+        try:
+            result = method(*args, **kwargs)
+        finally:
+            self.local.depth = depth
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+        record = {
+            "plugin": f"{type(plugin).__module__}.{type(plugin).__qualname__}",
+            "depth": depth,
+            "start": wall_start - self.start,
+            "wall_time": wall_time,
+            "cpu_time": cpu_time,
+            "input_bytes": input_bytes,
+            "output_bytes": _array_bytes(result),
+            "max_rss_increase": _max_rss() - max_rss,
+        }
+        self.write(record)
+        return result
+
+    def write(self, record):
+        """Write the record of a plugin call, or keep it to write as part of
+        a Chrome trace.
+
+        Args:
+            record (dict):
+                Record of a plugin call.
+        """
+        if self.chrome_trace:
+            event = {
+                "name": record["plugin"].rpartition(".")[2],
+                "cat": "plugin",
+                "ph": "X",
+                "ts": record["start"] * 1e6,
+                "dur": record["wall_time"] * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": record,
+            }
+            with self.lock:
+                self.events.append(event)
+        else:
+            line = json.dumps(record) + "\n"
+            with self.lock:
+                self.output.write(line)
+                self.output.flush()
+
+    def close(self):
+        """Finish writing the trace."""
+        if self.chrome_trace:
+            with open(self.filename, "w") as output:
+                json.dump({"traceEvents": self.events}, output)
+        else:
+            self.output.close()
+
+
+def trace_enable(filename):
+    """Start recording plugin calls to a file, which is completed at exit.
+
+    Args:
+        filename (str):
+            File to write the trace to, as a Chrome trace if it ends with
+            .json, or as JSON lines otherwise.
+    """
+    global _tracer
+    trace_disable()
+    _tracer = PluginTracer(filename)
+    atexit.register(trace_disable)
+
+
+def trace_disable():
+    """Stop recording plugin calls and finish writing the trace, if any."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        atexit.unregister(trace_disable)
+        tracer.close()
+
+
+def trace_call(plugin, method, args, kwargs):
+    """Call a plugin method, recording the call if tracing is enabled.
+
+    Args:
+        plugin (improver.BasePlugin):
+            Plugin being called.
+        method (callable):
+            Method to call.
+        args (tuple):
+            Positional arguments of the method.
+        kwargs (dict):
+            Keyword arguments of the method.
+
+    Returns:
+        Result of the method.
+    """
+    if _tracer is None:
+        return method(*args, **kwargs)
+    return _tracer.call(plugin, method, args, kwargs)
+
+
+if os.environ.get(TRACE_FILE_VARIABLE):
+    trace_enable(os.environ[TRACE_FILE_VARIABLE])
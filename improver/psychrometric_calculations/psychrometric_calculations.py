@@ -31,6 +31,7 @@
 """Module to contain Psychrometric Calculations."""
 
 import functools
+import os
 
 import iris
 import numpy as np
@@ -40,15 +41,16 @@ from stratify import interpolate
 
 import improver.constants as consts
 from improver import BasePlugin
-from improver.generate_ancillaries.generate_svp_table import (
-    SaturatedVapourPressureTable,
-)
+from improver.generate_ancillaries.generate_svp_table import svp_table
 from improver.metadata.utilities import (
     create_new_diagnostic_cube,
     generate_mandatory_attributes,
 )
 from improver.utilities.cube_checker import check_cube_coordinates
-from improver.utilities.cube_manipulation import sort_coord_in_cube
+from improver.utilities.cube_manipulation import (
+    get_dim_coord_names,
+    sort_coord_in_cube,
+)
 from improver.utilities.interpolation import interpolate_missing_data
 from improver.utilities.mathematical_operations import Integration, fast_linear_fit
 from improver.utilities.spatial import (
@@ -60,6 +62,18 @@ SVP_T_MIN = 183.15
 SVP_T_MAX = 338.25
 SVP_T_INCREMENT = 0.1
 
+# Environment variable naming a directory in which the SVP table is cached, so
+# that it is shared by, rather than recalculated in, every process.
+SVP_TABLE_CACHE_DIR_VARIABLE = "IMPROVER_SVP_TABLE_CACHE_DIR"
+
+# Axes of the wet bulb temperature lookup table: (minimum, number of points,
+# increment) for temperature (K), relative humidity (1) and pressure (Pa).
+# Relative humidities extend above 1 to cover supersaturated inputs.
+WBT_TABLE_TEMPERATURE = (SVP_T_MIN, 156, 1.0)
+WBT_TABLE_RELATIVE_HUMIDITY = (0.0, 25, 0.05)
+WBT_TABLE_PRESSURE = (1.0e4, 41, 2.5e3)
+WBT_TABLE_PRECISION = 1.0e-4
+
 
 @functools.lru_cache()
 def _svp_table():
@@ -67,6 +81,8 @@ def _svp_table():
     Calculate a saturated vapour pressure (SVP) lookup table.
     The lru_cache decorator caches this table on first call to this function,
     so that the table does not need to be re-calculated if used multiple times.
+    If the IMPROVER_SVP_TABLE_CACHE_DIR environment variable is set, the table
+    is also cached on disk in that directory, to be shared between processes.
 
     A value of SVP for any temperature between T_MIN and T_MAX (inclusive) can be
     obtained by interpolating through the table, as is done in the _svp_from_lookup
@@ -76,10 +92,12 @@ def _svp_table():
         numpy.ndarray:
             Array of saturated vapour pressures (Pa).
     """
-    svp_data = SaturatedVapourPressureTable(
-        t_min=SVP_T_MIN, t_max=SVP_T_MAX, t_increment=SVP_T_INCREMENT
-    ).process()
-    return svp_data.data
+    return svp_table(
+        SVP_T_MIN,
+        SVP_T_MAX,
+        SVP_T_INCREMENT,
+        cache_dir=os.environ.get(SVP_TABLE_CACHE_DIR_VARIABLE),
+    )
 
 
 def _svp_from_lookup(temperature):
@@ -135,6 +153,81 @@ def calculate_svp_in_air(temperature, pressure):
     return svp * correction.astype(np.float32)
 
 
+@functools.lru_cache()
+def _wet_bulb_temperature_table():
+    """
+    Calculate a lookup table of wet bulb temperatures on a regular grid of
+    temperature, relative humidity and pressure, with axes defined by
+    WBT_TABLE_TEMPERATURE, WBT_TABLE_RELATIVE_HUMIDITY and WBT_TABLE_PRESSURE.
+    The lru_cache decorator caches this table on first call to this function,
+    so that the table does not need to be re-calculated if used multiple times.
+
+    Returns:
+        numpy.ndarray:
+            3D array of wet bulb temperatures (K), with dimensions of
+            temperature, relative humidity and pressure.
+    """
+    axes = [
+        start + increment * np.arange(points)
+        for start, points, increment in (
+            WBT_TABLE_TEMPERATURE,
+            WBT_TABLE_RELATIVE_HUMIDITY,
+            WBT_TABLE_PRESSURE,
+        )
+    ]
+    temperature, relative_humidity, pressure = np.meshgrid(*axes, indexing="ij")
+    return WetBulbTemperature(
+        precision=WBT_TABLE_PRECISION
+    )._calculate_wet_bulb_temperature(pressure, relative_humidity, temperature)
+
+
+def _wet_bulb_temperature_from_lookup(temperature, relative_humidity, pressure):
+    """
+    Gets an approximate wet bulb temperature from a pre-calculated lookup
+    table, interpolating linearly between points in the table along each of
+    its axes. Inputs outside the range of the table are clipped to within it.
+
+    Args:
+        temperature (numpy.ndarray):
+            Array of air temperatures (K).
+        relative_humidity (numpy.ndarray):
+            Array of relative humidities (1).
+        pressure (numpy.ndarray):
+            Array of air pressures (Pa).
+
+    Returns:
+        numpy.ndarray:
+            Array of approximate wet bulb temperatures (K).
+    """
+    table = _wet_bulb_temperature_table()
+    strides = np.array(table.strides) // table.itemsize
+    flat_index = 0
+    factors = []
+    for values, (start, points, increment), stride in zip(
+        (temperature, relative_humidity, pressure),
+        (WBT_TABLE_TEMPERATURE, WBT_TABLE_RELATIVE_HUMIDITY, WBT_TABLE_PRESSURE),
+        strides,
+    ):
+        table_position = np.clip((values - start) / increment, 0, points - 1)
+        table_index = np.minimum(table_position.astype(int), points - 2)
+        flat_index = flat_index + stride * table_index
+        factors.append(table_position - table_index)
+
+    # Gather the values at the corners of the enclosing table cells, then
+    # interpolate between pairs of bracketing values along each axis in turn,
+    # starting with the last.
+    corner_values = [
+        np.take(table, flat_index + np.dot(corner, strides))
+        for corner in np.ndindex(2, 2, 2)
+    ]
+    for factor in reversed(factors):
+        corner_values = [
+            lower + factor * (upper - lower)
+            for lower, upper in zip(corner_values[::2], corner_values[1::2])
+        ]
+    return corner_values[0]
+
+
 class WetBulbTemperature(BasePlugin):
 
     """
@@ -154,7 +247,11 @@ class WetBulbTemperature(BasePlugin):
 
     """
 
-    def __init__(self, precision=0.005):
+    # Maximum number of points for which wet bulb temperatures are calculated
+    # together when processing whole cubes, limiting memory use
+    CHUNK_SIZE = 2 ** 16
+
+    def __init__(self, precision=0.005, whole_cube=False, lookup_table=False):
         """
         Initialise class.
 
@@ -162,9 +259,21 @@ class WetBulbTemperature(BasePlugin):
             precision (float):
                 The precision to which the Newton iterator must converge before
                 returning wet bulb temperatures.
+            whole_cube (bool):
+                If True, calculate wet bulb temperatures for the whole of the
+                input cubes, in chunks of at most CHUNK_SIZE points, rather
+                than slicing the inputs over vertical levels. The input cubes
+                must then have matching dimensions.
+            lookup_table (bool):
+                If True, use wet bulb temperatures interpolated from a lookup
+                table as the first guess for the Newton iterator, rather than
+                the air temperature. Fewer iterations are then needed to reach
+                the requested precision.
         """
         self.precision = precision
         self.maximum_iterations = 20
+        self.whole_cube = whole_cube
+        self.lookup_table = lookup_table
 
     @staticmethod
     def _slice_inputs(temperature, relative_humidity, pressure):
@@ -344,18 +453,26 @@ class WetBulbTemperature(BasePlugin):
         # Initialise psychrometric variables
         wbt_data_upd = wbt_data = temperature.flatten()
         pressure = pressure.flatten()
+        relative_humidity = relative_humidity.flatten()
 
         latent_heat = self._calculate_latent_heat(wbt_data)
         saturation_mixing_ratio = self._calculate_mixing_ratio(wbt_data, pressure)
-        mixing_ratio = relative_humidity.flatten() * saturation_mixing_ratio
+        mixing_ratio = relative_humidity * saturation_mixing_ratio
         specific_heat = self._calculate_specific_heat(mixing_ratio)
         enthalpy = self._calculate_enthalpy(
             mixing_ratio, specific_heat, latent_heat, wbt_data
         )
         del mixing_ratio
 
-        # Iterate to find the wet bulb temperature, using temperature as first
-        # guess
+        # Use wet bulb temperatures from the lookup table as the first guess
+        # if requested, otherwise the air temperature
+        if self.lookup_table:
+            wbt_data_upd = wbt_data = _wet_bulb_temperature_from_lookup(
+                wbt_data, relative_humidity, pressure
+            ).astype(wbt_data.dtype)
+            saturation_mixing_ratio = self._calculate_mixing_ratio(wbt_data, pressure)
+
+        # Iterate to find the wet bulb temperature
         iteration = 0
         to_update = np.arange(temperature.size)
         update_to_update = slice(None)
@@ -422,12 +539,69 @@ class WetBulbTemperature(BasePlugin):
         )
         return wbt
 
+    def _process_whole_cube(self, temperature, relative_humidity, pressure):
+        """
+        Calculate wet bulb temperatures for the whole of the input cubes,
+        working through the flattened data in chunks of at most CHUNK_SIZE
+        points to limit memory use. The input cubes are not modified.
+
+        Args:
+            temperature (iris.cube.Cube):
+                Cube of air temperatures.
+            relative_humidity (iris.cube.Cube):
+                Cube of relative humidities.
+            pressure (iris.cube.Cube):
+                Cube of air pressures.
+
+        Returns:
+            iris.cube.Cube:
+                Cube of wet bulb temperature (K).
+
+        Raises:
+            ValueError: If the input cubes do not have matching dimensions.
+        """
+        dim_coords = get_dim_coord_names(temperature)
+        for cube in [relative_humidity, pressure]:
+            if (
+                cube.shape != temperature.shape
+                or get_dim_coord_names(cube) != dim_coords
+            ):
+                raise ValueError("WetBulbTemperature: Cubes have differing dimensions.")
+
+        temperature_data, relative_humidity_data, pressure_data = [
+            cube.units.convert(cube.data, unit).reshape(-1)
+            for cube, unit in [
+                (temperature, "K"),
+                (relative_humidity, "1"),
+                (pressure, "Pa"),
+            ]
+        ]
+        wbt_data = np.empty_like(temperature_data)
+        for start in range(0, wbt_data.size, self.CHUNK_SIZE):
+            chunk = slice(start, start + self.CHUNK_SIZE)
+            wbt_data[chunk] = self._calculate_wet_bulb_temperature(
+                pressure_data[chunk],
+                relative_humidity_data[chunk],
+                temperature_data[chunk],
+            )
+
+        attributes = generate_mandatory_attributes(
+            [temperature, relative_humidity, pressure]
+        )
+        return create_new_diagnostic_cube(
+            "wet_bulb_temperature",
+            "K",
+            temperature,
+            attributes,
+            data=wbt_data.reshape(temperature.shape),
+        )
+
     def process(self, cubes):
         """
         Call the calculate_wet_bulb_temperature function to calculate wet bulb
-        temperatures. This process function splits input cubes over vertical
-        levels to mitigate memory issues when trying to operate on multi-level
-        data.
+        temperatures. Unless whole_cube is set, this process function splits
+        input cubes over vertical levels to mitigate memory issues when trying
+        to operate on multi-level data.
 
         Args:
             cubes (iris.cube.CubeList or list or iris.cube.Cube):
@@ -453,6 +627,9 @@ class WetBulbTemperature(BasePlugin):
             CubeList(cubes).extract_strict(n) for n in names_to_extract
         )
 
+        if self.whole_cube:
+            return self._process_whole_cube(temperature, relative_humidity, pressure)
+
         slices = self._slice_inputs(temperature, relative_humidity, pressure)
 
         cubelist = iris.cube.CubeList([])
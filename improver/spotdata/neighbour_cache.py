@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""On-disk cache of the grid point neighbours found for spot sites."""
+
+import os
+import zipfile
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from improver.metadata.utilities import generate_hash
+from improver.utilities.save import atomic_write
+
+
+class NeighbourCache:
+    """
+    A cache, held in files within a directory, of the grid point neighbours
+    found for individual spot sites and of the KDTrees used to find them.
+    Grids and site lists rarely change, so neighbour finding can reuse these
+    and only has to find the neighbours of sites that have been added.
+
+    Only plain arrays are cached, in .npz files that are loaded without
+    unpickling any objects. KDTrees are rebuilt from their cached nodes.
+    """
+
+    def __init__(self, cache_dir):
+        """
+        Args:
+            cache_dir (str):
+                The directory in which the cache files are kept. This is
+                created if it does not exist.
+        """
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, kind, key):
+        """Path of the cache file for arrays of the given kind and key."""
+        return os.path.join(self.cache_dir, "{}_{}.npz".format(kind, key))
+
+    def _load(self, kind, key, names):
+        """Load cached arrays, returning None if they are not in the cache."""
+        try:
+            with np.load(self._path(kind, key), allow_pickle=False) as arrays:
+                return [arrays[name] for name in names]
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            return None
+
+    def _save(self, kind, key, **arrays):
+        """Save arrays to the cache."""
+        with atomic_write(self._path(kind, key)) as cache_file:
+            np.savez(cache_file, **arrays)
+
+    def kdtree(self, key, build_kdtree):
+        """
+        Get a KDTree and the grid indices of its nodes from the cache,
+        building and caching them if they are not already cached.
+
+        Args:
+            key (str):
+                A hash identifying the grid and the constraints on the nodes
+                included in the tree.
+            build_kdtree (callable):
+                Function taking no arguments that builds the tree, returning
+                a tuple of the tree and the node indices.
+        Returns:
+            (tuple): tuple containing:
+                **scipy.spatial.ckdtree.cKDTree**:
+                    The KDTree.
+                **numpy.ndarray**:
+                    An array of shape (n_nodes, 2) that contains the x and y
+                    indices that correspond to each node.
+        """
+        cached = self._load("kdtree", key, ["nodes", "index_nodes"])
+        if cached is None:
+            tree, index_nodes = build_kdtree()
+            self._save("kdtree", key, nodes=tree.data, index_nodes=index_nodes)
+            return tree, index_nodes
+        nodes, index_nodes = cached
+        return cKDTree(nodes), index_nodes
+
+    @staticmethod
+    def site_keys(sites):
+        """
+        Generate a hash identifying each spot site from all its properties.
+
+        Args:
+            sites (list of dict):
+                A list of dictionaries defining the spot sites.
+        Returns:
+            list of str:
+                A hash for each site.
+        """
+        return [generate_hash(site) for site in sites]
+
+    def neighbours(self, key):
+        """
+        Get the cached neighbours of spot sites found on a grid with a
+        neighbour finding method.
+
+        Args:
+            key (str):
+                A hash identifying the grid, its orography and land mask and
+                the neighbour finding method.
+        Returns:
+            dict:
+                The neighbours of each site, keyed on the site hash. Each
+                value is a tuple of the x and y indices of the grid point
+                neighbour and the altitude of the site.
+        """
+        cached = self._load("neighbours", key, ["site_keys", "indices", "altitudes"])
+        if cached is None:
+            return {}
+        site_keys, indices, altitudes = cached
+        return {
+            str(site_key): (
+                tuple(int(index) for index in site_indices),
+                float(altitude),
+            )
+            for site_key, site_indices, altitude in zip(site_keys, indices, altitudes)
+        }
+
+    def update_neighbours(self, key, neighbours):
+        """
+        Add the neighbours of spot sites to the cache.
+
+        Args:
+            key (str):
+                A hash identifying the grid, its orography and land mask and
+                the neighbour finding method.
+            neighbours (dict):
+                The neighbours of each site, keyed on the site hash, as
+                returned by the neighbours method.
+        """
+        cached = self.neighbours(key)
+        cached.update(neighbours)
+        self._save(
+            "neighbours",
+            key,
+            site_keys=np.array(list(cached), dtype=str),
+            indices=np.array(
+                [indices for indices, _ in cached.values()], dtype=np.int64
+            ).reshape(-1, 2),
+            altitudes=np.array(
+                [altitude for _, altitude in cached.values()], dtype=np.float64
+            ),
+        )
@@ -38,8 +38,13 @@ import numpy as np
 from scipy.spatial import cKDTree
 
 from improver import BasePlugin
-from improver.metadata.utilities import create_coordinate_hash
+from improver.metadata.utilities import (
+    create_coordinate_hash,
+    generate_hash,
+    hash_array,
+)
 from improver.spotdata.build_spotdata_cube import build_spotdata_cube
+from improver.spotdata.neighbour_cache import NeighbourCache
 from improver.utilities.cube_manipulation import enforce_coordinate_ordering
 
 
@@ -72,6 +77,7 @@ class NeighbourSelection(BasePlugin):
         site_x_coordinate="longitude",
         site_y_coordinate="latitude",
         node_limit=36,
+        cache_dir=None,
     ):
         """
         Args:
@@ -99,6 +105,12 @@ class NeighbourSelection(BasePlugin):
                 The upper limit for the number of nearest neighbours to return
                 when querying the tree for a selection of neighbours from which
                 one matching the minimum_dz constraint will be picked.
+            cache_dir (str or None):
+                If set, a directory in which to cache the KDTrees built and
+                the neighbours found for each site, so that later calls for
+                the same grid only need to find the neighbours of sites that
+                are not already cached. The cache must only be writable by
+                trusted users.
         """
         self.minimum_dz = minimum_dz
         self.land_constraint = land_constraint
@@ -109,6 +121,7 @@ class NeighbourSelection(BasePlugin):
         self.site_altitude = "altitude"
         self.node_limit = node_limit
         self.global_coordinate_system = False
+        self.cache = None if cache_dir is None else NeighbourCache(cache_dir)
 
     def __repr__(self):
         """Represent the configured plugin instance as a string."""
@@ -265,8 +278,10 @@ class NeighbourSelection(BasePlugin):
     @staticmethod
     def get_nearest_indices(site_coords, cube):
         """
-        Uses the iris cube method nearest_neighbour_index to find the nearest
-        grid points to a site.
+        Finds the nearest grid points to the sites, giving the same result as
+        the iris coordinate method nearest_neighbour_index. The sites are
+        considered together, except for circular coordinates, where
+        nearest_neighbour_index is used for each site in turn.
 
         Args:
             site_coords (numpy.ndarray):
@@ -280,13 +295,15 @@ class NeighbourSelection(BasePlugin):
                 of the nearest grid points to the sites.
         """
         nearest_indices = np.zeros((len(site_coords), 2)).astype(np.int)
-        for index, (x_point, y_point) in enumerate(site_coords):
-            nearest_indices[index, 0] = cube.coord(axis="x").nearest_neighbour_index(
-                x_point
-            )
-            nearest_indices[index, 1] = cube.coord(axis="y").nearest_neighbour_index(
-                y_point
-            )
+        for axis, (coord, points) in enumerate(
+            zip([cube.coord(axis="x"), cube.coord(axis="y")], site_coords.T)
+        ):
+            if coord.circular:
+                nearest_indices[:, axis] = [
+                    coord.nearest_neighbour_index(point) for point in points
+                ]
+            else:
+                nearest_indices[:, axis] = _nearest_neighbour_indices(coord, points)
         return nearest_indices
 
     @staticmethod
@@ -343,6 +360,20 @@ class NeighbourSelection(BasePlugin):
                     e.g. node=100 -->  x_coord_index=10, y_coord_index=300,
                     index_nodes[100] = [10, 300]
         """
+        if self.cache is not None:
+            key = generate_hash(
+                [
+                    create_coordinate_hash(land_mask),
+                    hash_array(land_mask.data),
+                    self.land_constraint,
+                    self.global_coordinate_system,
+                ]
+            )
+            return self.cache.kdtree(key, lambda: self._build_KDTree(land_mask))
+        return self._build_KDTree(land_mask)
+
+    def _build_KDTree(self, land_mask):
+        """Build a KDTree, without using any cache.  See build_KDTree."""
         if self.land_constraint:
             included_points = np.nonzero(land_mask.data)
         else:
@@ -396,98 +427,118 @@ class NeighbourSelection(BasePlugin):
                 point neighbour. Returns None if no valid neighbours were found
                 in the tree query.
         """
-        # Values beyond the imposed search radius are set to inf,
-        # these need to be excluded.
-        valid_indices = np.where(np.isfinite(distance))
-
+        grid_points, found = self.select_minimum_dz_neighbours(
+            orography,
+            np.array([site_altitude]),
+            index_nodes,
+            distance[np.newaxis],
+            indices[np.newaxis],
+        )
         # If no valid neighbours are available in the tree, return None.
-        if valid_indices[0].shape[0] == 0:
+        if not found[0]:
             return None
+        return grid_points[0]
+
+    def select_minimum_dz_neighbours(
+        self, orography, site_altitudes, index_nodes, distances, indices
+    ):
+        """
+        Given a selection of nearest neighbours to each of many sites, this
+        function chooses the neighbour of each site with the minimum absolute
+        vertical displacement, in the same way as select_minimum_dz, but for
+        all the sites together. A single warning is raised if the node_limit
+        may be insufficient to reach the search radius for any of the sites.
+
+        Args:
+            orography (iris.cube.Cube):
+                A cube of orography, used to obtain the grid point altitudes.
+            site_altitudes (numpy.ndarray):
+                The altitudes of the spot sites being considered.
+            index_nodes (numpy.ndarray):
+                An array of shape (n_nodes, 2) that contains the x and y
+                indices that correspond to the selected node,
+            distances (numpy.ndarray):
+                An array of shape (n_sites, n_neighbours) that contains the
+                distances from each spot site to each grid point neighbour
+                being considered, which are np.inf beyond the search_radius.
+            indices (numpy.ndarray):
+                An array of shape (n_sites, n_neighbours) of tree node indices
+                identifying the neighbouring grid points, corresponding to the
+                array of distances.
+        Returns:
+            (tuple): tuple containing:
+                **grid_points** (numpy.ndarray):
+                    An array of shape (n_sites, 2) giving the x and y indices
+                    of the chosen grid point neighbour of each site.
+                **found** (numpy.ndarray):
+                    A boolean array which is False for any sites with no
+                    valid neighbours in the tree query, for which the grid
+                    points returned are not meaningful.
+        """
+        # Values beyond the imposed search radius are set to inf,
+        # these need to be excluded.
+        valid = np.isfinite(distances)
 
         # If the last distance is finite the number of tree nodes may not be
         # sufficient to fill the search radius, raise a warning.
-        if np.isfinite(distance[-1]):
+        incomplete = np.count_nonzero(valid[:, -1])
+        if incomplete:
             msg = (
                 "Limit on number of nearest neighbours to return, {}, may "
-                "not be sufficiently large to fill search_radius {}".format(
-                    self.node_limit, self.search_radius
+                "not be sufficiently large to fill search_radius {} for {} "
+                "of {} sites".format(
+                    self.node_limit, self.search_radius, incomplete, len(valid)
                 )
             )
             warnings.warn(msg)
 
-        indices = indices[valid_indices]
-
-        # Calculate the difference in height between the spot site
-        # and grid point.
-        grid_point_altitudes = orography.data[tuple(index_nodes[indices].T)]
-        vertical_displacements = abs(grid_point_altitudes - site_altitude)
-
-        # The tree returns an ordered array, the first element
-        # being the closest. We search the array for the first
-        # element that matches the minimum vertical displacement
-        # found, giving us the nearest such point.
-        index_of_minimum = np.argmax(
-            vertical_displacements == vertical_displacements.min()
+        # Calculate the difference in height between each spot site and its
+        # grid point neighbours, gathering the altitudes for all sites
+        # together. Invalid tree nodes are replaced by the first node and
+        # masked.
+        node_indices = index_nodes[np.where(valid, indices, 0)]
+        grid_point_altitudes = orography.data[
+            node_indices[..., 0], node_indices[..., 1]
+        ]
+        vertical_displacements = np.ma.masked_where(
+            ~valid,
+            abs(grid_point_altitudes - site_altitudes.astype(float)[:, np.newaxis]),
         )
-        grid_point = index_nodes[indices][index_of_minimum]
 
-        return grid_point
+        # The tree returns ordered arrays, the first element being the
+        # closest. The first element that matches the minimum vertical
+        # displacement found is chosen, giving us the nearest such point.
+        index_of_minimum = vertical_displacements.argmin(axis=1)
+        grid_points = node_indices[np.arange(len(valid)), index_of_minimum]
 
-    def process(self, sites, orography, land_mask):
+        return grid_points, valid.any(axis=1)
+
+    def _find_neighbours(self, sites, orography, land_mask):
         """
-        Using the constraints provided, find the nearest grid point neighbours
-        to the given spot sites for the model/grid given by the input cubes.
-        Returned is a cube that contains the defining characteristics of the
-        spot sites (e.g. x coordinate, y coordinate, altitude) and the indices
-        of the selected grid point neighbour.
+        Find the grid point neighbours of the spot sites that fall within the
+        domain of the grid, using the constraints provided.
 
         Args:
             sites (list of dict):
                 A list of dictionaries defining the spot sites for which
-                neighbours are to be found. e.g.:
-
-                   [{'altitude': 11.0, 'latitude': 57.867000579833984,
-                    'longitude': -5.632999897003174, 'wmo_id': 3034}]
-
+                neighbours are to be found.
             orography (iris.cube.Cube):
-                A cube of orography, used to obtain the grid point altitudes.
+                A cube of orography, used to obtain the grid point altitudes,
+                with x-y ordered dimensions.
             land_mask (iris.cube.Cube):
                 A land mask cube for the model/grid from which grid point
-                neighbours are being selected, with land points set to one and
-                sea points set to zero.
+                neighbours are being selected, with x-y ordered dimensions.
         Returns:
-            iris.cube.Cube:
-                A cube containing both the spot site information and for each
-                the grid point indices of its nearest neighbour as per the
-                imposed constraints.
+            (tuple): tuple containing:
+                **sites** (numpy.ndarray):
+                    The sites that fall within the grid domain.
+                **nearest_indices** (numpy.ndarray):
+                    An array of shape (n_sites, 2) that contains the x and y
+                    indices of the grid point neighbour of each site.
+                **site_altitudes** (numpy.ndarray):
+                    The altitude of each site, using the nearest point
+                    orography height for any that are unset.
         """
-        # Check if we are dealing with a global grid.
-        self.global_coordinate_system = orography.coord(axis="x").circular
-
-        # Exclude regional grids with spatial dimensions other than metres.
-        if not self.global_coordinate_system:
-            if not orography.coord(axis="x").units == "metres":
-                msg = (
-                    "Cube spatial coordinates for regional grids must be"
-                    "in metres to match the defined search_radius."
-                )
-                raise ValueError(msg)
-
-        # Ensure land_mask and orography are on the same grid.
-        if not orography.dim_coords == land_mask.dim_coords:
-            msg = "Orography and land_mask cubes are not on the same " "grid."
-            raise ValueError(msg)
-
-        # Enforce x-y coordinate order for input cubes.
-        enforce_coordinate_ordering(
-            orography,
-            [orography.coord(axis="x").name(), orography.coord(axis="y").name()],
-        )
-        enforce_coordinate_ordering(
-            land_mask,
-            [land_mask.coord(axis="x").name(), land_mask.coord(axis="y").name()],
-        )
-
         # Remap site coordinates on to coordinate system of the model grid.
         site_x_coords = np.array([site[self.site_x_coordinate] for site in sites])
         site_y_coords = np.array([site[self.site_y_coordinate] for site in sites])
@@ -554,18 +605,139 @@ class NeighbourSelection(BasePlugin):
                     distance_upper_bound=self.search_radius,
                     k=self.node_limit,
                 )
-                # Loop over the sites and for each choose the returned
-                # neighbour with the minimum vertical displacement.
-                for index, (distance, indices) in enumerate(
-                    zip(distances[0], node_indices[0])
-                ):
-                    grid_point = self.select_minimum_dz(
-                        orography, site_altitudes[index], index_nodes, distance, indices
-                    )
-                    # None is returned if the tree query returned no neighbours
-                    # within the search radius.
-                    if grid_point is not None:
-                        nearest_indices[index] = grid_point
+                # Choose the returned neighbour of each site with the minimum
+                # vertical displacement, for all the sites together.
+                grid_points, found = self.select_minimum_dz_neighbours(
+                    orography,
+                    site_altitudes,
+                    index_nodes,
+                    distances[0].reshape(len(sites), self.node_limit),
+                    node_indices[0].reshape(len(sites), self.node_limit),
+                )
+                # Sites for which the tree query returned no neighbours within
+                # the search radius keep their nearest neighbour.
+                nearest_indices[found] = grid_points[found]
+
+        return sites, nearest_indices, site_altitudes
+
+    def _find_cached_neighbours(self, sites, orography, land_mask):
+        """
+        Find the grid point neighbours of the spot sites that fall within the
+        domain of the grid, reusing the neighbours of any sites that are
+        held in the cache and adding those of the other sites to it. The
+        cached neighbours are specific to the grid, its orography and land
+        mask, and the constraints provided.  See _find_neighbours.
+        """
+        key = generate_hash(
+            [
+                create_coordinate_hash(orography),
+                hash_array(orography.data),
+                hash_array(land_mask.data),
+                self.neighbour_finding_method_name(),
+                self.search_radius,
+                self.node_limit,
+                self.site_coordinate_system.proj4_init,
+                self.site_x_coordinate,
+                self.site_y_coordinate,
+            ]
+        )
+        neighbours = self.cache.neighbours(key)
+        site_keys = self.cache.site_keys(sites)
+        new_sites = [
+            site
+            for site, site_key in zip(sites, site_keys)
+            if site_key not in neighbours
+        ]
+        if new_sites:
+            new_sites, nearest_indices, site_altitudes = self._find_neighbours(
+                new_sites, orography, land_mask
+            )
+            new_neighbours = {
+                site_key: (tuple(indices), float(altitude))
+                for site_key, indices, altitude in zip(
+                    self.cache.site_keys(new_sites), nearest_indices, site_altitudes
+                )
+            }
+            self.cache.update_neighbours(key, new_neighbours)
+            neighbours.update(new_neighbours)
+
+        # Sites outside the grid domain are never cached and are omitted
+        found = [site_key in neighbours for site_key in site_keys]
+        sites = np.array(sites)[found]
+        site_neighbours = [
+            neighbours[site_key] for site_key in site_keys if site_key in neighbours
+        ]
+        nearest_indices = np.array(
+            [indices for indices, _ in site_neighbours], dtype=np.int
+        ).reshape(-1, 2)
+        site_altitudes = np.array([altitude for _, altitude in site_neighbours])
+        return sites, nearest_indices, site_altitudes
+
+    def process(self, sites, orography, land_mask):
+        """
+        Using the constraints provided, find the nearest grid point neighbours
+        to the given spot sites for the model/grid given by the input cubes.
+        Returned is a cube that contains the defining characteristics of the
+        spot sites (e.g. x coordinate, y coordinate, altitude) and the indices
+        of the selected grid point neighbour.
+
+        Args:
+            sites (list of dict):
+                A list of dictionaries defining the spot sites for which
+                neighbours are to be found. e.g.:
+
+                   [{'altitude': 11.0, 'latitude': 57.867000579833984,
+                    'longitude': -5.632999897003174, 'wmo_id': 3034}]
+
+            orography (iris.cube.Cube):
+                A cube of orography, used to obtain the grid point altitudes.
+            land_mask (iris.cube.Cube):
+                A land mask cube for the model/grid from which grid point
+                neighbours are being selected, with land points set to one and
+                sea points set to zero.
+        Returns:
+            iris.cube.Cube:
+                A cube containing both the spot site information and for each
+                the grid point indices of its nearest neighbour as per the
+                imposed constraints.
+        """
+        # Check if we are dealing with a global grid.
+        self.global_coordinate_system = orography.coord(axis="x").circular
+
+        # Exclude regional grids with spatial dimensions other than metres.
+        if not self.global_coordinate_system:
+            if not orography.coord(axis="x").units == "metres":
+                msg = (
+                    "Cube spatial coordinates for regional grids must be"
+                    "in metres to match the defined search_radius."
+                )
+                raise ValueError(msg)
+
+        # Ensure land_mask and orography are on the same grid.
+        if not orography.dim_coords == land_mask.dim_coords:
+            msg = "Orography and land_mask cubes are not on the same " "grid."
+            raise ValueError(msg)
+
+        # Enforce x-y coordinate order for input cubes.
+        enforce_coordinate_ordering(
+            orography,
+            [orography.coord(axis="x").name(), orography.coord(axis="y").name()],
+        )
+        enforce_coordinate_ordering(
+            land_mask,
+            [land_mask.coord(axis="x").name(), land_mask.coord(axis="y").name()],
+        )
+
+        if self.cache is None:
+            sites, nearest_indices, site_altitudes = self._find_neighbours(
+                sites, orography, land_mask
+            )
+        else:
+            sites, nearest_indices, site_altitudes = self._find_cached_neighbours(
+                sites, orography, land_mask
+            )
+        site_x_coords = np.array([site[self.site_x_coordinate] for site in sites])
+        site_y_coords = np.array([site[self.site_y_coordinate] for site in sites])
 
         # Calculate the vertical displacements between the chosen grid point
         # and the spot site.
@@ -618,3 +790,56 @@ class NeighbourSelection(BasePlugin):
         neighbour_cube.attributes["model_grid_hash"] = grid_hash
 
         return neighbour_cube
+
+
+def _nearest_neighbour_indices(coord, points):
+    """
+    Find the index of the cell of a one-dimensional, non-circular coordinate
+    that is nearest to each of the points, giving the same result as calling
+    the iris coordinate method nearest_neighbour_index for each point in turn.
+
+    Args:
+        coord (iris.coords.Coord):
+            The coordinate to search.
+        points (numpy.ndarray):
+            The points for which to find the nearest cells.
+    Returns:
+        numpy.ndarray:
+            The index of the nearest cell to each point.
+    """
+    points = np.asarray(points)
+    if points.size == 0:
+        return np.zeros(points.shape, dtype=np.int)
+
+    if coord.has_bounds():
+        # As in iris, sort the cells by their centres and make them
+        # contiguous, with the boundaries midway between neighbouring cells,
+        # and choose the first cell that contains each point. The end cells
+        # extend to include any points beyond them.
+        dtype = np.result_type(coord.bounds, points[0])
+        bounds = coord.bounds.astype(dtype)
+        order = np.argsort(np.mean(bounds, axis=1))
+        bounds = bounds[order]
+        if coord.bounds[0, 1] > coord.bounds[0, 0]:
+            boundaries = 0.5 * (bounds[:-1, 1] + bounds[1:, 0])
+        else:
+            boundaries = 0.5 * (bounds[:-1, 0] + bounds[1:, 1])
+        return order[np.searchsorted(boundaries, points.astype(dtype), side="left")]
+
+    # Without bounds, choose the nearest point, or the lowest index of the
+    # points that are equally near.
+    dtype = np.result_type(coord.points, points[0])
+    order = np.argsort(coord.points, kind="stable")
+    sorted_points = coord.points[order].astype(dtype)
+    points = points.astype(dtype)
+    upper = np.searchsorted(sorted_points, points)
+    lower = order[np.clip(upper - 1, 0, len(order) - 1)]
+    upper = order[np.clip(upper, 0, len(order) - 1)]
+    lower_distance = np.abs(coord.points.astype(dtype)[lower] - points)
+    upper_distance = np.abs(coord.points.astype(dtype)[upper] - points)
+    return np.where(
+        (upper_distance < lower_distance)
+        | ((upper_distance == lower_distance) & (upper < lower)),
+        upper,
+        lower,
+    )
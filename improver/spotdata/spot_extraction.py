@@ -31,6 +31,7 @@
 
 """Spot data extraction from diagnostic fields using neighbour cubes."""
 
+import dask.array as da
 import iris
 import numpy as np
 
@@ -113,6 +114,11 @@ class SpotExtraction(BasePlugin):
         works in x-y order. As such, the diagnostic cube is changed to match
         before the indices are used to extract data.
 
+        If the diagnostic cube has lazy data, the values are gathered from each
+        x-y field of the lazy data in turn, so that only the chunks containing
+        the grid points are loaded and the whole gridded array is never held
+        in memory.
+
         Args:
             coordinate_cube (iris.cube.Cube):
                 A cube containing the x and y grid coordinates for the grid
@@ -134,7 +140,18 @@ class SpotExtraction(BasePlugin):
         )
 
         x_indices, y_indices = coordinate_cube.data
-        return diagnostic_cube.data[..., y_indices, x_indices]
+        if not diagnostic_cube.has_lazy_data():
+            return diagnostic_cube.data[..., y_indices, x_indices]
+
+        data = diagnostic_cube.lazy_data()
+        leading_shape = data.shape[:-2]
+        spot_values = da.stack(
+            [
+                data[index].vindex[y_indices, x_indices]
+                for index in np.ndindex(leading_shape)
+            ]
+        )
+        return spot_values.compute().reshape(leading_shape + x_indices.shape)
 
     @staticmethod
     def build_diagnostic_cube(
@@ -31,13 +31,17 @@
 # POSSIBILITY OF SUCH DAMAGE.
 """Plugin to regrid cube data and standardise metadata"""
 
+import copy
+import os
 import warnings
+import zipfile
 
 import iris
 import numpy as np
 from iris.analysis import Linear, Nearest
 from iris.exceptions import CoordinateNotFoundError
 from scipy.interpolate import griddata
+from scipy.sparse import csr_matrix
 
 from improver import BasePlugin
 from improver.metadata.amend import amend_attributes
@@ -49,9 +53,15 @@ from improver.metadata.check_datatypes import (
 from improver.metadata.constants.attributes import MANDATORY_ATTRIBUTE_DEFAULTS
 from improver.metadata.constants.mo_attributes import MOSG_GRID_ATTRIBUTES
 from improver.metadata.constants.time_types import TIME_COORDS
+from improver.metadata.utilities import (
+    create_coordinate_hash,
+    generate_hash,
+    hash_array,
+)
 from improver.threshold import BasicThreshold
 from improver.utilities.cube_checker import spatial_coords_match
 from improver.utilities.round import round_close
+from improver.utilities.save import atomic_write
 from improver.utilities.spatial import OccurrenceWithinVicinity
 
 
@@ -227,6 +237,507 @@ class StandardiseMetadata(BasePlugin):
         return cube
 
 
+class RegridWeights:
+    """
+    Precomputed weights for regridding from one rectilinear grid to another.
+    These reproduce regridding with iris.analysis.Linear ("bilinear") or
+    iris.analysis.Nearest ("nearest"), and for "nearest-with-mask" they also
+    include the land and sea point corrections made by AdjustLandSeaPoints.
+    Bilinear weights are held as a sparse matrix and nearest neighbour weights
+    as an index map, so they are applied to every x-y slice of a cube at once
+    and can be saved to disk and reused for every cube on the same grids.
+    """
+
+    # For each iris extrapolation mode, the value used to fill out of bounds
+    # data points, the value used to fill out of bounds mask fractions and
+    # whether out of bounds points are masked if the data is not masked.
+    EXTRAPOLATION_MODES = {
+        "extrapolate": (None, None, False),
+        "error": (0, 0, False),
+        "nan": (np.nan, 0, False),
+        "mask": (np.nan, 1, True),
+        "nanmask": (np.nan, 1, False),
+    }
+
+    def __init__(
+        self,
+        source_shape,
+        target_shape,
+        extrapolation_mode,
+        out_of_bounds,
+        matrix=None,
+        source_index=None,
+        corrected=None,
+    ):
+        """
+        Initialise the weights. Either matrix or source_index must be set.
+
+        Args:
+            source_shape (tuple of int):
+                The (y, x) shape of the source grid.
+            target_shape (tuple of int):
+                The (y, x) shape of the target grid.
+            extrapolation_mode (str):
+                Mode to fill regions outside the source domain, as used by
+                iris.analysis.
+            out_of_bounds (numpy.ndarray):
+                Boolean array, over the flattened target grid, which is True
+                where a target point is outside the source domain.
+            matrix (scipy.sparse.csr_matrix or None):
+                Bilinear weights, of shape (target points, source points).
+            source_index (numpy.ndarray or None):
+                The index into the flattened source grid of the nearest
+                neighbour of each point on the flattened target grid.
+            corrected (numpy.ndarray or None):
+                Boolean array, over the flattened target grid, which is True
+                where source_index has been changed to match land and sea
+                points. These points are never masked, as in
+                AdjustLandSeaPoints.
+        """
+        if extrapolation_mode not in self.EXTRAPOLATION_MODES:
+            raise ValueError(
+                "Extrapolation mode {!r} not supported".format(extrapolation_mode)
+            )
+        if (matrix is None) == (source_index is None):
+            raise ValueError("Exactly one of matrix or source_index must be set")
+        self.source_shape = tuple(source_shape)
+        self.target_shape = tuple(target_shape)
+        self.extrapolation_mode = extrapolation_mode
+        self.out_of_bounds = out_of_bounds
+        self.matrix = matrix
+        self.source_index = source_index
+        self.corrected = corrected
+
+    def __repr__(self):
+        """Represent the weights as a string."""
+        return "<RegridWeights: {} from {} to {}; extrapolation_mode: {}>".format(
+            "bilinear" if self.source_index is None else "nearest",
+            self.source_shape,
+            self.target_shape,
+            self.extrapolation_mode,
+        )
+
+    @staticmethod
+    def _xy_coords(cube):
+        """Return the x and y dimension coordinates of a cube."""
+        x_coord = cube.coord(axis="x", dim_coords=True)
+        y_coord = cube.coord(axis="y", dim_coords=True)
+        return x_coord, y_coord
+
+    @staticmethod
+    def _find_indices(points, grid):
+        """
+        Find the indices of the grid points below each point, and the distance
+        from that grid point as a fraction of the grid spacing, in the same
+        way as iris.
+
+        Args:
+            points (numpy.ndarray):
+                The points to find on the grid.
+            grid (numpy.ndarray):
+                The monotonically increasing grid points.
+
+        Returns:
+            (tuple): tuple containing:
+                **numpy.ndarray**:
+                    The index of the grid point below each point.
+                **numpy.ndarray**:
+                    The normalised distance from that grid point.
+                **numpy.ndarray**:
+                    True where a point is outside the grid.
+        """
+        index = np.searchsorted(grid, points) - 1
+        index[index < 0] = 0
+        index[index > grid.size - 2] = grid.size - 2
+        if grid.size == 1:
+            distance = points - grid[index]
+        else:
+            distance = (points - grid[index]) / (grid[index + 1] - grid[index])
+        out_of_bounds = (points < grid[0]) | (points > grid[-1])
+        return index, distance, out_of_bounds
+
+    @classmethod
+    def from_grids(
+        cls,
+        source_grid,
+        target_grid,
+        regrid_mode="bilinear",
+        extrapolation_mode="nanmask",
+        landmask=None,
+        landmask_vicinity=25000,
+    ):
+        """
+        Calculate the weights for regridding from the source grid to the
+        target grid.
+
+        Args:
+            source_grid (iris.cube.Cube):
+                Cube on the source grid.
+            target_grid (iris.cube.Cube):
+                Cube on the target grid. For "nearest-with-mask" regridding,
+                this must contain the land-sea mask on the target grid.
+            regrid_mode (str):
+                Mode of interpolation in regridding.  Valid options are
+                "bilinear", "nearest" or "nearest-with-mask".
+            extrapolation_mode (str):
+                Mode to fill regions outside the domain in regridding.
+            landmask (iris.cube.Cube or None):
+                Land-sea mask on the source grid, required for
+                "nearest-with-mask" regridding.
+            landmask_vicinity (float):
+                Radius of vicinity to search for a coastline, in metres.
+
+        Returns:
+            improver.standardise.RegridWeights:
+                The regridding weights.
+
+        Raises:
+            ValueError: If the coordinate systems of the grids are
+                incompatible, or if the extrapolation mode is "error" and
+                target points are outside the source domain.
+        """
+        if regrid_mode == "bilinear" and extrapolation_mode == "linear":
+            # As for iris.analysis.Linear
+            extrapolation_mode = "extrapolate"
+        if extrapolation_mode not in cls.EXTRAPOLATION_MODES:
+            raise ValueError(
+                "Extrapolation mode {!r} not supported".format(extrapolation_mode)
+            )
+        source_x, source_y = cls._xy_coords(source_grid)
+        target_x, target_y = cls._xy_coords(target_grid)
+        source_cs = source_x.coord_system
+        target_cs = target_x.coord_system
+        if (source_cs is None) != (target_cs is None):
+            raise ValueError(
+                "The rectilinear grid coordinates of the given "
+                "cube and target grid must either both have "
+                "coordinate systems or both have no coordinate "
+                "system but with matching coordinate metadata."
+            )
+
+        # Sample points on the target grid, in the source coordinate system
+        sample_x, sample_y = np.meshgrid(target_x.points, target_y.points)
+        if source_cs != target_cs:
+            sample_xyz = source_cs.as_cartopy_crs().transform_points(
+                target_cs.as_cartopy_crs(), sample_x, sample_y
+            )
+            sample_x, sample_y = sample_xyz[..., 0], sample_xyz[..., 1]
+        sample_x = sample_x.astype(np.float64).ravel()
+        sample_y = sample_y.astype(np.float64).ravel()
+
+        # Monotonically increasing source points, with the source grid index
+        # of each, extended by one point if the x coordinate is circular
+        x_points, x_index = source_x.points, np.arange(source_x.shape[0])
+        y_points, y_index = source_y.points, np.arange(source_y.shape[0])
+        if x_points.size > 1 and x_points[0] > x_points[1]:
+            x_points, x_index = x_points[::-1], x_index[::-1]
+        if y_points[0] > y_points[1]:
+            y_points, y_index = y_points[::-1], y_index[::-1]
+        if source_x.circular:
+            modulus = np.array(source_x.units.modulus or 0, dtype=source_x.dtype)
+            x_points = np.append(x_points, x_points[0] + modulus)
+            x_index = np.append(x_index, x_index[0])
+
+        # Map the sample points into the range of the source points
+        if source_x.units.modulus:
+            modulus = source_x.units.modulus
+            offset = (x_points.max() + x_points.min() - modulus) * 0.5
+            sample_x -= offset
+            sample_x = (sample_x % modulus) + offset
+
+        if extrapolation_mode == "error":
+            for dim, (points, grid) in enumerate(
+                [(sample_x, x_points), (sample_y, y_points)]
+            ):
+                if not (np.all(grid[0] <= points) and np.all(points <= grid[-1])):
+                    raise ValueError(
+                        "One of the requested xi is out of "
+                        "bounds in dimension {}".format(dim)
+                    )
+
+        x_lower, x_distance, x_outside = cls._find_indices(sample_x, x_points)
+        y_lower, y_distance, y_outside = cls._find_indices(sample_y, y_points)
+        out_of_bounds = x_outside | y_outside
+        source_shape = (source_y.shape[0], source_x.shape[0])
+        target_shape = (target_y.shape[0], target_x.shape[0])
+
+        def source_flat_index(x, y):
+            """Index into the flattened source grid of extended grid points,
+            wrapping indices beyond the grid as iris does."""
+            x = x_index[np.mod(x, x_index.size)]
+            y = y_index[np.mod(y, y_index.size)]
+            return np.ravel_multi_index((y, x), source_shape)
+
+        if regrid_mode == "bilinear":
+            # Corners are ordered as by iris, so that the weighted sum for
+            # each target point is accumulated in the same order
+            x_corners = [(x_lower, 1 - x_distance), (x_lower + 1, x_distance)]
+            y_corners = [(y_lower, 1 - y_distance), (y_lower + 1, y_distance)]
+            corners = [
+                (x, y, x_weight * y_weight)
+                for x, x_weight in x_corners
+                for y, y_weight in y_corners
+            ]
+            columns = np.stack([source_flat_index(x, y) for x, y, _ in corners], -1)
+            weights = np.stack([weight for _, _, weight in corners], -1)
+            matrix = csr_matrix(
+                (
+                    weights.ravel(),
+                    columns.ravel(),
+                    np.arange(0, columns.size + 1, len(corners)),
+                ),
+                shape=(columns.shape[0], np.prod(source_shape)),
+            )
+            return cls(
+                source_shape, target_shape, extrapolation_mode, out_of_bounds, matrix
+            )
+
+        source_index = source_flat_index(
+            np.where(x_distance <= 0.5, x_lower, x_lower + 1),
+            np.where(y_distance <= 0.5, y_lower, y_lower + 1),
+        )
+        corrected = None
+        if regrid_mode == "nearest-with-mask":
+            correction = cls._land_sea_correction(
+                landmask, target_grid, landmask_vicinity
+            )
+            source_index = source_index[correction]
+            out_of_bounds = out_of_bounds[correction]
+            corrected = correction != np.arange(correction.size)
+        return cls(
+            source_shape,
+            target_shape,
+            extrapolation_mode,
+            out_of_bounds,
+            source_index=source_index,
+            corrected=corrected,
+        )
+
+    @staticmethod
+    def _land_sea_correction(landmask, target_grid, landmask_vicinity):
+        """
+        Find the target points from which AdjustLandSeaPoints takes the value
+        of each target point, by adjusting a field of target point indices.
+
+        Args:
+            landmask (iris.cube.Cube):
+                Land-sea mask on the source grid.
+            target_grid (iris.cube.Cube):
+                Land-sea mask on the target grid.
+            landmask_vicinity (float):
+                Radius of vicinity to search for a coastline, in metres.
+
+        Returns:
+            numpy.ndarray:
+                The index into the flattened target grid of the point from
+                which each target point takes its value.
+        """
+        target_x, target_y = RegridWeights._xy_coords(target_grid)
+        ny, nx = target_y.shape[0], target_x.shape[0]
+        index = np.arange(ny * nx).reshape(ny, nx)
+        index = np.moveaxis(
+            index,
+            [0, 1],
+            [target_grid.coord_dims(target_y)[0], target_grid.coord_dims(target_x)[0]],
+        )
+        corrected = AdjustLandSeaPoints(vicinity_radius=landmask_vicinity)(
+            target_grid.copy(data=index), landmask, target_grid
+        )
+        return corrected.data.ravel().astype(np.int64)
+
+    @staticmethod
+    def key(
+        source_grid,
+        target_grid,
+        regrid_mode,
+        extrapolation_mode,
+        landmask=None,
+        landmask_vicinity=None,
+    ):
+        """
+        Generate a hash identifying the weights for regridding between two
+        grids. The arguments are as for from_grids.
+
+        Returns:
+            str:
+                A hash of the grids, regridding options and any land-sea masks.
+        """
+        hashable_data = [
+            create_coordinate_hash(source_grid),
+            source_grid.coord(axis="x", dim_coords=True).circular,
+            create_coordinate_hash(target_grid),
+            regrid_mode,
+            extrapolation_mode,
+        ]
+        if landmask is not None:
+            hashable_data.extend(
+                [
+                    create_coordinate_hash(landmask),
+                    hash_array(landmask.data),
+                    hash_array(target_grid.data),
+                    landmask_vicinity,
+                ]
+            )
+        return generate_hash(hashable_data)
+
+    def save(self, path):
+        """
+        Save the weights to a .npz file.
+
+        Args:
+            path (str):
+                The path of the file.
+        """
+        arrays = {
+            "source_shape": np.array(self.source_shape),
+            "target_shape": np.array(self.target_shape),
+            "extrapolation_mode": np.array(self.extrapolation_mode),
+            "out_of_bounds": self.out_of_bounds,
+        }
+        if self.matrix is not None:
+            arrays.update(
+                weights=self.matrix.data,
+                indices=self.matrix.indices,
+                indptr=self.matrix.indptr,
+            )
+        else:
+            arrays["source_index"] = self.source_index
+            if self.corrected is not None:
+                arrays["corrected"] = self.corrected
+        with atomic_write(path) as weights_file:
+            np.savez(weights_file, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load weights saved with the save method.
+
+        Args:
+            path (str):
+                The path of the file.
+
+        Returns:
+            improver.standardise.RegridWeights or None:
+                The regridding weights, or None if the file does not exist or
+                cannot be read.
+        """
+        try:
+            with np.load(path, allow_pickle=False) as arrays:
+                arrays = dict(arrays)
+        except (OSError, ValueError, zipfile.BadZipFile):
+            return None
+        source_shape = tuple(arrays["source_shape"])
+        target_shape = tuple(arrays["target_shape"])
+        matrix = None
+        if "weights" in arrays:
+            matrix = csr_matrix(
+                (arrays["weights"], arrays["indices"], arrays["indptr"]),
+                shape=(np.prod(target_shape), np.prod(source_shape)),
+            )
+        return cls(
+            source_shape,
+            target_shape,
+            str(arrays["extrapolation_mode"]),
+            arrays["out_of_bounds"],
+            matrix=matrix,
+            source_index=arrays.get("source_index"),
+            corrected=arrays.get("corrected"),
+        )
+
+    def apply(self, data):
+        """
+        Regrid an array, whose last two dimensions are the y and x dimensions
+        of the source grid, as iris regridding does each x-y slice.
+
+        Args:
+            data (numpy.ndarray or numpy.ma.MaskedArray):
+                The data on the source grid.
+
+        Returns:
+            numpy.ndarray or numpy.ma.MaskedArray:
+                The data on the target grid. This is masked if the input is
+                masked or if the extrapolation mode is "mask" and some target
+                points are outside the source domain.
+        """
+        if data.shape[-2:] != self.source_shape:
+            raise ValueError(
+                "Data of shape {} is not on the source grid of shape {}".format(
+                    data.shape, self.source_shape
+                )
+            )
+        fill_value, mask_fill_value, force_mask = self.EXTRAPOLATION_MODES[
+            self.extrapolation_mode
+        ]
+        dtype = data.dtype
+        if self.matrix is not None and dtype.kind == "i":
+            dtype = np.promote_types(dtype, np.float16)
+        leading_shape = data.shape[:-2]
+        data = data.reshape(-1, np.prod(self.source_shape))
+        values = np.ma.getdata(data)
+        if not np.issubdtype(values.dtype, np.inexact):
+            values = values.astype(float)
+
+        def regrid(values, fill):
+            """Regrid flattened slices, filling out of bounds points."""
+            if self.matrix is not None:
+                result = (self.matrix @ values.T).T
+            else:
+                result = values[:, self.source_index]
+            if fill is not None:
+                result[:, self.out_of_bounds] = fill
+            return result
+
+        result = regrid(values, fill_value).astype(dtype)
+        if np.ma.isMaskedArray(data) or force_mask:
+            mask_fraction = regrid(
+                np.ma.getmaskarray(data).astype(values.dtype), mask_fill_value
+            )
+            mask = mask_fraction > 0
+            if self.corrected is not None:
+                mask[:, self.corrected] = False
+            if np.ma.isMaskedArray(data) or np.any(mask):
+                result = np.ma.MaskedArray(result, mask=mask)
+        return result.reshape(leading_shape + self.target_shape)
+
+    def regrid(self, cube, target_grid):
+        """
+        Regrid a cube onto the target grid. As with iris regridding, the
+        x and y coordinates are taken from the target grid and coordinates
+        spanning the x or y dimensions of the cube are dropped.
+
+        Args:
+            cube (iris.cube.Cube):
+                Cube on the source grid, which must have no aux factories.
+            target_grid (iris.cube.Cube):
+                Cube on the target grid.
+
+        Returns:
+            iris.cube.Cube:
+                Regridded cube.
+        """
+        source_x, source_y = self._xy_coords(cube)
+        (x_dim,) = cube.coord_dims(source_x)
+        (y_dim,) = cube.coord_dims(source_y)
+        data = self.apply(np.moveaxis(cube.data, [y_dim, x_dim], [-2, -1]))
+        data = np.moveaxis(data, [-2, -1], [y_dim, x_dim])
+
+        result = iris.cube.Cube(data)
+        result.metadata = copy.deepcopy(cube.metadata)
+        target_x, target_y = self._xy_coords(target_grid)
+        for coord in cube.dim_coords:
+            (dim,) = cube.coord_dims(coord)
+            if dim == x_dim:
+                coord = target_x
+            elif dim == y_dim:
+                coord = target_y
+            result.add_dim_coord(coord.copy(), dim)
+        for coord in cube.aux_coords:
+            dims = cube.coord_dims(coord)
+            if x_dim not in dims and y_dim not in dims:
+                result.add_aux_coord(coord.copy(), dims)
+        return result
+
+
 class RegridLandSea(BasePlugin):
     """Regrid a field with the option to adjust the output so that regridded land
     points always take values from a land point on the source grid, and vice versa
@@ -244,6 +755,7 @@ class RegridLandSea(BasePlugin):
         extrapolation_mode="nanmask",
         landmask=None,
         landmask_vicinity=25000,
+        cache_dir=None,
     ):
         """
         Initialise regridding parameters
@@ -262,6 +774,10 @@ class RegridLandSea(BasePlugin):
                 "nearest-with-mask" regridding option.
             landmask_vicinity (float):
                 Radius of vicinity to search for a coastline, in metres
+            cache_dir (str or None):
+                If set, a directory in which to cache the regridding weights
+                for each pair of grids, so that later runs regridding between
+                the same grids do not need to recalculate them.
         """
         if regrid_mode not in self.REGRID_REQUIRES_LANDMASK:
             msg = "Unrecognised regrid mode {}"
@@ -274,22 +790,19 @@ class RegridLandSea(BasePlugin):
         self.landmask_source_grid = landmask
         self.landmask_vicinity = None if landmask is None else landmask_vicinity
         self.landmask_name = "land_binary_mask"
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+        self._weights = {}
 
-    def _adjust_landsea(self, cube, target_grid):
+    def _check_landmask_names(self, target_grid):
         """
-        Adjust regridded data using differences between the target landmask
-        and that obtained by regridding the source grid landmask, to ensure
-        that the "land" or "sea" nature of the points in the regridded cube
-        matches that of the target grid.
+        Warn if the source or target grid landmask cubes are not named as
+        land-sea masks.
 
         Args:
-            cube (iris.cube.Cube):
-                Cube after initial regridding
             target_grid (iris.cube.Cube):
                 Cube containing landmask data on the target grid
-
-        Returns:
-            iris.cube.Cube: Adjusted cube
         """
         if self.landmask_name not in self.landmask_source_grid.name():
             msg = "Expected {} in input_landmask cube but found {}".format(
@@ -303,10 +816,63 @@ class RegridLandSea(BasePlugin):
             )
             warnings.warn(msg)
 
+    def _adjust_landsea(self, cube, target_grid):
+        """
+        Adjust regridded data using differences between the target landmask
+        and that obtained by regridding the source grid landmask, to ensure
+        that the "land" or "sea" nature of the points in the regridded cube
+        matches that of the target grid.
+
+        Args:
+            cube (iris.cube.Cube):
+                Cube after initial regridding
+            target_grid (iris.cube.Cube):
+                Cube containing landmask data on the target grid
+
+        Returns:
+            iris.cube.Cube: Adjusted cube
+        """
+        self._check_landmask_names(target_grid)
         return AdjustLandSeaPoints(vicinity_radius=self.landmask_vicinity)(
             cube, self.landmask_source_grid, target_grid
         )
 
+    def _regrid_weights(self, cube, target_grid):
+        """
+        Get the weights for regridding cube to target_grid, from those already
+        calculated by this plugin or held in the cache directory, calculating
+        and caching them if they are not found.
+
+        Args:
+            cube (iris.cube.Cube):
+                Cube to be regridded
+            target_grid (iris.cube.Cube):
+                Data on the target grid
+
+        Returns:
+            improver.standardise.RegridWeights: Regridding weights
+        """
+        regrid_args = (
+            cube,
+            target_grid,
+            self.regrid_mode,
+            self.extrapolation_mode,
+            self.landmask_source_grid,
+            self.landmask_vicinity,
+        )
+        key = RegridWeights.key(*regrid_args)
+        weights = self._weights.get(key)
+        if weights is None and self.cache_dir is not None:
+            path = os.path.join(self.cache_dir, "regrid_weights_{}.npz".format(key))
+            weights = RegridWeights.load(path)
+            if weights is None:
+                weights = RegridWeights.from_grids(*regrid_args)
+                weights.save(path)
+        if weights is None:
+            weights = RegridWeights.from_grids(*regrid_args)
+        self._weights[key] = weights
+        return weights
+
     def _regrid_to_target(self, cube, target_grid, regridded_title):
         """
         Regrid cube to target_grid, inherit grid attributes and update title
@@ -325,13 +891,19 @@ class RegridLandSea(BasePlugin):
         Returns:
             iris.cube.Cube: Regridded cube with updated attributes
         """
-        regridder = Linear(extrapolation_mode=self.extrapolation_mode)
-        if "nearest" in self.regrid_mode:
-            regridder = Nearest(extrapolation_mode=self.extrapolation_mode)
-        cube = cube.regrid(target_grid, regridder)
-
-        if self.REGRID_REQUIRES_LANDMASK[self.regrid_mode]:
-            cube = self._adjust_landsea(cube, target_grid)
+        if cube.aux_factories:
+            # Reference surfaces of aux factories need regridding by iris
+            regridder = Linear(extrapolation_mode=self.extrapolation_mode)
+            if "nearest" in self.regrid_mode:
+                regridder = Nearest(extrapolation_mode=self.extrapolation_mode)
+            cube = cube.regrid(target_grid, regridder)
+
+            if self.REGRID_REQUIRES_LANDMASK[self.regrid_mode]:
+                cube = self._adjust_landsea(cube, target_grid)
+        else:
+            if self.REGRID_REQUIRES_LANDMASK[self.regrid_mode]:
+                self._check_landmask_names(target_grid)
+            cube = self._regrid_weights(cube, target_grid).regrid(cube, target_grid)
 
         # identify grid-describing attributes on source cube that need updating
         required_grid_attributes = [
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Server that runs improver commands in long-lived worker processes, and
+the client used by `improver --via-server`."""
+
+import importlib
+import io
+import json
+import multiprocessing
+import multiprocessing.connection
+import os
+import signal
+import socket
+import struct
+import sys
+import traceback
+import warnings
+from contextlib import redirect_stderr, redirect_stdout
+
+# Modules imported by the server before starting workers, so that commands
+# run by the workers do not need to import them.
+PRELOAD_MODULES = (
+    "numpy",
+    "scipy.interpolate",
+    "scipy.ndimage",
+    "scipy.spatial",
+    "scipy.stats",
+    "cartopy.crs",
+    "iris",
+    "improver.utilities.load",
+    "improver.utilities.save",
+)
+
+_HEADER = struct.Struct("!Q")
+
+
+def _send(connection, message):
+    """Send a message, which must be serialisable as JSON, over a socket."""
+    data = json.dumps(message).encode("utf-8")
+    connection.sendall(_HEADER.pack(len(data)) + data)
+
+
+def _receive_bytes(connection, size):
+    """Receive a number of bytes from a socket."""
+    chunks = []
+    while size:
+        chunk = connection.recv(min(size, 2 ** 20))
+        if not chunk:
+            raise ConnectionError("Connection closed before message was received")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _receive(connection):
+    """Receive a message sent with _send."""
+    (size,) = _HEADER.unpack(_receive_bytes(connection, _HEADER.size))
+    return json.loads(_receive_bytes(connection, size).decode("utf-8"))
+
+
+class _StreamWriter(io.TextIOBase):
+    """Text stream that sends everything written to it over a socket, as
+    messages for one of the output streams of a command."""
+
+    def __init__(self, connection, name):
+        """
+        Args:
+            connection (socket.socket):
+                The connection to the client running the command.
+            name (str):
+                The name of the output stream, "stdout" or "stderr".
+        """
+        super().__init__()
+        self.connection = connection
+        self.name = name
+
+    def writable(self):
+        """The stream can be written to."""
+        return True
+
+    def write(self, text):
+        """Send text to the client."""
+        if text:
+            _send(self.connection, {"stream": self.name, "text": text})
+        return len(text)
+
+
+def run_task(args, cwd, stdout, stderr):
+    """
+    Run an improver command as `improver` would from the command line,
+    writing its output to the given streams.
+
+    Args:
+        args (list of str):
+            The arguments to improver, including the command.
+        cwd (str):
+            The directory in which to run the command.
+        stdout (io.TextIOBase):
+            Stream to which the standard output of the command is written.
+        stderr (io.TextIOBase):
+            Stream to which the standard error of the command is written.
+
+    Returns:
+        int:
+            The exit status of the command.
+    """
+    from clize import run
+
+    from improver.cli import main
+
+    status = 0
+    server_cwd = os.getcwd()
+    try:
+        os.chdir(cwd)
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            with warnings.catch_warnings():
+                # Changing the filters resets the record of warnings already
+                # shown, so each command shows its warnings as a new process
+                # would. A final "default" filter does not change which are
+                # shown.
+                warnings.simplefilter("default", append=True)
+                run(main, args=["improver", *args], out=stdout, err=stderr)
+    except SystemExit as exit_:
+        if isinstance(exit_.code, str):
+            print(exit_.code, file=stderr)
+            status = 1
+        else:
+            status = exit_.code or 0
+    except Exception:  # pylint: disable=broad-except
+        traceback.print_exc(file=stderr)
+        status = 1
+    finally:
+        os.chdir(server_cwd)
+    return status
+
+
+def _worker(listener, max_tasks):
+    """Run the commands sent to a listening socket, until max_tasks have
+    been run."""
+    # The server stops workers when it is interrupted or terminated
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    for _ in range(max_tasks):
+        connection, _ = listener.accept()
+        with connection:
+            try:
+                request = _receive(connection)
+                status = run_task(
+                    request["args"],
+                    request["cwd"],
+                    _StreamWriter(connection, "stdout"),
+                    _StreamWriter(connection, "stderr"),
+                )
+                _send(connection, {"status": status})
+            except (ConnectionError, ValueError, KeyError):
+                continue
+
+
+def serve(socket_path, max_tasks=100, workers=1):
+    """
+    Run improver commands sent to a Unix socket, until terminated.
+
+    Commonly used modules are imported before starting worker processes,
+    which run one command at a time. Each worker keeps the modules and any
+    in-memory caches between commands, and is replaced by a new worker after
+    running max_tasks commands to limit its memory growth.
+
+    Args:
+        socket_path (str):
+            Path of the Unix socket on which to listen for commands. This
+            must not exist. Only the user running the server can connect to
+            the socket, as commands are run with that user's permissions.
+        max_tasks (int):
+            Number of commands run by each worker before it is replaced.
+        workers (int):
+            Number of worker processes, and so the number of commands that
+            can run concurrently.
+    """
+    from improver.cli import subcommands_table
+
+    for module in PRELOAD_MODULES:
+        importlib.import_module(module)
+    subcommands_table()
+
+    # Workers are forked, so that they start with the preloaded modules.
+    context = multiprocessing.get_context("fork")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Create the socket accessible only by its owner, whatever the umask.
+    umask = os.umask(0o077)
+    try:
+        listener.bind(socket_path)
+    finally:
+        os.umask(umask)
+    listener.listen()
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    processes = []
+    try:
+        while True:
+            processes = [process for process in processes if process.is_alive()]
+            while len(processes) < workers:
+                process = context.Process(target=_worker, args=(listener, max_tasks))
+                process.start()
+                processes.append(process)
+            multiprocessing.connection.wait([process.sentinel for process in processes])
+    finally:
+        for process in processes:
+            process.terminate()
+        listener.close()
+        os.remove(socket_path)
+
+
+def run_via_server(socket_path, args):
+    """
+    Run an improver command using a server started by `improver serve`,
+    writing its output to stdout and stderr as the command writes it.
+
+    Args:
+        socket_path (str):
+            Path of the Unix socket on which the server is listening.
+        args (list of str):
+            The arguments to improver, including the command. Relative paths
+            are relative to the current directory.
+
+    Raises:
+        SystemExit: If the command fails, with its exit status.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        _send(connection, {"args": [str(arg) for arg in args], "cwd": os.getcwd()})
+        message = _receive(connection)
+        while "status" not in message:
+            stream = sys.stdout if message["stream"] == "stdout" else sys.stderr
+            stream.write(message["text"])
+            stream.flush()
+            message = _receive(connection)
+    if message["status"]:
+        raise SystemExit(message["status"])
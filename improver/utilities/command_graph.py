@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Run a graph of improver commands in one process, passing the results
+between commands in memory."""
+
+import copy
+import json
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from improver.cli import dispatch_subcommand, execute_command
+from improver.utilities.save import save_netcdf
+
+
+def load_graph(path):
+    """Load a command graph from a JSON or YAML file.
+
+    Files with a .yaml or .yml extension are read as YAML, which requires
+    PyYAML to be installed. All other files are read as JSON.
+
+    Args:
+        path (str):
+            Path of the file describing the graph.
+
+    Returns:
+        dict:
+            The graph, as a mapping of node names to node definitions.
+    """
+    with open(path, "r") as input_file:
+        if path.endswith((".yaml", ".yml")):
+            import yaml
+
+            return yaml.safe_load(input_file)
+        return json.load(input_file)
+
+
+def _references(node):
+    """Names of the nodes whose results are used as arguments of a node."""
+    return [
+        arg[1:]
+        for arg in node.get("args", [])
+        if isinstance(arg, str) and arg[:1] == "@"
+    ]
+
+
+def _check_graph(graph):
+    """Check the nodes of a graph and count the uses of each node's result.
+
+    Args:
+        graph (dict):
+            Mapping of node names to node definitions.
+
+    Returns:
+        dict:
+            Number of times the result of each node is used as an argument of
+            other nodes.
+
+    Raises:
+        ValueError: If a node has no command, uses the result of a node that
+            is not in the graph, or the graph contains a cycle.
+    """
+    uses = dict.fromkeys(graph, 0)
+    for name, node in graph.items():
+        if "command" not in node:
+            raise ValueError(f"Node {name} has no command")
+        for reference in _references(node):
+            if reference not in graph:
+                raise ValueError(f"Node {name} uses unknown node {reference}")
+            uses[reference] += 1
+
+    waiting = {name: set(_references(node)) for name, node in graph.items()}
+    while waiting:
+        ready = [name for name, references in waiting.items() if not references]
+        if not ready:
+            raise ValueError(f"Graph contains a cycle between nodes {sorted(waiting)}")
+        for name in ready:
+            del waiting[name]
+        for references in waiting.values():
+            references.difference_update(ready)
+    return uses
+
+
+def _run_node(node, args, keep_result, verbose):
+    """Run the command of a node.
+
+    Args:
+        node (dict):
+            Node definition.
+        args (list):
+            Arguments of the command, in which the results of other nodes
+            have replaced references to them.
+        keep_result (bool):
+            Whether the result is used by other nodes. If so, the result is
+            returned as well as being saved to the output of the node.
+        verbose (bool):
+            Print the command as it is run.
+
+    Returns:
+        Result of the command.
+    """
+    output = node.get("output")
+    if output is not None and not keep_result:
+        args = [*args, "--output", output]
+    result = execute_command(
+        dispatch_subcommand, "improver", node["command"], *args, verbose=verbose
+    )
+    if output is not None and keep_result:
+        save_netcdf(result, output)
+    return result
+
+
+def run_graph(graph, max_workers=1, verbose=False):
+    """Run a graph of improver commands.
+
+    Each node of the graph runs one improver command, given as the name of
+    the command and a list of its command line arguments. An argument of the
+    form "@name" is replaced by the result of the node of that name, which
+    is passed to the command in memory rather than through a file. The
+    result of a node is only written to file if the node has an output,
+    and is released as soon as the last node using it has started, so that
+    at most the results still to be used are held in memory.
+
+    For example, in JSON::
+
+        {
+            "wet_bulb": {
+                "command": "wet-bulb-temperature",
+                "args": ["temperature.nc", "humidity.nc", "pressure.nc"]
+            },
+            "wet_bulb_probability": {
+                "command": "threshold",
+                "args": ["@wet_bulb", "--threshold-values", "273.15"],
+                "output": "wet_bulb_probability.nc"
+            }
+        }
+
+    Nodes whose results do not depend on each other are run concurrently
+    in a pool of threads. Commands that use the result of a node which
+    other nodes also use are given a copy of it, so that commands which
+    modify their inputs do not change the input of other commands. A node
+    with an output that is also used by other nodes is saved with the
+    default options of save_netcdf.
+
+    Args:
+        graph (dict):
+            Mapping of node names to node definitions. Each node definition
+            is a dictionary with a "command" key, and optional "args" and
+            "output" keys.
+        max_workers (int):
+            Maximum number of commands to run at the same time.
+        verbose (bool):
+            Print each command as it is run.
+
+    Raises:
+        ValueError: If the graph is not valid.
+    """
+    uses = _check_graph(graph)
+    results = {}
+    waiting = list(graph)
+    running = {}
+
+    def take_result(name):
+        """Take the result of a node for one of its uses, releasing it after
+        the last use."""
+        uses[name] -= 1
+        if uses[name]:
+            return copy.deepcopy(results[name])
+        return results.pop(name)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while waiting or running:
+            for name in list(waiting):
+                node = graph[name]
+                if any(
+                    reference in waiting or reference in running.values()
+                    for reference in _references(node)
+                ):
+                    continue
+                waiting.remove(name)
+                args = [
+                    take_result(arg[1:])
+                    if isinstance(arg, str) and arg[:1] == "@"
+                    else str(arg)
+                    for arg in node.get("args", [])
+                ]
+                future = executor.submit(
+                    _run_node, node, args, bool(uses[name]), verbose
+                )
+                running[future] = name
+                del args
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                result = future.result()
+                if uses[name]:
+                    results[name] = result
+            # drop references to finished futures, which hold their results
+            del done, future, result
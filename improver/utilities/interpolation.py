@@ -107,6 +107,157 @@ def interpolate_missing_data(
     return data
 
 
+def _search_sorted_rows(sorted_rows, values, side):
+    """Find insertion indices for a chunk of rows.  See search_sorted_rows."""
+    if sorted_rows.ndim == 1:
+        return np.searchsorted(sorted_rows, values, side=side)
+    nrows, nsorted = sorted_rows.shape
+    values = np.broadcast_to(values, (nrows, values.shape[-1]))
+
+    # Sort the sorted values and the values to insert together, with values
+    # to insert ahead of equal sorted values if searching from the left, and
+    # count the sorted values ahead of each value to insert
+    if side == "left":
+        merged = np.concatenate([values, sorted_rows], axis=-1)
+        first_sorted = values.shape[-1]
+    else:
+        merged = np.concatenate([sorted_rows, values], axis=-1)
+        first_sorted = 0
+    order = np.argsort(merged, axis=-1, kind="stable")
+    is_sorted_value = (order >= first_sorted) & (order < first_sorted + nsorted)
+    counts = np.empty(merged.shape, dtype=np.intp)
+    np.put_along_axis(counts, order, np.cumsum(is_sorted_value, axis=-1), axis=-1)
+    if side == "left":
+        return counts[:, :first_sorted]
+    return counts[:, nsorted:]
+
+
+def search_sorted_rows(sorted_rows, values, side="left", rows_per_chunk=4096):
+    """
+    Find the indices into each row of an array of increasing values at which
+    values should be inserted to maintain order, giving the same result as
+    calling np.searchsorted for each row in turn.  The rows are searched in
+    chunks to limit memory use.
+
+    Args:
+        sorted_rows (numpy.ndarray):
+            Increasing values, either with shape (number of rows, number of
+            sorted values) or one-dimensional and shared by all rows.
+        values (numpy.ndarray):
+            Values to insert, either with shape (number of rows, number of
+            values) or one-dimensional and shared by all rows.
+        side (str):
+            If "left", the index of the first suitable location is found.
+            If "right", the index of the last suitable location is found.
+        rows_per_chunk (int):
+            The maximum number of rows to search at once.
+
+    Returns:
+        numpy.ndarray:
+            Indices into each row of sorted_rows, with shape (number of rows,
+            number of values).
+    """
+    sorted_rows = np.asarray(sorted_rows)
+    values = np.asarray(values)
+    nrows = max(
+        array.shape[0] if array.ndim == 2 else 1 for array in (sorted_rows, values)
+    )
+    result = np.empty((nrows, values.shape[-1]), dtype=np.intp)
+    for start in range(0, nrows, rows_per_chunk):
+        rows = slice(start, start + rows_per_chunk)
+        chunk = [
+            array[rows] if array.ndim == 2 else array for array in (sorted_rows, values)
+        ]
+        result[rows] = _search_sorted_rows(*chunk, side=side)
+    return result
+
+
+def _take_rows(array, index):
+    """Take elements from each row of an array, or from a one-dimensional
+    array shared by all rows, at a two-dimensional array of indices."""
+    if array.ndim == 1:
+        return array.take(index)
+    nrows, ncols = array.shape
+    return array.take(index + ncols * np.arange(nrows)[:, np.newaxis])
+
+
+def _interpolate_rows(x, xp, fp, shape):
+    """Linearly interpolate a chunk of rows, with the same arithmetic as
+    np.interp.  See interpolate_rows."""
+    ndata = xp.shape[-1]
+    if ndata == 1:
+        return np.broadcast_to(fp[..., :1], shape).copy()
+    x = np.broadcast_to(x, shape)
+    counts = np.broadcast_to(_search_sorted_rows(xp, x, side="right"), shape)
+
+    index = np.clip(counts - 1, 0, ndata - 2)
+    x_lower = _take_rows(xp, index)
+    x_upper = _take_rows(xp, index + 1)
+    f_lower = _take_rows(fp, index)
+    f_upper = _take_rows(fp, index + 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (f_upper - f_lower) / (x_upper - x_lower)
+        result = slope * (x - x_lower) + f_lower
+        # If we get nan in one direction, try the other
+        invalid = np.isnan(result)
+        if invalid.any():
+            result[invalid] = (slope * (x - x_upper) + f_upper)[invalid]
+            invalid &= np.isnan(result) & (f_lower == f_upper)
+            result[invalid] = f_lower[invalid]
+    exact = x == x_lower
+    result[exact] = f_lower[exact]
+
+    # Use the end values outside the range of the data points
+    result = np.where(counts == 0, fp[..., :1], result)
+    result = np.where(counts == ndata, fp[..., -1:], result)
+    result[np.isnan(x)] = np.nan
+
+    # Rows of data points that are not increasing are interpolated with
+    # np.interp, as its result then depends on the details of its search
+    if xp.ndim == 2:
+        for row in np.flatnonzero(~(np.diff(xp, axis=-1) >= 0).all(axis=-1)):
+            result[row] = np.interp(x[row], xp[row], fp[row] if fp.ndim == 2 else fp)
+    return result
+
+
+def interpolate_rows(x, xp, fp, rows_per_chunk=4096):
+    """
+    One-dimensional linear interpolation of many independent rows, giving
+    the same result as calling np.interp for each row in turn.  Each of the
+    inputs may either vary by row or be one-dimensional and shared by all
+    rows.  The rows are interpolated in chunks to limit memory use.
+
+    Args:
+        x (numpy.ndarray):
+            The x-coordinates at which to evaluate the interpolated values,
+            with shape (number of rows, number of values) or
+            (number of values,).
+        xp (numpy.ndarray):
+            The x-coordinates of the data points, with shape
+            (number of rows, number of data points) or
+            (number of data points,).  These should be increasing; any rows
+            that are not are interpolated using np.interp.
+        fp (numpy.ndarray):
+            The y-coordinates of the data points, with the same shape as xp
+            or shared by all rows.
+        rows_per_chunk (int):
+            The maximum number of rows to interpolate at once.
+
+    Returns:
+        numpy.ndarray:
+            The interpolated values, with shape (number of rows, number of
+            values).
+    """
+    arrays = [np.asarray(array, dtype=np.float64) for array in (x, xp, fp)]
+    nrows = max(array.shape[0] if array.ndim == 2 else 1 for array in arrays)
+    result = np.empty((nrows, arrays[0].shape[-1]), dtype=np.float64)
+    for start in range(0, nrows, rows_per_chunk):
+        rows = slice(start, start + rows_per_chunk)
+        chunk = [array[rows] if array.ndim == 2 else array for array in arrays]
+        result[rows] = _interpolate_rows(*chunk, shape=result[rows].shape)
+    return result
+
+
 class InterpolateUsingDifference(BasePlugin):
     """
     Uses interpolation to fill masked regions in the data contained within the
@@ -31,7 +31,9 @@
 """Module for saving netcdf cubes with desired attribute types."""
 
 import os
+import tempfile
 import warnings
+from contextlib import contextmanager
 
 import cf_units
 import iris
@@ -39,6 +41,32 @@ import iris
 from improver.metadata.check_datatypes import check_mandatory_standards
 
 
+@contextmanager
+def atomic_write(path):
+    """
+    Open a file to be written in binary mode in place of the file at path.
+    The file is written under a temporary name in the same directory, then
+    renamed to path, so that any existing file is replaced in a single step
+    and concurrent readers never see a partial file. The temporary file is
+    removed if writing fails.
+
+    Args:
+        path (str):
+            The path of the file to be written.
+    Yields:
+        file:
+            The open temporary file.
+    """
+    handle, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(handle, "wb") as output_file:
+            yield output_file
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+
 def _order_cell_methods(cube):
     """
     Sorts the cell methods on a cube such that if there are multiple methods
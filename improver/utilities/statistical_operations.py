@@ -39,6 +39,7 @@ from iris.exceptions import CoordinateNotFoundError
 from improver import BasePlugin
 from improver.metadata.probabilistic import find_percentile_coordinate
 from improver.utilities.cube_checker import check_cube_coordinates
+from improver.utilities.interpolation import search_sorted_rows
 
 
 class ProbabilitiesFromPercentiles2D(BasePlugin):
@@ -225,56 +226,20 @@ class ProbabilitiesFromPercentiles2D(BasePlugin):
                    [-1, -1, -1],
                    [-1, -1, -1]] ]
 
-            1. Create slices over each percentile, and using the correct
-               inequality (as determined by inverse_ordering) compare the
-               threshold values to the percentiles slice; here we assume
-               inverse_ordering is False, so we use >=. We then populate the
-               value_bounds and percentile_bounds arrays.
-
-               Slice 0 - 0th Percentile::
-
-                   [[1.0 >= 2.0, 1.0 >= 2.0, 1.0 >= 2.0],
-                    [3.0 >= 2.0, 3.0 >= 2.0, 3.0 >= 2.0],
-                    [5.0 >= 2.0, 5.0 >= 2.0, 5.0 >= 2.0]]
-
-                   [[False, False, False],
-                    [True, True, True],
-                    [True, True, True]]
+            1. At each point, find the highest percentile whose value the
+               threshold reaches, using the correct inequality (as determined
+               by inverse_ordering); here we assume inverse_ordering is False,
+               so we use >=. The percentile values at all the points are
+               searched together. Here no percentile is reached in the first
+               row, the 0th percentile is the highest reached in the second
+               row, and the 50th percentile in the third row. We then populate
+               the value_bounds and percentile_bounds arrays.
 
                The value_bounds array has a leading dimensions with 2 indices
                to be associated with the lower [0] and upper bounds [1] about
                the threshold being considered. The [0] index is populated with
-               the values in the slice of percentiles_cube at every True index.
-               The [1] index is populated with the values in the next slice of
-               percentiles_cube.
-               ::
-
-                   [ [[np.nan, np.nan, np.nan],
-                      [2.0, 2.0, 2.0],
-                      [2.0, 2.0, 2.0]],
-
-                     [[np.nan, np.nan, np.nan],
-                      [4.0, 4.0, 4.0],
-                      [4.0, 4.0, 4.0]] ]
-
-               The percentile_bounds array is also contains a leading dimension
-               associated with lower and upper bounds about the thresholds. The
-               lower bound array is populated at every True index with the
-               current percentile value (0 in this first slice), whilst the
-               upper bound array takes the percentile value from the next
-               slice.
-               ::
-
-                   [ [[-1, -1, -1],
-                      [0, 0, 0],
-                      [0, 0, 0]],
-
-                     [[-1, -1, -1],
-                      [50, 50, 50],
-                      [50, 50, 50]] ]
-
-               After the same process is applied to the next slice, the 50th
-               percentile, we end up with value_bounds::
+               the values of the percentile found, and the [1] index with the
+               values of the next percentile, giving value_bounds::
 
                    [ [[np.nan, np.nan, np.nan],
                       [2.0, 2.0, 2.0],
@@ -284,7 +249,10 @@ class ProbabilitiesFromPercentiles2D(BasePlugin):
                       [4.0, 4.0, 4.0],
                       [4.0, 4.0, 4.0]] ]
 
-               And percentile bounds::
+               The percentile_bounds array also contains a leading dimension
+               associated with lower and upper bounds about the thresholds,
+               populated with the percentile found and the next percentile,
+               giving percentile_bounds::
 
                    [ [[-1, -1, -1],
                       [0, 0, 0],
@@ -348,33 +316,39 @@ class ProbabilitiesFromPercentiles2D(BasePlugin):
         percentiles = self.percentile_coordinate.points
         probabilities = self.create_probability_cube(percentiles_cube, threshold_cube)
 
-        # Create array with additional 2 dimensions to contain upper and lower
-        # bounds.
+        # Find the index of the highest percentile reached by the threshold
+        # at each point, searching the percentile values at all the points
+        # together. Use the last percentile reached so that degenerate
+        # percentile distributions use the right most band that the threshold
+        # falls within.
+        npercentiles = len(percentiles)
+        values = percentiles_cube.data.reshape(npercentiles, -1).T
+        thresholds = threshold_cube.data.reshape(-1, 1)
+        if self.inverse_ordering:
+            index = npercentiles - 1
+            index -= search_sorted_rows(values[:, ::-1], thresholds, side="left")[:, 0]
+        else:
+            index = search_sorted_rows(values, thresholds, side="right")[:, 0] - 1
+        index[np.isnan(thresholds[:, 0])] = -1
+
+        # Create arrays with an additional leading dimension to contain the
+        # lower and upper bounds. Where the top percentile is reached the
+        # upper bound is the same as the lower bound.
+        lower = np.maximum(index, 0)
+        upper = np.minimum(lower + 1, npercentiles - 1)
+        points = np.arange(len(index))
+        percentile_bounds = np.array(
+            [percentiles[lower], percentiles[upper]], dtype=np.float32
+        )
+        value_bounds = np.array(
+            [values[points, lower], values[points, upper]], dtype=np.float32
+        )
+        below_bottom_band = index < 0
+        percentile_bounds[:, below_bottom_band] = -1
+        value_bounds[:, below_bottom_band] = np.nan
         array_shape = [2] + list(threshold_cube.shape)
-        percentile_bounds = np.full(array_shape, -1, dtype=np.float32)
-        value_bounds = np.full(array_shape, np.nan, dtype=np.float32)
-
-        for index, pslice in enumerate(
-            percentiles_cube.slices_over(self.percentile_coordinate)
-        ):
-            # Change to use < & > to force degenerate percentile distributions
-            # to use the first percentile band that the threshold falls within.
-            indices = (
-                threshold_cube.data <= pslice.data
-                if self.inverse_ordering
-                else threshold_cube.data >= pslice.data
-            )
-            percentile_bounds[0, indices] = percentiles[index]
-            value_bounds[0, indices] = pslice.data[indices]
-            try:
-                # Usual behaviour where the threshold value falls between
-                # values corresponding to percentiles.
-                percentile_bounds[1, indices] = percentiles[index + 1]
-                value_bounds[1, indices] = percentiles_cube[index + 1].data[indices]
-            except IndexError:
-                # Invoked if we have reached the top of the available values.
-                percentile_bounds[1, indices] = percentiles[index]
-                value_bounds[1, indices] = pslice.data[indices]
+        percentile_bounds = percentile_bounds.reshape(array_shape)
+        value_bounds = value_bounds.reshape(array_shape)
 
         with np.errstate(divide="ignore", invalid="ignore"):
             numerator = threshold_cube.data - value_bounds[0]
@@ -344,10 +344,11 @@ class TimezoneExtraction(PostProcessingPlugin):
     def _fill_timezones(self, input_cube):
         """
         Populates the output cube data with data from input_cube. This is done by
-        multiplying the inverse of the timezone_cube.data with the input_cube.data and
-        summing along the time axis. Because timezone_cube.data is a mask of 1 and 0,
-        inverting it gives 1 where we WANT data and 0 where we don't. Summing these up
-        produces the result. The same logic can be used for times.
+        finding the index of the one time zone that each grid point falls in, which
+        is where timezone_cube.data is 0, and gathering the data for that index from
+        the time axis of input_cube. The same indices are used to gather the times,
+        so the work done is proportional to the number of grid points, rather than
+        to the number of grid points multiplied by the number of time zones.
         Modifies self.output_cube and self.time_points.
         Assumes that input_cube and self.timezone_cube have been arranged so that time
         or UTC_offset are the inner-most coord (dim=-1).
@@ -359,31 +360,29 @@ class TimezoneExtraction(PostProcessingPlugin):
 
         Raises:
             TypeError:
-                If combining the timezone_cube and input_cube results in float64 data.
-                (Hint: timezone_cube should be int8 and input cube should be float32)
+                If the output data are float64.
+                (Hint: input cube should be float32)
         """
-        # Get the output_data
-        result = input_cube.data * (1 - self.timezone_cube.data)
-        self.output_data = result.sum(axis=-1)
+        time_index = np.argmin(self.timezone_cube.data, axis=-1)
+
+        # Get the output_data. The indices need a length-one dimension for each
+        # leading dimension of input_cube, plus one for the time dimension.
+        data_index = time_index.reshape(
+            (1,) * (input_cube.ndim - time_index.ndim - 1) + time_index.shape + (1,)
+        )
+        result = np.take_along_axis(input_cube.data, data_index, axis=-1)
+        self.output_data = result[..., 0]
 
         # Check resulting dtype
-        enforce_dtype("multiply", [input_cube, self.timezone_cube], result)
+        enforce_dtype("take_along_axis", [input_cube], self.output_data)
 
         # Sort out the time points
-        input_time_points = input_cube.coord("time").points
-        # Add scalar coords to allow broadcast to spatial coords.
-        times = input_time_points.reshape((1, 1, len(input_time_points))) * (
-            1 - self.timezone_cube.data
-        )
-        self.time_points = times.sum(axis=-1)
+        self.time_points = input_cube.coord("time").points[time_index]
 
         # Sort out the time bounds (if present)
         bounds_offsets = self._get_time_bounds_offset(input_cube)
         if bounds_offsets is not None:
-            # Add scalar coords to allow broadcast to spatial coords.
-            self.time_bounds = bounds_offsets.reshape(
-                (1, 1, 2)
-            ) + self.time_points.reshape(list(self.time_points.shape) + [1])
+            self.time_bounds = self.time_points[..., np.newaxis] + bounds_offsets
 
     @staticmethod
     def _get_time_bounds_offset(input_cube):
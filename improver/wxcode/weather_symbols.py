@@ -31,7 +31,7 @@
 """Module containing weather symbol implementation."""
 
 
-import copy
+import operator
 
 import iris
 import numpy as np
@@ -79,6 +79,21 @@ def _define_invertible_conditions():
 
 INVERTIBLE_CONDITIONS = _define_invertible_conditions()
 
+# Functions applying the comparators, and the arithmetic operators that may
+# combine diagnostics, used in the decision tree.
+COMPARISON_OPERATORS = {
+    ">=": operator.ge,
+    ">": operator.gt,
+    "<=": operator.le,
+    "<": operator.lt,
+}
+ARITHMETIC_OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+}
+
 
 class WeatherSymbols(BasePlugin):
     """
@@ -491,6 +506,228 @@ class WeatherSymbols(BasePlugin):
         # otherwise, return a string
         return constraints[0]
 
+    def _threshold_constraint(self, diagnostic, threshold):
+        """
+        Construct an iris constraint that extracts a diagnostic at a
+        threshold, matching the threshold within the same tolerances as
+        construct_extract_constraint.
+
+        Args:
+            diagnostic (str):
+                The name of the diagnostic to be extracted from the CubeList.
+            threshold (iris.coords.AuxCoord):
+                The required threshold, including units.
+
+        Returns:
+            iris.Constraint:
+                The constraint.
+        """
+        if self.coord_named_threshold:
+            threshold_name = "threshold"
+        else:
+            threshold_name = get_threshold_coord_name_from_probability_name(diagnostic)
+        threshold_val = threshold.points.item()
+        if abs(threshold_val) < self.float_abs_tolerance:
+            lower, upper = -self.float_abs_tolerance, self.float_abs_tolerance
+        else:
+            lower = threshold_val * (1.0 - self.float_tolerance)
+            upper = threshold_val * (1.0 + self.float_tolerance)
+        return iris.Constraint(
+            name=diagnostic,
+            coord_values={threshold_name: lambda cell: lower < cell < upper},
+        )
+
+    def _diagnostic_data(self, cubes, diagnostic, threshold, cache):
+        """
+        Extract the data of a diagnostic at a threshold from the input cubes,
+        reusing any data already extracted.
+
+        Args:
+            cubes (iris.cube.CubeList):
+                A cubelist containing the diagnostics required for the
+                weather symbols decision tree.
+            diagnostic (str):
+                The name of the diagnostic.
+            threshold (iris.coords.AuxCoord):
+                The required threshold, including units.
+            cache (dict):
+                Data already extracted, keyed on the diagnostic name and
+                threshold value. This is updated with the extracted data.
+
+        Returns:
+            numpy.ndarray:
+                The probabilities of the diagnostic relative to the threshold.
+        """
+        key = (diagnostic, threshold.points.item())
+        if key not in cache:
+            constraint = self._threshold_constraint(diagnostic, threshold)
+            cache[key] = cubes.extract(constraint)[0].data
+        return cache[key]
+
+    def _evaluate_expression(self, cubes, items, thresholds, cache):
+        """
+        Evaluate a list of diagnostic names, numbers and arithmetic operators,
+        e.g. ["probability_of_lwe_snowfall_rate_above_threshold", "-",
+        "probability_of_rainfall_rate_above_threshold", "*", "0.7"],
+        applying multiplication and division before addition and subtraction.
+
+        Args:
+            cubes (iris.cube.CubeList):
+                A cubelist containing the diagnostics required for the
+                weather symbols decision tree.
+            items (list of str):
+                The diagnostic names, numbers and operators.
+            thresholds (list of iris.coords.AuxCoord):
+                The thresholds of the diagnostics, in the order in which the
+                diagnostics appear in items.
+            cache (dict):
+                Diagnostic data already extracted, as for _diagnostic_data.
+
+        Returns:
+            numpy.ndarray:
+                The result of the expression.
+        """
+        thresholds = iter(thresholds)
+        values = [
+            self._diagnostic_data(cubes, item, next(thresholds), cache)
+            if is_variable(item)
+            else float(item)
+            for item in items[::2]
+        ]
+        terms = [values[0]]
+        additions = []
+        for item, value in zip(items[1::2], values[1:]):
+            if item in ("*", "/"):
+                terms[-1] = ARITHMETIC_OPERATORS[item](terms[-1], value)
+            else:
+                additions.append(item)
+                terms.append(value)
+        result = terms[0]
+        for item, term in zip(additions, terms[1:]):
+            result = ARITHMETIC_OPERATORS[item](result, term)
+        return result
+
+    def evaluate_condition(self, cubes, query, invert=False, cache=None):
+        """
+        Evaluate the conditions of a single query from the decision tree,
+        without constructing and evaluating strings.
+
+        Args:
+            cubes (iris.cube.CubeList):
+                A cubelist containing the diagnostics required for the
+                weather symbols decision tree.
+            query (dict):
+                A single query from the decision tree.
+            invert (bool):
+                If True, evaluate the inverse of the query, which is satisfied
+                by points that follow the fail branch.
+            cache (dict or None):
+                Diagnostic data already extracted from the cubes, keyed on
+                the diagnostic name and threshold value. This is updated with
+                any data extracted.
+
+        Returns:
+            numpy.ndarray:
+                Boolean array, True where the (inverted) query is satisfied.
+                Points where any of the diagnostics are masked are False.
+        """
+        if cache is None:
+            cache = {}
+        comparator = query["threshold_condition"]
+        combination = query["condition_combination"]
+        if invert:
+            comparator, combination = self.invert_condition(query)
+        combinator = operator.or_ if combination == "OR" else operator.and_
+
+        result = None
+        for diagnostic, p_threshold, d_threshold in zip(
+            query["diagnostic_fields"],
+            query["probability_thresholds"],
+            query["diagnostic_thresholds"],
+        ):
+            if isinstance(diagnostic, list):
+                values = self._evaluate_expression(
+                    cubes, diagnostic, d_threshold, cache
+                )
+            else:
+                values = self._diagnostic_data(cubes, diagnostic, d_threshold, cache)
+            condition = COMPARISON_OPERATORS[comparator](values, p_threshold)
+            result = condition if result is None else combinator(result, condition)
+        return np.ma.filled(result, False)
+
+    def evaluate_tree(self, cubes, shape, omit_nodes=None):
+        """
+        Find the points at which each weather symbol is reached through the
+        decision tree. The tree is walked from the start node so that each
+        node is visited after all the nodes leading to it. The condition
+        for each branch of a node is evaluated once over the whole grid and
+        combined with the points that reach the node, and the diagnostic
+        data are extracted from the cubes once for all nodes.
+
+        Args:
+            cubes (iris.cube.CubeList):
+                A cubelist containing the diagnostics required for the
+                weather symbols decision tree.
+            shape (tuple of int):
+                The shape of the weather symbol data.
+            omit_nodes (dict or None):
+                A dictionary of (keyword) nodes names where the diagnostic
+                data is missing and (values) node associated with
+                diagnostic_missing_action.
+
+        Returns:
+            dict:
+                Boolean arrays, True where each weather symbol is reached,
+                keyed on the weather symbol code.
+        """
+        omit_nodes = omit_nodes or {}
+
+        def resolve(node):
+            """Follow the diagnostic_missing_action of omitted nodes."""
+            while node in omit_nodes:
+                node = omit_nodes[node]
+            return node
+
+        def targets(node):
+            """The distinct nodes that follow a node."""
+            query = self.queries[node]
+            return list(
+                dict.fromkeys(resolve(query[key]) for key in ("succeed", "fail"))
+            )
+
+        order = []
+        visited = set()
+
+        def visit(node):
+            """Add the nodes below a node, and then the node, to the order."""
+            if node in visited or node not in self.queries:
+                return
+            visited.add(node)
+            for target in targets(node):
+                visit(target)
+            order.append(node)
+
+        start_node = resolve(self.start_node)
+        visit(start_node)
+
+        cache = {}
+        reached = {start_node: np.ones(shape, dtype=bool)}
+        for node in reversed(order):
+            node_reached = reached.pop(node)
+            for target in targets(node):
+                invert = self.queries[node]["fail"] == target
+                target_reached = node_reached & self.evaluate_condition(
+                    cubes, self.queries[node], invert=invert, cache=cache
+                )
+                if target in reached:
+                    target_reached |= reached[target]
+                reached[target] = target_reached
+        return {
+            target: target_reached
+            for target, target_reached in reached.items()
+            if isinstance(target, int)
+        }
+
     @staticmethod
     def find_all_routes(graph, start, end, omit_nodes=None, route=None):
         """
@@ -595,57 +832,16 @@ class WeatherSymbols(BasePlugin):
         # Check input cubes contain required data
         optional_node_data_missing = self.check_input_cubes(cubes)
 
-        # Construct graph nodes dictionary
-        graph = {
-            key: [self.queries[key]["succeed"], self.queries[key]["fail"]]
-            for key in self.queries
-        }
-
-        # Search through tree for all leaves (weather code end points)
-        defined_symbols = []
-        for item in self.queries.values():
-            for value in item.values():
-                if isinstance(value, int):
-                    defined_symbols.append(value)
-
         # Create symbol cube
         symbols = self.create_symbol_cube(cubes)
 
-        # Loop over possible symbols
-        for symbol_code in defined_symbols:
+        # Set grid locations to the weather symbol reached through the tree
+        symbol_masks = self.evaluate_tree(
+            cubes, symbols.shape, omit_nodes=optional_node_data_missing
+        )
+        for symbol_code, symbol_mask in symbol_masks.items():
+            symbols.data[symbol_mask] = symbol_code
 
-            # In current decision tree
-            # start node is heavy_precipitation
-            routes = self.find_all_routes(
-                graph,
-                self.start_node,
-                symbol_code,
-                omit_nodes=optional_node_data_missing,
-            )
-            # Loop over possible routes from root to leaf
-
-            for route in routes:
-                conditions = []
-                for i_node in range(len(route) - 1):
-                    current_node = route[i_node]
-                    current = copy.copy(self.queries[current_node])
-                    try:
-                        next_node = route[i_node + 1]
-                    except KeyError:
-                        next_node = symbol_code
-
-                    if current["fail"] == next_node:
-                        (
-                            current["threshold_condition"],
-                            current["condition_combination"],
-                        ) = self.invert_condition(current)
-
-                    conditions.extend(self.create_condition_chain(current))
-
-                test_chain = self.format_condition_chain(conditions)
-
-                # Set grid locations to suitable weather symbol
-                symbols.data[np.ma.where(eval(test_chain))] = symbol_code
         # Update symbols for day or night.
         symbols = update_daynight(symbols)
         return symbols
@@ -80,6 +80,31 @@ def test_nearest_land(tmp_path, domain, model):
     acc.compare(output_path, kgo_path)
 
 
+@pytest.mark.parametrize("domain,model", UK_GLOBAL)
+def test_nearest_land_cached(tmp_path, domain, model):
+    """Test neighbour finding with a land constraint, reusing the cache"""
+    kgo_dir = acc.kgo_root() / "neighbour-finding"
+    kgo_path = kgo_dir / f"outputs/nearest_land_{domain}_kgo.nc"
+    sites_path = kgo_dir / f"inputs/{domain}_sites.json"
+    orography_path = kgo_dir / f"inputs/{model}_orography.nc"
+    landmask_path = kgo_dir / f"inputs/{model}_landmask.nc"
+    cache_path = tmp_path / "cache"
+    for run in range(2):
+        output_path = tmp_path / f"output_{run}.nc"
+        args = [
+            orography_path,
+            landmask_path,
+            sites_path,
+            "--land-constraint",
+            "--cache-dir",
+            cache_path,
+            "--output",
+            output_path,
+        ]
+        run_cli(args)
+        acc.compare(output_path, kgo_path)
+
+
 @pytest.mark.slow
 @pytest.mark.parametrize("domain,model", UK_GLOBAL)
 def test_nearest_minimum_dz(tmp_path, domain, model):
@@ -124,6 +124,36 @@ def test_regrid_nearest_landmask(tmp_path):
     acc.compare(output_path, kgo_path)
 
 
+@pytest.mark.slow
+def test_regrid_nearest_landmask_cache_dir(tmp_path):
+    """Test nearest neighbour regridding with land sea mask, with the
+    regridding weights calculated by the first run and loaded by the second"""
+    kgo_dir = acc.kgo_root() / "regrid/landmask"
+    kgo_path = kgo_dir / "kgo.nc"
+    input_path = kgo_dir / "../global_cutout.nc"
+    landmask_path = kgo_dir / "glm_landmask.nc"
+    target_path = kgo_dir / "ukvx_landmask.nc"
+    cache_dir = tmp_path / "cache"
+    for run in range(2):
+        output_path = tmp_path / f"output_{run}.nc"
+        args = [
+            input_path,
+            target_path,
+            landmask_path,
+            "--output",
+            output_path,
+            "--regrid-mode",
+            "nearest-with-mask",
+            "--regridded-title",
+            GLOBAL_UK_TITLE,
+            "--cache-dir",
+            cache_dir,
+        ]
+        run_cli(args)
+        assert len(list(cache_dir.iterdir())) == 1
+        acc.compare(output_path, kgo_path, recreate=False)
+
+
 @pytest.mark.slow
 def test_regrid_check_landmask(tmp_path):
     """Test land sea mask output matches other test"""
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Setup and reporting of performance benchmarks"""
+
+import os
+import resource
+import time
+import tracemalloc
+
+import pytest
+
+BENCHMARK_ENVVAR = "IMPROVER_BENCHMARK"
+
+
+def benchmarks_enabled():
+    """True if the benchmarks have been requested via the environment"""
+    return bool(os.environ.get(BENCHMARK_ENVVAR))
+
+
+def time_call(function, *args, repeats=3, **kwargs):
+    """
+    Time a function call, returning the best of several repeats to limit
+    the influence of other activity on the host.
+
+    Args:
+        function (Callable): function to be timed
+        args: positional arguments passed to the function
+        repeats (int): number of times to call the function
+        kwargs: keyword arguments passed to the function
+
+    Returns:
+        Tuple[float, Any]: best wall-clock time in seconds and the value
+            returned by the final call
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def peak_memory(function, *args, **kwargs):
+    """
+    Measure the peak memory allocated by python objects, including numpy
+    arrays, during a function call.
+
+    Args:
+        function (Callable): function to be measured
+        args: positional arguments passed to the function
+        kwargs: keyword arguments passed to the function
+
+    Returns:
+        Tuple[int, Any]: peak traced memory in bytes and the value returned
+            by the call
+    """
+    tracemalloc.start()
+    try:
+        result = function(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, result
+
+
+def max_rss():
+    """Maximum resident set size of this process so far, in kilobytes"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def report(name, **measurements):
+    """
+    Print a single line summary of a benchmark. Run pytest with the -s
+    option to see these.
+
+    Args:
+        name (str): name of the benchmark
+        measurements: named values to be reported
+    """
+    values = ", ".join(f"{key}: {value:.4g}" for key, value in measurements.items())
+    print(f"\nBENCHMARK {name}: {values}")
+
+
+# Pytest decorator to skip benchmarks unless they have been requested
+# pylint: disable=invalid-name
+skip_unless_benchmarking = pytest.mark.skipif(
+    not benchmarks_enabled(), reason=f"set {BENCHMARK_ENVVAR} to run benchmarks"
+)
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Benchmark of the start up time of improver commands"""
+
+import subprocess  # nosec
+import sys
+
+import pytest
+
+from . import benchmark as bm
+
+pytestmark = [pytest.mark.benchmark, bm.skip_unless_benchmarking]
+
+COMMAND = "threshold"
+# Run an improver command, then print the improver.cli modules imported. These
+# are imported by importlib, so are not included in -X importtime output.
+SCRIPT = (
+    "import sys; "
+    "from improver import cli; "
+    "cli.main('improver', *sys.argv[1:]); "
+    "print(*[m for m in sys.modules if m.startswith('improver.cli.')])"
+)
+
+
+def _run(*args, importtime=False):
+    """
+    Run an improver command in a fresh python interpreter.
+
+    Returns:
+        Tuple[str, str]: the improver.cli modules imported, separated by
+            spaces, and the stderr output
+    """
+    options = ["-X", "importtime"] if importtime else []
+    process = subprocess.run(  # nosec
+        [sys.executable, *options, "-c", SCRIPT, *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    )
+    return process.stdout, process.stderr
+
+
+def _import_times(*args):
+    """
+    Summarise the output of python -X importtime for an improver command.
+
+    Returns:
+        Tuple[float, List[str]]: total time spent importing modules, in
+            seconds, and the names of the improver.cli modules imported
+    """
+    cli_modules, importtime = _run(*args, importtime=True)
+    total = 0
+    for line in importtime.splitlines():
+        if line.startswith("import time:"):
+            self_us = line[len("import time:") :].split("|")[0].strip()
+            if self_us.isdigit():
+                total += int(self_us)
+    return total * 1e-6, cli_modules.split()
+
+
+def test_cli_startup():
+    """Compare the start up of a single command with that of help, which
+    lists all the commands"""
+    command_time, _ = bm.time_call(_run, COMMAND, "--help")
+    help_time, _ = bm.time_call(_run, "help")
+    command_imports, command_cli_modules = _import_times(COMMAND, "--help")
+    help_imports, help_cli_modules = _import_times("help")
+    bm.report(
+        "cli-startup",
+        seconds=command_time,
+        import_seconds=command_imports,
+        cli_modules=len(command_cli_modules),
+        help_seconds=help_time,
+        help_import_seconds=help_imports,
+        help_cli_modules=len(help_cli_modules),
+    )
+    assert command_cli_modules == ["improver.cli." + COMMAND]
+    assert command_imports < help_imports
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Benchmark of the methods available for minimising the CRPS when estimating
+EMOS coefficients"""
+
+import iris
+import numpy as np
+import pytest
+
+from improver.calibration.ensemble_calibration import (
+    ContinuousRankedProbabilityScoreMinimisers,
+)
+from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+
+from . import benchmark as bm
+
+pytestmark = [pytest.mark.benchmark, bm.skip_unless_benchmarking]
+
+# A training period of 30 days of a 12 member ensemble at 100 x 100 points,
+# flattened into a single training set as when estimating EMOS coefficients.
+TRAINING_SHAPE = (300, 100)
+REALIZATIONS = 12
+
+
+def _training_cubes(distribution):
+    """Truths and an under-dispersive, biased ensemble of historic forecasts,
+    of air temperature for the normal distribution and wind speed for the
+    truncated normal distribution"""
+    rng = np.random.RandomState(0)
+    if distribution == "norm":
+        name, units = "air_temperature", "K"
+        truth = rng.normal(280, 5, TRAINING_SHAPE)
+    else:
+        name, units = "wind_speed", "m s-1"
+        truth = rng.gamma(2, 2.5, TRAINING_SHAPE)
+    error = rng.normal(1, 1.5, TRAINING_SHAPE)
+    spread = rng.normal(0, 0.5, (REALIZATIONS,) + TRAINING_SHAPE)
+    forecasts = truth + error + spread
+    if distribution == "truncnorm":
+        forecasts = np.abs(forecasts)
+    forecasts = set_up_variable_cube(
+        forecasts.astype(np.float32), name=name, units=units, spatial_grid="equalarea"
+    )
+    truth = set_up_variable_cube(
+        truth.astype(np.float32), name=name, units=units, spatial_grid="equalarea"
+    )
+    return forecasts, truth
+
+
+def _minimise(method, distribution, predictor, forecasts, truth):
+    """Estimate the coefficients, returning them with the number of CRPS
+    evaluations made"""
+    plugin = ContinuousRankedProbabilityScoreMinimisers(
+        tolerance=0.01, minimisation_method=method
+    )
+    crps_function = plugin.minimisation_dict[distribution]
+    evaluations = []
+
+    def counted_crps(*args):
+        evaluations.append(None)
+        return crps_function(*args)
+
+    plugin.minimisation_dict[distribution] = counted_crps
+    if predictor == "mean":
+        forecast_predictor = forecasts.collapsed("realization", iris.analysis.MEAN)
+        initial_guess = [0, 1, 0, 1]
+    else:
+        forecast_predictor = forecasts
+        initial_guess = [0] + [np.sqrt(1 / REALIZATIONS)] * REALIZATIONS + [0, 1]
+    forecast_var = forecasts.collapsed("realization", iris.analysis.VARIANCE)
+    coefficients = plugin(
+        initial_guess, forecast_predictor, truth, forecast_var, predictor, distribution
+    )
+    return coefficients, len(evaluations)
+
+
+def _crps(coefficients, distribution, predictor, forecasts, truth):
+    """Mean CRPS of the training set for the given coefficients"""
+    plugin = ContinuousRankedProbabilityScoreMinimisers()
+    if predictor == "mean":
+        forecast_predictor = forecasts.data.mean(axis=0).flatten()
+    else:
+        forecast_predictor = forecasts.data.reshape(REALIZATIONS, -1).T
+    return plugin.minimisation_dict[distribution](
+        coefficients.astype(np.float64),
+        forecast_predictor.astype(np.float64),
+        truth.data.flatten().astype(np.float64),
+        forecasts.data.var(axis=0).flatten().astype(np.float64),
+        np.sqrt(np.pi),
+        predictor,
+    )
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.filterwarnings("ignore::UserWarning")
+@pytest.mark.parametrize("predictor", ["mean", "realizations"])
+@pytest.mark.parametrize("distribution", ["norm", "truncnorm"])
+def test_minimisation_methods(distribution, predictor):
+    """Compare the gradient-based minimisation methods with Nelder-Mead"""
+    forecasts, truth = _training_cubes(distribution)
+
+    results = {}
+    for method in ContinuousRankedProbabilityScoreMinimisers.MINIMISATION_METHODS:
+        seconds, (coefficients, evaluations) = bm.time_call(
+            _minimise, method, distribution, predictor, forecasts, truth, repeats=1
+        )
+        crps = _crps(coefficients, distribution, predictor, forecasts, truth)
+        results[method] = (evaluations, crps)
+        bm.report(
+            f"emos-{distribution}-{predictor}-{method}",
+            seconds=seconds,
+            crps_evaluations=evaluations,
+            crps=crps,
+        )
+
+    nelder_mead_evaluations, nelder_mead_crps = results["Nelder-Mead"]
+    for method in ["BFGS", "L-BFGS-B"]:
+        evaluations, crps = results[method]
+        assert evaluations < nelder_mead_evaluations
+        assert crps <= nelder_mead_crps + 1e-4
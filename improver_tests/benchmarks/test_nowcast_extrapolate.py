@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Benchmark of extrapolation nowcasts to many lead times on radar-sized
+fields"""
+
+from datetime import timedelta
+
+import numpy as np
+import pytest
+from scipy import ndimage
+
+from improver.nowcasting.forecasting import AdvectField
+from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+
+from . import benchmark as bm
+
+pytestmark = [pytest.mark.benchmark, bm.skip_unless_benchmarking]
+
+# Approximately the size of the UK 1 km radar composite
+GRID_SHAPE = (1000, 1000)
+# Nowcasts every 15 minutes out to 6 hours
+TIMESTEPS = [timedelta(minutes=minutes) for minutes in range(0, 361, 15)]
+
+
+def _setup_cubes():
+    """Rain-like field with smoothly varying advection velocities"""
+    rng = np.random.RandomState(0)
+    field = ndimage.gaussian_filter(rng.random_sample(GRID_SHAPE), 8)
+    field = 40.0 * np.clip(field - 0.5, 0, None)
+    cube = set_up_variable_cube(
+        field.astype(np.float32),
+        name="lwe_precipitation_rate",
+        units="mm h-1",
+        spatial_grid="equalarea",
+        grid_spacing=1000,
+    )
+    cube.remove_coord("forecast_period")
+    cube.remove_coord("forecast_reference_time")
+    velocities = []
+    for name, scale in [("x", 10.0), ("y", -6.0)]:
+        velocity = ndimage.gaussian_filter(rng.random_sample(GRID_SHAPE), 50)
+        velocities.append(
+            cube.copy(data=(scale * velocity / velocity.mean()).astype(np.float32))
+        )
+        velocities[-1].rename("precipitation_advection_{}_velocity".format(name))
+        velocities[-1].units = "m s-1"
+    return cube, velocities
+
+
+def _boolean_index_advection(data, grid_vel_x, grid_vel_y, timestep):
+    """Advect one field with boolean indexing of each source point, as
+    AdvectField did before the source values were gathered by flat index"""
+    ydim, xdim = data.shape
+    adv_field = np.full(data.shape, np.nan, dtype=np.float32)
+    (xgrid, ygrid) = np.meshgrid(np.arange(xdim), np.arange(ydim))
+    xsrc_point_frac = -grid_vel_x * timestep + xgrid.astype(np.float32)
+    ysrc_point_frac = -grid_vel_y * timestep + ygrid.astype(np.float32)
+
+    def point_in_bounds(x, y, nx, ny):
+        """Check point (y, x) lies within defined bounds"""
+        return (x >= 0.0) & (x < nx) & (y >= 0.0) & (y < ny)
+
+    cond_pt = point_in_bounds(xsrc_point_frac, ysrc_point_frac, xdim, ydim)
+    adv_field[cond_pt] = 0
+    xsrc_point_lower = xsrc_point_frac.astype(int)
+    ysrc_point_lower = ysrc_point_frac.astype(int)
+    x_weight_upper = xsrc_point_frac - xsrc_point_lower.astype(float)
+    y_weight_upper = ysrc_point_frac - ysrc_point_lower.astype(float)
+    x_weights = np.array([1.0 - x_weight_upper, x_weight_upper], dtype=np.float32)
+    y_weights = np.array([1.0 - y_weight_upper, y_weight_upper], dtype=np.float32)
+    for xpt, xwt in zip([xsrc_point_lower, xsrc_point_lower + 1], x_weights):
+        for ypt, ywt in zip([ysrc_point_lower, ysrc_point_lower + 1], y_weights):
+            cond = point_in_bounds(xpt, ypt, xdim, ydim) & cond_pt
+            xdest, ydest = xgrid[cond], ygrid[cond]
+            adv_field[ydest, xdest] += (
+                data[ypt[cond], xpt[cond]] * xwt[ydest, xdest] * ywt[ydest, xdest]
+            )
+    return np.ma.masked_where(~np.isfinite(adv_field), adv_field)
+
+
+def test_advection_engine():
+    """Compare gathering source values by flat index with boolean indexing,
+    for a single lead time"""
+    cube, (vel_x, vel_y) = _setup_cubes()
+    plugin = AdvectField(vel_x, vel_y)
+    grid_vel_x, grid_vel_y = plugin._grid_velocities(cube)
+    args = (cube.data, grid_vel_x, grid_vel_y, 3600)
+
+    loop_time, expected = bm.time_call(_boolean_index_advection, *args)
+    gather_time, result = bm.time_call(plugin._advect_field, *args)
+    bm.report(
+        "nowcast-advection-engine",
+        boolean_index_seconds=loop_time,
+        gather_seconds=gather_time,
+        speedup=loop_time / gather_time,
+    )
+    np.testing.assert_array_equal(result.mask, expected.mask)
+    np.testing.assert_array_equal(result.filled(np.nan), expected.filled(np.nan))
+
+
+def _loop_advection(plugin, cube):
+    """Advect the field to one lead time at a time"""
+    return [plugin(cube, timestep) for timestep in TIMESTEPS]
+
+
+def test_advect_lead_times():
+    """Compare advecting to all lead times together with advecting to each
+    lead time in turn"""
+    cube, (vel_x, vel_y) = _setup_cubes()
+    plugin = AdvectField(vel_x, vel_y)
+
+    loop_time, expected = bm.time_call(_loop_advection, plugin, cube, repeats=1)
+    batched_time, result = bm.time_call(
+        plugin.process_lead_times, cube, TIMESTEPS, repeats=1
+    )
+    loop_memory, _ = bm.peak_memory(_loop_advection, plugin, cube)
+    batched_memory, _ = bm.peak_memory(plugin.process_lead_times, cube, TIMESTEPS)
+    bm.report(
+        "nowcast-extrapolate-lead-times",
+        lead_times=len(TIMESTEPS),
+        loop_seconds=loop_time,
+        batched_seconds=batched_time,
+        speedup=loop_time / batched_time,
+        loop_peak_mb=loop_memory / 2 ** 20,
+        batched_peak_mb=batched_memory / 2 ** 20,
+    )
+    for result_cube, expected_cube in zip(result, expected):
+        np.testing.assert_array_equal(
+            np.ma.getmaskarray(result_cube.data), np.ma.getmaskarray(expected_cube.data)
+        )
+        np.testing.assert_array_equal(
+            np.ma.filled(result_cube.data, np.nan),
+            np.ma.filled(expected_cube.data, np.nan),
+        )
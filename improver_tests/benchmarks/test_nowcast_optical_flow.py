@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Benchmark of optical flow velocity estimation on radar-sized fields"""
+
+from datetime import datetime, timedelta
+
+import iris
+import numpy as np
+import pytest
+from scipy import ndimage
+
+from improver.nowcasting.optical_flow import (
+    OpticalFlow,
+    generate_optical_flow_components,
+)
+from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+
+from . import benchmark as bm
+
+pytestmark = [pytest.mark.benchmark, bm.skip_unless_benchmarking]
+
+# Approximately the size of the UK 1 km radar composite
+GRID_SHAPE = (1000, 1000)
+BOXSIZE = 30
+
+
+def _rainfall_fields(count):
+    """Rain-like fields advecting two grid squares per time step"""
+    rng = np.random.RandomState(0)
+    field = ndimage.gaussian_filter(rng.random_sample(GRID_SHAPE), 8)
+    field = 40.0 * np.clip(field - 0.5, 0, None)
+    return [
+        np.roll(field, (2 * step, 3 * step), axis=(0, 1)).astype(np.float32)
+        for step in range(count)
+    ]
+
+
+def _loop_displacements(plugin, partial_dx, partial_dy, partial_dt):
+    """Solve the optical flow equations one box at a time"""
+    dx_boxed, _ = plugin._make_subboxes(partial_dx)
+    dy_boxed, _ = plugin._make_subboxes(partial_dy)
+    dt_boxed, _ = plugin._make_subboxes(partial_dt)
+    velocity = []
+    for deriv_x, deriv_y, deriv_t in zip(dx_boxed, dy_boxed, dt_boxed):
+        deriv_xy = np.array([deriv_x.flatten(), deriv_y.flatten()], dtype=np.float64)
+        velocity.append(plugin.solve_for_uv(deriv_xy.transpose(), deriv_t.flatten()))
+    return np.array(velocity, dtype=np.float32).transpose()
+
+
+def _batched_displacements(plugin, partial_dx, partial_dy, partial_dt):
+    """Solve the optical flow equations for all boxes at once"""
+    u, v = plugin.solve_for_uv_batched(
+        *[
+            plugin._make_box_arrays(field)
+            for field in (partial_dx, partial_dy, partial_dt)
+        ]
+    )
+    return np.array([u, v], dtype=np.float32)
+
+
+def test_box_solver():
+    """Compare the batched box solver with solving each box in turn"""
+    plugin = OpticalFlow()
+    plugin.boxsize = BOXSIZE
+    plugin.data1, plugin.data2 = _rainfall_fields(2)
+    plugin.shape = GRID_SHAPE
+    partial_derivatives = (
+        plugin._partial_derivative_spatial(axis=1),
+        plugin._partial_derivative_spatial(axis=0),
+        plugin._partial_derivative_temporal(),
+    )
+
+    loop_time, expected = bm.time_call(
+        _loop_displacements, plugin, *partial_derivatives
+    )
+    batched_time, result = bm.time_call(
+        _batched_displacements, plugin, *partial_derivatives
+    )
+    bm.report(
+        "optical-flow-box-solver",
+        loop_seconds=loop_time,
+        batched_seconds=batched_time,
+        speedup=loop_time / batched_time,
+    )
+    np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-6)
+
+
+def test_nowcast_optical_flow():
+    """Time the optical flow calculation made by nowcast-optical-flow from
+    three radar-sized fields"""
+    time = datetime(2017, 11, 10, 4, 0)
+    cubes = iris.cube.CubeList(
+        [
+            set_up_variable_cube(
+                data,
+                name="lwe_precipitation_rate",
+                units="mm h-1",
+                spatial_grid="equalarea",
+                grid_spacing=1000,
+                time=time + timedelta(minutes=15 * step),
+                frt=time + timedelta(minutes=15 * step),
+            )
+            for step, data in enumerate(_rainfall_fields(3))
+        ]
+    )
+    elapsed, _ = bm.time_call(
+        generate_optical_flow_components,
+        cubes,
+        ofc_box_size=BOXSIZE,
+        smart_smoothing_iterations=100,
+        repeats=1,
+    )
+    bm.report("nowcast-optical-flow", seconds=elapsed)
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Benchmark of the upstream orographic enhancement component on a UK 2 km
+standard grid"""
+
+import iris
+import numpy as np
+import pytest
+
+from improver.orographic_enhancement import OrographicEnhancement
+
+from . import benchmark as bm
+
+pytestmark = [pytest.mark.benchmark, bm.skip_unless_benchmarking]
+
+GRID_SHAPE = (970, 1042)
+GRID_SPACING_KM = 2.0
+
+
+def _plugin(stream_distances):
+    """Set up a plugin with random wind components"""
+    rng = np.random.RandomState(0)
+    plugin = OrographicEnhancement(stream_distances=stream_distances)
+    for name in ("uwind", "vwind"):
+        data = rng.normal(0, 10, GRID_SHAPE).astype(np.float32)
+        setattr(plugin, name, iris.cube.Cube(data, units="m s-1"))
+    plugin.grid_spacing_km = GRID_SPACING_KM
+    return plugin
+
+
+def _loop_distances(plugin, max_sin_cos):
+    """Fill the distance array one grid point at a time, as the plugin used
+    to"""
+    max_roi = plugin._max_range_of_influence(max_sin_cos)
+    distance = np.full((np.amax(max_roi),) + GRID_SHAPE, np.nan, dtype=np.float32)
+    for y in range(distance.shape[1]):
+        for x in range(distance.shape[2]):
+            distance[: max_roi[y, x], y, x] = (
+                np.arange(max_roi[y, x]) / max_sin_cos[y, x]
+            )
+    return distance
+
+
+def _generator_gather(point_orogenh, x_source, y_source):
+    """Gather the source values one point at a time, as the plugin used to"""
+    return np.fromiter(
+        (point_orogenh[y, x] for (x, y) in zip(x_source.flatten(), y_source.flatten())),
+        np.float32,
+        count=x_source.size,
+    ).reshape(x_source.shape)
+
+
+def test_orographic_enhancement():
+    """Compare the upstream component with and without streaming over the
+    upstream distances, and the cost of the former point by point loops"""
+    point_orogenh = (
+        np.random.RandomState(1).random_sample(GRID_SHAPE).astype(np.float32)
+    )
+
+    full_plugin = _plugin(False)
+    full_time, expected = bm.time_call(
+        full_plugin._add_upstream_component, point_orogenh, repeats=1
+    )
+    full_memory, _ = bm.peak_memory(full_plugin._add_upstream_component, point_orogenh)
+    stream_plugin = _plugin(True)
+    stream_time, result = bm.time_call(
+        stream_plugin._add_upstream_component, point_orogenh, repeats=1
+    )
+    stream_memory, _ = bm.peak_memory(
+        stream_plugin._add_upstream_component, point_orogenh
+    )
+
+    max_sin_cos = np.abs(np.random.RandomState(2).uniform(0.7, 1.0, GRID_SHAPE))
+    loop_time, distance = bm.time_call(
+        _loop_distances, full_plugin, max_sin_cos, repeats=1
+    )
+    np.testing.assert_array_equal(
+        full_plugin._get_point_distances(point_orogenh, max_sin_cos), distance
+    )
+    sources = np.zeros(distance.shape, dtype=int)
+    gather_time, _ = bm.time_call(
+        _generator_gather, point_orogenh, sources, sources, repeats=1
+    )
+
+    bm.report(
+        "orographic-enhancement-upstream",
+        full_seconds=full_time,
+        stream_seconds=stream_time,
+        full_peak_mb=full_memory / 2 ** 20,
+        stream_peak_mb=stream_memory / 2 ** 20,
+        loop_distances_seconds=loop_time,
+        loop_gather_seconds=gather_time,
+    )
+    np.testing.assert_array_equal(result, expected)
+    assert stream_memory < full_memory
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Benchmark of blending percentile forecasts from several models"""
+
+import numpy as np
+import pytest
+
+from improver.blending.weighted_blend import PercentileBlendingAggregator
+
+from . import benchmark as bm
+
+pytestmark = [pytest.mark.benchmark, bm.skip_unless_benchmarking]
+
+GRID_SHAPE = (200, 200)
+MODELS = 4
+PERCENTILES = np.linspace(5, 95, 19, dtype=np.float32)
+
+
+def _percentile_forecasts():
+    """Sorted percentile forecasts and normalised weights for each model"""
+    rng = np.random.RandomState(0)
+    perc_data = rng.normal(15, 3, size=(len(PERCENTILES), MODELS) + GRID_SHAPE)
+    perc_data = np.sort(perc_data, axis=0).astype(np.float32)
+    weights = rng.random_sample(size=(MODELS,) + GRID_SHAPE).astype(np.float32)
+    weights /= weights.sum(axis=0)
+    return perc_data, weights
+
+
+def _per_point_blend(perc_data, weights):
+    """Blend the percentiles at each grid point in turn"""
+    data = np.moveaxis(perc_data, 1, 0).reshape(MODELS, len(PERCENTILES), -1)
+    flat_weights = weights.reshape(MODELS, -1)
+    result = np.empty(data.shape[1:], dtype=np.float32)
+    for i in range(data.shape[-1]):
+        result[:, i] = PercentileBlendingAggregator.blend_percentiles(
+            data[:, :, i], PERCENTILES, flat_weights[:, i]
+        )
+    return result.reshape((len(PERCENTILES),) + GRID_SHAPE)
+
+
+def test_percentile_blending():
+    """Compare blending chunks of points with blending each point in turn"""
+    perc_data, weights = _percentile_forecasts()
+
+    loop_time, expected = bm.time_call(_per_point_blend, perc_data, weights, repeats=1)
+    batched_time, result = bm.time_call(
+        PercentileBlendingAggregator.aggregate, perc_data, 1, PERCENTILES, weights
+    )
+    batched_memory, _ = bm.peak_memory(
+        PercentileBlendingAggregator.aggregate, perc_data, 1, PERCENTILES, weights
+    )
+    bm.report(
+        "percentile-blending",
+        points=np.prod(GRID_SHAPE),
+        loop_seconds=loop_time,
+        batched_seconds=batched_time,
+        speedup=loop_time / batched_time,
+        batched_peak_mb=batched_memory / 2 ** 20,
+    )
+    np.testing.assert_array_equal(result, expected)
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Benchmark of the recursive filter against a slice by slice loop"""
+
+import numpy as np
+import pytest
+
+from improver.nbhood.recursive_filter import RecursiveFilter
+from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+
+from . import benchmark as bm
+
+pytestmark = [pytest.mark.benchmark, bm.skip_unless_benchmarking]
+
+GRID_SIZE = 1000
+REALIZATIONS = 6
+ITERATIONS = 4
+EDGE_WIDTH = 15
+
+
+def _loop_forward(grid, coefficients, axis):
+    """Forward recursion over a 2D grid, one row or column at a time"""
+    for i in range(1, grid.shape[axis]):
+        if axis == 0:
+            grid[i, :] = (1.0 - coefficients[i - 1, :]) * grid[i, :] + coefficients[
+                i - 1, :
+            ] * grid[i - 1, :]
+        else:
+            grid[:, i] = (1.0 - coefficients[:, i - 1]) * grid[:, i] + coefficients[
+                :, i - 1
+            ] * grid[:, i - 1]
+    return grid
+
+
+def _loop_backward(grid, coefficients, axis):
+    """Backward recursion over a 2D grid, one row or column at a time"""
+    for i in range(grid.shape[axis] - 2, -1, -1):
+        if axis == 0:
+            grid[i, :] = (1.0 - coefficients[i, :]) * grid[i, :] + coefficients[
+                i, :
+            ] * grid[i + 1, :]
+        else:
+            grid[:, i] = (1.0 - coefficients[:, i]) * grid[:, i] + coefficients[
+                :, i
+            ] * grid[:, i + 1]
+    return grid
+
+
+def _slice_by_slice(data, coefficients_x, coefficients_y):
+    """Pad and filter each x-y slice in turn, as the plugin used to"""
+    width = 2 * EDGE_WIDTH
+    pad_x, pad_y = [
+        np.pad(coefficients, width, mode="symmetric")
+        for coefficients in (coefficients_x, coefficients_y)
+    ]
+    result = []
+    for data_slice in data:
+        grid = np.pad(data_slice, width, mode="symmetric")
+        for _ in range(ITERATIONS):
+            grid = _loop_forward(grid, pad_x, 1)
+            grid = _loop_backward(grid, pad_x, 1)
+            grid = _loop_forward(grid, pad_y, 0)
+            grid = _loop_backward(grid, pad_y, 0)
+        result.append(grid[width:-width, width:-width])
+    return np.stack(result)
+
+
+def _coefficients_cube(data, axis, template):
+    """Set up a smoothing coefficients cube staggered along one axis"""
+    cube = set_up_variable_cube(data, name=f"smoothing_coefficient_{axis}")
+    points = template.coord(axis=axis).points
+    cube.coord(axis=axis).points = (points[1:] + points[:-1]) / 2
+    return cube
+
+
+def test_recursive_filter():
+    """Compare the plugin with filtering each realization in turn"""
+    rng = np.random.RandomState(0)
+    data = rng.random_sample((REALIZATIONS, GRID_SIZE, GRID_SIZE)).astype(np.float32)
+    cube = set_up_variable_cube(data, name="probability_of_rain", units="1")
+    coefficients_x = rng.uniform(0, 0.5, (GRID_SIZE, GRID_SIZE - 1)).astype(np.float32)
+    coefficients_y = rng.uniform(0, 0.5, (GRID_SIZE - 1, GRID_SIZE)).astype(np.float32)
+    coefficients = [
+        _coefficients_cube(coefficients_x, "x", cube),
+        _coefficients_cube(coefficients_y, "y", cube),
+    ]
+
+    loop_time, expected = bm.time_call(
+        _slice_by_slice, data, coefficients_x, coefficients_y, repeats=1
+    )
+    plugin = RecursiveFilter(iterations=ITERATIONS, edge_width=EDGE_WIDTH)
+    plugin_time, result = bm.time_call(
+        plugin, cube, smoothing_coefficients=coefficients
+    )
+    bm.report(
+        "recursive-filter",
+        loop_seconds=loop_time,
+        plugin_seconds=plugin_time,
+        speedup=loop_time / plugin_time,
+    )
+    np.testing.assert_array_equal(result.data, expected)
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Benchmark of spot extraction from a large multi-realization NetCDF file"""
+
+import iris
+import numpy as np
+import pytest
+
+from improver.spotdata.spot_extraction import SpotExtraction
+from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+from improver.utilities.load import load_cube
+from improver.utilities.save import save_netcdf
+
+from . import benchmark as bm
+
+pytestmark = [pytest.mark.benchmark, bm.skip_unless_benchmarking]
+
+GRID_SHAPE = (1000, 1000)
+REALIZATIONS = 12
+SITES = 10000
+
+
+def _diagnostic_file(path):
+    """Save a multi-realization temperature field to a NetCDF file"""
+    rng = np.random.RandomState(0)
+    data = rng.normal(280, 5, size=(REALIZATIONS,) + GRID_SHAPE).astype(np.float32)
+    cube = set_up_variable_cube(
+        data, spatial_grid="equalarea", realizations=np.arange(REALIZATIONS)
+    )
+    save_netcdf(cube, str(path))
+
+
+def _coordinate_cube():
+    """Cube of x and y indices of the grid point neighbours of each site"""
+    rng = np.random.RandomState(1)
+    indices = np.array(
+        [rng.randint(0, GRID_SHAPE[1], SITES), rng.randint(0, GRID_SHAPE[0], SITES)]
+    )
+    return iris.cube.Cube(indices)
+
+
+def _extract(path, coordinate_cube, no_lazy_load):
+    """Load the diagnostic and extract the values at the sites"""
+    cube = load_cube(str(path), no_lazy_load=no_lazy_load)
+    return SpotExtraction.extract_diagnostic_data(coordinate_cube, cube)
+
+
+def test_spot_extraction(tmp_path):
+    """Compare extraction from lazily loaded and fully realised data"""
+    path = tmp_path / "diagnostic.nc"
+    _diagnostic_file(path)
+    coordinate_cube = _coordinate_cube()
+
+    realised_time, expected = bm.time_call(_extract, path, coordinate_cube, True)
+    lazy_time, result = bm.time_call(_extract, path, coordinate_cube, False)
+    realised_memory, _ = bm.peak_memory(_extract, path, coordinate_cube, True)
+    lazy_memory, _ = bm.peak_memory(_extract, path, coordinate_cube, False)
+    bm.report(
+        "spot-extraction",
+        sites=SITES,
+        realised_seconds=realised_time,
+        lazy_seconds=lazy_time,
+        realised_peak_mb=realised_memory / 2 ** 20,
+        lazy_peak_mb=lazy_memory / 2 ** 20,
+    )
+    np.testing.assert_array_equal(result, expected)
+    assert lazy_memory < realised_memory
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Benchmark of weather symbols on a UK 2 km standard grid"""
+
+import copy
+
+import iris
+import numpy as np
+import pytest
+
+from improver.metadata.probabilistic import (
+    get_threshold_coord_name_from_probability_name,
+)
+from improver.synthetic_data.set_up_test_cubes import set_up_probability_cube
+from improver.wxcode.utilities import (
+    expand_nested_lists,
+    get_parameter_names,
+    update_daynight,
+)
+from improver.wxcode.weather_symbols import WeatherSymbols
+
+from . import benchmark as bm
+
+pytestmark = [pytest.mark.benchmark, bm.skip_unless_benchmarking]
+
+GRID_SHAPE = (970, 1042)
+
+
+def _input_cubes(plugin):
+    """Random probabilities of every diagnostic and threshold required by the
+    decision tree"""
+    thresholds = {}
+    for query in plugin.queries.values():
+        for diagnostic, threshold, condition in zip(
+            get_parameter_names(expand_nested_lists(query, "diagnostic_fields")),
+            expand_nested_lists(query, "diagnostic_thresholds"),
+            expand_nested_lists(query, "diagnostic_conditions"),
+        ):
+            values, units, _ = thresholds.setdefault(
+                diagnostic, (set(), threshold.units, condition)
+            )
+            values.add(threshold.points.item())
+
+    rng = np.random.RandomState(0)
+    cubes = iris.cube.CubeList()
+    for diagnostic, (values, units, condition) in thresholds.items():
+        data = rng.random_sample((len(values),) + GRID_SHAPE).astype(np.float32)
+        cubes.append(
+            set_up_probability_cube(
+                data,
+                np.array(sorted(values), dtype=np.float32),
+                variable_name=get_threshold_coord_name_from_probability_name(
+                    diagnostic, check_vicinity=True
+                ),
+                threshold_units=str(units),
+                spp__relative_to_threshold=condition,
+                spatial_grid="equalarea",
+            )
+        )
+    return cubes
+
+
+def _route_symbols(plugin, cubes):
+    """Set the weather symbols one route through the tree at a time, building
+    and evaluating a condition string for each, as the plugin used to"""
+    omit_nodes = plugin.check_input_cubes(cubes)
+    symbols = plugin.create_symbol_cube(cubes)
+    graph = {
+        key: [query["succeed"], query["fail"]] for key, query in plugin.queries.items()
+    }
+    defined_symbols = [
+        value
+        for query in plugin.queries.values()
+        for value in query.values()
+        if isinstance(value, int)
+    ]
+    for symbol_code in defined_symbols:
+        for route in plugin.find_all_routes(
+            graph, plugin.start_node, symbol_code, omit_nodes=omit_nodes
+        ):
+            conditions = []
+            for current_node, next_node in zip(route[:-1], route[1:]):
+                current = copy.copy(plugin.queries[current_node])
+                if current["fail"] == next_node:
+                    (
+                        current["threshold_condition"],
+                        current["condition_combination"],
+                    ) = plugin.invert_condition(current)
+                conditions.extend(plugin.create_condition_chain(current))
+            test_chain = plugin.format_condition_chain(conditions)
+            # pylint: disable=eval-used
+            symbols.data[np.ma.where(eval(test_chain))] = symbol_code
+    return update_daynight(symbols)
+
+
+@pytest.mark.parametrize("wxtree", ["high_resolution", "global"])
+def test_wxcode(wxtree):
+    """Compare evaluating each node of the decision tree once with evaluating
+    every route through it"""
+    cubes = _input_cubes(WeatherSymbols(wxtree=wxtree))
+
+    tree_time, result = bm.time_call(WeatherSymbols(wxtree=wxtree), cubes)
+    route_plugin = WeatherSymbols(wxtree=wxtree)
+    route_time, expected = bm.time_call(_route_symbols, route_plugin, cubes, repeats=1)
+
+    bm.report(f"wxcode-{wxtree}", tree_seconds=tree_time, route_seconds=route_time)
+    np.testing.assert_array_equal(
+        np.ma.getmaskarray(result.data), np.ma.getmaskarray(expected.data)
+    )
+    np.testing.assert_array_equal(result.data, expected.data)
+    assert tree_time < route_time
@@ -32,6 +32,7 @@
 
 
 import unittest
+from unittest.mock import patch
 
 import numpy as np
 from iris.tests import IrisTest
@@ -248,6 +249,65 @@ class Test_aggregate(IrisTest):
         with self.assertRaisesRegex(ValueError, "Weights shape does not match data"):
             PercentileBlendingAggregator.aggregate(perc_data, 1, percentiles, weights)
 
+    def test_matches_per_point_blend(self):
+        """Test blending points in chunks gives the same result as blending
+        each point in turn with blend_percentiles, including points with tied
+        percentile values"""
+        rng = np.random.RandomState(0)
+        perc_data = np.sort(rng.normal(15, 3, size=(3, 6, 5, 7)), axis=1)
+        perc_data[:, :, 0] = np.round(perc_data[:, :, 0])
+        perc_data = perc_data.astype(np.float32)
+        weights = rng.random_sample(size=(3, 5, 7)).astype(np.float32)
+        weights /= weights.sum(axis=0)
+        percentiles = np.array([0, 20, 40, 60, 80, 100], dtype=np.float32)
+        expected = np.empty((6, 5, 7), dtype=np.float32)
+        for index in np.ndindex(5, 7):
+            expected[
+                (slice(None),) + index
+            ] = PercentileBlendingAggregator.blend_percentiles(
+                perc_data[(slice(None), slice(None)) + index],
+                percentiles,
+                weights[(slice(None),) + index],
+            )
+        with patch.object(PercentileBlendingAggregator, "CHUNK_SIZE", 4):
+            result = PercentileBlendingAggregator.aggregate(
+                np.moveaxis(perc_data, 0, -1), -1, percentiles, weights
+            )
+        self.assertArrayEqual(result, expected)
+
+
+class Test_blend_percentiles_batched(IrisTest):
+    """Test the blend_percentiles_batched method"""
+
+    def test_matches_blend_percentiles(self):
+        """Test the batched blend matches blend_percentiles at each point"""
+        weights = np.array([[0.38872692, 0.33041788, 0.2808552], [0.2, 0.5, 0.3]])
+        percentiles = np.array(
+            [0.0, 10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 70.0, 80.0, 90.0, 100.0]
+        )
+        perc_values = np.array([PERCENTILE_VALUES, PERCENTILE_VALUES[::-1]])
+        result = PercentileBlendingAggregator.blend_percentiles_batched(
+            perc_values, percentiles, weights
+        )
+        self.assertEqual(result.shape, (2, 11))
+        for point in range(2):
+            expected = PercentileBlendingAggregator.blend_percentiles(
+                perc_values[point], percentiles, weights[point]
+            )
+            self.assertArrayEqual(result[point], expected)
+
+    def test_two_percentiles(self):
+        """Test that when two percentiles are provided, the extreme values in
+           the set of thresholds we are blending are returned"""
+        weights = np.array([[0.5, 0.5]])
+        percentiles = np.array([30.0, 60.0])
+        percentile_values = np.array([[[5.0, 8.0], [6.0, 7.0]]])
+        result = PercentileBlendingAggregator.blend_percentiles_batched(
+            percentile_values, percentiles, weights
+        )
+        expected_result = np.array([[5.0, 8.0]])
+        self.assertArrayAlmostEqual(result, expected_result)
+
 
 class Test_blend_percentiles(IrisTest):
     """Test the blend_percentiles method"""
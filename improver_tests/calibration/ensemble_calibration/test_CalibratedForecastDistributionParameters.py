@@ -107,6 +107,31 @@ class SetupCoefficientsCubes(SetupCubes, SetupExpectedCoefficients):
             self.current_temperature_forecast_cube,
         )
 
+        # Set up coefficients cubes when the coefficients have been estimated
+        # point by point, using the same coefficients at each point.
+        estimator = EstimateCoefficientsForEnsembleCalibration(
+            "norm", desired_units="Celsius", point_by_point=True
+        )
+        self.point_by_point_coeffs_from_mean = estimator.create_coefficients_cubelist(
+            np.tile(
+                np.reshape(self.expected_mean_predictor_norm, (-1, 1, 1)), (1, 3, 3)
+            ),
+            self.current_temperature_forecast_cube,
+        )
+        estimator = EstimateCoefficientsForEnsembleCalibration(
+            "norm",
+            desired_units="Celsius",
+            predictor="realizations",
+            point_by_point=True,
+        )
+        self.point_by_point_coeffs_from_realizations = estimator.create_coefficients_cubelist(
+            np.tile(
+                np.reshape(self.expected_realizations_norm_statsmodels, (-1, 1, 1)),
+                (1, 3, 3),
+            ),
+            self.current_temperature_forecast_cube,
+        )
+
         # Some expected data that are used in various tests.
         self.expected_loc_param_mean = np.array(
             [
@@ -237,6 +262,27 @@ class Test__spatial_domain_match(SetupCoefficientsCubes):
         with self.assertRaisesRegex(ValueError, msg):
             self.plugin._spatial_domain_match()
 
+    def test_matching_point_by_point(self):
+        """Test case in which the spatial domains match and the coefficients
+        have been estimated point by point."""
+        self.plugin.current_forecast = self.current_temperature_forecast_cube
+        self.plugin.coefficients_cubelist = self.point_by_point_coeffs_from_mean
+        self.plugin._spatial_domain_match()
+
+    def test_unmatching_x_axis_point_by_point(self):
+        """Test when an interior point of the x dimension does not match and
+        the coefficients have been estimated point by point. The collapsed
+        x coordinates still match."""
+        x_coord = self.current_temperature_forecast_cube.coord(axis="x")
+        points = x_coord.points.copy()
+        points[1] = points[1] + 1.0
+        x_coord.points = points
+        self.plugin.current_forecast = self.current_temperature_forecast_cube
+        self.plugin.coefficients_cubelist = self.point_by_point_coeffs_from_mean
+        msg = "The points or bounds of the x axis given by the current forecast"
+        with self.assertRaisesRegex(ValueError, msg):
+            self.plugin._spatial_domain_match()
+
 
 class Test__calculate_location_parameter_from_mean(
     SetupCoefficientsCubes, EnsembleCalibrationAssertions
@@ -273,6 +319,17 @@ class Test__calculate_location_parameter_from_mean(
             decimal=0,
         )
 
+    @ManageWarnings(ignored_messages=["Collapsing a non-contiguous coordinate."])
+    def test_point_by_point(self):
+        """Test that the expected values for the location parameter are
+        calculated when using coefficients estimated point by point."""
+        self.plugin.coefficients_cubelist = self.point_by_point_coeffs_from_mean
+        location_parameter = self.plugin._calculate_location_parameter_from_mean()
+        self.assertCalibratedVariablesAlmostEqual(
+            location_parameter, self.expected_loc_param_mean
+        )
+        self.assertEqual(location_parameter.dtype, np.float32)
+
 
 class Test__calculate_location_parameter_from_realizations(
     SetupCoefficientsCubes, EnsembleCalibrationAssertions
@@ -334,6 +391,20 @@ class Test__calculate_location_parameter_from_realizations(
             decimal=0,
         )
 
+    @ManageWarnings(ignored_messages=["Collapsing a non-contiguous coordinate."])
+    def test_point_by_point(self):
+        """Test that the expected values for the location parameter are
+        calculated when using the ensemble realizations with coefficients
+        estimated point by point."""
+        self.plugin.coefficients_cubelist = self.point_by_point_coeffs_from_realizations
+        location_parameter = (
+            self.plugin._calculate_location_parameter_from_realizations()
+        )
+        self.assertCalibratedVariablesAlmostEqual(
+            location_parameter, self.expected_loc_param_statsmodels_realizations
+        )
+        self.assertEqual(location_parameter.dtype, np.float32)
+
 
 class Test__calculate_scale_parameter(
     SetupCoefficientsCubes, EnsembleCalibrationAssertions
@@ -429,6 +500,22 @@ class Test_process(SetupCoefficientsCubes, EnsembleCalibrationAssertions):
         )
         self.assertEqual(calibrated_forecast_predictor.dtype, np.float32)
 
+    @ManageWarnings(ignored_messages=["Collapsing a non-contiguous coordinate."])
+    def test_end_to_end_point_by_point(self):
+        """An example end-to-end calculation using coefficients estimated
+        point by point."""
+        calibrated_forecast_predictor, calibrated_forecast_var = self.plugin.process(
+            self.current_temperature_forecast_cube, self.point_by_point_coeffs_from_mean
+        )
+
+        self.assertCalibratedVariablesAlmostEqual(
+            calibrated_forecast_predictor.data, self.expected_loc_param_mean
+        )
+        self.assertCalibratedVariablesAlmostEqual(
+            calibrated_forecast_var.data, self.expected_scale_param_mean
+        )
+        self.assertEqual(calibrated_forecast_predictor.dtype, np.float32)
+
     @ManageWarnings(ignored_messages=["Collapsing a non-contiguous coordinate."])
     def test_end_to_end_with_mask(self):
         """An example end-to-end calculation, but making sure that the
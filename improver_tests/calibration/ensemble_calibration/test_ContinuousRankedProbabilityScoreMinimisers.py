@@ -39,6 +39,7 @@ import unittest
 import iris
 import numpy as np
 from iris.tests import IrisTest
+from scipy.optimize import approx_fprime
 
 from improver.calibration.ensemble_calibration import (
     ContinuousRankedProbabilityScoreMinimisers as Plugin,
@@ -60,22 +61,50 @@ class Test__repr__(IrisTest):
             "<ContinuousRankedProbabilityScoreMinimisers: "
             "minimisation_dict: {'norm': 'calculate_normal_crps', "
             "'truncnorm': 'calculate_truncated_normal_crps'}; "
-            "tolerance: 0.02; max_iterations: 1000>"
+            "tolerance: 0.02; max_iterations: 1000; "
+            "minimisation_method: Nelder-Mead; point_by_point: False; "
+            "max_workers: 1>"
         )
         self.assertEqual(result, msg)
 
     def test_update_kwargs(self):
         """A test to update the available keyword argument."""
-        result = str(Plugin(tolerance=10, max_iterations=10))
+        result = str(
+            Plugin(
+                tolerance=10,
+                max_iterations=10,
+                minimisation_method="BFGS",
+                point_by_point=True,
+                max_workers=4,
+            )
+        )
         msg = (
             "<ContinuousRankedProbabilityScoreMinimisers: "
             "minimisation_dict: {'norm': 'calculate_normal_crps', "
             "'truncnorm': 'calculate_truncated_normal_crps'}; "
-            "tolerance: 10; max_iterations: 10>"
+            "tolerance: 10; max_iterations: 10; minimisation_method: BFGS; "
+            "point_by_point: True; max_workers: 4>"
         )
         self.assertEqual(result, msg)
 
 
+class Test__init__(IrisTest):
+
+    """Test the __init__ method."""
+
+    def test_minimisation_method_case_insensitive(self):
+        """Test that the minimisation method is matched case insensitively
+        and stored as named in scipy.optimize.minimize."""
+        plugin = Plugin(minimisation_method="l-bfgs-b")
+        self.assertEqual(plugin.minimisation_method, "L-BFGS-B")
+
+    def test_invalid_minimisation_method(self):
+        """Test that an unsupported minimisation method raises an error."""
+        msg = "Minimisation method Powell is not supported"
+        with self.assertRaisesRegex(ValueError, msg):
+            Plugin(minimisation_method="Powell")
+
+
 class SetupInputs(IrisTest):
 
     """Set up inputs for testing."""
@@ -91,6 +120,18 @@ class SetupInputs(IrisTest):
             dtype=np.float64,
         )
 
+    def vary_between_days(self):
+        """Add offsets that vary between the historic days to the truth and
+        the ensemble mean. Otherwise, the training data at each point is the
+        same on every day, so the coefficients at each point are not well
+        defined."""
+        truth_offsets = np.array([0.4, -0.3, 0.1, -0.5, 0.2], dtype=np.float32)
+        self.truth.data = self.truth.data + truth_offsets[:, np.newaxis, np.newaxis]
+        mean_offsets = np.array([0.3, -0.1, 0.2, -0.4, 0.0], dtype=np.float32)
+        self.forecast_predictor_mean.data = (
+            self.forecast_predictor_mean.data + mean_offsets[:, np.newaxis, np.newaxis]
+        )
+
 
 class SetupNormalInputs(SetupInputs, SetupCubes):
 
@@ -213,6 +254,147 @@ class Test_calculate_normal_crps(SetupNormalInputs):
         self.assertAlmostEqual(result, plugin.BAD_VALUE)
 
 
+class Test_calculate_normal_crps_gradient(SetupNormalInputs):
+
+    """Test the gradient of the CRPS for a normal distribution."""
+
+    @ManageWarnings(ignored_messages=["Collapsing a non-contiguous coordinate."])
+    def test_mean_predictor(self):
+        """Test that the gradient matches a finite difference approximation
+        with the ensemble mean as the predictor."""
+        predictor = "mean"
+        initial_guess = np.array([0.1, 0.9, 0.2, 0.8], dtype=np.float64)
+        args = (
+            self.forecast_predictor_data,
+            self.truth_data,
+            self.forecast_variance_data,
+            self.sqrt_pi,
+            predictor,
+        )
+
+        plugin = Plugin()
+        result = plugin.calculate_normal_crps_gradient(initial_guess, *args)
+        expected = approx_fprime(
+            initial_guess, plugin.calculate_normal_crps, 1e-6, *args
+        )
+
+        self.assertEqual(result.shape, initial_guess.shape)
+        self.assertArrayAlmostEqual(result, expected, decimal=4)
+
+    @ManageWarnings(ignored_messages=["Collapsing a non-contiguous coordinate."])
+    def test_realizations_predictor(self):
+        """Test that the gradient matches a finite difference approximation
+        with the ensemble realizations as the predictor."""
+        predictor = "realizations"
+        initial_guess = np.array([0.1, 0.5, 0.6, 0.5, 0.2, 0.8], dtype=np.float64)
+        args = (
+            self.forecast_predictor_data_realizations,
+            self.truth_data,
+            self.forecast_variance_data,
+            self.sqrt_pi,
+            predictor,
+        )
+
+        plugin = Plugin()
+        result = plugin.calculate_normal_crps_gradient(initial_guess, *args)
+        expected = approx_fprime(
+            initial_guess, plugin.calculate_normal_crps, 1e-6, *args
+        )
+
+        self.assertEqual(result.shape, initial_guess.shape)
+        self.assertArrayAlmostEqual(result, expected, decimal=4)
+
+    @ManageWarnings(
+        ignored_messages=[
+            "Collapsing a non-contiguous coordinate.",
+            "invalid value encountered in",
+        ],
+        warning_types=[UserWarning, RuntimeWarning],
+    )
+    def test_bad_value(self):
+        """Test that a zero gradient is returned where the CRPS would be
+        set to the BAD_VALUE."""
+        initial_guess = np.array([1e65, 1e65, 1e65, 1e65], dtype=np.float32)
+
+        plugin = Plugin()
+        result = plugin.calculate_normal_crps_gradient(
+            initial_guess,
+            self.forecast_predictor_data,
+            self.truth_data,
+            self.forecast_variance_data,
+            self.sqrt_pi,
+            "mean",
+        )
+
+        self.assertArrayEqual(result, np.zeros(4))
+
+
+class Test__calculate_point_crps_and_gradient(SetupNormalInputs):
+
+    """Test calculating the CRPS and its gradient independently at each
+    point."""
+
+    def setUp(self):
+        """Set up the data at each point."""
+        super().setUp()
+        self.plugin = Plugin()
+        self.truth_points = self.plugin._get_point_data(self.truth, ["time"])
+        self.forecast_variance_points = self.plugin._get_point_data(
+            self.forecast_variance, ["time"]
+        )
+        # Use different coefficients at each point.
+        self.point_offsets = np.linspace(0, 0.1, self.truth_points.shape[0])[
+            :, np.newaxis
+        ]
+
+    def assertMatchesEachPoint(self, coefficients, forecast_predictor, predictor):
+        """Assert that the CRPS and gradient at each point match those
+        calculated using the data at that point alone."""
+        crps, gradient = self.plugin._calculate_point_crps_and_gradient(
+            coefficients,
+            forecast_predictor,
+            self.truth_points,
+            self.forecast_variance_points,
+            self.sqrt_pi,
+            predictor,
+            "norm",
+        )
+        self.assertEqual(crps.shape, (9,))
+        self.assertEqual(gradient.shape, coefficients.shape)
+        for index, point_coefficients in enumerate(coefficients):
+            args = (
+                forecast_predictor[index],
+                self.truth_points[index],
+                self.forecast_variance_points[index],
+                self.sqrt_pi,
+                predictor,
+            )
+            self.assertAlmostEqual(
+                crps[index],
+                self.plugin.calculate_normal_crps(point_coefficients, *args),
+            )
+            self.assertArrayAlmostEqual(
+                gradient[index],
+                self.plugin.calculate_normal_crps_gradient(point_coefficients, *args),
+            )
+
+    def test_mean_predictor(self):
+        """Test with the ensemble mean as the predictor."""
+        coefficients = np.array([0.1, 0.9, 0.2, 0.8]) + self.point_offsets
+        forecast_predictor = self.plugin._get_point_data(
+            self.forecast_predictor_mean, ["time"]
+        )
+        self.assertMatchesEachPoint(coefficients, forecast_predictor, "mean")
+
+    def test_realizations_predictor(self):
+        """Test with the ensemble realizations as the predictor."""
+        coefficients = np.array([0.1, 0.5, 0.6, 0.5, 0.2, 0.8]) + self.point_offsets
+        forecast_predictor = self.plugin._get_point_data(
+            self.forecast_predictor_realizations, ["time", "realization"]
+        )
+        self.assertMatchesEachPoint(coefficients, forecast_predictor, "realizations")
+
+
 class Test_process_normal_distribution(
     SetupNormalInputs, EnsembleCalibrationAssertions
 ):
@@ -439,6 +621,215 @@ class Test_process_normal_distribution(
         self.assertTrue(any(warning_msg_min in str(item) for item in warning_list))
         self.assertTrue(any(warning_msg_iter in str(item) for item in warning_list))
 
+    @ManageWarnings(
+        ignored_messages=[
+            "Collapsing a non-contiguous coordinate.",
+            "Minimisation did not result in convergence",
+            "The final iteration resulted in",
+            "invalid value encountered in",
+            "divide by zero encountered in",
+        ],
+        warning_types=[
+            UserWarning,
+            UserWarning,
+            UserWarning,
+            RuntimeWarning,
+            RuntimeWarning,
+        ],
+    )
+    def test_gradient_based_minimisation(self):
+        """
+        Test that the gradient-based minimisation methods reach a CRPS at
+        least as low as Nelder-Mead. The ensemble mean is the predictor.
+        """
+        predictor = "mean"
+        distribution = "norm"
+        args = (
+            self.forecast_predictor_data,
+            self.truth_data,
+            self.forecast_variance_data,
+            self.sqrt_pi,
+            predictor,
+        )
+        nelder_mead_crps = self.plugin.calculate_normal_crps(
+            self.plugin.process(
+                self.initial_guess_for_mean,
+                self.forecast_predictor_mean,
+                self.truth,
+                self.forecast_variance,
+                predictor,
+                distribution,
+            ).astype(np.float64),
+            *args,
+        )
+        for method in ["BFGS", "L-BFGS-B"]:
+            with self.subTest(method=method):
+                plugin = Plugin(tolerance=self.tolerance, minimisation_method=method)
+                result = plugin.process(
+                    self.initial_guess_for_mean,
+                    self.forecast_predictor_mean,
+                    self.truth,
+                    self.forecast_variance,
+                    predictor,
+                    distribution,
+                )
+                self.assertEqual(result.dtype, np.float32)
+                crps = plugin.calculate_normal_crps(result.astype(np.float64), *args)
+                self.assertLessEqual(crps, nelder_mead_crps + 1e-4)
+
+
+class Test_process_point_by_point(SetupNormalInputs, EnsembleCalibrationAssertions):
+
+    """Test minimising the CRPS for a normal distribution independently at
+    each point."""
+
+    def setUp(self):
+        """Set up the plugin and vary the training data between days."""
+        super().setUp()
+        self.tolerance = 1e-4
+        self.plugin = Plugin(tolerance=self.tolerance, point_by_point=True)
+        self.vary_between_days()
+
+    def assertImprovesOnDomain(self, result, initial_guess, forecast_predictor):
+        """Assert that the CRPS at each point using the coefficients for that
+        point is no higher than using coefficients for the whole domain."""
+        predictor = "mean" if forecast_predictor.ndim == 3 else "realizations"
+        domain_coefficients = Plugin(
+            tolerance=self.tolerance, minimisation_method="BFGS"
+        ).process(
+            initial_guess,
+            forecast_predictor,
+            self.truth,
+            self.forecast_variance,
+            predictor,
+            "norm",
+        )
+        for y_index, x_index in np.ndindex(self.truth.shape[1:]):
+            args = (
+                forecast_predictor.data[:, ..., y_index, x_index].astype(np.float64),
+                self.truth.data[:, y_index, x_index].astype(np.float64),
+                self.forecast_variance.data[:, y_index, x_index].astype(np.float64),
+                self.sqrt_pi,
+                predictor,
+            )
+            self.assertLessEqual(
+                self.plugin.calculate_normal_crps(
+                    result[:, y_index, x_index].astype(np.float64), *args
+                ),
+                self.plugin.calculate_normal_crps(
+                    domain_coefficients.astype(np.float64), *args
+                ),
+            )
+
+    @ManageWarnings(
+        ignored_messages=[
+            "Collapsing a non-contiguous coordinate.",
+            "Minimisation did not result in convergence",
+            "invalid value encountered in",
+            "divide by zero encountered in",
+        ],
+        warning_types=[UserWarning, UserWarning, RuntimeWarning, RuntimeWarning],
+    )
+    def test_mean_predictor(self):
+        """Test that coefficients are returned for each point, which improve
+        upon the coefficients for the whole domain. The ensemble mean is the
+        predictor."""
+        result = self.plugin.process(
+            self.initial_guess_for_mean,
+            self.forecast_predictor_mean,
+            self.truth,
+            self.forecast_variance,
+            "mean",
+            "norm",
+        )
+        self.assertEqual(result.dtype, np.float32)
+        self.assertEqual(result.shape, (4, 3, 3))
+        self.assertImprovesOnDomain(
+            result, self.initial_guess_for_mean, self.forecast_predictor_mean
+        )
+
+    @ManageWarnings(
+        ignored_messages=[
+            "Collapsing a non-contiguous coordinate.",
+            "Minimisation did not result in convergence",
+            "invalid value encountered in",
+            "divide by zero encountered in",
+        ],
+        warning_types=[UserWarning, UserWarning, RuntimeWarning, RuntimeWarning],
+    )
+    def test_realizations_predictor(self):
+        """Test that coefficients are returned for each point, which improve
+        upon the coefficients for the whole domain. The ensemble realizations
+        are the predictor."""
+        result = self.plugin.process(
+            self.initial_guess_for_realization,
+            self.forecast_predictor_realizations,
+            self.truth,
+            self.forecast_variance,
+            "realizations",
+            "norm",
+        )
+        self.assertEqual(result.dtype, np.float32)
+        self.assertEqual(result.shape, (6, 3, 3))
+        self.assertImprovesOnDomain(
+            result,
+            self.initial_guess_for_realization,
+            self.forecast_predictor_realizations,
+        )
+
+    @ManageWarnings(
+        ignored_messages=[
+            "Collapsing a non-contiguous coordinate.",
+            "Minimisation did not result in convergence",
+        ],
+    )
+    def test_masked_point(self):
+        """Test that the coefficients are NaN at a point where the truth is
+        masked on every day, without affecting the other points."""
+        expected = self.plugin.process(
+            self.initial_guess_for_mean,
+            self.forecast_predictor_mean,
+            self.truth,
+            self.forecast_variance,
+            "mean",
+            "norm",
+        )
+        expected[:, 0, 0] = np.nan
+        self.truth.data = np.ma.masked_array(self.truth.data)
+        self.truth.data[:, 0, 0] = np.ma.masked
+
+        result = self.plugin.process(
+            self.initial_guess_for_mean,
+            self.forecast_predictor_mean,
+            self.truth,
+            self.forecast_variance,
+            "mean",
+            "norm",
+        )
+        self.assertArrayEqual(result, expected)
+
+    @ManageWarnings(
+        ignored_messages=[
+            "Collapsing a non-contiguous coordinate.",
+            "Minimisation did not result in convergence",
+        ],
+    )
+    def test_max_workers(self):
+        """Test that minimising groups of points in parallel gives the same
+        coefficients as minimising all points together."""
+        args = (
+            self.initial_guess_for_mean,
+            self.forecast_predictor_mean,
+            self.truth,
+            self.forecast_variance,
+            "mean",
+            "norm",
+        )
+        expected = self.plugin.process(*args)
+        plugin = Plugin(tolerance=self.tolerance, point_by_point=True, max_workers=2)
+        result = plugin.process(*args)
+        self.assertArrayEqual(result, expected)
+
 
 class SetupTruncatedNormalInputs(SetupInputs, SetupCubes):
 
@@ -561,6 +952,81 @@ class Test_calculate_truncated_normal_crps(SetupTruncatedNormalInputs):
         self.assertAlmostEqual(result, plugin.BAD_VALUE)
 
 
+class Test_calculate_truncated_normal_crps_gradient(SetupTruncatedNormalInputs):
+
+    """Test the gradient of the CRPS for a truncated normal distribution."""
+
+    @ManageWarnings(ignored_messages=["Collapsing a non-contiguous coordinate."])
+    def test_mean_predictor(self):
+        """Test that the gradient matches a finite difference approximation
+        with the ensemble mean as the predictor."""
+        predictor = "mean"
+        initial_guess = np.array([0.1, 0.9, 0.2, 0.8], dtype=np.float64)
+        args = (
+            self.forecast_predictor_data,
+            self.truth_data,
+            self.forecast_variance_data,
+            self.sqrt_pi,
+            predictor,
+        )
+
+        plugin = Plugin()
+        result = plugin.calculate_truncated_normal_crps_gradient(initial_guess, *args)
+        expected = approx_fprime(
+            initial_guess, plugin.calculate_truncated_normal_crps, 1e-6, *args
+        )
+
+        self.assertEqual(result.shape, initial_guess.shape)
+        self.assertArrayAlmostEqual(result, expected, decimal=4)
+
+    @ManageWarnings(ignored_messages=["Collapsing a non-contiguous coordinate."])
+    def test_realizations_predictor(self):
+        """Test that the gradient matches a finite difference approximation
+        with the ensemble realizations as the predictor."""
+        predictor = "realizations"
+        initial_guess = np.array([0.1, 0.5, 0.6, 0.5, 0.2, 0.8], dtype=np.float64)
+        args = (
+            self.forecast_predictor_data_realizations,
+            self.truth_data,
+            self.forecast_variance_data,
+            self.sqrt_pi,
+            predictor,
+        )
+
+        plugin = Plugin()
+        result = plugin.calculate_truncated_normal_crps_gradient(initial_guess, *args)
+        expected = approx_fprime(
+            initial_guess, plugin.calculate_truncated_normal_crps, 1e-6, *args
+        )
+
+        self.assertEqual(result.shape, initial_guess.shape)
+        self.assertArrayAlmostEqual(result, expected, decimal=4)
+
+    @ManageWarnings(
+        ignored_messages=[
+            "Collapsing a non-contiguous coordinate.",
+            "invalid value encountered in",
+        ],
+        warning_types=[UserWarning, RuntimeWarning],
+    )
+    def test_bad_value(self):
+        """Test that a zero gradient is returned where the CRPS would be
+        set to the BAD_VALUE."""
+        initial_guess = np.array([1e65, 1e65, 1e65, 1e65], dtype=np.float32)
+
+        plugin = Plugin()
+        result = plugin.calculate_truncated_normal_crps_gradient(
+            initial_guess,
+            self.forecast_predictor_data,
+            self.truth_data,
+            self.forecast_variance_data,
+            self.sqrt_pi,
+            "mean",
+        )
+
+        self.assertArrayEqual(result, np.zeros(4))
+
+
 class Test_process_truncated_normal_distribution(
     SetupTruncatedNormalInputs, EnsembleCalibrationAssertions
 ):
@@ -797,6 +1263,117 @@ class Test_process_truncated_normal_distribution(
         self.assertTrue(any(warning_msg_min in str(item) for item in warning_list))
         self.assertTrue(any(warning_msg_iter in str(item) for item in warning_list))
 
+    @ManageWarnings(
+        ignored_messages=[
+            "Collapsing a non-contiguous coordinate.",
+            "Minimisation did not result in convergence",
+            "The final iteration resulted in",
+            "invalid value encountered in",
+            "divide by zero encountered in",
+        ],
+        warning_types=[
+            UserWarning,
+            UserWarning,
+            UserWarning,
+            RuntimeWarning,
+            RuntimeWarning,
+        ],
+    )
+    def test_gradient_based_minimisation(self):
+        """
+        Test that the gradient-based minimisation methods reach a CRPS at
+        least as low as Nelder-Mead. The ensemble mean is the predictor.
+        """
+        predictor = "mean"
+        distribution = "truncnorm"
+        args = (
+            self.forecast_predictor_data,
+            self.truth_data,
+            self.forecast_variance_data,
+            self.sqrt_pi,
+            predictor,
+        )
+        nelder_mead_crps = self.plugin.calculate_truncated_normal_crps(
+            self.plugin.process(
+                self.initial_guess_for_mean,
+                self.forecast_predictor_mean,
+                self.truth,
+                self.forecast_variance,
+                predictor,
+                distribution,
+            ).astype(np.float64),
+            *args,
+        )
+        for method in ["BFGS", "L-BFGS-B"]:
+            with self.subTest(method=method):
+                plugin = Plugin(tolerance=self.tolerance, minimisation_method=method)
+                result = plugin.process(
+                    self.initial_guess_for_mean,
+                    self.forecast_predictor_mean,
+                    self.truth,
+                    self.forecast_variance,
+                    predictor,
+                    distribution,
+                )
+                self.assertEqual(result.dtype, np.float32)
+                crps = plugin.calculate_truncated_normal_crps(
+                    result.astype(np.float64), *args
+                )
+                self.assertLessEqual(crps, nelder_mead_crps + 1e-4)
+
+    @ManageWarnings(
+        ignored_messages=[
+            "Collapsing a non-contiguous coordinate.",
+            "Minimisation did not result in convergence",
+            "invalid value encountered in",
+            "divide by zero encountered in",
+        ],
+        warning_types=[UserWarning, UserWarning, RuntimeWarning, RuntimeWarning],
+    )
+    def test_point_by_point(self):
+        """
+        Test that coefficients are returned for each point, which improve
+        upon the coefficients for the whole domain. The ensemble mean is the
+        predictor.
+        """
+        predictor = "mean"
+        distribution = "truncnorm"
+        self.vary_between_days()
+        args = (
+            self.initial_guess_for_mean,
+            self.forecast_predictor_mean,
+            self.truth,
+            self.forecast_variance,
+            predictor,
+            distribution,
+        )
+        domain_coefficients = Plugin(
+            tolerance=self.tolerance, minimisation_method="BFGS"
+        ).process(*args)
+        plugin = Plugin(tolerance=self.tolerance, point_by_point=True)
+        result = plugin.process(*args)
+
+        self.assertEqual(result.dtype, np.float32)
+        self.assertEqual(result.shape, (4, 3, 3))
+        for y_index, x_index in np.ndindex(self.truth.shape[1:]):
+            point_args = (
+                self.forecast_predictor_mean.data[:, y_index, x_index].astype(
+                    np.float64
+                ),
+                self.truth.data[:, y_index, x_index].astype(np.float64),
+                self.forecast_variance.data[:, y_index, x_index].astype(np.float64),
+                self.sqrt_pi,
+                predictor,
+            )
+            self.assertLessEqual(
+                plugin.calculate_truncated_normal_crps(
+                    result[:, y_index, x_index].astype(np.float64), *point_args
+                ),
+                plugin.calculate_truncated_normal_crps(
+                    domain_coefficients.astype(np.float64), *point_args
+                ),
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -153,6 +153,14 @@ class Test__init__(SetupCubes):
         with self.assertRaisesRegex(ValueError, msg):
             Plugin(distribution, self.desired_units)
 
+    def test_invalid_minimisation_method(self):
+        """Test an error is raised for an invalid minimisation method"""
+        msg = "Minimisation method biscuits is not supported"
+        with self.assertRaisesRegex(ValueError, msg):
+            Plugin(
+                self.distribution, self.desired_units, minimisation_method="biscuits"
+            )
+
     @unittest.skipIf(STATSMODELS_FOUND is True, "statsmodels module is available.")
     @ManageWarnings(
         record=True, ignored_messages=IGNORED_MESSAGES, warning_types=WARNING_TYPES
@@ -234,7 +242,10 @@ class Test__repr__(IrisTest):
             "ContinuousRankedProbabilityScoreMinimisers'>; "
             "coeff_names: ['alpha', 'beta', 'gamma', 'delta']; "
             "tolerance: 0.01; "
-            "max_iterations: 1000>"
+            "max_iterations: 1000; "
+            "minimisation_method: Nelder-Mead; "
+            "point_by_point: False; "
+            "max_workers: 1>"
         )
         self.assertEqual(result, msg)
 
@@ -248,6 +259,9 @@ class Test__repr__(IrisTest):
                 predictor="realizations",
                 tolerance=10,
                 max_iterations=10,
+                minimisation_method="bfgs",
+                point_by_point=True,
+                max_workers=4,
             )
         )
         msg = (
@@ -259,7 +273,10 @@ class Test__repr__(IrisTest):
             "ContinuousRankedProbabilityScoreMinimisers'>; "
             "coeff_names: ['alpha', 'beta', 'gamma', 'delta']; "
             "tolerance: 10; "
-            "max_iterations: 10>"
+            "max_iterations: 10; "
+            "minimisation_method: BFGS; "
+            "point_by_point: True; "
+            "max_workers: 4>"
         )
         self.assertEqual(result, msg)
 
@@ -434,6 +451,72 @@ class Test_create_coefficients_cubelist(SetupExpectedCoefficients):
             self.historic_forecast_with_realizations.coord("realization").points,
         )
 
+    @ManageWarnings(ignored_messages=IGNORED_MESSAGES, warning_types=WARNING_TYPES)
+    def test_coefficients_from_mean_point_by_point(self):
+        """Test that the expected coefficient cubes are returned when the
+        coefficients are estimated point by point, with the spatial
+        coordinates of the historic forecasts."""
+        optimised_coeffs = np.tile(
+            np.reshape(self.optimised_coeffs, (-1, 1, 1)), (1, 3, 3)
+        )
+        plugin = Plugin(
+            distribution=self.distribution,
+            desired_units=self.desired_units,
+            predictor=self.predictor,
+            point_by_point=True,
+        )
+        result = plugin.create_coefficients_cubelist(
+            optimised_coeffs, self.historic_forecast
+        )
+        self.assertEqual(len(result), 4)
+        for cube, coeffs in zip(result, optimised_coeffs):
+            self.assertArrayEqual(cube.data, coeffs)
+            self.assertEqual(
+                cube.coord("forecast_reference_time").cell(0).point, self.expected_frt,
+            )
+            self.assertEqual(
+                cube.coord("forecast_period"), self.expected_fp,
+            )
+            for axis in ["x", "y"]:
+                self.assertEqual(
+                    cube.coord(axis=axis, dim_coords=True),
+                    self.historic_forecast.coord(axis=axis),
+                )
+            self.assertDictEqual(cube.attributes, self.attributes)
+
+        self.assertEqual([cube.name() for cube in result], self.expected_coeff_names)
+
+    @ManageWarnings(ignored_messages=IGNORED_MESSAGES, warning_types=WARNING_TYPES)
+    def test_coefficients_from_realizations_point_by_point(self):
+        """Test that the expected coefficient cubes are returned when the
+        coefficients are estimated point by point and the ensemble
+        realizations are used as the predictor. The beta coefficient cube
+        has a leading realization dimension."""
+        predictor = "realizations"
+        optimised_coeffs = np.tile(np.arange(6).reshape(-1, 1, 1), (1, 3, 3))
+
+        plugin = Plugin(
+            distribution=self.distribution,
+            desired_units=self.desired_units,
+            predictor=predictor,
+            point_by_point=True,
+        )
+        result = plugin.create_coefficients_cubelist(
+            optimised_coeffs, self.historic_forecast_with_realizations
+        )
+        self.assertEqual([cube.name() for cube in result], self.expected_coeff_names)
+        beta = result.extract("emos_coefficient_beta", strict=True)
+        self.assertEqual(beta.shape, (3, 3, 3))
+        self.assertArrayEqual(beta.data, optimised_coeffs[1:4])
+        self.assertEqual(beta.coord_dims("realization"), (0,))
+        self.assertArrayEqual(
+            beta.coord("realization").points,
+            self.historic_forecast_with_realizations.coord("realization").points,
+        )
+        for name in ["alpha", "gamma", "delta"]:
+            cube = result.extract("emos_coefficient_" + name, strict=True)
+            self.assertEqual(cube.shape, (3, 3))
+
     @ManageWarnings(ignored_messages=IGNORED_MESSAGES, warning_types=WARNING_TYPES)
     def test_too_few_coefficients(self):
         """Test that an exception is raised if the number of coefficients
@@ -861,6 +944,32 @@ class Test_process(
             [cube.name() for cube in result], self.expected_coeff_names
         )
 
+    @ManageWarnings(ignored_messages=IGNORED_MESSAGES, warning_types=WARNING_TYPES)
+    def test_coefficient_values_for_norm_distribution_point_by_point(self):
+        """Ensure that coefficients are returned for each point when
+        estimating the coefficients point by point. The original data is
+        surrounded by a halo that is masked out by the landsea_mask, so that
+        no coefficients are estimated for the halo."""
+        plugin = Plugin(self.distribution, point_by_point=True)
+        result = plugin.process(
+            self.historic_temperature_forecast_cube_halo,
+            self.temperature_truth_cube_halo,
+            landsea_mask=self.landsea_cube,
+        )
+
+        self.assertArrayEqual(
+            [cube.name() for cube in result], self.expected_coeff_names
+        )
+        halo = ~self.landsea_cube.data.astype(bool)
+        for cube in result:
+            self.assertEqual(cube.shape, (5, 5))
+            self.assertEqual(
+                cube.coord(axis="x"),
+                self.historic_temperature_forecast_cube_halo.coord(axis="x"),
+            )
+            self.assertTrue(np.all(np.isnan(cube.data[halo])))
+            self.assertTrue(np.all(np.isfinite(cube.data[~halo])))
+
     @ManageWarnings(ignored_messages=IGNORED_MESSAGES, warning_types=WARNING_TYPES)
     def test_coefficient_values_for_norm_distribution_mismatching_inputs(self):
         """Test that the values for the optimised coefficients match the
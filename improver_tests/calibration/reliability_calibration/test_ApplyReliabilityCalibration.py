@@ -126,10 +126,11 @@ class Test__extract_matching_reliability_table(Test_ReliabilityCalibrate):
 
     def test_matching_coords(self):
         """Test that no exception is raised in the case that the forecast
-        and reliability table cubes have equivalent threshold coordinates."""
+        threshold and reliability table cubes have equivalent threshold
+        coordinates."""
 
         result = self.plugin._extract_matching_reliability_table(
-            self.forecast[0], self.reliability_cube
+            self.threshold[0], self.reliability_cube
         )
         self.assertEqual(result.xml(), self.reliability_cube[0].xml())
 
@@ -139,7 +140,7 @@ class Test__extract_matching_reliability_table(Test_ReliabilityCalibrate):
         the reliability_table is provided as a cubelist"""
 
         result = self.plugin._extract_matching_reliability_table(
-            self.forecast[0], self.reliability_cubelist
+            self.threshold[0], self.reliability_cubelist
         )
         self.assertEqual(result.xml(), self.reliability_cubelist[0].xml())
 
@@ -150,7 +151,7 @@ class Test__extract_matching_reliability_table(Test_ReliabilityCalibrate):
         msg = "No reliability table found to match threshold"
         with self.assertRaisesRegex(ValueError, msg):
             self.plugin._extract_matching_reliability_table(
-                self.forecast[0], self.reliability_cubelist[1]
+                self.threshold[0], self.reliability_cubelist[1]
             )
 
 
@@ -276,6 +277,62 @@ class Test__calculate_reliability_probabilities(Test_ReliabilityCalibrate):
         self.assertIsNone(result[1])
 
 
+class Test__calculate_reliability_curves(Test_ReliabilityCalibrate):
+
+    """Test the _calculate_reliability_curves method."""
+
+    def test_values(self):
+        """Test that the curves for all thresholds are returned stacked and
+        that all thresholds can be calibrated."""
+
+        expected_probabilities = np.array(
+            [[0.0, 0.25, 0.5, 0.75, 1.0], [0.0, 0.25, 0.5, 0.75, 1.0]]
+        )
+        expected_frequencies = np.array(
+            [[0.0, 0.0, 0.25, 0.5, 0.75], [0.25, 0.5, 0.75, 1.0, 1.0]]
+        )
+
+        result = self.plugin._calculate_reliability_curves(self.reliability_cube)
+
+        assert_array_equal(result[0], expected_probabilities)
+        assert_array_equal(result[1], expected_frequencies)
+        assert_array_equal(result[2], [True, True])
+
+    def test_padding(self):
+        """Test that curves with fewer points are padded at the end to the
+        length of the longest curve."""
+
+        reliability_cubelist = iris.cube.CubeList(
+            [self.reliability_cubelist[0][..., 1:4], self.reliability_cubelist[1]]
+        )
+        expected_probabilities = np.array(
+            [[0.25, 0.5, 0.75, np.inf, np.inf], [0.0, 0.25, 0.5, 0.75, 1.0]]
+        )
+        expected_frequencies = np.array(
+            [[0.0, 0.25, 0.5, np.nan, np.nan], [0.25, 0.5, 0.75, 1.0, 1.0]]
+        )
+
+        result = self.plugin._calculate_reliability_curves(reliability_cubelist)
+
+        assert_array_equal(result[0], expected_probabilities)
+        assert_array_equal(result[1], expected_frequencies)
+        assert_array_equal(result[2], [True, True])
+
+    def test_uncalibrated_threshold(self):
+        """Test that a threshold with fewer than two bins in its reliability
+        table is flagged as not calibrated."""
+
+        reliability_cubelist = iris.cube.CubeList(
+            [self.reliability_cubelist[0][..., 0], self.reliability_cubelist[1]]
+        )
+
+        result = self.plugin._calculate_reliability_curves(reliability_cubelist)
+
+        self.assertTrue(np.isinf(result[0][0]).all())
+        assert_array_equal(result[0][1], [0.0, 0.25, 0.5, 0.75, 1.0])
+        assert_array_equal(result[2], [False, True])
+
+
 class Test__interpolate(unittest.TestCase):
 
     """Test the _interpolate method."""
@@ -351,6 +408,26 @@ class Test__interpolate(unittest.TestCase):
         self.assertEqual(result.shape, expected.shape)
         assert_allclose(result, expected)
 
+    def test_multiple_curves(self):
+        """Test that stacked curves, including padded curves, are each
+        applied to the matching leading slice of the forecast."""
+
+        reliability_probabilities = np.array(
+            [[0.0, 0.4, 0.8, np.inf], [0.0, 0.2, 0.6, 1.0]], dtype=np.float32
+        )
+        observation_frequencies = np.array(
+            [[0.2, 0.6, 1.0, np.nan], [0.0, 0.4, 0.6, 0.6]], dtype=np.float32
+        )
+        forecast = np.array([[0.2, 0.4, 0.9], [0.1, 0.4, 0.8]], dtype=np.float32)
+        expected = np.array([[0.4, 0.6, 1.0], [0.2, 0.5, 0.6]])
+
+        result = self.plugin._interpolate(
+            forecast, reliability_probabilities, observation_frequencies
+        )
+
+        self.assertEqual(result.dtype, np.float32)
+        assert_allclose(result, expected, rtol=1e-6)
+
 
 class Test_process(Test_ReliabilityCalibrate):
 
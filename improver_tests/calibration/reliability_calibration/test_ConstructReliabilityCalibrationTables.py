@@ -414,44 +414,59 @@ class Test__create_reliability_table_cube(Test_Setup):
         self.assertEqual(result.attributes, self.expected_attributes)
 
 
-class Test__populate_reliability_bins(Test_Setup):
+class Test__accumulate_reliability_bins(Test_Setup):
 
-    """Test the _populate_reliability_bins method."""
+    """Test the _accumulate_reliability_bins method."""
 
-    def test_table_values(self):
-        """Test the reliability table returned has the expected values for the
-        given inputs."""
-
-        forecast_slice = next(self.forecast_1.slices_over("air_temperature"))
-        truth_slice = next(self.truth_1.slices_over("air_temperature"))
-        result = Plugin(
+    def setUp(self):
+        """Set up an empty table and the plugin."""
+        super().setUp()
+        self.plugin = Plugin(
             single_value_lower_limit=True, single_value_upper_limit=True
-        )._populate_reliability_bins(forecast_slice.data, truth_slice.data)
-
-        self.assertSequenceEqual(result.shape, self.expected_table_shape)
-        assert_array_equal(result, self.expected_table)
-
-
-class Test__populate_masked_reliability_bins(Test_Setup):
+        )
+        self.table = np.zeros(self.expected_table_shape, dtype=np.float32)
+        self.forecast_slice = next(self.forecast_1.slices_over("air_temperature"))
 
-    """Test the _populate_masked_reliability_bins method."""
+    def test_table_values(self):
+        """Test the reliability table has the expected values for the given
+        inputs."""
+        truth_slice = next(self.truth_1.slices_over("air_temperature"))
+        result = self.plugin._accumulate_reliability_bins(
+            self.table, self.forecast_slice.data, truth_slice.data
+        )
+        assert_array_equal(self.table, self.expected_table)
+        assert_array_equal(result, np.ones((3, 3), dtype=bool))
 
     def test_table_values_masked_truth(self):
-        """Test the reliability table returned has the expected values when a
-        masked truth is input."""
-
-        forecast_slice = next(self.forecast_1.slices_over("air_temperature"))
+        """Test the reliability table has the expected values when a masked
+        truth is input, and that the masked points are identified."""
         truth_slice = next(self.masked_truth_1.slices_over("air_temperature"))
-        result = Plugin(
-            single_value_lower_limit=True, single_value_upper_limit=True
-        )._populate_masked_reliability_bins(forecast_slice.data, truth_slice.data)
+        result = self.plugin._accumulate_reliability_bins(
+            self.table, self.forecast_slice.data, truth_slice.data
+        )
+        assert_array_equal(self.table, self.expected_table_for_mask)
+        expected = np.ones((3, 3), dtype=bool)
+        expected[0, :2] = False
+        assert_array_equal(result, expected)
 
-        self.assertSequenceEqual(result.shape, self.expected_table_shape)
-        self.assertTrue(np.ma.is_masked(result))
-        assert_array_equal(result.data, self.expected_table_for_mask)
-        expected_mask = np.zeros(self.expected_table_for_mask.shape, dtype=bool)
-        expected_mask[:, :, 0, :2] = True
-        assert_array_equal(result.mask, expected_mask)
+    def test_accumulation(self):
+        """Test that contributions are added to the existing table values."""
+        truth_slice = next(self.truth_1.slices_over("air_temperature"))
+        for _ in range(2):
+            self.plugin._accumulate_reliability_bins(
+                self.table, self.forecast_slice.data, truth_slice.data
+            )
+        assert_array_equal(self.table, 2 * self.expected_table)
+
+    def test_values_outside_bins(self):
+        """Test that forecast values outside all of the probability bins are
+        not counted."""
+        truth_slice = next(self.truth_1.slices_over("air_temperature"))
+        forecast = self.forecast_slice.data.copy()
+        forecast[0, :] = [-0.1, 1.1, np.nan]
+        self.plugin._accumulate_reliability_bins(self.table, forecast, truth_slice.data)
+        self.expected_table[..., 0, :] = 0
+        assert_array_equal(self.table, self.expected_table)
 
 
 class Test_process(Test_Setup):
@@ -541,5 +556,68 @@ class Test_process(Test_Setup):
             Plugin().process(self.forecasts, self.truths)
 
 
+class Test_process_iterable(Test_Setup):
+
+    """Test the process_iterable method."""
+
+    def test_matches_process(self):
+        """Test that the tables constructed from the forecasts and truths of
+        each day in turn match those constructed from all the days at once."""
+        plugin = Plugin(single_value_lower_limit=True, single_value_upper_limit=True)
+        expected = plugin.process(self.forecasts, self.truths)
+        result = plugin.process_iterable(
+            iter([(self.forecast_1, self.truth_1), (self.forecast_2, self.truth_2)])
+        )
+        self.assertEqual(result, expected)
+        assert_array_equal(result.data, expected.data)
+
+    def test_masked_truth(self):
+        """Test that points are unmasked in the tables if they are unmasked in
+        the truth of any of the parts."""
+        plugin = Plugin(single_value_lower_limit=True, single_value_upper_limit=True)
+        expected = plugin.process(self.forecasts, self.masked_truths)
+        result = plugin.process_iterable(
+            [
+                (self.forecast_1, self.masked_truth_1),
+                (self.forecast_2, self.masked_truth_2),
+            ]
+        )
+        self.assertIsInstance(result.data, np.ma.MaskedArray)
+        assert_array_equal(result.data.data, expected.data.data)
+        assert_array_equal(result.data.mask, expected.data.mask)
+
+    def test_mismatching_parts(self):
+        """Test that an exception is raised if the parts have differing
+        threshold coordinates."""
+        msg = "Threshold coordinates differ between historic forecasts."
+        with self.assertRaisesRegex(ValueError, msg):
+            Plugin().process_iterable(
+                [
+                    (self.forecast_1, self.truth_1),
+                    (self.forecast_2[:1], self.truth_2[:1]),
+                ]
+            )
+
+    def test_mismatching_grids(self):
+        """Test that an exception is raised if the parts are on differing
+        grids of the same shape."""
+        forecast_2, truth_2 = self.forecast_2.copy(), self.truth_2.copy()
+        for cube in (forecast_2, truth_2):
+            x_coord = cube.coord(axis="x")
+            cube.replace_coord(x_coord.copy(points=x_coord.points + 1))
+        msg = "Spatial coordinates differ between historic forecasts."
+        with self.assertRaisesRegex(ValueError, msg):
+            Plugin().process_iterable(
+                [(self.forecast_1, self.truth_1), (forecast_2, truth_2)]
+            )
+
+    def test_no_parts(self):
+        """Test that an exception is raised if no forecasts and truths are
+        provided."""
+        msg = "No historic forecasts and truths were provided."
+        with self.assertRaisesRegex(ValueError, msg):
+            Plugin().process_iterable(iter([]))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -36,7 +36,7 @@ from datetime import datetime
 import iris
 import numpy as np
 
-from improver.calibration import split_forecasts_and_truth
+from improver.calibration import pair_forecasts_and_truth, split_forecasts_and_truth
 from improver.synthetic_data.set_up_test_cubes import (
     set_up_probability_cube,
     set_up_variable_cube,
@@ -228,5 +228,56 @@ class Test_split_forecasts_and_truth(unittest.TestCase):
             )
 
 
+class Test_pair_forecasts_and_truth(unittest.TestCase):
+
+    """Test the pair_forecasts_and_truth method."""
+
+    def setUp(self):
+        """Create the cubes used for testing the split_forecasts_and_truth
+        method."""
+        Test_split_forecasts_and_truth.setUp(self)
+
+    def test_probability_data(self):
+        """Test that each probability forecast cube is paired with the truth
+        at its validity time."""
+        pairs = pair_forecasts_and_truth(
+            self.probability_forecasts[::-1] + self.probability_truths,
+            self.truth_attribute,
+        )
+        self.assertNotIsInstance(pairs, list)
+        pairs = list(pairs)
+        self.assertEqual(len(pairs), 2)
+        for (forecast, truth), expected_forecast, expected_truth in zip(
+            pairs, self.probability_forecasts[::-1], self.probability_truths[::-1]
+        ):
+            self.assertEqual(forecast, expected_forecast)
+            self.assertEqual(truth, expected_truth)
+
+    def test_unmatched_forecast(self):
+        """Test that a forecast without a truth at its validity time is
+        skipped."""
+        pairs = list(
+            pair_forecasts_and_truth(
+                self.realization_forecasts + self.realization_truths[:1],
+                self.truth_attribute,
+            )
+        )
+        self.assertEqual(len(pairs), 1)
+        self.assertEqual(pairs[0][0], self.realization_forecasts[0])
+        self.assertEqual(pairs[0][1], self.realization_truths[0])
+
+    def test_exception_for_no_matches(self):
+        """Test that an exception is raised if no forecast matches the
+        validity time of a truth."""
+        msg = "The filtering has found no matches in validity time"
+        with self.assertRaisesRegex(ValueError, msg):
+            list(
+                pair_forecasts_and_truth(
+                    self.realization_forecasts[1:] + self.realization_truths[:1],
+                    self.truth_attribute,
+                )
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
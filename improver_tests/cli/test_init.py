@@ -382,6 +382,26 @@ def test_import_cli():
     subprocess.run([sys.executable, "-c", script], check=True)  # nosec
 
 
+def test_subcommand_imports_one_cli():
+    """Test running a subcommand imports only that CLI module, and that
+    help for all commands imports all of them."""
+    import subprocess  # nosec
+    import sys
+
+    script = (
+        "import improver.cli, sys; "
+        "improver.cli.main('improver', 'help', 'wet-bulb-temperature'); "
+        "clis = [m for m in sys.modules if m.startswith('improver.cli.')]; "
+        "assert clis == ['improver.cli.wet_bulb_temperature'], clis; "
+        "improver.cli.main('improver', 'help'); "
+        "clis = [m for m in sys.modules if m.startswith('improver.cli.')]; "
+        "assert len(clis) == len(improver.cli.subcommands_table()) - 1, clis"
+    )
+    subprocess.run(  # nosec
+        [sys.executable, "-c", script], check=True, stdout=subprocess.DEVNULL
+    )
+
+
 def test_help_no_stderr():
     """Test if help writes to sys.stderr."""
     import contextlib
@@ -119,5 +119,89 @@ class Test__rescale_shape_parameters(IrisTest):
         self.assertArrayEqual(plugin.shape_parameters, shape_parameters)
 
 
+class Test__evaluate_distribution(IrisTest):
+
+    """Test the _evaluate_distribution method"""
+
+    def setUp(self):
+        """Set up location and scale parameters, including a zero scale
+        parameter, and probabilities and thresholds for testing."""
+        self.location_parameter = np.array([-30.0, -1.0, 0.0, 1.0, 2.0, 5.0])
+        self.scale_parameter = np.array([0.5, 1.0, 1.5, 2.0, 0.0, 3.0])
+        self.probabilities = np.array([0.0, 0.1, 0.5, 0.9, 1.0])
+        self.thresholds = np.array([-2.0, 0.0, 0.5, 4.0])
+
+    def expected(self, plugin, method, values):
+        """Evaluate the method of the distribution using scipy.stats."""
+        distribution = plugin.distribution(
+            *plugin.shape_parameters,
+            loc=self.location_parameter,
+            scale=self.scale_parameter,
+        )
+        return getattr(distribution, method)(values[:, np.newaxis])
+
+    def test_norm(self):
+        """Test that the normal distribution matches scipy.stats for each
+        method, evaluating the points in several chunks."""
+        plugin = Plugin(distribution="norm")
+        plugin.CHUNK_SIZE = 4
+        for method, values in [
+            ("ppf", self.probabilities),
+            ("cdf", self.thresholds),
+            ("sf", self.thresholds),
+        ]:
+            result = plugin._evaluate_distribution(
+                method, values, self.location_parameter, self.scale_parameter
+            )
+            self.assertEqual(result.shape, (len(values), 6))
+            self.assertArrayEqual(result, self.expected(plugin, method, values))
+
+    def test_truncnorm(self):
+        """Test that the truncated normal distribution matches scipy.stats
+        for each method, including a truncation far into the tail."""
+        plugin = Plugin(distribution="truncnorm", shape_parameters=[0, np.inf])
+        plugin._rescale_shape_parameters(self.location_parameter, self.scale_parameter)
+        for method, values in [
+            ("ppf", self.probabilities),
+            ("cdf", self.thresholds),
+            ("sf", self.thresholds),
+        ]:
+            result = plugin._evaluate_distribution(
+                method, values, self.location_parameter, self.scale_parameter
+            )
+            self.assertArrayAlmostEqual(result, self.expected(plugin, method, values))
+
+    def test_bounded_truncnorm(self):
+        """Test a truncated normal distribution with finite bounds."""
+        plugin = Plugin(distribution="truncnorm", shape_parameters=[-1.0, 3.0])
+        plugin._rescale_shape_parameters(self.location_parameter, self.scale_parameter)
+        for method, values in [
+            ("ppf", self.probabilities),
+            ("cdf", self.thresholds),
+            ("sf", self.thresholds),
+        ]:
+            result = plugin._evaluate_distribution(
+                method, values, self.location_parameter, self.scale_parameter
+            )
+            self.assertArrayAlmostEqual(result, self.expected(plugin, method, values))
+
+    def test_invalid_probabilities(self):
+        """Test that probabilities outside the range 0 to 1 give NaN."""
+        plugin = Plugin(distribution="truncnorm", shape_parameters=[0, np.inf])
+        plugin._rescale_shape_parameters(self.location_parameter, self.scale_parameter)
+        result = plugin._evaluate_distribution(
+            "ppf", np.array([-0.1, 1.1]), self.location_parameter, self.scale_parameter,
+        )
+        self.assertTrue(np.isnan(result).all())
+
+    def test_alternative_distribution(self):
+        """Test a distribution evaluated using scipy.stats."""
+        plugin = Plugin(distribution="gamma", shape_parameters=[2.0])
+        result = plugin._evaluate_distribution(
+            "cdf", self.thresholds, self.location_parameter, self.scale_parameter
+        )
+        self.assertArrayEqual(result, self.expected(plugin, "cdf", self.thresholds))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -234,6 +234,84 @@ def test__calculate_tz_offsets():
     assert_array_equal(result, expected)
 
 
+def test__calculate_offset_memoised():
+    """Test that the offsets are memoised by timezone name, and that the
+    memoised offsets are discarded when the time is set."""
+
+    coordinate_pairs = np.array([[41, -74], [51.5, 0], [-37.9, 145], [40.7, -74]])
+    time = datetime(2020, 1, 1, 12, tzinfo=pytz.utc)
+    plugin = GenerateTimezoneMask(time=time)
+    plugin._calculate_tz_offsets(coordinate_pairs)
+    assert plugin._zone_offsets == {
+        "America/New_York": -5 * 3600,
+        "Europe/London": 0,
+        "Australia/Melbourne": 10 * 3600,
+    }
+
+    plugin.time = "20200701T1200Z"
+    plugin._set_time(None)
+    assert plugin._zone_offsets == {}
+
+
+class StraightBoundaryTimezoneFinder:
+    """Stand in for TimezoneFinder, with straight timezone boundaries and an
+    area of sea, which counts the number of points queried."""
+
+    def __init__(self):
+        self.queries = 0
+
+    def certain_timezone_at(self, lng=None, lat=None):
+        """Return the timezone name, or None over the sea."""
+        self.queries += 1
+        if lng < 3.3:
+            return "Europe/London"
+        if lat > 1:
+            return "Europe/Paris"
+        return None
+
+
+@pytest.mark.parametrize("coarse_step", [1, 2, 3, 8, 64])
+def test__calculate_grid_offsets(coarse_step):
+    """Test that the offsets found working from a coarse grid match those found
+    at every point when the timezones are larger than the coarse grid cells,
+    while fewer points are queried."""
+
+    latitudes, longitudes = np.meshgrid(
+        np.linspace(-5, 5, 23), np.linspace(-5, 5, 31), indexing="ij"
+    )
+    coordinate_pairs = np.stack([latitudes, longitudes], axis=-1)
+    time = datetime(2020, 1, 1, 12, tzinfo=pytz.utc)
+    plugin = GenerateTimezoneMask(time=time)
+    plugin.tf = StraightBoundaryTimezoneFinder()
+    expected = plugin._calculate_tz_offsets(coordinate_pairs.reshape(-1, 2))
+
+    plugin = GenerateTimezoneMask(time=time, coarse_step=coarse_step)
+    plugin.tf = StraightBoundaryTimezoneFinder()
+    result = plugin._calculate_grid_offsets(coordinate_pairs)
+
+    assert_array_equal(result, expected)
+    assert result.dtype == np.int32
+    if coarse_step == 1:
+        assert plugin.tf.queries == result.size
+    else:
+        assert plugin.tf.queries < result.size
+
+
+def test__query_tz_offsets_max_workers():
+    """Test that the offsets calculated by several worker processes match
+    those calculated in this process."""
+
+    coordinate_pairs = np.array(
+        [[41, -74], [51.5, 0], [-37.9, 145], [35.7, 139.7], [0, -30]]
+    )
+    time = datetime(2020, 1, 1, 12, tzinfo=pytz.utc)
+    expected = GenerateTimezoneMask(time=time)._query_tz_offsets(coordinate_pairs)
+    result = GenerateTimezoneMask(time=time, max_workers=2)._query_tz_offsets(
+        coordinate_pairs
+    )
+    assert_array_equal(result, expected)
+
+
 @pytest.mark.parametrize("grid_fixture", ["global_grid", "uk_grid"])
 @pytest.mark.parametrize("include_dst", [False, True])
 def test__create_template_cube(request, grid_fixture, include_dst):
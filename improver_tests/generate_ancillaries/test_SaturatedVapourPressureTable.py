@@ -32,7 +32,11 @@
 Unit tests for the SaturatedVapourPressureTable utility.
 
 """
+import os
+import shutil
 import unittest
+from tempfile import mkdtemp
+from unittest.mock import patch
 
 import numpy as np
 from cf_units import Unit
@@ -40,6 +44,7 @@ from iris.tests import IrisTest
 
 from improver.generate_ancillaries.generate_svp_table import (
     SaturatedVapourPressureTable,
+    svp_table,
 )
 
 
@@ -70,6 +75,17 @@ class Test_saturation_vapour_pressure_goff_gratch(IrisTest):
         expected = 0.01 * np.array([[195.6419, 469.67078, 990.9421]])
         self.assertArrayAlmostEqual(result, expected)
 
+    def test_triple_point(self):
+        """Test that values either side of the triple point are calculated
+        over ice and water respectively, and that the type of the input is
+        preserved."""
+        data = np.array([273.15, 273.16, 273.17])
+        plugin = SaturatedVapourPressureTable()
+        result = plugin.saturation_vapour_pressure_goff_gratch(data)
+        expected = np.array([6.1063594, 6.11139, 6.1158319])
+        self.assertEqual(result.dtype, np.float64)
+        self.assertArrayAlmostEqual(result, expected)
+
 
 class Test_process(IrisTest):
 
@@ -125,5 +141,75 @@ class Test_process(IrisTest):
         self.assertArrayAlmostEqual(result.coord("air_temperature").points, expected)
 
 
+class Test_svp_table(IrisTest):
+
+    """Test the function that gets the data of an SVP table, optionally from
+    an on-disk cache."""
+
+    def setUp(self):
+        """Set up a temporary cache directory."""
+        self.directory = mkdtemp()
+        self.cache_dir = os.path.join(self.directory, "cache")
+        self.args = (200.15, 220.15, 10.0)
+        self.expected = SaturatedVapourPressureTable(*self.args).process().data
+
+    def tearDown(self):
+        """Remove the temporary cache directory."""
+        shutil.rmtree(self.directory)
+
+    def test_no_cache(self):
+        """Test that the table is created and nothing is cached when no cache
+        directory is given."""
+        result = svp_table(*self.args)
+        self.assertArrayEqual(result, self.expected)
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_cache_written(self):
+        """Test that the table is written to the cache directory, which is
+        created, and that no temporary files are left behind."""
+        result = svp_table(*self.args, cache_dir=self.cache_dir)
+        self.assertArrayEqual(result, self.expected)
+        self.assertEqual(
+            os.listdir(self.cache_dir), ["svp_table_200.15_220.15_10.0.npy"]
+        )
+
+    def test_cache_reused(self):
+        """Test that a cached table is memory-mapped rather than created
+        again."""
+        svp_table(*self.args, cache_dir=self.cache_dir)
+        with patch.object(SaturatedVapourPressureTable, "process") as mock_process:
+            result = svp_table(*self.args, cache_dir=self.cache_dir)
+        mock_process.assert_not_called()
+        self.assertArrayEqual(result, self.expected)
+        self.assertIsInstance(result.base, np.memmap)
+
+    def test_cache_keyed(self):
+        """Test that tables for different temperatures are cached separately."""
+        svp_table(*self.args, cache_dir=self.cache_dir)
+        result = svp_table(200.15, 230.15, 10.0, cache_dir=self.cache_dir)
+        self.assertEqual(result.shape, (4,))
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_corrupt_cache(self):
+        """Test that a corrupt cache file is replaced."""
+        os.makedirs(self.cache_dir)
+        path = os.path.join(self.cache_dir, "svp_table_200.15_220.15_10.0.npy")
+        with open(path, "wb") as cache_file:
+            cache_file.write(b"corrupt")
+        result = svp_table(*self.args, cache_dir=self.cache_dir)
+        self.assertArrayEqual(result, self.expected)
+        self.assertArrayEqual(np.load(path), self.expected)
+
+    def test_pickled_cache(self):
+        """Test that a cache file containing pickled objects is not loaded,
+        and is replaced."""
+        os.makedirs(self.cache_dir)
+        path = os.path.join(self.cache_dir, "svp_table_200.15_220.15_10.0.npy")
+        np.save(path, np.array([{"pickled": True}], dtype=object), allow_pickle=True)
+        result = svp_table(*self.args, cache_dir=self.cache_dir)
+        self.assertArrayEqual(result, self.expected)
+        self.assertArrayEqual(np.load(path, allow_pickle=False), self.expected)
+
+
 if __name__ == "__main__":
     unittest.main()
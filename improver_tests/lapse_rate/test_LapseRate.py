@@ -31,6 +31,7 @@
 """Unit tests for the LapseRate plugin."""
 
 import unittest
+from unittest.mock import patch
 
 import cf_units
 import numpy as np
@@ -118,6 +119,53 @@ class Test__calc_lapse_rate(IrisTest):
         )
         self.assertArrayAlmostEqual(result, expected_out)
 
+    def test_no_height_difference_screen(self):
+        """Test that the box sum calculation used when max_height_diff is None
+        matches the calculation with a height difference screen that excludes
+        no points."""
+        self.orography[..., 0, 0] = 205.0
+        self.temperature[..., 2, 2] = np.nan
+        expected_out = LapseRate(
+            max_height_diff=1000, nbhood_radius=1
+        )._generate_lapse_rate_array(
+            self.temperature, self.orography, self.land_sea_mask
+        )
+        result = LapseRate(
+            max_height_diff=None, nbhood_radius=1
+        )._generate_lapse_rate_array(
+            self.temperature, self.orography, self.land_sea_mask
+        )
+        self.assertArrayAlmostEqual(result, expected_out)
+
+    def test_leading_dimension(self):
+        """Test that each slice of an array with a leading dimension gives the
+        same lapse rates as when it is processed alone."""
+        temperature = np.stack([self.temperature, self.temperature[::-1]])
+        plugin = LapseRate(nbhood_radius=1)
+        result = plugin._generate_lapse_rate_array(
+            temperature, self.orography, self.land_sea_mask
+        )
+        self.assertEqual(result.shape, temperature.shape)
+        for index, temperature_slice in enumerate(temperature):
+            expected_out = plugin._generate_lapse_rate_array(
+                temperature_slice, self.orography, self.land_sea_mask
+            )
+            self.assertArrayAlmostEqual(result[index], expected_out)
+
+    def test_row_blocks(self):
+        """Test that accumulating the screened sums for a single row at a time
+        gives the same lapse rates as for the whole grid together."""
+        self.orography[..., 0, 0] = 205.0
+        plugin = LapseRate(nbhood_radius=1)
+        expected_out = plugin._generate_lapse_rate_array(
+            self.temperature, self.orography, self.land_sea_mask
+        )
+        with patch.object(LapseRate, "CHUNK_SIZE", 1):
+            result = plugin._generate_lapse_rate_array(
+                self.temperature, self.orography, self.land_sea_mask
+            )
+        self.assertArrayEqual(result, expected_out)
+
 
 class Test_process(IrisTest):
     """Test the LapseRate processing works"""
@@ -310,6 +358,20 @@ class Test_process(IrisTest):
         )
         self.assertArrayAlmostEqual(result.data, expected_out, decimal=4)
 
+    def test_constant_orog_no_height_difference_screen(self):
+        """Test that DALR values are returned where the orography is constant
+        when the box sum calculation is used."""
+        expected_out = np.full((1, 5, 5), DALR)
+
+        self.temperature.data[:, :, :] = 0.08
+        self.temperature.data[:, 1, 1] = 0.09
+        self.orography.data[:, :] = 10
+
+        result = LapseRate(max_height_diff=None, nbhood_radius=1).process(
+            self.temperature, self.orography, self.land_sea_mask
+        )
+        self.assertArrayAlmostEqual(result.data, expected_out, decimal=4)
+
     def test_fails_if_max_less_min_lapse_rate(self):
         """Test code raises a Value Error if input maximum lapse rate is
         less than input minimum lapse rate"""
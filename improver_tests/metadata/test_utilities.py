@@ -41,6 +41,7 @@ from improver.metadata.utilities import (
     create_new_diagnostic_cube,
     generate_hash,
     generate_mandatory_attributes,
+    hash_array,
 )
 from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
 
@@ -307,6 +308,30 @@ class Test_generate_hash(unittest.TestCase):
         self.assertEqual(result1, result2)
 
 
+class Test_hash_array(unittest.TestCase):
+
+    """Test the hash_array function."""
+
+    def test_same_values(self):
+        """Test that equal arrays give the same hash."""
+        self.assertEqual(hash_array(np.arange(4.0)), hash_array(np.arange(4.0)))
+
+    def test_different_values(self):
+        """Test that a change to any value of a large array changes the
+        hash."""
+        data = np.zeros((1000, 1000))
+        original = hash_array(data)
+        data[500, 500] = 1
+        self.assertNotEqual(hash_array(data), original)
+
+    def test_different_mask(self):
+        """Test that masking a value changes the hash."""
+        data = np.ma.masked_array(np.arange(4.0), mask=[0, 0, 0, 0])
+        original = hash_array(data)
+        data.mask[1] = True
+        self.assertNotEqual(hash_array(data), original)
+
+
 class Test_create_coordinate_hash(unittest.TestCase):
     """Test wrapper to hash generation to return a hash based on the x and y
     coordinates of a given cube."""
@@ -369,6 +369,21 @@ class Test__recurse_forward(Test_RecursiveFilter):
         self.assertIsInstance(result, np.ndarray)
         self.assertArrayAlmostEqual(result, expected_result)
 
+    def test_leading_dimension(self):
+        """Test that each slice of an array with a leading dimension is
+        filtered independently and gives the same result as filtering the
+        slices one at a time."""
+        coefficients = self.smoothing_coefficients_alternative[1].data
+        grid = np.stack([self.cube.data[0], 2 * self.cube.data[0]])
+        expected_result = np.stack(
+            [
+                RecursiveFilter._recurse_forward(grid_slice.copy(), coefficients, 0)
+                for grid_slice in grid
+            ]
+        )
+        result = RecursiveFilter._recurse_forward(grid, coefficients, 1)
+        self.assertArrayEqual(result, expected_result)
+
 
 class Test__recurse_backward(Test_RecursiveFilter):
 
@@ -410,6 +425,21 @@ class Test__recurse_backward(Test_RecursiveFilter):
         self.assertIsInstance(result, np.ndarray)
         self.assertArrayAlmostEqual(result, expected_result)
 
+    def test_leading_dimension(self):
+        """Test that each slice of an array with a leading dimension is
+        filtered independently and gives the same result as filtering the
+        slices one at a time."""
+        coefficients = self.smoothing_coefficients_alternative[0].data
+        grid = np.stack([self.cube.data[0], 2 * self.cube.data[0]])
+        expected_result = np.stack(
+            [
+                RecursiveFilter._recurse_backward(grid_slice.copy(), coefficients, 1)
+                for grid_slice in grid
+            ]
+        )
+        result = RecursiveFilter._recurse_backward(grid, coefficients, -1)
+        self.assertArrayEqual(result, expected_result)
+
 
 class Test__run_recursion(Test_RecursiveFilter):
 
@@ -539,6 +569,24 @@ class Test_process(Test_RecursiveFilter):
         )
         self.assertArrayAlmostEqual(result.data[0], expected_result)
 
+    def test_multiple_realizations(self):
+        """Test that all realizations are filtered together and match the
+        result of filtering each realization separately."""
+        cube = add_coordinate(self.cube[0], [0, 1, 2], "realization")
+        cube.data[1] *= 0.5
+        cube.data[2] = cube.data[2].T
+        plugin = RecursiveFilter(iterations=2)
+        result = plugin(cube, smoothing_coefficients=self.smoothing_coefficients)
+        self.assertEqual(result.shape, cube.shape)
+        for result_slice, input_slice in zip(
+            result.slices_over("realization"), cube.slices_over("realization")
+        ):
+            expected = plugin(
+                iris.util.new_axis(input_slice, "realization"),
+                smoothing_coefficients=self.smoothing_coefficients,
+            )
+            self.assertArrayEqual(result_slice.data, expected.data[0])
+
     def test_error_multiple_times_masked(self):
         """Test that the plugin raises an error when given a masked cube with
         multiple time points"""
@@ -108,54 +108,6 @@ class Test__repr__(IrisTest):
         self.assertEqual(result, expected_result)
 
 
-class Test__increment_output_array(IrisTest):
-    """Tests for the _increment_output_array method"""
-
-    def setUp(self):
-        """Create input arrays"""
-        vel_x = set_up_xy_velocity_cube("advection_velocity_x")
-        vel_y = vel_x.copy(data=2.0 * np.ones(shape=(4, 3)))
-        self.dummy_plugin = AdvectField(vel_x, vel_y)
-
-        self.data = np.array(
-            [[2.0, 3.0, 4.0], [1.0, 2.0, 3.0], [0.0, 1.0, 2.0], [0.0, 0.0, 1.0]]
-        )
-        (self.xgrid, self.ygrid) = np.meshgrid(np.arange(3), np.arange(4))
-
-    def test_basic(self):
-        """Test one increment from the points negative x-wards and positive
-        y-wards on the source grid, with different directional weightings"""
-        xsrc = np.array([[-1, 0, 1], [-1, 0, 1], [-1, 0, 1], [-1, 0, 1]])
-        ysrc = np.array([[1, 1, 1], [2, 2, 2], [3, 3, 3], [4, 4, 4]])
-        cond = np.array(
-            [
-                [False, True, True],
-                [False, True, True],
-                [False, True, True],
-                [False, False, False],
-            ]
-        )
-        xfrac = np.full((4, 3), 0.5)
-        yfrac = np.full((4, 3), 0.75)
-        outdata = np.zeros(shape=(4, 3))
-
-        expected_output = np.array(
-            [
-                [0.0, 0.375, 0.750],
-                [0.0, 0.000, 0.375],
-                [0.0, 0.000, 0.000],
-                [0.0, 0.000, 0.000],
-            ]
-        )
-
-        self.dummy_plugin._increment_output_array(
-            self.data, outdata, cond, self.xgrid, self.ygrid, xsrc, ysrc, xfrac, yfrac
-        )
-
-        self.assertIsInstance(outdata, np.ndarray)
-        self.assertArrayAlmostEqual(outdata, expected_output)
-
-
 class Test__advect_field(IrisTest):
     """Tests for the _advect_field method"""
 
@@ -255,6 +207,62 @@ class Test__advect_field(IrisTest):
         self.assertArrayEqual(result.mask, expected_mask)
 
 
+class Test__advect_fields(IrisTest):
+    """Tests for the _advect_fields method"""
+
+    def setUp(self):
+        """Set up dimensionless velocity arrays and gridded data"""
+        vel_x = set_up_xy_velocity_cube("advection_velocity_x")
+        vel_y = vel_x.copy(data=2.0 * np.ones(shape=(4, 3)))
+        self.dummy_plugin = AdvectField(vel_x, vel_y)
+
+        self.grid_vel_x = 0.5 * vel_x.data
+        self.grid_vel_y = 0.25 * vel_y.data
+        self.data = np.ma.MaskedArray(
+            [[2.0, 3.0, 4.0], [1.0, 2.0, 3.0], [0.0, 1.0, 2.0], [0.0, 0.0, 1.0]],
+            mask=[
+                [False, False, True],
+                [False, False, False],
+                [False, False, False],
+                [False, False, False],
+            ],
+        )
+        self.timesteps = [0, 1, 2.5, 4]
+
+    def test_basic(self):
+        """Test one masked array is returned for each time step"""
+        result = self.dummy_plugin._advect_fields(
+            self.data, self.grid_vel_x, self.grid_vel_y, self.timesteps
+        )
+        self.assertIsInstance(result, list)
+        self.assertEqual(len(result), len(self.timesteps))
+        for field in result:
+            self.assertIsInstance(field, np.ma.MaskedArray)
+            self.assertEqual(field.shape, self.data.shape)
+
+    def test_matches_single_time_step(self):
+        """Test the batched advection reproduces the advection for each
+        time step in turn, including zero time steps"""
+        result = self.dummy_plugin._advect_fields(
+            self.data, self.grid_vel_x, self.grid_vel_y, self.timesteps
+        )
+        for timestep, field in zip(self.timesteps, result):
+            expected = self.dummy_plugin._advect_field(
+                self.data, self.grid_vel_x, self.grid_vel_y, timestep
+            )
+            self.assertArrayEqual(field.mask, np.ma.getmaskarray(expected))
+            self.assertArrayEqual(field.filled(-1), expected.filled(-1))
+
+    def test_zero_time_steps(self):
+        """Test the input data are returned if no advection is required"""
+        result = self.dummy_plugin._advect_fields(
+            self.data, self.grid_vel_x, self.grid_vel_y, [0, 0]
+        )
+        self.assertEqual(len(result), 2)
+        for field in result:
+            self.assertIs(field, self.data)
+
+
 class Test_process(IrisTest):
     """Test dimensioned cube data is correctly advected"""
 
@@ -532,5 +540,61 @@ class Test_process(IrisTest):
         self.assertEqual(result.coord("forecast_reference_time").dtype, np.int64)
 
 
+class Test_process_lead_times(IrisTest):
+    """Test dimensioned cube data is correctly advected to several lead
+    times"""
+
+    def setUp(self):
+        """Set up plugin instance and a cube to advect"""
+        vel_x = set_up_xy_velocity_cube("advection_velocity_x")
+        vel_y = vel_x.copy(data=2.0 * np.ones(shape=(4, 3)))
+        vel_y.rename("advection_velocity_y")
+        self.plugin = AdvectField(vel_x, vel_y)
+        data = np.array(
+            [[2.0, 3.0, 4.0], [1.0, 2.0, 3.0], [0.0, 1.0, 2.0], [0.0, 0.0, 1.0]],
+            dtype=np.float32,
+        )
+        self.cube = iris.cube.Cube(
+            data,
+            standard_name="rainfall_rate",
+            units="mm h-1",
+            dim_coords_and_dims=[(self.plugin.y_coord, 0), (self.plugin.x_coord, 1)],
+        )
+        time_coord = DimCoord(
+            1519099200, standard_name="time", units="seconds since 1970-01-01 00:00:00"
+        )
+        self.cube.add_aux_coord(time_coord)
+        self.timesteps = [
+            datetime.timedelta(seconds=0),
+            datetime.timedelta(seconds=300),
+            datetime.timedelta(seconds=600),
+        ]
+
+    def test_basic(self):
+        """Test one cube is returned for each time step"""
+        result = self.plugin.process_lead_times(self.cube, self.timesteps)
+        self.assertIsInstance(result, iris.cube.CubeList)
+        self.assertEqual(len(result), len(self.timesteps))
+
+    def test_matches_process(self):
+        """Test each cube matches that from advecting to a single lead
+        time"""
+        result = self.plugin.process_lead_times(self.cube, self.timesteps)
+        for timestep, cube in zip(self.timesteps, result):
+            expected = self.plugin.process(self.cube, timestep)
+            self.assertEqual(cube.name(), expected.name())
+            self.assertEqual(cube.units, expected.units)
+            self.assertEqual(cube.coord("time"), expected.coord("time"))
+            self.assertEqual(
+                cube.coord("forecast_period"), expected.coord("forecast_period")
+            )
+            self.assertArrayEqual(
+                np.ma.getmaskarray(cube.data), np.ma.getmaskarray(expected.data)
+            )
+            self.assertArrayEqual(
+                np.ma.filled(cube.data, -1), np.ma.filled(expected.data, -1)
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -32,6 +32,7 @@
 
 import unittest
 
+import iris
 import numpy as np
 from iris.tests import IrisTest
 
@@ -266,5 +267,40 @@ class Test_extrapolate(SetUpCubes):
         )
 
 
+class Test_process(SetUpCubes):
+    """Test the process method."""
+
+    def setUp(self):
+        """Set up a plugin without orographic enhancement"""
+        super().setUp()
+        input_cube = self.precip_cube.copy()
+        input_cube.rename("air_temperature")
+        input_cube.units = "K"
+        self.plugin = CreateExtrapolationForecast(input_cube, self.vel_x, self.vel_y)
+
+    def test_basic(self):
+        """Test plugin returns one forecast cube for each lead time, with the
+        expected forecast periods"""
+        result = self.plugin.process(10, 30)
+        self.assertIsInstance(result, iris.cube.CubeList)
+        self.assertEqual(len(result), 4)
+        for cube, lead_time in zip(result, [0, 600, 1200, 1800]):
+            self.assertEqual(cube.coord("forecast_period").points[0], lead_time)
+
+    def test_matches_extrapolate(self):
+        """Test the forecasts match those extrapolated to each lead time in
+        turn"""
+        result = self.plugin.process(10, 20)
+        for cube, lead_time in zip(result, [0, 10, 20]):
+            expected = self.plugin.extrapolate(lead_time)
+            self.assertArrayEqual(
+                np.ma.getmaskarray(cube.data), np.ma.getmaskarray(expected.data)
+            )
+            self.assertArrayEqual(
+                np.ma.filled(cube.data, -1), np.ma.filled(expected.data, -1)
+            )
+            self.assertEqual(cube.coord("time"), expected.coord("time"))
+
+
 if __name__ == "__main__":
     unittest.main()
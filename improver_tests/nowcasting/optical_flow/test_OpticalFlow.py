@@ -260,6 +260,50 @@ class Test__make_subboxes(OpticalFlowUtilityTest):
         self.assertArrayAlmostEqual(weights, expected_weights)
 
 
+class Test__make_box_arrays(OpticalFlowUtilityTest):
+    """Test _make_box_arrays function"""
+
+    def test_values(self):
+        """Test function carves up array as expected, zero-padding the boxes
+        that extend beyond the edge of the field"""
+        expected_boxes = np.array(
+            [
+                [1.0, 2.0, 0.0, 1.0],
+                [3.0, 4.0, 2.0, 3.0],
+                [5.0, 0.0, 4.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0],
+                [1.0, 2.0, 0.0, 0.0],
+                [3.0, 0.0, 0.0, 0.0],
+            ]
+        )
+        self.plugin.boxsize = 2
+        boxes = self.plugin._make_box_arrays(self.plugin.data1)
+        self.assertIsInstance(boxes, np.ndarray)
+        self.assertArrayAlmostEqual(boxes, expected_boxes)
+
+    def test_matches_subboxes(self):
+        """Test the boxes contain the same values as those generated by
+        _make_subboxes"""
+        self.plugin.boxsize = 2
+        expected_boxes, _ = self.plugin._make_subboxes(self.plugin.data1)
+        boxes = self.plugin._make_box_arrays(self.plugin.data1)
+        for box, ebox in zip(boxes, expected_boxes):
+            self.assertArrayAlmostEqual(box[box != 0], ebox[ebox != 0])
+            self.assertAlmostEqual(box.sum(), ebox.sum())
+
+
+class Test__make_box_weights(OpticalFlowUtilityTest):
+    """Test _make_box_weights function"""
+
+    def test_values(self):
+        """Test output weights values match those from _make_subboxes"""
+        self.plugin.boxsize = 2
+        _, expected_weights = self.plugin._make_subboxes(self.plugin.data1)
+        weights = self.plugin._make_box_weights()
+        self.assertEqual(weights.dtype, np.float32)
+        self.assertArrayAlmostEqual(weights, expected_weights)
+
+
 class OpticalFlowDisplacementTest(IrisTest):
     """Class with shared plugin definition for smoothing and regridding
     tests"""
@@ -443,6 +487,47 @@ class Test_solve_for_uv(IrisTest):
         self.assertAlmostEqual(v, 2.0)
 
 
+class Test_solve_for_uv_batched(IrisTest):
+    """Test solve_for_uv_batched function"""
+
+    def setUp(self):
+        """Define input matrices with one row per box, the final box being
+        singular"""
+        random = np.random.RandomState(0)
+        self.deriv_x = random.normal(size=(4, 9)).astype(np.float32)
+        self.deriv_y = random.normal(size=(4, 9)).astype(np.float32)
+        self.deriv_t = random.normal(size=(4, 9)).astype(np.float32)
+        self.deriv_x[3] = 0.0
+        self.deriv_y[3] = 0.0
+
+    def test_values(self):
+        """Test output values match those from solving each box in turn,
+        including zero displacement for the singular box"""
+        expected = [
+            OpticalFlow().solve_for_uv(
+                np.array([deriv_x, deriv_y], dtype=np.float64).transpose(), deriv_t
+            )
+            for deriv_x, deriv_y, deriv_t in zip(
+                self.deriv_x, self.deriv_y, self.deriv_t
+            )
+        ]
+        u, v = OpticalFlow().solve_for_uv_batched(
+            self.deriv_x, self.deriv_y, self.deriv_t
+        )
+        self.assertArrayAlmostEqual(u, [vel[0] for vel in expected])
+        self.assertArrayAlmostEqual(v, [vel[1] for vel in expected])
+        self.assertArrayEqual(u[3], 0)
+        self.assertArrayEqual(v[3], 0)
+
+    def test_simple_values(self):
+        """Test output values for the system solved by Test_solve_for_uv"""
+        u, v = OpticalFlow().solve_for_uv_batched(
+            np.array([[2.0, 1.0]]), np.array([[3.0, -2.0]]), np.array([[-8.0, 3.0]])
+        )
+        self.assertArrayAlmostEqual(u, [1.0])
+        self.assertArrayAlmostEqual(v, [2.0])
+
+
 class Test_extreme_value_check(IrisTest):
     """Test extreme_value_check function"""
 
@@ -140,6 +140,7 @@ class Test__init__(IrisTest):
         self.assertAlmostEqual(plugin.upstream_range_of_influence_km, 15.0)
         self.assertAlmostEqual(plugin.efficiency_factor, 0.23265)
         self.assertAlmostEqual(plugin.cloud_lifetime_s, 102.0)
+        self.assertFalse(plugin.stream_distances)
 
         none_type_attributes = [
             "topography",
@@ -612,6 +613,17 @@ class Test__get_point_distances(IrisTest):
         distance = self.plugin._get_point_distances(self.wind_speed, self.max_sin_cos)
         np.testing.assert_allclose(distance, expected_data, equal_nan=True)
 
+    def test_steps(self):
+        """Test distances are returned for only the requested steps"""
+        expected_data = self.plugin._get_point_distances(
+            self.wind_speed, self.max_sin_cos
+        )[3:4]
+        distance = self.plugin._get_point_distances(
+            self.wind_speed, self.max_sin_cos, steps=range(3, 4)
+        )
+        self.assertSequenceEqual(distance.shape, (1, 3, 4))
+        np.testing.assert_array_equal(distance, expected_data)
+
 
 class Test__locate_source_points(IrisTest):
     """Test the _locate_source_points method"""
@@ -761,6 +773,14 @@ class Test__add_upstream_component(IrisTest):
         result = self.plugin._add_upstream_component(self.point_orogenh)
         self.assertArrayAlmostEqual(result, expected_values)
 
+    def test_stream_distances(self):
+        """Test output values are identical when accumulated one upstream
+        distance at a time"""
+        expected_values = self.plugin._add_upstream_component(self.point_orogenh)
+        self.plugin.stream_distances = True
+        result = self.plugin._add_upstream_component(self.point_orogenh)
+        self.assertArrayEqual(result, expected_values)
+
 
 class Test__create_output_cube(IrisTest):
     """Test the _create_output_cube method"""
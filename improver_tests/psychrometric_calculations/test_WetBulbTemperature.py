@@ -31,6 +31,7 @@
 """Unit tests for psychrometric_calculations WetBulbTemperature"""
 
 import unittest
+from unittest.mock import patch
 
 import iris
 import numpy as np
@@ -39,7 +40,12 @@ from iris.cube import Cube, CubeList
 from iris.tests import IrisTest
 
 from improver.psychrometric_calculations.psychrometric_calculations import (
+    WBT_TABLE_PRESSURE,
+    WBT_TABLE_RELATIVE_HUMIDITY,
+    WBT_TABLE_TEMPERATURE,
     WetBulbTemperature,
+    _wet_bulb_temperature_from_lookup,
+    _wet_bulb_temperature_table,
 )
 from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
 
@@ -95,6 +101,37 @@ class Test_psychrometric_variables(IrisTest):
         self.assertArrayAlmostEqual(result.data, expected, decimal=3)
 
 
+class Test__wet_bulb_temperature_from_lookup(IrisTest):
+    """Test wet bulb temperatures interpolated from the lookup table."""
+
+    def test_table_points(self):
+        """Test that the table values are returned at the table points."""
+        table = _wet_bulb_temperature_table()
+        indices = np.array([[0, 0, 0], [100, 10, 20], [155, 24, 40]])
+        inputs = [
+            start + increment * indices[:, axis]
+            for axis, (start, _, increment) in enumerate(
+                [WBT_TABLE_TEMPERATURE, WBT_TABLE_RELATIVE_HUMIDITY, WBT_TABLE_PRESSURE]
+            )
+        ]
+        result = _wet_bulb_temperature_from_lookup(*inputs)
+        self.assertArrayAlmostEqual(result, table[tuple(indices.T)])
+
+    def test_values(self):
+        """Test that interpolated values are close to those from the Newton
+        iterator."""
+        temperature = np.array([260.65, 273.15, 290.0, 305.3], dtype=np.float32)
+        relative_humidity = np.array([0.7, 0.75, 0.42, 1.03], dtype=np.float32)
+        pressure = np.array([9.9e4, 9.85e4, 8.71e4, 1.02e5], dtype=np.float32)
+        expected = WetBulbTemperature(precision=1.0e-4)._calculate_wet_bulb_temperature(
+            pressure, relative_humidity, temperature
+        )
+        result = _wet_bulb_temperature_from_lookup(
+            temperature, relative_humidity, pressure
+        )
+        self.assertArrayAlmostEqual(result, expected, decimal=1)
+
+
 class Test_WetBulbTemperature(IrisTest):
     """Class to set up inputs for WetBulbTemperature tests."""
 
@@ -238,6 +275,61 @@ class Test_process(Test_WetBulbTemperature):
         self.assertEqual(result.coord_dims("time")[0], 0)
         self.assertEqual(result.coord_dims("height")[0], 1)
 
+    def test_whole_cube(self):
+        """Test that calculating wet bulb temperatures for whole cubes gives
+        the same result as slicing the cubes over vertical levels."""
+        cubes = CubeList(
+            [
+                self._make_multi_level(cube, time_promote=True)
+                for cube in [self.temperature, self.relative_humidity, self.pressure]
+            ]
+        )
+        expected = WetBulbTemperature().process(cubes)
+        result = WetBulbTemperature(whole_cube=True).process(cubes)
+        self.assertArrayEqual(result.data, expected.data)
+        self.assertEqual(result.units, Unit("K"))
+        self.assertEqual(result.name(), "wet_bulb_temperature")
+        self.assertEqual(result.coord_dims("time")[0], 0)
+        self.assertEqual(result.coord_dims("height")[0], 1)
+
+    def test_whole_cube_chunks(self):
+        """Test that the result is unchanged when the whole cube calculation
+        is split into chunks smaller than the data."""
+        cubes = CubeList([self.temperature, self.relative_humidity, self.pressure])
+        expected = WetBulbTemperature(whole_cube=True).process(cubes)
+        with patch.object(WetBulbTemperature, "CHUNK_SIZE", 3):
+            result = WetBulbTemperature(whole_cube=True).process(cubes)
+        self.assertArrayEqual(result.data, expected.data)
+
+    def test_whole_cube_inputs_unmodified(self):
+        """Test that the input cubes are not modified when converting units
+        for the whole cube calculation."""
+        self.temperature.convert_units("celsius")
+        temperature = self.temperature.copy()
+        result = WetBulbTemperature(whole_cube=True).process(
+            CubeList([self.temperature, self.relative_humidity, self.pressure])
+        )
+        self.assertArrayAlmostEqual(result.data, self.expected_wbt_data, decimal=3)
+        self.assertEqual(self.temperature, temperature)
+
+    def test_whole_cube_different_dimensions(self):
+        """Check an exception is raised if the whole cube calculation is
+        requested for cubes with differing dimensions."""
+        temperature = self._make_multi_level(self.temperature)
+        msg = "WetBulbTemperature: Cubes have differing dimensions"
+        with self.assertRaisesRegex(ValueError, msg):
+            WetBulbTemperature(whole_cube=True).process(
+                CubeList([temperature, self.relative_humidity, self.pressure])
+            )
+
+    def test_lookup_table(self):
+        """Test wet bulb temperatures calculated with a first guess from the
+        lookup table converge to the expected values."""
+        result = WetBulbTemperature(lookup_table=True).process(
+            CubeList([self.temperature, self.relative_humidity, self.pressure])
+        )
+        self.assertArrayAlmostEqual(result.data, self.expected_wbt_data, decimal=2)
+
     def test_too_many_cubes(self):
         """Tests that an error is raised if there are too many cubes."""
         temp = self.temperature
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Unit tests for the neighbour_cache module."""
+
+import os
+import shutil
+import unittest
+from tempfile import mkdtemp
+
+import numpy as np
+from iris.tests import IrisTest
+from scipy.spatial import cKDTree
+
+from improver.spotdata.neighbour_cache import NeighbourCache
+
+
+class Test_NeighbourCache(IrisTest):
+
+    """Test the NeighbourCache class."""
+
+    def setUp(self):
+        """Set up a cache in a temporary directory."""
+        self.cache_dir = os.path.join(mkdtemp(), "cache")
+        self.cache = NeighbourCache(self.cache_dir)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(os.path.dirname(self.cache_dir))
+
+    def test_kdtree(self):
+        """Test that a KDTree is built once and then loaded from the cache,
+        including by another cache instance using the same directory."""
+        nodes = np.array([[0.0, 0.0], [1.0, 1.0], [2.0, 0.0]])
+        index_nodes = np.array([[0, 0], [1, 1], [2, 0]])
+        calls = []
+
+        def build_kdtree():
+            calls.append(None)
+            return cKDTree(nodes), index_nodes
+
+        self.cache.kdtree("key", build_kdtree)
+        tree, result_nodes = NeighbourCache(self.cache_dir).kdtree("key", build_kdtree)
+        self.assertEqual(len(calls), 1)
+        self.assertArrayEqual(result_nodes, index_nodes)
+        self.assertEqual(tree.query([1.9, 0.1])[1], 2)
+
+    def test_site_keys(self):
+        """Test that sites are identified by all their properties."""
+        sites = [
+            {"latitude": 50.0, "longitude": 0.0, "wmo_id": 1},
+            {"longitude": 0.0, "latitude": 50.0, "wmo_id": 1},
+            {"latitude": 50.0, "longitude": 0.0, "wmo_id": 2},
+        ]
+        keys = self.cache.site_keys(sites)
+        self.assertEqual(keys[0], keys[1])
+        self.assertNotEqual(keys[0], keys[2])
+
+    def test_neighbours(self):
+        """Test that neighbours added to the cache are merged with those
+        already cached, separately for each key."""
+        self.assertEqual(self.cache.neighbours("key"), {})
+        self.cache.update_neighbours("key", {"site1": ((1, 2), 10.0)})
+        self.cache.update_neighbours("key", {"site2": ((3, 4), 20.0)})
+        self.cache.update_neighbours("other_key", {"site3": ((5, 6), 30.0)})
+        expected = {"site1": ((1, 2), 10.0), "site2": ((3, 4), 20.0)}
+        self.assertEqual(self.cache.neighbours("key"), expected)
+
+    def test_corrupt_file(self):
+        """Test that an unreadable cache file is treated as missing."""
+        with open(os.path.join(self.cache_dir, "neighbours_key.npz"), "w") as f:
+            f.write("not an npz file")
+        self.assertEqual(self.cache.neighbours("key"), {})
+
+    def test_pickled_file(self):
+        """Test that a cache file containing pickled objects is not loaded."""
+        np.savez(
+            os.path.join(self.cache_dir, "neighbours_key.npz"),
+            site_keys=np.array([{"site1": ((1, 2), 10.0)}], dtype=object),
+            indices=np.array([[1, 2]]),
+            altitudes=np.array([10.0]),
+        )
+        self.assertEqual(self.cache.neighbours("key"), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -30,7 +30,10 @@
 # POSSIBILITY OF SUCH DAMAGE.
 """Unit tests for NeighbourSelection class"""
 
+import shutil
 import unittest
+from tempfile import mkdtemp
+from unittest.mock import patch
 
 import cartopy.crs as ccrs
 import iris
@@ -414,6 +417,31 @@ class Test_get_nearest_indices(Test_NeighbourSelection):
         result = plugin.get_nearest_indices(site_coords, self.region_orography)
         self.assertArrayEqual(result, expected)
 
+    def test_matches_iris(self):
+        """Test that the indices match those found by the iris coordinate
+        method nearest_neighbour_index, for points between grid points, on
+        cell boundaries and beyond the grid, with and without bounds."""
+
+        plugin = NeighbourSelection()
+        x_points = np.linspace(-1.5e5, 1.5e5, 25)
+        y_points = np.linspace(-7.5e4, 7.5e4, 25)
+        site_coords = np.stack((x_points, y_points), axis=1)
+
+        orography = self.region_orography
+        for has_bounds in [True, False]:
+            if not has_bounds:
+                orography.coord(axis="x").bounds = None
+                orography.coord(axis="y").bounds = None
+            expected = [
+                [
+                    orography.coord(axis="x").nearest_neighbour_index(x_point),
+                    orography.coord(axis="y").nearest_neighbour_index(y_point),
+                ]
+                for x_point, y_point in site_coords
+            ]
+            result = plugin.get_nearest_indices(site_coords, orography)
+            self.assertArrayEqual(result, expected)
+
 
 class Test_geocentric_cartesian(Test_NeighbourSelection):
 
@@ -625,6 +653,97 @@ class Test_select_minimum_dz(Test_NeighbourSelection):
         self.assertTrue(any(item.category == UserWarning for item in warning_list))
 
 
+class Test_select_minimum_dz_neighbours(Test_NeighbourSelection):
+
+    """Test extraction of the minimum height difference points for many sites
+    together. As for select_minimum_dz, the nodes are chosen along the line
+    of islands at a y index of 4."""
+
+    def setUp(self):
+        """Set up nodes and tree query results for three sites, the second
+        of which has some nodes beyond the search radius and the third of
+        which has no nodes within the search radius."""
+        super().setUp()
+        self.nodes = np.array([[0, 4], [1, 4], [2, 4], [3, 4], [4, 4]])
+        self.distances = np.array(
+            [[0, 1, 2, 3, np.inf], [0, 1, 2, np.inf, np.inf], np.full(5, np.inf)]
+        )
+        self.indices = np.array([[0, 1, 2, 3, 5], [2, 1, 0, 5, 5], [5, 5, 5, 5, 5]])
+
+    def test_basic(self):
+        """Test that the node with the minimum vertical displacement is chosen
+        for each site, and that sites without valid nodes are identified."""
+        plugin = NeighbourSelection()
+        site_altitudes = np.array([3.0, 5.0, 0.0])
+        grid_points, found = plugin.select_minimum_dz_neighbours(
+            self.region_orography,
+            site_altitudes,
+            self.nodes,
+            self.distances,
+            self.indices,
+        )
+        self.assertArrayEqual(grid_points[:2], [[0, 4], [1, 4]])
+        self.assertArrayEqual(found, [True, True, False])
+
+    def test_tied_displacements(self):
+        """Test that the nearest of the nodes with equal vertical displacements
+        is chosen."""
+        plugin = NeighbourSelection()
+        site_altitudes = np.array([0.0, 0.0, 0.0])
+        grid_points, _ = plugin.select_minimum_dz_neighbours(
+            self.region_orography,
+            site_altitudes,
+            self.nodes,
+            self.distances,
+            self.indices,
+        )
+        self.assertArrayEqual(grid_points[:2], [[2, 4], [2, 4]])
+
+    def test_matches_select_minimum_dz(self):
+        """Test that the result for each site matches select_minimum_dz."""
+        plugin = NeighbourSelection()
+        site_altitudes = np.array([1.0, 4.0, 2.0])
+        grid_points, found = plugin.select_minimum_dz_neighbours(
+            self.region_orography,
+            site_altitudes,
+            self.nodes,
+            self.distances,
+            self.indices,
+        )
+        for index in range(3):
+            expected = plugin.select_minimum_dz(
+                self.region_orography,
+                site_altitudes[index],
+                self.nodes,
+                self.distances[index],
+                self.indices[index],
+            )
+            if expected is None:
+                self.assertFalse(found[index])
+            else:
+                self.assertArrayEqual(grid_points[index], expected)
+
+    @ManageWarnings(record=True)
+    def test_incomplete_search(self, warning_list=None):
+        """Test a single warning is raised when the number of nearest
+        neighbours searched does not exhaust the search_radius for several
+        sites."""
+        plugin = NeighbourSelection(search_radius=6)
+        distances = np.array([np.arange(5), np.arange(5), np.full(5, np.inf)])
+        indices = np.tile(np.arange(5), (3, 1))
+        plugin.select_minimum_dz_neighbours(
+            self.region_orography,
+            np.array([3.0, 3.0, 3.0]),
+            self.nodes,
+            distances,
+            indices,
+        )
+        msg = "Limit on number of nearest neighbours"
+        warnings = [item for item in warning_list if msg in str(item)]
+        self.assertEqual(len(warnings), 1)
+        self.assertIn("for 2 of 3 sites", str(warnings[0]))
+
+
 class Test_process(Test_NeighbourSelection):
 
     """Test the process method of the NeighbourSelection class."""
@@ -870,6 +989,57 @@ class Test_process(Test_NeighbourSelection):
 
         self.assertArrayEqual(result.data, expected)
 
+    def test_region_cached(self):
+        """Test that the neighbours found using a cache match those found
+        without one, both when the cache is populated and when it is reused,
+        and that only sites that are not yet cached are searched for."""
+
+        kwargs = {
+            "land_constraint": True,
+            "minimum_dz": True,
+            "search_radius": 2e5,
+            "site_coordinate_system": self.region_projection.as_cartopy_crs(),
+            "site_x_coordinate": "projection_x_coordinate",
+            "site_y_coordinate": "projection_y_coordinate",
+        }
+        new_site = {
+            "altitude": 0.0,
+            "projection_x_coordinate": 3.0e4,
+            "projection_y_coordinate": 1.0e4,
+            "wmo_id": 2,
+        }
+        sites = self.region_sites + [new_site]
+        expected = NeighbourSelection(**kwargs).process(
+            sites, self.region_orography, self.region_land_mask
+        )
+
+        cache_dir = mkdtemp()
+        try:
+            plugin = NeighbourSelection(cache_dir=cache_dir, **kwargs)
+            plugin.process(
+                self.region_sites,
+                self.region_orography.copy(),
+                self.region_land_mask.copy(),
+            )
+            with patch.object(
+                NeighbourSelection,
+                "_find_neighbours",
+                side_effect=plugin._find_neighbours,
+            ) as find_neighbours:
+                result = plugin.process(
+                    sites, self.region_orography.copy(), self.region_land_mask.copy()
+                )
+                cached_result = plugin.process(
+                    sites, self.region_orography.copy(), self.region_land_mask.copy()
+                )
+        finally:
+            shutil.rmtree(cache_dir)
+
+        find_neighbours.assert_called_once()
+        self.assertEqual(find_neighbours.call_args[0][0], [new_site])
+        self.assertEqual(result, expected)
+        self.assertEqual(cached_result, expected)
+
     def test_global_tied_case_nearest(self):
         """Test which neighbour is returned in an artificial case in which two
         neighbouring grid points are identically close. First with no
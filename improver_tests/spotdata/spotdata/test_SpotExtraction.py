@@ -32,6 +32,7 @@
 
 import unittest
 
+import dask.array as da
 import iris
 import numpy as np
 from iris.tests import IrisTest
@@ -214,6 +215,42 @@ class Test_extract_diagnostic_data(Test_SpotExtraction):
         )
         self.assertArrayEqual(result, expected)
 
+    def test_lazy_cube(self):
+        """Test extraction of diagnostic data from a cube with lazy data and
+        a leading dimension, which is extracted without realising the data."""
+        plugin = SpotExtraction()
+        data = self.diagnostic_cube_yx.data
+        data = np.stack([data, data + 25])
+        realization = iris.coords.DimCoord([0, 1], standard_name="realization")
+        cube = iris.cube.Cube(
+            da.from_array(data, chunks=(1, 2, 2)),
+            standard_name="air_temperature",
+            units="K",
+            dim_coords_and_dims=[
+                (realization, 0),
+                (self.diagnostic_cube_yx.coord("latitude"), 1),
+                (self.diagnostic_cube_yx.coord("longitude"), 2),
+            ],
+        )
+        expected = [[0, 0, 12, 12], [25, 25, 37, 37]]
+        result = plugin.extract_diagnostic_data(self.coordinate_cube, cube)
+        self.assertIsInstance(result, np.ndarray)
+        self.assertArrayEqual(result, expected)
+        self.assertTrue(cube.has_lazy_data())
+
+    def test_lazy_masked_cube(self):
+        """Test extraction of diagnostic data from a cube with lazy masked
+        data retains the mask."""
+        plugin = SpotExtraction()
+        cube = self.diagnostic_cube_yx.copy(
+            data=da.from_array(
+                np.ma.masked_equal(self.diagnostic_cube_yx.data, 12), chunks=(2, 2)
+            )
+        )
+        expected = np.ma.masked_array([0, 0, 12, 12], mask=[0, 0, 1, 1])
+        result = plugin.extract_diagnostic_data(self.coordinate_cube, cube)
+        self.assertMaskedArrayEqual(result, expected)
+
 
 class Test_build_diagnostic_cube(Test_SpotExtraction):
 
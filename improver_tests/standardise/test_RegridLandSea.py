@@ -30,7 +30,9 @@
 # POSSIBILITY OF SUCH DAMAGE.
 """Unit tests for the standardise.RegridLandSea plugin."""
 
+import os
 import unittest
+from tempfile import TemporaryDirectory
 
 import numpy as np
 from iris.tests import IrisTest
@@ -148,6 +150,37 @@ class Test_process(IrisTest):
             self.assertEqual(result.coord(axis=axis), self.target_grid.coord(axis=axis))
         self.assertDictEqual(result.attributes, expected_attributes)
 
+    def test_weights_reused(self):
+        """Test the regridding weights are calculated once for each pair of
+        grids"""
+        plugin = RegridLandSea()
+        plugin(self.cube, self.target_grid)
+        weights = plugin._weights.copy()
+        result = plugin(self.cube.copy(data=self.cube.data + 1), self.target_grid)
+        self.assertEqual(plugin._weights, weights)
+        self.assertEqual(len(weights), 1)
+        self.assertArrayAlmostEqual(result.data, 283 * np.ones((12, 12)))
+
+    @ManageWarnings(ignored_messages=IGNORED_MESSAGES, warning_types=WARNING_TYPES)
+    def test_cache_dir(self):
+        """Test the regridding weights are cached on disk and that cached
+        weights are used by a new plugin"""
+        expected = RegridLandSea(
+            regrid_mode="nearest-with-mask",
+            landmask=self.landmask,
+            landmask_vicinity=90000,
+        )(self.cube, self.target_grid.copy())
+        with TemporaryDirectory() as cache_dir:
+            for _ in range(2):
+                result = RegridLandSea(
+                    regrid_mode="nearest-with-mask",
+                    landmask=self.landmask,
+                    landmask_vicinity=90000,
+                    cache_dir=cache_dir,
+                )(self.cube, self.target_grid.copy())
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+                self.assertEqual(result, expected)
+
     def test_error_regrid_with_incorrect_landmask(self):
         """Test an error is thrown if a landmask is provided that does not
         match the source grid"""
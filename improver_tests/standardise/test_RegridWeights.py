@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Unit tests for the standardise.RegridWeights class."""
+
+import os
+import unittest
+from tempfile import TemporaryDirectory
+
+import numpy as np
+from iris.analysis import Linear, Nearest
+from iris.tests import IrisTest
+
+from improver.standardise import AdjustLandSeaPoints, RegridWeights
+from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+from improver.utilities.warnings_handler import ManageWarnings
+
+# The warning messages are internal to the iris.analysis module v2.2.0
+IGNORED_MESSAGES = ["Using a non-tuple sequence for multidimensional indexing"]
+WARNING_TYPES = [FutureWarning]
+
+
+class Test_regrid(IrisTest):
+    """Test that regridding with the weights reproduces regridding with iris
+    and, for "nearest-with-mask", AdjustLandSeaPoints."""
+
+    def setUp(self):
+        """Set up a multi-realization cube on a lat-lon grid, a target grid
+        within its domain, and land-sea masks on both grids"""
+        domain_corner = (54.9 - 15, -2.5 - 15)
+        data = np.random.RandomState(0).normal(280, 5, (3, 15, 15))
+        self.cube = set_up_variable_cube(
+            data.astype(np.float32),
+            spatial_grid="latlon",
+            domain_corner=domain_corner,
+            grid_spacing=2,
+        )
+        self.landmask = self.cube[0].copy(data=np.zeros((15, 15), dtype=np.int8))
+        self.landmask.data[:, 8:] = 1
+        self.landmask.rename("land_binary_mask")
+        self.landmask.units = "no_unit"
+        for coord in [
+            "realization",
+            "time",
+            "forecast_reference_time",
+            "forecast_period",
+        ]:
+            self.landmask.remove_coord(coord)
+
+        self.target_grid = set_up_variable_cube(
+            np.zeros((12, 12), dtype=np.int8),
+            name="land_binary_mask",
+            units="no_unit",
+            spatial_grid="equalarea",
+            grid_spacing=100000,
+            domain_corner=(-600000, -600000),
+        )
+        self.target_grid.data[::2, 1::3] = 1
+        for coord in ["time", "forecast_reference_time", "forecast_period"]:
+            self.target_grid.remove_coord(coord)
+
+    def test_bilinear(self):
+        """Test bilinear regridding matches iris.analysis.Linear"""
+        expected = self.cube.regrid(self.target_grid, Linear("nanmask"))
+        result = RegridWeights.from_grids(
+            self.cube, self.target_grid, "bilinear", "nanmask"
+        ).regrid(self.cube, self.target_grid)
+        self.assertArrayEqual(result.data, expected.data)
+        self.assertEqual(result.dtype, expected.dtype)
+        self.assertEqual(result, expected)
+
+    def test_nearest_masked(self):
+        """Test nearest neighbour regridding of masked data matches
+        iris.analysis.Nearest"""
+        self.cube.data = np.ma.masked_greater(self.cube.data, 285)
+        expected = self.cube.regrid(self.target_grid, Nearest("nanmask"))
+        result = RegridWeights.from_grids(
+            self.cube, self.target_grid, "nearest", "nanmask"
+        ).regrid(self.cube, self.target_grid)
+        self.assertArrayEqual(result.data.mask, expected.data.mask)
+        self.assertArrayEqual(result.data.data, expected.data.data)
+
+    @ManageWarnings(ignored_messages=IGNORED_MESSAGES, warning_types=WARNING_TYPES)
+    def test_nearest_with_mask(self):
+        """Test nearest neighbour regridding with a land-sea mask matches
+        iris.analysis.Nearest followed by AdjustLandSeaPoints, and that some
+        points are corrected"""
+        nearest = self.cube.regrid(self.target_grid, Nearest("nanmask"))
+        expected = AdjustLandSeaPoints(vicinity_radius=500000)(
+            nearest, self.landmask, self.target_grid
+        )
+        weights = RegridWeights.from_grids(
+            self.cube,
+            self.target_grid,
+            "nearest-with-mask",
+            "nanmask",
+            landmask=self.landmask,
+            landmask_vicinity=500000,
+        )
+        result = weights.regrid(self.cube, self.target_grid)
+        self.assertTrue(weights.corrected.any())
+        self.assertArrayEqual(result.data, expected.data)
+        self.assertEqual(result.coords(), expected.coords())
+
+    def test_extrapolation_mask(self):
+        """Test points outside the source domain are masked as by iris"""
+        self.cube = self.cube[:, 4:-4, 4:-4]
+        expected = self.cube.regrid(self.target_grid, Linear("mask"))
+        result = RegridWeights.from_grids(
+            self.cube, self.target_grid, "bilinear", "mask"
+        ).regrid(self.cube, self.target_grid)
+        self.assertTrue(expected.data.mask.any())
+        self.assertArrayEqual(result.data.mask, expected.data.mask)
+        self.assertArrayEqual(result.data.data, expected.data.data)
+
+    def test_extrapolation_error(self):
+        """Test an error is raised for the "error" extrapolation mode if
+        points are outside the source domain"""
+        self.cube = self.cube[:, 4:-4, 4:-4]
+        msg = "One of the requested xi is out of bounds"
+        with self.assertRaisesRegex(ValueError, msg):
+            RegridWeights.from_grids(self.cube, self.target_grid, "bilinear", "error")
+
+    def test_dimension_order(self):
+        """Test regridding a cube whose x and y dimensions are not last"""
+        self.cube.transpose([2, 0, 1])
+        expected = self.cube.regrid(self.target_grid, Linear("nanmask"))
+        result = RegridWeights.from_grids(
+            self.cube, self.target_grid, "bilinear", "nanmask"
+        ).regrid(self.cube, self.target_grid)
+        self.assertArrayEqual(result.data, expected.data)
+        self.assertEqual(result, expected)
+
+    def test_invalid_extrapolation_mode(self):
+        """Test an error is raised for an unknown extrapolation mode"""
+        msg = "Extrapolation mode 'kludge' not supported"
+        with self.assertRaisesRegex(ValueError, msg):
+            RegridWeights.from_grids(self.cube, self.target_grid, "nearest", "kludge")
+
+    def test_wrong_source_grid(self):
+        """Test an error is raised for data not on the source grid"""
+        weights = RegridWeights.from_grids(self.cube, self.target_grid)
+        msg = "is not on the source grid"
+        with self.assertRaisesRegex(ValueError, msg):
+            weights.regrid(self.cube[:, 1:], self.target_grid)
+
+
+class Test_save_load(IrisTest):
+    """Test saving and loading weights."""
+
+    def setUp(self):
+        """Set up a cube and a target grid"""
+        self.cube = set_up_variable_cube(
+            np.arange(36, dtype=np.float32).reshape(6, 6), grid_spacing=2
+        )
+        self.target_grid = set_up_variable_cube(
+            np.zeros((4, 4), dtype=np.float32), grid_spacing=3, domain_corner=(-4, -4),
+        )
+
+    def test_round_trip(self):
+        """Test loaded weights give the same result as those saved"""
+        for regrid_mode in ["bilinear", "nearest"]:
+            weights = RegridWeights.from_grids(
+                self.cube, self.target_grid, regrid_mode, "mask"
+            )
+            with TemporaryDirectory() as cache_dir:
+                path = os.path.join(cache_dir, "weights.npz")
+                weights.save(path)
+                loaded = RegridWeights.load(path)
+                self.assertEqual(os.listdir(cache_dir), ["weights.npz"])
+            self.assertEqual(repr(loaded), repr(weights))
+            self.assertArrayEqual(
+                loaded.regrid(self.cube, self.target_grid).data,
+                weights.regrid(self.cube, self.target_grid).data,
+            )
+
+    def test_load_missing(self):
+        """Test None is returned if there are no saved weights"""
+        with TemporaryDirectory() as cache_dir:
+            path = os.path.join(cache_dir, "weights.npz")
+            self.assertIsNone(RegridWeights.load(path))
+
+    def test_key(self):
+        """Test the key depends on the grids and regridding options"""
+        key = RegridWeights.key(self.cube, self.target_grid, "bilinear", "nanmask")
+        self.assertEqual(
+            key, RegridWeights.key(self.cube, self.target_grid, "bilinear", "nanmask")
+        )
+        self.assertNotEqual(
+            key, RegridWeights.key(self.cube, self.target_grid, "nearest", "nanmask")
+        )
+        self.assertNotEqual(
+            key, RegridWeights.key(self.target_grid, self.cube, "bilinear", "nanmask")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Unit tests for improver.plugin_trace"""
+
+import json
+
+import numpy as np
+import pytest
+
+from improver import BasePlugin, PostProcessingPlugin
+from improver.plugin_trace import trace_disable, trace_enable
+from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+
+
+class Inner(PostProcessingPlugin):
+    """Plugin doubling a cube."""
+
+    def process(self, cube):
+        """Return a new cube with doubled data."""
+        return cube.copy(data=cube.data * 2)
+
+
+class Outer(BasePlugin):
+    """Plugin calling another plugin."""
+
+    def process(self, cubes, scale=None):
+        """Call the inner plugin on each cube and stack the results."""
+        return np.stack([Inner()(cube).data for cube in cubes])
+
+
+@pytest.fixture(name="cube")
+def cube_fixture():
+    """Cube with 27 float32 values."""
+    return set_up_variable_cube(np.ones((3, 3, 3), dtype=np.float32))
+
+
+@pytest.fixture(name="trace_file")
+def trace_file_fixture(tmp_path, request):
+    """Enable tracing to a file, with the extension given by the test
+    parameter, and disable it after the test."""
+    path = tmp_path / f"trace{request.param}"
+    trace_enable(str(path))
+    yield path
+    trace_disable()
+
+
+@pytest.mark.parametrize("trace_file", [".jsonl"], indirect=True)
+def test_json_lines(trace_file, cube):
+    """Test each plugin call is recorded as a line of JSON, including calls
+    by other plugins."""
+    result = Outer()([cube, cube], scale={"factor": np.ones(4)})
+    trace_disable()
+    records = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    assert [(record["plugin"], record["depth"]) for record in records] == [
+        (f"{__name__}.Inner", 1),
+        (f"{__name__}.Inner", 1),
+        (f"{__name__}.Outer", 0),
+    ]
+    assert [record["input_bytes"] for record in records] == [108, 108, 248]
+    assert [record["output_bytes"] for record in records] == [108, 108, 216]
+    np.testing.assert_array_equal(result, 2)
+    for record in records:
+        assert record["start"] >= 0
+        assert record["wall_time"] >= 0
+        assert record["cpu_time"] >= 0
+        assert record["max_rss_increase"] >= 0
+    outer = records[2]
+    assert all(
+        outer["start"] <= record["start"] <= outer["start"] + outer["wall_time"]
+        for record in records[:2]
+    )
+
+
+@pytest.mark.parametrize("trace_file", [".json"], indirect=True)
+def test_chrome_trace(trace_file, cube):
+    """Test plugin calls are written as Chrome trace events at the end."""
+    Inner()(cube)
+    assert not trace_file.exists()
+    trace_disable()
+    (event,) = json.loads(trace_file.read_text())["traceEvents"]
+    assert event["name"] == "Inner"
+    assert event["ph"] == "X"
+    assert event["dur"] == pytest.approx(event["args"]["wall_time"] * 1e6)
+    assert event["args"]["input_bytes"] == 108
+
+
+def test_disabled(tmp_path, cube):
+    """Test nothing is recorded once tracing is disabled."""
+    path = tmp_path / "trace.jsonl"
+    trace_enable(str(path))
+    trace_disable()
+    Inner()(cube)
+    assert path.read_text() == ""
+
+
+def test_import_without_resource():
+    """Test `import improver` does not import the POSIX-only resource module,
+    which is only needed when tracing."""
+    import subprocess  # nosec
+    import sys
+
+    script = (
+        "import improver, sys; "
+        'assert "resource" not in sys.modules, "resource imported by improver"'
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)  # nosec
@@ -267,16 +267,31 @@ def test_process(with_percentiles, input_as_cube, input_has_time_bounds):
 def test_bad_dtype():
     """Checks that the plugin raises a useful error if the output are float64"""
     cube = make_input_cube([3, 4])
+    cube.data = cube.data.astype(np.float64)
     local_time = datetime(2017, 11, 10, 5, 0)
     timezone_cube = make_timezone_cube()
-    timezone_cube.data = timezone_cube.data.astype(np.int32)
     with pytest.raises(
         TypeError,
-        match=r"Operation multiply on types \{dtype\(\'.*32\'\), dtype\(\'.*32\'\)\} results in",
+        match=r"Operation take_along_axis on types \{dtype\(\'float64\'\)\} results in",
     ):
         TimezoneExtraction()(cube, timezone_cube, local_time)
 
 
+def test_timezone_cube_dtype():
+    """Checks that the dtype of the timezone_cube does not affect the output, as it
+    is only used to find the time zone of each point"""
+    cube = make_input_cube([3, 4])
+    cube.data = np.array(
+        [np.zeros([3, 4], dtype=np.float32), np.ones([3, 4], dtype=np.float32)]
+    )
+    local_time = datetime(2017, 11, 10, 5, 0)
+    timezone_cube = make_timezone_cube()
+    timezone_cube.data = timezone_cube.data.astype(np.int32)
+    result = TimezoneExtraction()(cube, timezone_cube, local_time)
+    assert_metadata_ok(result)
+    assert np.isclose(result.data, [[0, 0, 0, 0], [0, 0, 0, 0], [1, 1, 1, 1]]).all()
+
+
 def test_bad_spatial_coords():
     """Checks that the plugin raises a useful error if the longitude coord is shifted by
     180 degrees"""
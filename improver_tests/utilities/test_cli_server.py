@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Unit tests for utilities.cli_server."""
+
+import io
+import multiprocessing
+import os
+import socket
+import stat
+import time
+
+import pytest
+
+from improver.utilities.cli_server import (
+    _receive,
+    _StreamWriter,
+    run_task,
+    run_via_server,
+    serve,
+)
+
+
+def test_run_task(tmp_path):
+    """Test a command's output is captured, and the directory restored"""
+    cwd = os.getcwd()
+    stdout, stderr = io.StringIO(), io.StringIO()
+    status = run_task(["help", "threshold"], str(tmp_path), stdout, stderr)
+    assert status == 0
+    assert stdout.getvalue().startswith("Usage: improver threshold")
+    assert stderr.getvalue() == ""
+    assert os.getcwd() == cwd
+
+
+def test_run_task_unknown_command(tmp_path):
+    """Test the exit status and error message of an unknown command"""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    status = run_task(["kludge"], str(tmp_path), stdout, stderr)
+    assert status == 2
+    assert 'Unknown command "kludge"' in stderr.getvalue()
+
+
+def test_run_task_error(tmp_path):
+    """Test the traceback of a failed command is returned"""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    status = run_task(
+        ["threshold", "missing.nc", "--threshold-values", "1"],
+        str(tmp_path),
+        stdout,
+        stderr,
+    )
+    assert status == 1
+    assert "Traceback" in stderr.getvalue()
+    assert "missing.nc" in stderr.getvalue()
+
+
+def test_stream_writer():
+    """Test output is sent as a message for each write, as it is written"""
+    server_end, client_end = socket.socketpair()
+    with server_end, client_end:
+        stdout = _StreamWriter(server_end, "stdout")
+        stderr = _StreamWriter(server_end, "stderr")
+        print("first", file=stdout, end="")
+        assert _receive(client_end) == {"stream": "stdout", "text": "first"}
+        stderr.write("second")
+        stdout.write("")
+        stdout.write("third")
+        assert _receive(client_end) == {"stream": "stderr", "text": "second"}
+        assert _receive(client_end) == {"stream": "stdout", "text": "third"}
+
+
+@pytest.fixture(name="server")
+def server_fixture(tmp_path):
+    """Run a server whose workers are replaced after every command, started
+    with a group-writable umask"""
+    socket_path = str(tmp_path / "improver.sock")
+    process = multiprocessing.get_context("fork").Process(
+        target=serve, args=(socket_path,), kwargs={"max_tasks": 1, "workers": 2}
+    )
+    umask = os.umask(0o002)
+    try:
+        process.start()
+    finally:
+        os.umask(umask)
+    for _ in range(600):
+        if os.path.exists(socket_path):
+            break
+        time.sleep(0.1)
+    yield socket_path
+    process.terminate()
+    process.join()
+    assert not os.path.exists(socket_path)
+
+
+def test_run_via_server(server, capsys):
+    """Test commands run by the server, including after workers have been
+    replaced"""
+    for _ in range(3):
+        run_via_server(server, ["help", "threshold"])
+        captured = capsys.readouterr()
+        assert captured.out.startswith("Usage: improver threshold")
+        assert captured.err == ""
+
+
+def test_socket_mode(server):
+    """Test only the owner of the server can access its socket"""
+    assert stat.S_IMODE(os.stat(server).st_mode) & 0o077 == 0
+
+
+def test_run_via_server_error(server, capsys):
+    """Test the exit status of a failed command is raised"""
+    with pytest.raises(SystemExit) as exit_info:
+        run_via_server(server, ["kludge"])
+    assert exit_info.value.code == 2
+    assert 'Unknown command "kludge"' in capsys.readouterr().err
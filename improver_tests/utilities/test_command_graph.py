@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# (C) British Crown Copyright 2017-2021 Met Office.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Unit tests for utilities.command_graph."""
+
+import json
+import threading
+import weakref
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
+from improver.utilities.command_graph import load_graph, run_graph
+from improver.utilities.load import load_cube
+from improver.utilities.save import save_netcdf
+
+
+class Result:
+    """Result of a fake command, which can be weakly referenced."""
+
+    def __init__(self, command, args):
+        self.command = command
+        self.args = tuple(
+            f"@{arg.command}" if isinstance(arg, Result) else arg for arg in args
+        )
+
+    def __eq__(self, other):
+        return (self.command, self.args) == (other.command, other.args)
+
+
+class FakeCommands:
+    """Replacement for execute_command, which records the commands run."""
+
+    def __init__(self, actions=None, record_args=True):
+        self.actions = actions or {}
+        self.record_args = record_args
+        self.calls = {}
+        self.results = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, dispatcher, prog_name, command, *args, verbose=False):
+        action = self.actions.get(command)
+        if action is not None:
+            action(self)
+        result = Result(command, args)
+        with self.lock:
+            self.calls[command] = args if self.record_args else None
+            self.results[command] = weakref.ref(result)
+        return result
+
+
+def run(graph, commands, **kwargs):
+    """Run a graph with fake commands."""
+    with patch("improver.utilities.command_graph.execute_command", commands):
+        run_graph(graph, **kwargs)
+
+
+def test_chain():
+    """Test results are passed in memory and only declared outputs are
+    written."""
+    graph = {
+        "b": {"command": "b", "args": ["@a", "--option", 1.5], "output": "b.nc"},
+        "a": {"command": "a", "args": ["input.nc"]},
+    }
+    commands = FakeCommands()
+    run(graph, commands)
+    assert commands.calls["a"] == ("input.nc",)
+    assert commands.calls["b"] == (
+        Result("a", ("input.nc",)),
+        "--option",
+        "1.5",
+        "--output",
+        "b.nc",
+    )
+
+
+def test_shared_result_copied():
+    """Test each node using a result gets its own copy of it."""
+    graph = {
+        "a": {"command": "a"},
+        "b": {"command": "b", "args": ["@a"]},
+        "c": {"command": "c", "args": ["@a"]},
+    }
+    commands = FakeCommands()
+    run(graph, commands)
+    (b_input,) = commands.calls["b"]
+    (c_input,) = commands.calls["c"]
+    assert b_input == c_input
+    assert b_input is not c_input
+
+
+def test_output_of_used_node_saved():
+    """Test a node with an output which is also used by another node is
+    saved by the runner, and its result passed on."""
+    graph = {
+        "a": {"command": "a", "output": "a.nc"},
+        "b": {"command": "b", "args": ["@a"]},
+    }
+    commands = FakeCommands()
+    with patch("improver.utilities.command_graph.save_netcdf") as save_netcdf:
+        run(graph, commands)
+    save_netcdf.assert_called_once_with(Result("a", ()), "a.nc")
+    assert commands.calls["a"] == ()
+    assert commands.calls["b"] == (Result("a", ()),)
+
+
+def test_intermediates_released():
+    """Test a result is released once the last node using it has run."""
+
+    def check_released(commands):
+        assert commands.results["a"]() is None
+        assert commands.results["b"]() is not None
+
+    graph = {
+        "a": {"command": "a"},
+        "b": {"command": "b", "args": ["@a"]},
+        "c": {"command": "c", "args": ["@b"]},
+    }
+    commands = FakeCommands({"c": check_released}, record_args=False)
+    run(graph, commands)
+    assert set(commands.calls) == {"a", "b", "c"}
+
+
+def test_concurrent():
+    """Test independent nodes run at the same time."""
+    barrier = threading.Barrier(2, timeout=10)
+    actions = {"a": lambda _: barrier.wait(), "b": lambda _: barrier.wait()}
+    graph = {
+        "a": {"command": "a"},
+        "b": {"command": "b"},
+        "c": {"command": "c", "args": ["@a", "@b"]},
+    }
+    commands = FakeCommands(actions)
+    run(graph, commands, max_workers=2)
+    assert set(commands.calls) == {"a", "b", "c"}
+
+
+def test_error():
+    """Test an error in a command is raised, and later nodes not run."""
+
+    def fail(_):
+        raise RuntimeError("command failed")
+
+    graph = {
+        "a": {"command": "a"},
+        "b": {"command": "b", "args": ["@a"]},
+    }
+    commands = FakeCommands({"a": fail})
+    with pytest.raises(RuntimeError, match="command failed"):
+        run(graph, commands)
+    assert not commands.calls
+
+
+def test_commands(tmp_path):
+    """Test running improver commands, with a result used by two of them."""
+    data = np.linspace(270, 290, 9, dtype=np.float32).reshape(3, 3)
+    input_path = str(tmp_path / "input.nc")
+    save_netcdf(set_up_variable_cube(data), input_path)
+    graph = {
+        "celsius": {
+            "command": "standardise",
+            "args": [input_path, "--new-units", "degC"],
+        },
+        "kelvin": {
+            "command": "standardise",
+            "args": ["@celsius", "--new-units", "K"],
+            "output": str(tmp_path / "kelvin.nc"),
+        },
+        "probability": {
+            "command": "threshold",
+            "args": [
+                "@celsius",
+                "--threshold-values",
+                "5",
+                "--threshold-units",
+                "degC",
+            ],
+            "output": str(tmp_path / "probability.nc"),
+        },
+    }
+    run_graph(graph, max_workers=2)
+    assert not (tmp_path / "celsius.nc").exists()
+    kelvin = load_cube(str(tmp_path / "kelvin.nc"))
+    np.testing.assert_allclose(kelvin.data, data, rtol=1e-6)
+    probability = load_cube(str(tmp_path / "probability.nc"))
+    np.testing.assert_array_equal(probability.data, (data > 278.15).astype(np.float32))
+
+
+@pytest.mark.parametrize(
+    "graph, message",
+    (
+        ({"a": {"args": []}}, "Node a has no command"),
+        ({"a": {"command": "a", "args": ["@b"]}}, "Node a uses unknown node b"),
+        (
+            {
+                "a": {"command": "a", "args": ["@b"]},
+                "b": {"command": "b", "args": ["@a"]},
+                "c": {"command": "c"},
+            },
+            r"cycle between nodes \['a', 'b'\]",
+        ),
+    ),
+)
+def test_invalid_graph(graph, message):
+    """Test invalid graphs are rejected before any command is run."""
+    commands = FakeCommands()
+    with pytest.raises(ValueError, match=message):
+        run(graph, commands)
+    assert not commands.calls
+
+
+def test_load_json(tmp_path):
+    """Test loading a graph from a JSON file."""
+    graph = {"a": {"command": "a", "args": ["input.nc"], "output": "a.nc"}}
+    path = tmp_path / "graph.json"
+    path.write_text(json.dumps(graph))
+    assert load_graph(str(path)) == graph
+
+
+def test_load_yaml(tmp_path):
+    """Test loading a graph from a YAML file."""
+    pytest.importorskip("yaml")
+    path = tmp_path / "graph.yaml"
+    path.write_text("a:\n  command: a\n  args: [input.nc]\n  output: a.nc\n")
+    expected = {"a": {"command": "a", "args": ["input.nc"], "output": "a.nc"}}
+    assert load_graph(str(path)) == expected
@@ -35,7 +35,11 @@ import unittest
 import numpy as np
 from iris.tests import IrisTest
 
-from improver.utilities.interpolation import interpolate_missing_data
+from improver.utilities.interpolation import (
+    interpolate_missing_data,
+    interpolate_rows,
+    search_sorted_rows,
+)
 
 
 class Test_interpolate_missing_data(IrisTest):
@@ -234,5 +238,105 @@ class Test_interpolate_missing_data(IrisTest):
         self.assertArrayEqual(data_updated, expected)
 
 
+class Test_search_sorted_rows(IrisTest):
+    """Test the search_sorted_rows function"""
+
+    def setUp(self):
+        """Set up sorted rows and values to insert."""
+        self.sorted_rows = np.array(
+            [[1.0, 2.0, 3.0], [1.0, 1.0, 4.0], [0.0, 5.0, 5.0], [2.0, 3.0, 4.0]]
+        )
+        self.values = np.array(
+            [[0.0, 2.0, 3.5], [1.0, 4.0, 5.0], [5.0, 2.0, 6.0], [2.0, 2.5, 1.0]]
+        )
+
+    def test_left(self):
+        """Test that the result matches np.searchsorted for each row when
+        searching from the left, using several chunks."""
+        expected = np.array(
+            [
+                np.searchsorted(row, val)
+                for row, val in zip(self.sorted_rows, self.values)
+            ]
+        )
+        result = search_sorted_rows(self.sorted_rows, self.values, rows_per_chunk=3)
+        self.assertArrayEqual(result, expected)
+
+    def test_right(self):
+        """Test that the result matches np.searchsorted for each row when
+        searching from the right."""
+        expected = np.array(
+            [
+                np.searchsorted(row, val, side="right")
+                for row, val in zip(self.sorted_rows, self.values)
+            ]
+        )
+        result = search_sorted_rows(self.sorted_rows, self.values, side="right")
+        self.assertArrayEqual(result, expected)
+
+    def test_shared_values(self):
+        """Test one-dimensional values to insert shared by all rows."""
+        values = np.array([1.0, 4.0])
+        expected = np.array([np.searchsorted(row, values) for row in self.sorted_rows])
+        result = search_sorted_rows(self.sorted_rows, values)
+        self.assertArrayEqual(result, expected)
+
+
+class Test_interpolate_rows(IrisTest):
+    """Test the interpolate_rows function"""
+
+    def setUp(self):
+        """Set up data points for several rows and values at which to
+        interpolate, including values outside the data and tied data
+        points."""
+        self.xp = np.array(
+            [[0.0, 1.0, 2.0], [0.0, 0.5, 0.5], [1.0, 1.0, 1.0], [-1.0, 0.0, 3.0]]
+        )
+        self.fp = np.array(
+            [[10.0, 20.0, 40.0], [0.0, 1.0, 2.0], [5.0, 6.0, 7.0], [1.0, 2.0, 3.0]]
+        )
+        self.x = np.array(
+            [[-1.0, 0.5, 3.0], [0.25, 0.5, 1.0], [0.0, 1.0, 2.0], [-0.5, 1.5, 3.0]]
+        )
+
+    def test_basic(self):
+        """Test that the result matches np.interp for each row, using
+        several chunks."""
+        expected = np.array(
+            [np.interp(*args) for args in zip(self.x, self.xp, self.fp)]
+        )
+        result = interpolate_rows(self.x, self.xp, self.fp, rows_per_chunk=3)
+        self.assertArrayEqual(result, expected)
+
+    def test_shared_inputs(self):
+        """Test one-dimensional x and fp shared by all rows."""
+        x = np.array([0.0, 0.25, 0.75, 2.0])
+        fp = np.array([0.0, 50.0, 100.0])
+        expected = np.array([np.interp(x, xp, fp) for xp in self.xp])
+        result = interpolate_rows(x, self.xp, fp)
+        self.assertArrayEqual(result, expected)
+
+    def test_shared_data_points(self):
+        """Test one-dimensional xp shared by all rows."""
+        xp = np.array([0.0, 1.0, 2.0])
+        expected = np.array([np.interp(x, xp, fp) for x, fp in zip(self.x, self.fp)])
+        result = interpolate_rows(self.x, xp, self.fp)
+        self.assertArrayEqual(result, expected)
+
+    def test_decreasing_row(self):
+        """Test that a row of data points that is not increasing gives the
+        same result as np.interp."""
+        xp = self.xp.copy()
+        xp[0] = [2.0, 1.0, 0.0]
+        expected = np.array([np.interp(*args) for args in zip(self.x, xp, self.fp)])
+        result = interpolate_rows(self.x, xp, self.fp)
+        self.assertArrayEqual(result, expected)
+
+    def test_single_data_point(self):
+        """Test that a single data point gives its value everywhere."""
+        result = interpolate_rows(self.x, self.xp[:, :1], self.fp[:, :1])
+        self.assertArrayEqual(result, np.repeat(self.fp[:, :1], 3, axis=1))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -43,7 +43,7 @@ from netCDF4 import Dataset
 
 from improver.synthetic_data.set_up_test_cubes import set_up_variable_cube
 from improver.utilities.load import load_cube
-from improver.utilities.save import _order_cell_methods, save_netcdf
+from improver.utilities.save import _order_cell_methods, atomic_write, save_netcdf
 
 
 def set_up_test_cube():
@@ -296,6 +296,30 @@ def test_least_significant_digit(bitshaving_cube, tmp_path, lsd, compress):
     assert np.max(abs_diff) < 10 ** (-1.0 * lsd)
 
 
+def test_atomic_write(tmp_path):
+    """Test a file is written in place of any existing file"""
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"old")
+    with atomic_write(str(path)) as output_file:
+        output_file.write(b"new")
+        assert path.read_bytes() == b"old"
+    assert path.read_bytes() == b"new"
+    assert os.listdir(str(tmp_path)) == ["file.bin"]
+
+
+def test_atomic_write_error(tmp_path):
+    """Test an existing file is kept, and the temporary file removed, if
+    writing fails"""
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"old")
+    with pytest.raises(RuntimeError):
+        with atomic_write(str(path)) as output_file:
+            output_file.write(b"new")
+            raise RuntimeError
+    assert path.read_bytes() == b"old"
+    assert os.listdir(str(tmp_path)) == ["file.bin"]
+
+
 class Test__order_cell_methods(IrisTest):
     """ Test function that sorts cube cell_methods before saving. """
 
@@ -764,6 +764,123 @@ class Test_find_all_routes(IrisTest):
         self.assertListEqual(result, expected_nodes)
 
 
+class Test_evaluate_condition(Test_WXCode):
+
+    """Test the evaluate_condition method."""
+
+    def setUp(self):
+        """ Set up a query for testing"""
+        super().setUp()
+        self.rain = "probability_of_rainfall_rate_above_threshold"
+        self.query = {
+            "succeed": 1,
+            "fail": 2,
+            "probability_thresholds": [0.5],
+            "threshold_condition": ">=",
+            "condition_combination": "",
+            "diagnostic_fields": [self.rain],
+            "diagnostic_thresholds": [AuxCoord(8.33333333e-09, units="m s-1")],
+            "diagnostic_conditions": ["above"],
+        }
+        self.expected = np.zeros((3, 3), dtype=bool)
+        self.expected[2] = True
+
+    def test_basic(self):
+        """Test evaluate_condition returns a boolean array that is True where
+        the query is satisfied."""
+        plugin = WeatherSymbols()
+        result = plugin.evaluate_condition(self.cubes, self.query)
+        self.assertEqual(result.dtype, bool)
+        self.assertArrayEqual(result, self.expected)
+
+    def test_invert(self):
+        """Test evaluate_condition returns the inverse of the query."""
+        plugin = WeatherSymbols()
+        result = plugin.evaluate_condition(self.cubes, self.query, invert=True)
+        self.assertArrayEqual(result, ~self.expected)
+
+    def test_combination(self):
+        """Test evaluate_condition combines multiple conditions."""
+        self.query["probability_thresholds"] = [0.5, 0.5]
+        self.query["condition_combination"] = "OR"
+        self.query["diagnostic_fields"] = [
+            self.rain,
+            "probability_of_low_and_medium_type_cloud_area_fraction_above_threshold",
+        ]
+        self.query["diagnostic_thresholds"].append(AuxCoord(0.1875, units="1"))
+        plugin = WeatherSymbols()
+        result = plugin.evaluate_condition(self.cubes, self.query)
+        self.expected[[0, 1, 1], [1, 1, 2]] = True
+        self.assertArrayEqual(result, self.expected)
+        result = plugin.evaluate_condition(self.cubes, self.query, invert=True)
+        self.assertArrayEqual(result, ~self.expected)
+
+    def test_operator_precedence(self):
+        """Test evaluate_condition multiplies before subtracting when
+        combining diagnostics, so compares 0.5 * rain with the threshold."""
+        self.query["diagnostic_fields"] = [[self.rain, "-", self.rain, "*", "0.5"]]
+        self.query["diagnostic_thresholds"] = [
+            [AuxCoord(8.33333333e-09, units="m s-1")] * 2
+        ]
+        plugin = WeatherSymbols()
+        result = plugin.evaluate_condition(self.cubes, self.query)
+        self.assertArrayEqual(result, self.expected)
+
+    def test_masked(self):
+        """Test that masked points satisfy neither the query nor its
+        inverse."""
+        self.cubes[2].data = np.ma.masked_where(
+            self.cubes[2].data > 0.5, self.cubes[2].data
+        )
+        plugin = WeatherSymbols()
+        result = plugin.evaluate_condition(self.cubes, self.query)
+        self.assertFalse(result.any())
+        result = plugin.evaluate_condition(self.cubes, self.query, invert=True)
+        self.assertArrayEqual(result, ~self.expected)
+
+    def test_cache(self):
+        """Test that diagnostic data are extracted from the cubes once."""
+        plugin = WeatherSymbols()
+        cache = {}
+        plugin.evaluate_condition(self.cubes, self.query, cache=cache)
+        self.assertEqual(list(cache), [(self.rain, 8.33333333e-09)])
+        cache[(self.rain, 8.33333333e-09)] = np.ones((3, 3))
+        result = plugin.evaluate_condition(self.cubes, self.query, cache=cache)
+        self.assertTrue(result.all())
+
+
+class Test_evaluate_tree(Test_WXCode):
+
+    """Test the evaluate_tree method."""
+
+    def assert_symbols(self, result, expected):
+        """Check that each point reaches only the expected symbol."""
+        symbols = np.zeros((3, 3), dtype=int)
+        for symbol_code, symbol_mask in result.items():
+            self.assertEqual(symbol_mask.dtype, bool)
+            self.assertFalse((symbols[symbol_mask] > 0).any())
+            symbols[symbol_mask] = symbol_code
+        self.assertArrayEqual(symbols, expected)
+
+    def test_basic(self):
+        """Test evaluate_tree finds the points reaching each symbol."""
+        plugin = WeatherSymbols()
+        omit_nodes = plugin.check_input_cubes(self.cubes)
+        result = plugin.evaluate_tree(self.cubes, (3, 3), omit_nodes=omit_nodes)
+        self.assertIsInstance(result, dict)
+        self.assert_symbols(result, [[1, 29, 5], [6, 7, 8], [10, 11, 12]])
+
+    def test_omit_nodes(self):
+        """Test evaluate_tree follows the diagnostic_missing_action of nodes
+        for which diagnostics are missing."""
+        plugin = WeatherSymbols()
+        cubes = self.cubes.extract(self.uk_no_lightning)
+        omit_nodes = plugin.check_input_cubes(cubes)
+        result = plugin.evaluate_tree(cubes, (3, 3), omit_nodes=omit_nodes)
+        self.assertNotIn(29, result)
+        self.assert_symbols(result, [[1, 3, 5], [6, 7, 8], [10, 11, 12]])
+
+
 class Test_create_symbol_cube(IrisTest):
 
     """Test the create_symbol_cube method ."""